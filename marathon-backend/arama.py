@@ -0,0 +1,181 @@
+import bisect
+import heapq
+import math
+import os
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import Optional
+from sqlalchemy import select
+import models
+import db as database
+
+# Konular ve chatbot geçmişi için süreç içi ters indeks (BM25 sıralama). Saf Python olduğundan
+# MySQL'de de SQLite'ta da çevrimdışı çalışır. İndeks kalıcı değildir: her worker kendi
+# belleğine ilk aramada kurar (tüm konular ve chatbot geçmişi okunur; büyük tablolarda saniyeler
+# ve yüzlerce MB). ARAMA_BASLANGICTA=1 ise başlangıçtan hemen sonra arka planda kurulur (bkz.
+# isinma.py); başlangıç beklemez, kurulum bitmeden gelen arama bitmesini bekler.
+# create_konu/create_chatbot yeni kaydı hemen ekler, her arama öncesi de pk > son_id olan
+# satırlar (toplu ekleme, diğer worker'lar) tamamlanır. Veritabanı okuması arama kilidi dışında yapılır, satırlar parça parça eklenir.
+# Konu/chatbot güncelleme ve silme endpointi olmadığından indeks yalnızca büyür.
+BM25_K1 = 1.2
+BM25_B = 0.75
+ARAMA_BASLANGICTA = os.getenv("ARAMA_BASLANGICTA", "0").lower() in ("1", "true", "yes")
+# Türkçe eklemeli olduğundan ("üçgen" -> "üçgenin", "açıları") sorgu terimi ön ek olarak da
+# eşleşir; çok kısa ön ekler patlamasın diye alt sınır ve genişleme üst sınırı var. Sınırı
+# aşan terimlerde alfabetik ilk ONEK_MAX_GENISLEME eşleşme kullanılır, sonuç "kesildi"
+# olarak işaretlenir (endpointlerde X-Onek-Kesildi başlığı)
+ONEK_MIN_UZUNLUK = 3
+ONEK_MAX_GENISLEME = 50
+_TR_BUYUK = str.maketrans({"I": "ı", "İ": "i"})
+_KELIME = re.compile(r"\w+")
+
+
+def normalize(metin: str) -> str:
+    # Türkçe büyük/küçük harf kuralı, sonra aksan katlama: "IŞIK" -> "isik", "Çiğdem" -> "cigdem"
+    metin = unicodedata.normalize("NFKD", metin.translate(_TR_BUYUK).lower())
+    return "".join(h for h in metin if not unicodedata.combining(h)).replace("ı", "i")
+
+
+def terimler(metin: Optional[str]) -> list[str]:
+    if not metin:
+        return []
+    return [t for t in _KELIME.findall(normalize(metin)) if len(t) > 1]
+
+
+class TersIndeks:
+    def __init__(self, model, pk: str, alanlar: dict[str, float], filtre: Optional[str] = None):
+        # alanlar: kolon adı -> ağırlık; filtre: aramada eşitlikle süzülebilen kolon (ör. ogrenci_id)
+        self.model = model
+        self.pk = pk
+        self.alanlar = alanlar
+        self.filtre = filtre
+        self._kilit = threading.Lock()
+        # Aynı anda tek eşitleme; aramalar yalnızca _kilit'i bekler
+        self._esitle_kilit = threading.Lock()
+        self._postings = defaultdict(dict)  # terim -> {kayit_id: ağırlıklı tf}
+        self._sirali_terimler = []  # ön ek araması için
+        self._uzunluk = {}
+        self._filtre_degeri = {}
+        self._toplam_uzunluk = 0.0
+        self.son_id = 0
+        self.kuruldu = False
+
+    def _ekle(self, kayit_id: int, degerler: dict):
+        if kayit_id in self._uzunluk:
+            return
+        tf = defaultdict(float)
+        for alan, agirlik in self.alanlar.items():
+            for terim in terimler(degerler.get(alan)):
+                tf[terim] += agirlik
+        for terim, frekans in tf.items():
+            if terim not in self._postings:
+                bisect.insort(self._sirali_terimler, terim)
+            self._postings[terim][kayit_id] = frekans
+        uzunluk = sum(tf.values())
+        self._uzunluk[kayit_id] = uzunluk
+        self._toplam_uzunluk += uzunluk
+        if self.filtre is not None:
+            self._filtre_degeri[kayit_id] = degerler.get(self.filtre)
+
+    def kayit_ekle(self, nesne):
+        # create_* sonrası; indeks henüz kurulmadıysa ilk aramada zaten yüklenecek
+        with self._kilit:
+            if self.kuruldu:
+                kolonlar = list(self.alanlar) + ([self.filtre] if self.filtre else [])
+                self._ekle(getattr(nesne, self.pk), {k: getattr(nesne, k) for k in kolonlar})
+
+    def esitle(self, db, parca: int = 1000):
+        pk = getattr(self.model, self.pk)
+        kolonlar = [pk] + [getattr(self.model, a) for a in self.alanlar]
+        if self.filtre is not None:
+            kolonlar.append(getattr(self.model, self.filtre))
+        with self._esitle_kilit:
+            sorgu = select(*kolonlar).filter(pk > self.son_id).order_by(pk).execution_options(yield_per=parca)
+            for satirlar in db.execute(sorgu).partitions():
+                with self._kilit:
+                    for satir in satirlar:
+                        degerler = satir._asdict()
+                        self._ekle(degerler[self.pk], degerler)
+                    self.son_id = getattr(satirlar[-1], self.pk)
+            with self._kilit:
+                self.kuruldu = True
+
+    def _eslesen_terimler(self, terim: str) -> tuple[list[str], bool]:
+        # (eşleşen terimler, genişleme sınırında kesildi mi)
+        if len(terim) < ONEK_MIN_UZUNLUK:
+            return ([terim] if terim in self._postings else []), False
+        sirali = self._sirali_terimler
+        bas = bisect.bisect_left(sirali, terim)
+        ust = min(bas + ONEK_MAX_GENISLEME, len(sirali))
+        bitis = bisect.bisect_left(sirali, terim + "\uffff", bas, ust)
+        return sirali[bas:bitis], bitis == ust < len(sirali) and sirali[ust].startswith(terim)
+
+    def ara(self, sorgu: str, skip: int = 0, limit: int = 10, filtre_degeri=None) -> tuple[int, list[tuple[int, float]], bool]:
+        # (toplam eşleşme, [(kayit_id, skor)], ön ek genişlemesi kesildi mi) skor azalan, eşitlikte id artan
+        sorgu_terimleri = set(terimler(sorgu))
+        kesildi = False
+        with self._kilit:
+            n = len(self._uzunluk)
+            if not n or not sorgu_terimleri:
+                return 0, [], False
+            # BM25 payda sabitleri döngü dışında: norm = a + c * uzunluk
+            a = BM25_K1 * (1 - BM25_B)
+            c = BM25_K1 * BM25_B * n / self._toplam_uzunluk if self._toplam_uzunluk else 0.0
+            uzunluk, filtre = self._uzunluk, self._filtre_degeri
+            skorlar = defaultdict(float)
+            for terim in sorgu_terimleri:
+                # Ön ekle eşleşen terimler tek terim gibi sayılır (tf toplanır, df birleşimden)
+                eslesenler, terim_kesildi = self._eslesen_terimler(terim)
+                kesildi |= terim_kesildi
+                if len(eslesenler) == 1:
+                    postings = self._postings[eslesenler[0]]
+                else:
+                    postings = defaultdict(float)
+                    for eslesen in eslesenler:
+                        for kayit_id, tf in self._postings[eslesen].items():
+                            postings[kayit_id] += tf
+                if not postings:
+                    continue
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                carpan = idf * (BM25_K1 + 1)
+                for kayit_id, tf in postings.items():
+                    if filtre_degeri is not None and filtre.get(kayit_id) != filtre_degeri:
+                        continue
+                    skorlar[kayit_id] += carpan * tf / (tf + a + c * uzunluk[kayit_id])
+        # Yalnızca istenen sayfaya kadar olan en iyi sonuçlar sıralanır
+        sirali = heapq.nsmallest(skip + limit, skorlar.items(), key=lambda s: (-s[1], s[0]))
+        return len(skorlar), sirali[skip:], kesildi
+
+    def ozet(self) -> dict:
+        with self._kilit:
+            return {"kayit": len(self._uzunluk), "terim": len(self._postings), "son_id": self.son_id,
+                    "kuruldu": self.kuruldu}
+
+
+KONULAR = TersIndeks(models.Konular, "konu_id",
+                     {"konu_adi": 3.0, "konu_metni": 1.0, "konu_cozumMetni": 1.0}, filtre="ders_id")
+CHATBOT = TersIndeks(models.ChatbotEtkilesim, "chatbot_id",
+                     {"chatbot_soruMetni": 1.5, "chatbot_cevapMetni": 1.0}, filtre="ogrenci_id")
+
+
+def kur():
+    # ARAMA_BASLANGICTA'da yaşam döngüsü başında arka plan thread'inde çağrılır
+    db = database.SessionLocal()
+    try:
+        for indeks in (KONULAR, CHATBOT):
+            indeks.esitle(db)
+    finally:
+        db.close()
+
+
+def ara(indeks: TersIndeks, db, sorgu: str, skip: int = 0, limit: int = 10, filtre_degeri=None):
+    # Toplam, sıralı (nesne, skor) listesi ve kesildi bayrağı; nesneler tek IN sorgusuyla yüklenir
+    indeks.esitle(db)
+    toplam, sonuclar, kesildi = indeks.ara(sorgu, skip=skip, limit=limit, filtre_degeri=filtre_degeri)
+    if not sonuclar:
+        return toplam, [], kesildi
+    pk = getattr(indeks.model, indeks.pk)
+    nesneler = {getattr(n, indeks.pk): n for n in db.query(indeks.model).filter(pk.in_([i for i, _ in sonuclar]))}
+    return toplam, [(nesneler[i], skor) for i, skor in sonuclar if i in nesneler], kesildi
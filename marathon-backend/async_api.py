@@ -0,0 +1,188 @@
+from datetime import date, datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+import db as database
+import hizli, kosullu, models, schemas, crud_async
+from oturum import oturum_gerekli, sahip_kontrolu
+from pagination import SAYFA_MAX, id_listesi
+
+# ASYNC_DB=1 iken main.py'deki sync CRUD endpointlerinin yerini alan async router.
+# Handler'lar threadpool'a düşmeden event loop üzerinde AsyncSession ile çalışır.
+router = APIRouter()
+
+async def get_async_db():
+    async with database.AsyncSessionLocal() as db:
+        yield db
+
+def bagla(app: FastAPI):
+    # Aynı path+method için sync route'u kaldırıp async karşılığını ekle
+    async_yollar = {(r.path, m) for r in router.routes for m in r.methods}
+    app.router.routes[:] = [
+        r for r in app.router.routes
+        if not (isinstance(r, APIRoute) and any((r.path, m) in async_yollar for m in r.methods))
+    ]
+    app.include_router(router)
+
+# Ogrenci Endpoints
+@router.post("/ogrenciler/", response_model=schemas.Ogrenci)
+async def ogrenci_olustur(ogrenci: schemas.OgrenciCreate, db: AsyncSession = Depends(get_async_db)):
+    try:
+        return await crud_async.create_ogrenci(db=db, ogrenci=ogrenci)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Öğrenci oluşturulurken hata: {str(e)}")
+
+@router.get("/ogrenciler/", response_model=list[schemas.Ogrenci], dependencies=[Depends(oturum_gerekli)])
+async def ogrencileri_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, idler: Optional[list[int]] = Depends(id_listesi), db: AsyncSession = Depends(get_async_db)):
+    if idler is not None:
+        kayitlar, eksikler = await crud_async.get_by_ids(db, models.Ogrenci, idler, kolonlar=hizli.OGRENCILER.secim())
+        return hizli.OGRENCILER.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = await crud_async.get_ogrenciler(db, skip=skip, limit=limit, cursor=cursor, kolonlar=hizli.OGRENCILER.secim())
+    return hizli.OGRENCILER.liste_yaniti(response, kayitlar, "ogrenci_id", limit)
+
+@router.get("/ogrenciler/{ogrenci_id}", response_model=schemas.Ogrenci)
+async def ogrenci_getir(ogrenci_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    db_ogrenci = await crud_async.get_ogrenci(db, ogrenci_id=ogrenci_id)
+    if db_ogrenci is None:
+        raise HTTPException(status_code=404, detail="Öğrenci bulunamadı")
+    kosul = kosullu.surum_kosulu(request, response, f"ogrenci:{ogrenci_id}", db_ogrenci.ogrenci_sonGuncellemeTarihi,
+                                 kosullu.alan_degerleri(db_ogrenci, schemas.Ogrenci))
+    return kosul or db_ogrenci
+
+@router.put("/ogrenciler/{ogrenci_id}", response_model=schemas.Ogrenci)
+async def ogrenci_guncelle(ogrenci_id: int, ogrenci: schemas.OgrenciUpdate, db: AsyncSession = Depends(get_async_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    try:
+        db_ogrenci = await crud_async.update_ogrenci(db=db, ogrenci_id=ogrenci_id, ogrenci_update=ogrenci)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Öğrenci güncellenirken hata: {str(e)}")
+    if db_ogrenci is None:
+        raise HTTPException(status_code=404, detail="Öğrenci bulunamadı")
+    return db_ogrenci
+
+# Dersler Endpoints
+@router.post("/dersler/", response_model=schemas.Dersler)
+async def ders_olustur(ders: schemas.DerslerCreate, db: AsyncSession = Depends(get_async_db)):
+    try:
+        return await crud_async.create_ders(db=db, ders=ders)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Ders oluşturulurken hata: {str(e)}")
+
+@router.get("/dersler/", response_model=list[schemas.Dersler])
+async def dersleri_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, baslangic: Optional[date] = None, bitis: Optional[date] = None, idler: Optional[list[int]] = Depends(id_listesi), db: AsyncSession = Depends(get_async_db)):
+    if idler is not None:
+        kayitlar, eksikler = await crud_async.get_by_ids(db, models.Dersler, idler, kolonlar=hizli.DERSLER.secim())
+        return hizli.DERSLER.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = await crud_async.get_dersler(db, skip=skip, limit=limit, cursor=cursor, baslangic=baslangic, bitis=bitis, kolonlar=hizli.DERSLER.secim())
+    return hizli.DERSLER.liste_yaniti(response, kayitlar, "ders_id", limit)
+
+@router.get("/dersler/{ders_id}", response_model=schemas.Dersler)
+async def ders_getir(ders_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_ders = await crud_async.get_ders(db, ders_id=ders_id)
+    if db_ders is None:
+        raise HTTPException(status_code=404, detail="Ders bulunamadı")
+    return db_ders
+
+# Konular Endpoints
+@router.post("/konular/", response_model=schemas.Konular)
+async def konu_olustur(konu: schemas.KonularCreate, db: AsyncSession = Depends(get_async_db)):
+    return await crud_async.create_konu(db=db, konu=konu)
+
+@router.get("/konular/", response_model=list[schemas.Konular])
+async def konulari_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, ders_id: Optional[int] = None, konu_seviyesi: Optional[int] = None, idler: Optional[list[int]] = Depends(id_listesi), db: AsyncSession = Depends(get_async_db)):
+    if idler is not None:
+        kayitlar, eksikler = await crud_async.get_by_ids(db, models.Konular, idler, kolonlar=hizli.KONULAR.secim())
+        return hizli.KONULAR.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = await crud_async.get_konular(db, skip=skip, limit=limit, cursor=cursor, ders_id=ders_id, konu_seviyesi=konu_seviyesi, kolonlar=hizli.KONULAR.secim())
+    return hizli.KONULAR.liste_yaniti(response, kayitlar, "konu_id", limit)
+
+@router.get("/konular/{konu_id}", response_model=schemas.Konular)
+async def konu_getir(konu_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_konu = await crud_async.get_konu(db, konu_id=konu_id)
+    if db_konu is None:
+        raise HTTPException(status_code=404, detail="Konu bulunamadı")
+    return db_konu
+
+# SinavSimilasyonlari Endpoints
+@router.post("/sinavlar/", response_model=schemas.SinavSimilasyonlari)
+async def sinav_olustur(sinav: schemas.SinavSimilasyonlariCreate, db: AsyncSession = Depends(get_async_db)):
+    return await crud_async.create_sinav(db=db, sinav=sinav)
+
+@router.get("/sinavlar/", response_model=list[schemas.SinavSimilasyonlari])
+async def sinavlari_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, baslangic: Optional[date] = None, bitis: Optional[date] = None, idler: Optional[list[int]] = Depends(id_listesi), db: AsyncSession = Depends(get_async_db)):
+    if idler is not None:
+        kayitlar, eksikler = await crud_async.get_by_ids(db, models.SinavSimilasyonlari, idler, kolonlar=hizli.SINAVLAR.secim())
+        return hizli.SINAVLAR.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = await crud_async.get_sinavlar(db, skip=skip, limit=limit, cursor=cursor, baslangic=baslangic, bitis=bitis, kolonlar=hizli.SINAVLAR.secim())
+    return hizli.SINAVLAR.liste_yaniti(response, kayitlar, "sinav_id", limit)
+
+@router.get("/sinavlar/{sinav_id}", response_model=schemas.SinavSimilasyonlari)
+async def sinav_getir(sinav_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_sinav = await crud_async.get_sinav(db, sinav_id=sinav_id)
+    if db_sinav is None:
+        raise HTTPException(status_code=404, detail="Sınav bulunamadı")
+    return db_sinav
+
+# Istatistikler Endpoints
+@router.post("/istatistikler/", response_model=schemas.Istatistikler, dependencies=[Depends(oturum_gerekli)])
+async def istatistik_olustur(istatistik: schemas.IstatistiklerCreate, db: AsyncSession = Depends(get_async_db)):
+    return await crud_async.create_istatistik(db=db, istatistik=istatistik)
+
+@router.get("/istatistikler/", response_model=list[schemas.Istatistikler])
+async def istatistikleri_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, ogrenci_id: Optional[int] = None, baslangic: Optional[date] = None, bitis: Optional[date] = None, idler: Optional[list[int]] = Depends(id_listesi), db: AsyncSession = Depends(get_async_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    if idler is not None:
+        kayitlar, eksikler = await crud_async.get_by_ids(db, models.Istatistikler, idler, kolonlar=hizli.ISTATISTIKLER.secim())
+        return hizli.ISTATISTIKLER.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = await crud_async.get_istatistikler(db, skip=skip, limit=limit, cursor=cursor, ogrenci_id=ogrenci_id, baslangic=baslangic, bitis=bitis, kolonlar=hizli.ISTATISTIKLER.secim())
+    return hizli.ISTATISTIKLER.liste_yaniti(response, kayitlar, "istatistik_id", limit)
+
+@router.get("/istatistikler/{istatistik_id}", response_model=schemas.Istatistikler, dependencies=[Depends(oturum_gerekli)])
+async def istatistik_getir(istatistik_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_istatistik = await crud_async.get_istatistik(db, istatistik_id=istatistik_id)
+    if db_istatistik is None:
+        raise HTTPException(status_code=404, detail="İstatistik bulunamadı")
+    return db_istatistik
+
+# OdullerVeBasarimlar Endpoints
+@router.post("/basarimlar/", response_model=schemas.OdullerVeBasarimlar)
+async def basarim_olustur(basarim: schemas.OdullerVeBasarimlarCreate, db: AsyncSession = Depends(get_async_db)):
+    return await crud_async.create_basarim(db=db, basarim=basarim)
+
+@router.get("/basarimlar/", response_model=list[schemas.OdullerVeBasarimlar])
+async def basarimlari_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, idler: Optional[list[int]] = Depends(id_listesi), db: AsyncSession = Depends(get_async_db)):
+    if idler is not None:
+        kayitlar, eksikler = await crud_async.get_by_ids(db, models.OdullerVeBasarimlar, idler, kolonlar=hizli.BASARIMLAR.secim())
+        return hizli.BASARIMLAR.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = await crud_async.get_basarimlar(db, skip=skip, limit=limit, cursor=cursor, kolonlar=hizli.BASARIMLAR.secim())
+    return hizli.BASARIMLAR.liste_yaniti(response, kayitlar, "basarim_id", limit)
+
+@router.get("/basarimlar/{basarim_id}", response_model=schemas.OdullerVeBasarimlar)
+async def basarim_getir(basarim_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_basarim = await crud_async.get_basarim(db, basarim_id=basarim_id)
+    if db_basarim is None:
+        raise HTTPException(status_code=404, detail="Başarım bulunamadı")
+    return db_basarim
+
+# ChatbotEtkilesim Endpoints
+@router.post("/chatbot/", response_model=schemas.ChatbotEtkilesim, dependencies=[Depends(oturum_gerekli)])
+async def chatbot_olustur(chatbot: schemas.ChatbotEtkilesimCreate, db: AsyncSession = Depends(get_async_db)):
+    return await crud_async.create_chatbot(db=db, chatbot=chatbot)
+
+@router.get("/chatbot/", response_model=list[schemas.ChatbotEtkilesim])
+async def chatbotlari_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, ogrenci_id: Optional[int] = None, baslangic: Optional[datetime] = None, bitis: Optional[datetime] = None, idler: Optional[list[int]] = Depends(id_listesi), db: AsyncSession = Depends(get_async_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    if idler is not None:
+        kayitlar, eksikler = await crud_async.get_by_ids(db, models.ChatbotEtkilesim, idler, kolonlar=hizli.CHATBOTLAR.secim())
+        return hizli.CHATBOTLAR.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = await crud_async.get_chatbotlar(db, skip=skip, limit=limit, cursor=cursor, ogrenci_id=ogrenci_id, baslangic=baslangic, bitis=bitis, kolonlar=hizli.CHATBOTLAR.secim())
+    return hizli.CHATBOTLAR.liste_yaniti(response, kayitlar, "chatbot_id", limit)
+
+@router.get("/chatbot/{chatbot_id}", response_model=schemas.ChatbotEtkilesim, dependencies=[Depends(oturum_gerekli)])
+async def chatbot_getir(chatbot_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_chatbot = await crud_async.get_chatbot(db, chatbot_id=chatbot_id)
+    if db_chatbot is None:
+        raise HTTPException(status_code=404, detail="Chatbot etkileşimi bulunamadı")
+    return db_chatbot
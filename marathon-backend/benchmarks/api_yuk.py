@@ -0,0 +1,401 @@
+# Endpoint yük testi: gerçekçi hacimde tohumlanmış veritabanına karşı senaryo başına, her
+# eşzamanlılık düzeyinde p50/p95/p99 gecikme ve throughput ölçülür, sonuç JSON olarak yazılır
+# ve isteğe bağlı olarak kayıtlı bir tabanla karşılaştırılır (gerileme varsa 1 ile çıkar).
+#   python -m benchmarks.api_yuk --db /tmp/bench.db --cikti sonuc.json                  (uygulama içi)
+#   python -m benchmarks.api_yuk --db /tmp/bench.db --surucu http --worker 4             (uvicorn alt süreci)
+#   python -m benchmarks.api_yuk --db /tmp/bench.db --taban taban.json --tolerans 0.15   (karşılaştırma)
+#   python -m benchmarks.api_yuk --surucu http --hedef http://sunucu:8000 --token ...    (çalışan sunucu)
+# Varsayılan hacim 100k öğrenci, 10M istatistik, 5M chatbot etkileşimi (--olcek ile ölçeklenir).
+# Tohumlama deterministiktir (--tohum) ve --db verilirse aynı hacim için yeniden kullanılır
+# (hacim DB'nin yanındaki .json dosyasında tutulur; tam hacim tohumlaması dakikalar sürer, bir
+# kez yapılır). --url ile yerel MySQL de tohumlanabilir.
+# Not: uygulama içi sürücüde yük üreten istemci uygulamayla aynı süreçte ve CPU'da çalışır;
+# sonuçlar aynı makinedeki ölçümlerle karşılaştırılmalı.
+# Senaryoların küçük hacimde hatasız çalışması ve taban karşılaştırması CI'da
+# tests/test_api_yuk.py ile kontrol edilir.
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional
+import numpy as np
+
+from benchmarks.benzer_soru import soru
+
+# Tarihe bağlı endpointler sabit güne göre çağrılır; sonuçlar tohumlama gününden bağımsız
+REFERANS = datetime.date(2025, 6, 30)
+TOKEN_ANAHTARI = "benchmark-anahtari"
+DUYGULAR = ["mutlu", "kararsız", "yorgun", "meraklı", "stresli"]
+PARCA = 50000
+
+
+def hacim(args) -> dict:
+    return {
+        "ogrenci": max(1, int(args.ogrenci * args.olcek)),
+        "istatistik": int(args.istatistik * args.olcek),
+        "chatbot": int(args.chatbot * args.olcek),
+        "konu": max(1, int(args.konu * args.olcek)),
+        "ders": 20,
+        "tohum": args.tohum,
+    }
+
+
+def tohumla(url: str, h: dict):
+    from sqlalchemy import create_engine, event, insert
+    from sqlalchemy.orm import Session
+    import models, rollup
+
+    engine = create_engine(url)
+    if engine.dialect.name == "sqlite":
+        @event.listens_for(engine, "connect")
+        def _hizli_yazim(dbapi_conn, kayit):
+            dbapi_conn.execute("PRAGMA journal_mode=WAL")
+            dbapi_conn.execute("PRAGMA synchronous=OFF")
+
+    models.Base.metadata.create_all(engine)
+    rastgele = random.Random(h["tohum"])
+    baslangic = time.perf_counter()
+
+    def parcalar(tablo, adet: int, satir):
+        for bas in range(0, adet, PARCA):
+            with engine.begin() as conn:
+                conn.execute(insert(tablo), [satir(i) for i in range(bas, min(bas + PARCA, adet))])
+            print(f"  {tablo.__tablename__}: {min(bas + PARCA, adet)}/{adet}  "
+                  f"({time.perf_counter() - baslangic:.0f} sn)", file=sys.stderr)
+
+    ogrenci, gun = h["ogrenci"], 365
+    parcalar(models.Ogrenci, ogrenci, lambda i: {
+        "ogrenci_kullaniciAdi": f"ogrenci{i}", "ogrenci_email": f"ogrenci{i}@ornek.com",
+        "ogrenci_sifreHashed": "x", "ogrenci_ad": "Ad", "ogrenci_soyad": "Soyad",
+        "ogrenci_dogumTarihi": datetime.date(2008 + i % 6, 1 + i % 12, 1 + i % 28),
+        "ogrenci_mevcutSeviye": 1 + i % 10, "ogrenci_basariOrani": rastgele.randint(0, 100),
+        "ogrenci_dikkatSeviyesi": rastgele.randint(0, 100),
+        "ogrenci_sonGuncellemeTarihi": datetime.datetime(2025, 1, 1),
+    })
+    parcalar(models.Dersler, h["ders"], lambda i: {"ders_adi": f"ders {i}"})
+    parcalar(models.Konular, h["konu"], lambda i: {
+        "konu_adi": f"konu {i}", "konu_seviyesi": 1 + i % 10, "ders_id": 1 + i % h["ders"]})
+    # Her öğrenci 3 derse kayıtlı (ders liderlik tabloları için)
+    parcalar(models.Dersler_has_Ogrenci, ogrenci * 3, lambda i: {
+        "ogrenci_id": 1 + i // 3, "ders_id": 1 + (i // 3 + i % 3 * 7) % h["ders"]})
+    # Öğrenci etkinliği eşit değil: ~%20 öğrenci kayıtların yarısını üretir
+    def ogrenci_sec():
+        return rastgele.randint(1, max(1, ogrenci // 5)) if rastgele.random() < 0.5 else rastgele.randint(1, ogrenci)
+
+    parcalar(models.Istatistikler, h["istatistik"], lambda i: {
+        "istatistik_tarihi": REFERANS - datetime.timedelta(days=rastgele.randrange(gun)),
+        "istatistik_gunlukcalismaSuresi": rastgele.randint(0, 600) / 10,
+        "istatistik_tamamlananModulSayisi": rastgele.randint(0, 10),
+        "istatistik_ortalamaodakPuani": rastgele.randint(0, 100),
+        "istatistik_cozulenSoruSayisi": rastgele.randint(0, 60),
+        "istatistik_dogruCevapOrani": rastgele.randint(0, 100),
+        "istatistik_kazanilanHalkaSayisi": rastgele.randint(0, 5),
+        "istatistik_molaSayisi": rastgele.randint(0, 5),
+        "istatistik_toplamMolaSuresi": rastgele.randint(0, 60),
+        "istatistik_uykuKalitesi": rastgele.randint(0, 10),
+        "istatistik_notlar": None,
+        "ogrenci_id": ogrenci_sec(),
+    })
+    parcalar(models.ChatbotEtkilesim, h["chatbot"], lambda i: {
+        "chatbot_soruMetni": soru(i), "chatbot_cevapMetni": f"cevap {i}",
+        "chatbot_zamanDamgasi": datetime.datetime.combine(REFERANS, datetime.time(12))
+                                - datetime.timedelta(seconds=rastgele.randrange(gun * 86400)),
+        "chatbot_duyguCikarimi": rastgele.choice(DUYGULAR), "ogrenci_id": ogrenci_sec(),
+    })
+    with Session(engine) as db:
+        print(f"  istatistikozetleri: {rollup.yeniden_olustur(db)} satır", file=sys.stderr)
+    engine.dispose()
+    print(f"tohumlama {time.perf_counter() - baslangic:.0f} sn", file=sys.stderr)
+
+
+def veritabani_yolu(args) -> str:
+    if args.url:
+        return args.url
+    return f"sqlite:///{args.db or os.path.join(tempfile.mkdtemp(prefix='api_yuk_'), 'bench.db')}"
+
+
+def hazirla(args, url: str, h: dict):
+    if args.url:
+        if not args.tohumlanmis:
+            tohumla(url, h)
+        return
+    yol = url[len("sqlite:///"):]
+    kayit = yol + ".json"
+    if os.path.exists(yol) and os.path.exists(kayit):
+        with open(kayit) as f:
+            if json.load(f) == h:
+                print(f"tohumlanmış veritabanı kullanılıyor: {yol}", file=sys.stderr)
+                return
+        os.remove(yol)
+    tohumla(url, h)
+    with open(kayit, "w") as f:
+        json.dump(h, f)
+
+
+# Senaryo: ad -> istek üreteci; (method, yol, parametreler, json gövde[, öğrenci]). Öğrenciye ait
+# veriler yalnızca o öğrencinin token'ıyla okunur: beşinci eleman varsa istek o öğrencinin
+# token'ıyla gönderilir (token'lar sunucuyla aynı TOKEN_ANAHTARI ile üretilir).
+def senaryolar(h: dict) -> dict:
+    o, ist, cb = h["ogrenci"], max(1, h["istatistik"]), max(1, h["chatbot"])
+    ref, once = REFERANS.isoformat(), (REFERANS - datetime.timedelta(days=29)).isoformat()
+
+    def ogrenci_yolu(r, sablon: str, params: Optional[dict] = None):
+        kimlik = r.randint(1, o)
+        return "GET", sablon.format(kimlik), params, None, kimlik
+
+    def ogrenci_filtresi(r, yol: str, limit: int):
+        kimlik = r.randint(1, o)
+        return "GET", yol, {"ogrenci_id": kimlik, "limit": limit}, None, kimlik
+
+    return {
+        "ogrenci_getir": lambda r: ogrenci_yolu(r, "/ogrenciler/{}"),
+        "ogrenci_sayfa": lambda r: ("GET", "/ogrenciler/", {"skip": r.randint(0, max(0, o - 20)), "limit": 20}, None),
+        "ogrenci_ozet": lambda r: ogrenci_yolu(r, "/ogrenciler/{}/ozet", {"baslangic": once, "bitis": ref}),
+        "sonraki_konu": lambda r: ogrenci_yolu(r, "/ogrenciler/{}/sonraki-konu"),
+        "istatistik_getir": lambda r: ("GET", f"/istatistikler/{r.randint(1, ist)}", None, None),
+        "istatistik_ogrenci": lambda r: ogrenci_filtresi(r, "/istatistikler/", 50),
+        "istatistik_idler": lambda r: ("GET", "/istatistikler/",
+                                       {"ids": ",".join(str(r.randint(1, ist)) for _ in range(50))}, None),
+        "chatbot_ogrenci": lambda r: ogrenci_filtresi(r, "/chatbot/", 20),
+        "chatbot_getir": lambda r: ("GET", f"/chatbot/{r.randint(1, cb)}", None, None),
+        "liderlik": lambda r: ("GET", "/liderlik/", {"donem": "hafta", "tarih": ref, "n": 20}, None),
+        "liderlik_ders": lambda r: ("GET", "/liderlik/", {"donem": "ay", "tarih": ref,
+                                                          "ders_id": r.randint(1, h["ders"])}, None),
+        "istatistik_ekle": lambda r: ("POST", "/istatistikler/", None, {
+            "istatistik_tarihi": ref, "istatistik_gunlukcalismaSuresi": 12.5,
+            "istatistik_tamamlananModulSayisi": 2, "istatistik_ortalamaodakPuani": 70,
+            "istatistik_cozulenSoruSayisi": 20, "istatistik_dogruCevapOrani": 0.8,
+            "istatistik_kazanilanHalkaSayisi": 3, "istatistik_molaSayisi": 1, "istatistik_toplamMolaSuresi": 5,
+            "istatistik_uykuKalitesi": 7, "istatistik_notlar": None, "ogrenci_id": r.randint(1, o)}),
+        # Süreç içi indeks kurar (tüm chatbot tablosu okunur); varsayılan senaryolarda yok
+        "chatbot_ara": lambda r: ("GET", "/chatbot/ara", {"q": r.choice(["türev", "olasılık", "fotosentez"])}, None),
+        "chatbot_benzer": lambda r: ("GET", "/chatbot/benzer", {"q": soru(r.randrange(cb))}, None),
+    }
+
+
+VARSAYILAN_SENARYOLAR = ["ogrenci_getir", "ogrenci_sayfa", "ogrenci_ozet", "sonraki_konu", "istatistik_getir",
+                         "istatistik_ogrenci", "istatistik_idler", "chatbot_ogrenci", "chatbot_getir",
+                         "liderlik", "liderlik_ders", "istatistik_ekle"]
+
+
+async def kos(client, uretec, istek: int, eszamanlilik: int, tohum: int) -> dict:
+    rastgele = random.Random(tohum)
+    istekler = [uretec(rastgele) for _ in range(istek)]
+    sahipler = {i[4] for i in istekler if len(i) > 4}
+    if sahipler:
+        import oturum
+
+        tokenlar = {k: {"Authorization": f"Bearer {oturum.token_olustur(k)}"} for k in sahipler}
+    sureler = np.empty(istek)
+    kalan = iter(range(istek))
+    hatalar = 0
+
+    async def isci():
+        nonlocal hatalar
+        for i in kalan:
+            method, yol, params, govde, *sahip = istekler[i]
+            basliklar = tokenlar[sahip[0]] if sahip else None
+            t0 = time.perf_counter()
+            yanit = await client.request(method, yol, params=params, json=govde, headers=basliklar)
+            sureler[i] = time.perf_counter() - t0
+            hatalar += yanit.status_code >= 400
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(isci() for _ in range(eszamanlilik)))
+    gecen = time.perf_counter() - t0
+    p50, p95, p99 = np.percentile(sureler * 1000, [50, 95, 99])
+    return {"p50_ms": round(p50, 3), "p95_ms": round(p95, 3), "p99_ms": round(p99, 3),
+            "ort_ms": round(float(sureler.mean() * 1000), 3), "istek_sn": round(istek / gecen, 1),
+            "istek": istek, "hata": hatalar}
+
+
+async def olc(client, args, h: dict) -> dict:
+    tum = senaryolar(h)
+    sonuclar = {}
+    for ad in args.senaryo:
+        # Isınma: süreç içi indeksler/tablolar ve önbellek ilk istekte kurulur, ölçüme girmez
+        await kos(client, tum[ad], args.isinma, 1, args.tohum + 1)
+        sonuclar[ad] = {}
+        for n in args.eszamanlilik:
+            sonuc = sonuclar[ad][str(n)] = await kos(client, tum[ad], args.istek, n, args.tohum)
+            print(f"{ad:<20} {n:>4} {sonuc['p50_ms']:>9.2f} {sonuc['p95_ms']:>9.2f} {sonuc['p99_ms']:>9.2f} "
+                  f"{sonuc['istek_sn']:>9.0f} {sonuc['hata']:>6}", file=sys.stderr)
+    return sonuclar
+
+
+def bos_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def async_url(url: str) -> str:
+    return url.replace("sqlite://", "sqlite+aiosqlite://", 1).replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+
+
+async def surucu_calistir(args, url: str, h: dict) -> dict:
+    import httpx
+
+    if args.surucu == "uygulama":
+        # Ortam değişkenleri main import edilmeden önce ayarlanmalı
+        import main
+        import onbellek, oturum
+
+        if args.onbelleksiz:
+            onbellek.ayarla(None)
+        transport, hedef, token = httpx.ASGITransport(app=main.app), "http://bench", oturum.token_olustur(1)
+    else:
+        transport, hedef = None, args.hedef
+        token = args.token
+        if token is None:
+            import oturum
+            token = oturum.token_olustur(1)
+    limitler = httpx.Limits(max_connections=max(args.eszamanlilik), max_keepalive_connections=max(args.eszamanlilik))
+    async with httpx.AsyncClient(transport=transport, base_url=hedef, limits=limitler, timeout=60,
+                                 headers={"Authorization": f"Bearer {token}"}) as client:
+        return await olc(client, args, h)
+
+
+def sunucu_baslat(args, env: dict):
+    port = bos_port()
+    args.hedef = f"http://127.0.0.1:{port}"
+    surec = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(args.worker), "--log-level", "warning", "--no-access-log"],
+        env=env, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import httpx
+    for _ in range(300):
+        try:
+            httpx.get(args.hedef + "/", timeout=1).raise_for_status()
+            return surec
+        except httpx.HTTPError:
+            if surec.poll() is not None:
+                sys.exit("uvicorn başlatılamadı")
+            time.sleep(0.1)
+    surec.terminate()
+    sys.exit("uvicorn 30 sn içinde yanıt vermedi")
+
+
+def karsilastir(sonuc: dict, taban: dict, tolerans: float) -> bool:
+    # p95 gecikme (1 + tolerans) katını ya da throughput (1 - tolerans) katını aşarsa gerileme
+    gerileme = False
+    for alan in ("surucu", "mod", "worker", "onbellek", "hacim", "veritabani", "cpu"):
+        if sonuc["meta"].get(alan) != taban.get("meta", {}).get(alan):
+            print(f"uyarı: taban farklı koşulda ölçülmüş ({alan}: {taban.get('meta', {}).get(alan)} -> "
+                  f"{sonuc['meta'].get(alan)})", file=sys.stderr)
+    print(f"\n{'senaryo':<20} {'eşz.':>4} {'p95 ms':>9} {'taban':>9} {'fark':>7} {'istek/sn':>9} {'taban':>9} {'fark':>7}")
+    for ad, duzeyler in sonuc["sonuclar"].items():
+        for n, s in duzeyler.items():
+            t = taban.get("sonuclar", {}).get(ad, {}).get(n)
+            if t is None:
+                continue
+            p95_fark = s["p95_ms"] / t["p95_ms"] - 1 if t["p95_ms"] else 0.0
+            hiz_fark = s["istek_sn"] / t["istek_sn"] - 1 if t["istek_sn"] else 0.0
+            kotu = p95_fark > tolerans or hiz_fark < -tolerans
+            gerileme |= kotu
+            print(f"{ad:<20} {n:>4} {s['p95_ms']:>9.2f} {t['p95_ms']:>9.2f} {p95_fark:>+7.1%} "
+                  f"{s['istek_sn']:>9.0f} {t['istek_sn']:>9.0f} {hiz_fark:>+7.1%}{'  GERİLEME' if kotu else ''}")
+    return gerileme
+
+
+def git_surumu() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ogrenci", type=int, default=100_000)
+    parser.add_argument("--istatistik", type=int, default=10_000_000)
+    parser.add_argument("--chatbot", type=int, default=5_000_000)
+    parser.add_argument("--konu", type=int, default=5_000)
+    parser.add_argument("--olcek", type=float, default=1.0, help="tüm hacimlerin çarpanı (ör. 0.01)")
+    parser.add_argument("--tohum", type=int, default=7)
+    parser.add_argument("--db", help="SQLite dosyası; aynı hacimle tohumlanmışsa yeniden kullanılır")
+    parser.add_argument("--url", help="SQLite yerine veritabanı URL'si (ör. yerel MySQL, mysql+pymysql://...)")
+    parser.add_argument("--tohumlanmis", action="store_true", help="--url zaten tohumlanmış, tohumlama atlanır")
+    parser.add_argument("--surucu", choices=["uygulama", "http"], default="uygulama")
+    parser.add_argument("--hedef", help="http sürücüsünde çalışan sunucu; verilmezse uvicorn başlatılır")
+    parser.add_argument("--token", help="--hedef sunucusu için Bearer token (öğrenciye ait senaryolar için "
+                                        "ortamda sunucunun TOKEN_ANAHTARI'sı da verilmeli)")
+    parser.add_argument("--worker", type=int, default=1, help="başlatılan uvicorn worker sayısı")
+    parser.add_argument("--mod", choices=["sync", "async"], default="sync")
+    parser.add_argument("--onbelleksiz", action="store_true", help="okuma önbelleği kapalı (CACHE_BACKEND=none)")
+    parser.add_argument("--senaryo", nargs="+", default=VARSAYILAN_SENARYOLAR)
+    parser.add_argument("--eszamanlilik", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--istek", type=int, default=1000, help="senaryo ve eşzamanlılık düzeyi başına")
+    parser.add_argument("--isinma", type=int, default=50)
+    parser.add_argument("--cikti", help="sonuç JSON dosyası (verilmezse stdout)")
+    parser.add_argument("--taban", help="karşılaştırılacak önceki sonuç JSON dosyası")
+    parser.add_argument("--tolerans", type=float, default=0.10)
+    args = parser.parse_args()
+    if args.hedef and args.surucu != "http":
+        parser.error("--hedef yalnızca --surucu http ile kullanılır")
+    bilinmeyen = set(args.senaryo) - set(senaryolar(hacim(args)))
+    if bilinmeyen:
+        parser.error(f"bilinmeyen senaryo: {', '.join(sorted(bilinmeyen))}")
+
+    h = hacim(args)
+    url = None if args.hedef else veritabani_yolu(args)
+    # Uygulama içi sürücüde bu süreç, http sürücüsünde uvicorn alt süreci bu ortamla açılır;
+    # db modülü ilk importta (tohumlamada da) bu adresle engine kurar
+    os.environ.update(DATABASE_URL=url or "", ASYNC_DATABASE_URL=async_url(url or ""),
+                      ASYNC_DB="1" if args.mod == "async" else "0",
+                      TOKEN_ANAHTARI=os.getenv("TOKEN_ANAHTARI", TOKEN_ANAHTARI))
+    if args.onbelleksiz:
+        os.environ["CACHE_BACKEND"] = "none"
+    if url and url.startswith("sqlite"):
+        # Benzer soru indeksi geliştirme dizinine değil tohumlanmış DB'nin yanına yazılır
+        os.environ.setdefault("BENZER_DIZIN", url[len("sqlite:///"):] + ".benzer")
+    if url:
+        hazirla(args, url, h)
+
+    sunucu = sunucu_baslat(args, dict(os.environ)) if args.surucu == "http" and not args.hedef else None
+    print(f"{'senaryo':<20} {'eşz.':>4} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'istek/sn':>9} {'hata':>6}",
+          file=sys.stderr)
+    try:
+        sonuclar = asyncio.run(surucu_calistir(args, url, h))
+    finally:
+        if sunucu is not None:
+            sunucu.terminate()
+            sunucu.wait()
+
+    sonuc = {
+        "meta": {
+            "tarih": datetime.datetime.now().isoformat(timespec="seconds"), "git": git_surumu(),
+            "python": platform.python_version(), "platform": platform.platform(), "cpu": os.cpu_count(),
+            "surucu": args.surucu, "mod": args.mod, "worker": args.worker if sunucu else None,
+            "onbellek": not args.onbelleksiz, "hacim": h, "istek": args.istek,
+            "veritabani": (url or args.hedef).split("://")[0],
+        },
+        "sonuclar": sonuclar,
+    }
+    metin = json.dumps(sonuc, indent=2, ensure_ascii=False)
+    if args.cikti:
+        with open(args.cikti, "w") as f:
+            f.write(metin + "\n")
+    else:
+        print(metin)
+
+    if args.taban:
+        with open(args.taban) as f:
+            taban = json.load(f)
+        if karsilastir(sonuc, taban, args.tolerans):
+            print(f"p95 gecikme ya da throughput tabana göre tolerans (%{args.tolerans * 100:.0f}) dışında geriledi",
+                  file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
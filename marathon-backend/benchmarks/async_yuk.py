@@ -0,0 +1,107 @@
+# Sync ve async (ASYNC_DB=1) modların eşzamanlılığa göre throughput'unu karşılaştırır.
+# Her mod ayrı bir süreçte, SQLite (pysqlite / aiosqlite) üzerinde uygulama içinden çalıştırılır.
+#   python -m benchmarks.async_yuk --eszamanlilik 1 8 32 --istek 2000
+# Not: sync modda eşzamanlılık threadpool boyutunu (40) ve varsayılan bağlantı havuzunu
+# (5 + 10 overflow) aşınca get_db teardown'ı thread bekler ve istekler havuz timeout'una düşer.
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def tohumla(url: str, satir: int):
+    from sqlalchemy import create_engine, insert
+    import models
+
+    engine = create_engine(url)
+    models.Base.metadata.create_all(engine)
+    bugun = datetime.date.today()
+    with engine.begin() as conn:
+        conn.execute(insert(models.Istatistikler), [
+            {
+                "istatistik_tarihi": bugun - datetime.timedelta(days=i % 365),
+                "istatistik_gunlukcalismaSuresi": (i % 300) / 10,
+                "istatistik_ortalamaodakPuani": i % 100,
+                "istatistik_kazanilanHalkaSayisi": i % 5,
+            }
+            for i in range(satir)
+        ])
+    engine.dispose()
+
+
+async def yuk_uret(app, eszamanlilik: int, istek: int, satir: int) -> float:
+    import httpx
+    import oturum
+
+    kalan = iter(range(istek))
+    transport = httpx.ASGITransport(app=app)
+    basliklar = {"Authorization": f"Bearer {oturum.token_olustur(1)}"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=basliklar) as client:
+        async def isci():
+            for i in kalan:
+                if i % 2:
+                    r = await client.get(f"/istatistikler/{random.randint(1, satir)}")
+                else:
+                    r = await client.get("/istatistikler/", params={"limit": 20})
+                r.raise_for_status()
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(isci() for _ in range(eszamanlilik)))
+        return istek / (time.perf_counter() - t0)
+
+
+def calistir(args):
+    # Bu süreçte ortam değişkenleri zaten ayarlı; main import edilince mod seçilir
+    import main
+
+    sonuc = {}
+    for n in args.eszamanlilik:
+        sonuc[n] = asyncio.run(yuk_uret(main.app, n, args.istek, args.satir))
+    print(json.dumps(sonuc))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--eszamanlilik", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--istek", type=int, default=2000)
+    parser.add_argument("--satir", type=int, default=10000)
+    parser.add_argument("--mod", choices=["sync", "async"])
+    args = parser.parse_args()
+
+    if args.mod:
+        calistir(args)
+        return
+
+    with tempfile.TemporaryDirectory() as klasor:
+        yol = os.path.join(klasor, "bench.db")
+        tohumla(f"sqlite:///{yol}", args.satir)
+        sonuclar = {}
+        for mod in ("sync", "async"):
+            env = dict(
+                os.environ,
+                DATABASE_URL=f"sqlite:///{yol}",
+                ASYNC_DATABASE_URL=f"sqlite+aiosqlite:///{yol}",
+                ASYNC_DB="1" if mod == "async" else "0",
+                TOKEN_ANAHTARI=os.environ.get("TOKEN_ANAHTARI", "benchmark-anahtari"),
+            )
+            cikti = subprocess.run(
+                [sys.executable, "-m", "benchmarks.async_yuk", "--mod", mod,
+                 "--istek", str(args.istek), "--satir", str(args.satir),
+                 "--eszamanlilik", *map(str, args.eszamanlilik)],
+                env=env, check=True, stdout=subprocess.PIPE, text=True,
+            ).stdout
+            sonuclar[mod] = json.loads(cikti.strip().splitlines()[-1])
+
+    print(f"{'eşzamanlılık':>12} {'sync req/s':>12} {'async req/s':>12}")
+    for n in args.eszamanlilik:
+        print(f"{n:>12} {sonuclar['sync'][str(n)]:>12.0f} {sonuclar['async'][str(n)]:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
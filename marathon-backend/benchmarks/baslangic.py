@@ -0,0 +1,111 @@
+# Worker soğuk başlangıcı: her ölçüm yeni bir Python sürecinde yapılır. Süreç başlatmadan
+# istek kabul edilebilir ana kadar geçen süre (hazır), main import'u, yaşam döngüsü başlangıcı
+# ve ardından ilk / ikinci istek turunun süresi (birkaç sık okuma endpointi) medyan olarak
+# yazdırılır. DB_ISINMA kapalı ve açık karşılaştırılır: ısınma başlangıcı uzatır, ilk turu kısaltır.
+#   python -m benchmarks.baslangic --tekrar 7
+#   python -m benchmarks.baslangic --mod async --cikti baslangic.json
+#   python -m benchmarks.baslangic --url mysql+pymysql://...   (şeması kurulmuş yerel MySQL)
+# Not: alt süreç yalnızca uygulamanın import ettiklerini yükler; bu modül üst düzeyde
+# standart kütüphane dışında bir şey import etmez.
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+TOKEN_ANAHTARI = "benchmark-anahtari"
+TUR = ["/ogrenciler/?limit=20", "/ogrenciler/1", "/dersler/1", "/konular/?ids=1,2,3", "/istatistikler/?limit=20"]
+OLCULER = ["hazir_ms", "import_ms", "baslangic_ms", "ilk_tur_ms", "ikinci_tur_ms"]
+
+
+def _ms(t0: float) -> float:
+    return (time.perf_counter() - t0) * 1000
+
+
+async def _tur(client) -> float:
+    t0 = time.perf_counter()
+    for yol in TUR:
+        (await client.get(yol)).raise_for_status()
+    return _ms(t0)
+
+
+async def _cocuk_olc(uygulama, import_ms: float) -> dict:
+    import httpx
+    import oturum
+
+    t0 = time.perf_counter()
+    async with uygulama.app.router.lifespan_context(uygulama.app):
+        sonuc = {"hazir": time.time(), "import_ms": import_ms, "baslangic_ms": _ms(t0)}
+        basliklar = {"Authorization": f"Bearer {oturum.token_olustur(1)}"}
+        transport = httpx.ASGITransport(app=uygulama.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=basliklar) as client:
+            sonuc["ilk_tur_ms"] = await _tur(client)
+            sonuc["ikinci_tur_ms"] = await _tur(client)
+    return sonuc
+
+
+def cocuk():
+    t0 = time.perf_counter()
+    import main as uygulama
+
+    import_ms = _ms(t0)
+    print(json.dumps(asyncio.run(_cocuk_olc(uygulama, import_ms))))
+
+
+def olc(env: dict) -> dict:
+    baslangic = time.time()
+    cikti = subprocess.run([sys.executable, "-m", "benchmarks.baslangic", "--cocuk"], env=env,
+                           capture_output=True, text=True, check=True).stdout
+    sonuc = json.loads(cikti.strip().splitlines()[-1])
+    sonuc["hazir_ms"] = (sonuc.pop("hazir") - baslangic) * 1000
+    return sonuc
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tekrar", type=int, default=5)
+    parser.add_argument("--satir", type=int, default=1000, help="tohumlanan tablo başına satır")
+    parser.add_argument("--url", help="SQLite yerine veritabanı URL'si (şema ve veri hazır olmalı)")
+    parser.add_argument("--mod", choices=["sync", "async"], default="sync")
+    parser.add_argument("--isinma", choices=["0", "1"], nargs="+", default=["0", "1"], help="DB_ISINMA değerleri")
+    parser.add_argument("--cikti", help="sonuç JSON dosyası")
+    parser.add_argument("--cocuk", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.cocuk:
+        return cocuk()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        url = args.url
+        if url is None:
+            from sqlalchemy import create_engine
+            from benchmarks.serilestirme import tohumla
+
+            url = f"sqlite:///{os.path.join(klasor, 'bench.db')}"
+            tohumla(create_engine(url), args.satir)
+        env = dict(os.environ, DATABASE_URL=url, TOKEN_ANAHTARI=TOKEN_ANAHTARI,
+                   KUYRUK_SPOOL=os.path.join(klasor, "kuyruk.ndjson"), BENZER_DIZIN=os.path.join(klasor, "benzer"))
+        if args.mod == "async":
+            from benchmarks.api_yuk import async_url
+
+            env.update(ASYNC_DB="1", ASYNC_DATABASE_URL=async_url(url))
+
+        sonuclar = {}
+        for isinma in args.isinma:
+            env["DB_ISINMA"] = isinma
+            olcumler = [olc(env) for _ in range(args.tekrar)]
+            sonuclar[f"DB_ISINMA={isinma}"] = {o: round(statistics.median(m[o] for m in olcumler), 1) for o in OLCULER}
+
+    print(f"{'':<13}" + "".join(f"{o:>15}" for o in OLCULER))
+    for ad, sonuc in sonuclar.items():
+        print(f"{ad:<13}" + "".join(f"{sonuc[o]:>15.1f}" for o in OLCULER))
+    if args.cikti:
+        with open(args.cikti, "w") as f:
+            json.dump({"mod": args.mod, "tekrar": args.tekrar, "sonuclar": sonuclar}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Benzer soru eşiğinin ve vektör boyutunun kalibrasyonu: etiketli soru çiftleri (aynı soru /
+# kalıbı aynı ama konusu farklı soru) için kosinüs skorları ve eşik taramasında, kök
+# kontrolüyle (benzer.ayni_soru_mu) birlikte kabul edilen çift sayıları yazdırılır.
+# Yanlış kabul (farklı soruya önceki cevabı vermek) kaçırmaktan pahalıdır; eşik, hiç yanlış
+# kabul olmadan en çok aynı soruyu yakalayan değerlerden seçilir.
+# CI kontrolü tests/test_benzer.py'dedir.
+#   python -m benchmarks.benzer_kalibrasyon --boyut 256 1024
+import argparse
+
+import numpy as np
+
+# Aynı soru, farklı ifade
+AYNI = [
+    ("Üçgenin iç açıları toplamı kaçtır?", "Bir üçgenin iç açılarının toplamı kaç derecedir?"),
+    ("Fotosentez nedir?", "Fotosentez ne demektir?"),
+    ("Türkiye'nin başkenti neresidir?", "Türkiye'nin başkenti hangi şehirdir?"),
+    ("Kesirlerde toplama nasıl yapılır?", "Kesirler nasıl toplanır?"),
+    ("Asal sayı nedir?", "Asal sayılar ne demek?"),
+    ("Pisagor teoremi nedir?", "Pisagor teoremini açıklar mısın?"),
+    ("Suyun kaynama noktası kaç derecedir?", "Su kaç derecede kaynar?"),
+    ("Karenin çevresi nasıl hesaplanır?", "Bir karenin çevresini nasıl hesaplarım?"),
+    ("Işığın hızı nedir?", "Işık hızı ne kadardır?"),
+    ("Denklem nasıl çözülür?", "Bir denklemi nasıl çözerim?"),
+    ("Osmanlı Devleti ne zaman kuruldu?", "Osmanlı Devleti hangi yılda kuruldu?"),
+    ("Karenin köşegeni nasıl bulunur?", "Bir karenin köşegenini nasıl bulurum?"),
+    # Sözcük düzeyinde ortak kökü olmayan eş anlamlı ifadeler: yakalanması beklenmez
+    ("Dairenin alanı nasıl hesaplanır?", "Daire alanı nasıl bulunur?"),
+    ("Hücre zarının görevi nedir?", "Hücre zarı ne işe yarar?"),
+]
+# Kalıbı aynı, konusu farklı
+FARKLI = [
+    ("Dairenin alanı nasıl hesaplanır?", "Karenin alanı nasıl hesaplanır?"),
+    ("Türkiye'nin başkenti neresidir?", "Fransa'nın başkenti neresidir?"),
+    ("Karenin çevresi nasıl hesaplanır?", "Karenin alanı nasıl hesaplanır?"),
+    ("Üçgenin iç açıları toplamı kaçtır?", "Dörtgenin iç açıları toplamı kaçtır?"),
+    ("Suyun kaynama noktası kaç derecedir?", "Suyun donma noktası kaç derecedir?"),
+    ("Kesirlerde toplama nasıl yapılır?", "Kesirlerde çarpma nasıl yapılır?"),
+    ("Asal sayı nedir?", "Tek sayı nedir?"),
+    ("Fotosentez nedir?", "Solunum nedir?"),
+    ("Işığın hızı nedir?", "Sesin hızı nedir?"),
+    ("Hücre zarının görevi nedir?", "Hücre çekirdeğinin görevi nedir?"),
+    ("Mitoz bölünme nasıl gerçekleşir?", "Mayoz bölünme nasıl gerçekleşir?"),
+    ("Kesirlerde toplama nasıl yapılır?", "Kesirlerde sadeleştirme nasıl yapılır?"),
+    ("Dünyanın uydusu nedir?", "Dünyanın yarıçapı nedir?"),
+    ("Karenin köşegeni nasıl bulunur?", "Karenin kenarı nasıl bulunur?"),
+    ("Osmanlı Devleti ne zaman kuruldu?", "Cumhuriyet ne zaman kuruldu?"),
+]
+
+
+def skor(a: str, b: str, boyut: int) -> float:
+    from benzer import vektor
+
+    return float(vektor(a, boyut) @ vektor(b, boyut))
+
+
+def kabul_edilen(ciftler: list, esik: float, boyut: int) -> int:
+    from benzer import ayni_soru_mu
+
+    return sum(skor(a, b, boyut) >= esik and ayni_soru_mu(a, b) for a, b in ciftler)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boyut", type=int, nargs="+", default=[256, 1024])
+    args = parser.parse_args()
+
+    from benzer import BENZER_ESIK
+
+    for boyut in args.boyut:
+        print(f"boyut={boyut}")
+        for ad, ciftler in (("aynı", AYNI), ("farklı", FARKLI)):
+            for a, b in ciftler:
+                print(f"  {ad:<7}{skor(a, b, boyut):5.2f}  {a} | {b}")
+        print(f"  {'eşik':>6} {'aynı kabul':>12} {'farklı kabul':>13}")
+        for esik in np.arange(0.3, 0.9, 0.05):
+            isaret = " <- BENZER_ESIK" if abs(esik - BENZER_ESIK) < 1e-9 else ""
+            print(f"  {esik:6.2f} {kabul_edilen(AYNI, esik, boyut):>7}/{len(AYNI):<4} "
+                  f"{kabul_edilen(FARKLI, esik, boyut):>8}/{len(FARKLI)}{isaret}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Benzer soru aramasının gecikmesi: geçici bir dizinde --kayit sentetik soru memmap indekse
+# yazılır (veritabanı olmadan, toplu_ekle ile), sonra kayıtlı soruların hafif değiştirilmiş
+# halleriyle sorgu gecikmesinin p50/p95/p99 değerleri ölçülür. Her sorguda kaynak sorunun
+# ilk sırada dönmesi de kontrol edilir.
+#   python -m benchmarks.benzer_soru --kayit 1000000 --sorgu 200
+import argparse
+import random
+import tempfile
+import time
+import numpy as np
+
+KONULAR = ["üçgen", "türev", "integral", "olasılık", "permütasyon", "logaritma", "limit", "fonksiyon",
+           "hücre bölünmesi", "fotosentez", "kuvvet", "elektrik akımı", "asit baz", "mol kavramı",
+           "osmanlı tarihi", "paragraf", "üslü sayılar", "köklü sayılar", "polinom", "çember"]
+KALIPLAR = ["{k} konusunda {n}. soruyu nasıl çözerim?", "{k} ile ilgili {n} numaralı örneği anlamadım",
+            "{k} sorularında en sık yapılan hata nedir? ({n})", "{n} puanlık {k} sorusunun çözümü nedir?",
+            "{k} için {n} dakikada nasıl tekrar yapabilirim?"]
+
+
+def soru(i: int) -> str:
+    return KALIPLAR[i % len(KALIPLAR)].format(k=KONULAR[(i // len(KALIPLAR)) % len(KONULAR)], n=i // 100)
+
+
+def doldur(indeks, kayit: int, parca: int = 20000) -> float:
+    from benzer import vektor
+
+    meta = indeks._olustur("benchmark")
+    t0 = time.perf_counter()
+    for bas in range(0, kayit, parca):
+        kimlikler = np.arange(bas + 1, min(bas + parca, kayit) + 1, dtype=np.int64)
+        vektorler = np.stack([vektor(soru(int(i) - 1), indeks.boyut) for i in kimlikler])
+        meta = indeks.toplu_ekle(meta, kimlikler, vektorler)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kayit", type=int, default=1000000)
+    parser.add_argument("--sorgu", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    from benzer import BENZER_BOYUT, BenzerIndeks
+
+    with tempfile.TemporaryDirectory() as klasor:
+        indeks = BenzerIndeks(klasor, BENZER_BOYUT)
+        sure = doldur(indeks, args.kayit)
+        print(f"{args.kayit} kayıt indekslendi: {sure:.1f} sn ({args.kayit / sure:.0f} kayıt/sn), "
+              f"matris {BENZER_BOYUT * args.kayit * 4 / 1024 / 1024:.0f} MB")
+
+        rastgele = random.Random(7)
+        sureler, isabet = [], 0
+        for _ in range(args.sorgu):
+            i = rastgele.randrange(args.kayit)
+            metin = soru(i).upper().replace("?", "")
+            t0 = time.perf_counter()
+            sonuclar = indeks.sorgula(metin, k=args.k, esik=0.0)
+            sureler.append(time.perf_counter() - t0)
+            # Aynı metinli kayıtlar (aynı kalıp/konu/sayı) eşit skorlu olabilir
+            isabet += bool(sonuclar) and soru(sonuclar[0][0] - 1) == soru(i)
+        p50, p95, p99 = np.percentile(np.array(sureler) * 1000, [50, 95, 99])
+        print(f"sorgu (k={args.k}): p50 {p50:.1f} ms  p95 {p95:.1f} ms  p99 {p99:.1f} ms  "
+              f"ilk sırada kaynak soru {isabet}/{args.sorgu}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Dışa aktarma endpointlerinin tepe belleğinin tablo boyutundan bağımsız kaldığını doğrular.
+# Büyük bir SQLite tablosu tohumlanır, /istatistikler/export akışı okunup atılırken
+# tracemalloc tepe değeri ölçülür; sınır aşılırsa 1 ile çıkar.
+# CI kontrolü tests/test_disa_aktar.py'dedir; bu betik büyük hacimde ölçüm içindir.
+#   python -m benchmarks.disa_aktar_bellek --satir 200000 --max-mb 16
+import argparse
+import asyncio
+import datetime
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+def tohumla(engine, satir: int):
+    from sqlalchemy import insert
+    import models
+
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for bas in range(0, satir, 20000):
+            conn.execute(insert(models.Istatistikler), [
+                {
+                    "istatistik_tarihi": datetime.date(2025, 1, 1) + datetime.timedelta(days=i % 365),
+                    "istatistik_gunlukcalismaSuresi": (i % 300) / 10,
+                    "istatistik_ortalamaodakPuani": i % 100,
+                    "istatistik_cozulenSoruSayisi": i % 50,
+                    "istatistik_notlar": "not " * (i % 8),
+                    "ogrenci_id": None,
+                }
+                for i in range(bas, min(bas + 20000, satir))
+            ])
+
+
+async def akisi_tuket(app, yol: str, sorgu: str, token: str) -> int:
+    # Uygulama doğrudan ASGI seviyesinde çağrılır; TestClient ve httpx ASGITransport gövdeyi
+    # bellekte biriktirdiği için ölçümü bozar. Gelen parçalar sayılıp atılır.
+    bitti = asyncio.Event()
+    istek_gonderildi = False
+    satir = 0
+
+    async def receive():
+        nonlocal istek_gonderildi
+        if not istek_gonderildi:
+            istek_gonderildi = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await bitti.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(mesaj):
+        nonlocal satir
+        if mesaj["type"] == "http.response.start" and mesaj["status"] != 200:
+            raise RuntimeError(f"{yol} -> HTTP {mesaj['status']}")
+        if mesaj["type"] == "http.response.body":
+            satir += mesaj.get("body", b"").count(b"\n")
+            if not mesaj.get("more_body"):
+                bitti.set()
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": yol, "raw_path": yol.encode(), "root_path": "",
+        "query_string": sorgu.encode(), "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "server": ("bench", 80), "client": ("127.0.0.1", 1234),
+    }
+    await app(scope, receive, send)
+    return satir
+
+
+def olc(app, token: str, bicim: str) -> tuple[int, float, float]:
+    # (satır, sn, tepe MB)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    satir = asyncio.run(akisi_tuket(app, "/istatistikler/export", f"bicim={bicim}", token))
+    sure = time.perf_counter() - t0
+    _, tepe = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return satir, sure, tepe / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--satir", type=int, default=200000)
+    parser.add_argument("--max-mb", type=float, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(klasor, 'bench.db')}"
+        os.environ.setdefault("TOKEN_ANAHTARI", "benchmark-anahtari")
+        import main as uygulama
+        import oturum
+
+        tohumla(uygulama.database.engine, args.satir)
+        token = oturum.token_olustur(1)
+        asildi = False
+        for bicim in ("ndjson", "csv"):
+            satir, sure, tepe = olc(uygulama.app, token, bicim)
+            asildi |= tepe > args.max_mb
+            print(f"{bicim:<7} {satir:>9} satır  {satir / sure:>9.0f} satır/sn  tepe {tepe:6.1f} MB")
+
+    if asildi:
+        print(f"tepe bellek {args.max_mb} MB sınırını aştı")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# Öğrenci başına sorguların planında beklenen indekslerin kullanıldığını doğrular. Sorgular
+# crud fonksiyonları çağrılarak üretilir; engine'den geçen SQL (ORDER BY/LIMIT dahil) aynen
+# yakalanıp EXPLAIN edilir. Sayfalı sorgularda ek sıralama (SQLite "TEMP B-TREE", MySQL
+# "filesort") da hata sayılır; yalnızca tarih aralığı + pk sırası gibi tek indeksle
+# karşılanamayan sorgularda açıkça izin verilir.
+# CI kontrolü tests/test_indeksler.py'dedir (geçici SQLite'a alembic upgrade head).
+#   python -m benchmarks.indeks_kontrol --url mysql+pymysql://...   (şeması kurulu veritabanı, MySQL EXPLAIN)
+# Beklenen indeks kullanılmıyorsa 1 ile çıkar.
+import argparse
+import datetime
+import re
+import sys
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import crud
+from pagination import encode_cursor
+
+
+def sorgular() -> list:
+    # (ad, crud çağrısı, kabul edilen indeksler, sıralamaya izin var mı)
+    bugun = datetime.date.today()
+    once = bugun - datetime.timedelta(days=30)
+    zaman = datetime.datetime.combine(once, datetime.time())
+    return [
+        ("istatistikler ogrenci sayfa", lambda db: crud.get_istatistikler(db, limit=20, ogrenci_id=42),
+         {"ix_istatistikler_ogrenci_id"}, False),
+        ("istatistikler ogrenci cursor",
+         lambda db: crud.get_istatistikler(db, limit=20, ogrenci_id=42, cursor=encode_cursor(100)),
+         {"ix_istatistikler_ogrenci_id"}, False),
+        # Tarih aralığı ve pk sırası tek indekste birleşmez; sıralanan küme öğrencinin aralığıyla sınırlı
+        ("istatistikler ogrenci+tarih",
+         lambda db: crud.get_istatistikler(db, limit=20, ogrenci_id=42, baslangic=once, bitis=bugun),
+         {"ix_istatistikler_ogrenci_tarih", "ix_istatistikler_ogrenci_id"}, True),
+        ("chatbot ogrenci sayfa", lambda db: crud.get_chatbotlar(db, limit=20, ogrenci_id=42),
+         {"ix_chatbotetkilesim_ogrenci_id"}, False),
+        ("chatbot ogrenci+zaman",
+         lambda db: crud.get_chatbotlar(db, limit=20, ogrenci_id=42, baslangic=zaman, bitis=datetime.datetime.now()),
+         {"ix_chatbotetkilesim_ogrenci_zaman", "ix_chatbotetkilesim_ogrenci_id"}, True),
+        ("konular ders+seviye", lambda db: crud.get_konular(db, limit=20, ders_id=3, konu_seviyesi=2),
+         {"ix_konular_ders_seviye"}, False),
+        ("dersler tarih", lambda db: crud.get_dersler(db, limit=20, baslangic=once, bitis=bugun),
+         {"ix_dersler_ders_tarihi"}, True),
+        ("sinav puanlari ogrenci", lambda db: crud.get_sinav_puanlari(db, 42, once, bugun),
+         {"ix_sinavsimilasyonlari_has_ogrenci_ogrenci", "ix_sinavsimilasyonlari_sinav_tarihi"}, True),
+        ("istatistik ozetleri ogrenci", lambda db: crud.get_istatistik_gunluk(db, 42, once, bugun),
+         {"sqlite_autoindex_istatistikozetleri_1", "PRIMARY"}, False),
+    ]
+
+
+def yakala(db, cagri) -> list[tuple]:
+    # Çağrının çalıştırdığı SELECT ifadeleri ve parametreleri
+    ifadeler = []
+
+    def kaydet(conn, cursor, ifade, parametreler, context, executemany):
+        if ifade.lstrip().upper().startswith("SELECT"):
+            ifadeler.append((ifade, parametreler))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", kaydet)
+    try:
+        cagri(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", kaydet)
+    return ifadeler
+
+
+def plan(db, ifade: str, parametreler) -> tuple[set, bool, str]:
+    # (kullanılan indeksler, ek sıralama var mı, plan özeti)
+    baglanti = db.connection()
+    if baglanti.dialect.name == "sqlite":
+        detaylar = [s[-1] for s in baglanti.exec_driver_sql("EXPLAIN QUERY PLAN " + ifade, parametreler)]
+        ozet = "; ".join(detaylar)
+        return set(re.findall(r"INDEX (\S+)", ozet)), "TEMP B-TREE" in ozet, ozet
+    satirlar = baglanti.exec_driver_sql("EXPLAIN " + ifade, parametreler).mappings().all()
+    ozet = "; ".join(f"{s['table']}:{s['key']} {s['Extra'] or ''}".strip() for s in satirlar)
+    return {s["key"] for s in satirlar if s["key"]}, any("filesort" in (s["Extra"] or "") for s in satirlar), ozet
+
+
+def sorgu_kontrol(db, cagri, beklenen: set, siralama_serbest: bool) -> tuple[bool, str]:
+    ifadeler = yakala(db, cagri)
+    ozetler, tamam = [], bool(ifadeler)
+    for ifade, parametreler in ifadeler:
+        indeksler, siralama, ozet = plan(db, ifade, parametreler)
+        tamam &= bool(beklenen & indeksler) and (siralama_serbest or not siralama)
+        ozetler.append(ozet)
+    return tamam, " | ".join(ozetler)
+
+
+def kontrol_et(url: str) -> int:
+    engine = create_engine(url)
+    db = sessionmaker(bind=engine)()
+    hatali = 0
+    try:
+        for ad, cagri, beklenen, siralama_serbest in sorgular():
+            tamam, ozet = sorgu_kontrol(db, cagri, beklenen, siralama_serbest)
+            hatali += not tamam
+            print(f"{'OK ' if tamam else 'YOK'} {ad:<30} {ozet}")
+    finally:
+        db.close()
+        engine.dispose()
+    return hatali
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", required=True, help="şeması kurulu veritabanı")
+    args = parser.parse_args()
+    hatali = kontrol_et(args.url)
+    print(f"{hatali} sorgu beklenen indeksi kullanmıyor" if hatali else "tüm sorgular indeks kullanıyor")
+    sys.exit(1 if hatali else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# Liderlik tablosu işlemlerinin öğrenci sayısıyla ölçeklenmesi: --ogrenci kişilik sıralı
+# tablo kurulur, ardından halka ekleme, sıra, komşular ve ilk N işlemleri işlem başı µs
+# olarak ölçülür. Sıra/komşu/ilk N O(log n) olduğundan n on katına çıkınca neredeyse sabit
+# kalmalı; ekleme geçilen öğrenci sayısıyla (puanlar 0-500 arasında sıkıştıkça) büyür.
+#   python -m benchmarks.liderlik --ogrenci 10000 100000 1000000
+import argparse
+import random
+import time
+
+
+def olc(islem, adet: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(adet):
+        islem(i)
+    return (time.perf_counter() - t0) / adet * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ogrenci", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--islem", type=int, default=20000)
+    args = parser.parse_args()
+
+    from liderlik import SiraliTablo
+
+    print(f"{'öğrenci':>9} {'kurma sn':>9} {'ekle µs':>8} {'sıra µs':>8} {'komşu µs':>9} {'ilk10 µs':>9}")
+    for n in args.ogrenci:
+        rastgele = random.Random(7)
+        t0 = time.perf_counter()
+        tablo = SiraliTablo({o: rastgele.randint(0, 500) for o in range(1, n + 1)})
+        kurma = time.perf_counter() - t0
+        kimlikler = [rastgele.randint(1, n) for _ in range(args.islem)]
+        ekle = olc(lambda i: tablo.ekle(kimlikler[i], rastgele.randint(1, 5)), args.islem)
+        sira = olc(lambda i: tablo.sira(kimlikler[i]), args.islem)
+        komsu = olc(lambda i: tablo.konum(kimlikler[i], 2), args.islem)
+        ilk = olc(lambda i: tablo.ilk(10), args.islem)
+        print(f"{n:>9} {kurma:>9.2f} {ekle:>8.1f} {sira:>8.1f} {komsu:>9.1f} {ilk:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
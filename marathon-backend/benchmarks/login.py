@@ -0,0 +1,84 @@
+# POST /login throughput'u (giriş/sn) ve ham scrypt maliyeti; SIFRE_SCRYPT_* ve
+# SIFRE_HAVUZ_BOYUTU ortam değişkenleriyle farklı maliyetler denenebilir.
+#   python -m benchmarks.login --kullanici 100 --istek 400 --eszamanlilik 1 8 32
+# "eski" satırı base64 kayıtlı kullanıcıların ilk girişini (doğrulama + yeniden hash) ölçer.
+import argparse
+import asyncio
+import datetime
+import os
+import tempfile
+import time
+
+SIFRE = "gizli-sifre-123"
+
+
+def tohumla(engine, kullanici: int, sifre_hash: str):
+    from sqlalchemy import insert
+    import models, sifre
+
+    models.Base.metadata.create_all(bind=engine)
+    simdi = datetime.datetime.now()
+    with engine.begin() as conn:
+        conn.execute(insert(models.Ogrenci), [
+            {
+                "ogrenci_kullaniciAdi": f"ogr{i}",
+                "ogrenci_email": f"ogr{i}@marathon.test",
+                # İlk yarı güncel hash, ikinci yarı frontend'in eski base64 kaydı
+                "ogrenci_sifreHashed": sifre_hash if i < kullanici else sifre.eski_kodlama(f"ogr{i}@marathon.test", SIFRE),
+                "ogrenci_ad": "Ad",
+                "ogrenci_soyad": "Soyad",
+                "ogrenci_dogumTarihi": datetime.date(2011, 1, 1),
+                "ogrenci_sonGuncellemeTarihi": simdi,
+            }
+            for i in range(2 * kullanici)
+        ])
+
+
+async def yuk_uret(app, eszamanlilik: int, epostalar: list[str]) -> float:
+    import httpx
+
+    kalan = iter(epostalar)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def isci():
+            for eposta in kalan:
+                r = await client.post("/login", data={"email": eposta, "password": SIFRE})
+                r.raise_for_status()
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(isci() for _ in range(eszamanlilik)))
+        return len(epostalar) / (time.perf_counter() - t0)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kullanici", type=int, default=100)
+    parser.add_argument("--istek", type=int, default=400)
+    parser.add_argument("--eszamanlilik", type=int, nargs="+", default=[1, 8, 32])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(klasor, 'bench.db')}"
+        os.environ.setdefault("TOKEN_ANAHTARI", "benchmark-anahtari")
+        import main as uygulama
+        import sifre
+
+        t0 = time.perf_counter()
+        sifre_hash = sifre.hashle(SIFRE)
+        hash_ms = (time.perf_counter() - t0) * 1000
+        tohumla(uygulama.database.engine, args.kullanici, sifre_hash)
+
+        print(f"scrypt N={sifre.SIFRE_SCRYPT_N} r={sifre.SIFRE_SCRYPT_R} p={sifre.SIFRE_SCRYPT_P} "
+              f"havuz={sifre.SIFRE_HAVUZ_BOYUTU} tek hash={hash_ms:.1f} ms")
+        print(f"{'eşzamanlılık':>12} {'giriş/sn':>10}")
+        for n in args.eszamanlilik:
+            epostalar = [f"ogr{i % args.kullanici}@marathon.test" for i in range(args.istek)]
+            print(f"{n:>12} {asyncio.run(yuk_uret(uygulama.app, n, epostalar)):>10.1f}")
+
+        eski = [f"ogr{i}@marathon.test" for i in range(args.kullanici, 2 * args.kullanici)]
+        hiz = asyncio.run(yuk_uret(uygulama.app, max(args.eszamanlilik), eski))
+        print(f"{'eski':>12} {hiz:>10.1f}  (ilk giriş, yeniden hash dahil)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Offset ve keyset (cursor) sayfalamanın derin sayfa gecikmesini karşılaştırır.
+#   python -m benchmarks.pagination --satir 200000 --sayfa 1000 --limit 100
+import argparse
+import datetime
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+import crud, models
+from pagination import encode_cursor
+
+
+def tohumla(engine, satir: int):
+    models.Ogrenci.__table__.create(engine)
+    simdi = datetime.datetime.now()
+    with engine.begin() as conn:
+        for bas in range(0, satir, 10000):
+            conn.execute(insert(models.Ogrenci), [
+                {
+                    "ogrenci_kullaniciAdi": f"ogr{i}",
+                    "ogrenci_email": f"ogr{i}@marathon.test",
+                    "ogrenci_sifreHashed": "x",
+                    "ogrenci_ad": "Ad",
+                    "ogrenci_soyad": "Soyad",
+                    "ogrenci_dogumTarihi": datetime.date(2011, 1, 1),
+                    "ogrenci_sonGuncellemeTarihi": simdi,
+                }
+                for i in range(bas, min(bas + 10000, satir))
+            ])
+
+
+def olc(fn, tekrar: int) -> float:
+    sureler = []
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        fn()
+        sureler.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(sureler)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--satir", type=int, default=200000)
+    parser.add_argument("--sayfa", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--tekrar", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        engine = create_engine(f"sqlite:///{os.path.join(klasor, 'bench.db')}")
+        tohumla(engine, args.satir)
+        db = sessionmaker(bind=engine)()
+
+        skip = (args.sayfa - 1) * args.limit
+        # Keyset modunda istemci bir önceki sayfanın son id'sini cursor olarak taşır
+        cursor = encode_cursor(skip)
+
+        offset_sayfa = crud.get_ogrenciler(db, skip=skip, limit=args.limit)
+        cursor_sayfa = crud.get_ogrenciler(db, cursor=cursor, limit=args.limit)
+        assert [o.ogrenci_id for o in offset_sayfa] == [o.ogrenci_id for o in cursor_sayfa]
+
+        offset_ms = olc(lambda: crud.get_ogrenciler(db, skip=skip, limit=args.limit), args.tekrar)
+        cursor_ms = olc(lambda: crud.get_ogrenciler(db, cursor=cursor, limit=args.limit), args.tekrar)
+        db.close()
+        engine.dispose()
+
+    print(f"satir={args.satir} sayfa={args.sayfa} limit={args.limit}")
+    print(f"offset (skip={skip}): {offset_ms:.3f} ms")
+    print(f"cursor            : {cursor_ms:.3f} ms")
+    print(f"hizlanma          : {offset_ms / cursor_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Liste endpointlerinde satır başı maliyet: ORM + response_model yolu ile HIZLI_LISTE yolu.
+# Her kaynak için büyük bir sayfa (limit=--sayfa) iki modda da istenir, yanıtların aynı
+# olduğu kontrol edilir ve satır başı µs yazdırılır.
+#   python -m benchmarks.serilestirme --sayfa 1000 --tekrar 5
+import argparse
+import datetime
+import os
+import statistics
+import tempfile
+import time
+from decimal import Decimal
+
+KAYNAKLAR = [
+    ("/ogrenciler/", "Ogrenci"),
+    ("/dersler/", "Dersler"),
+    ("/konular/", "Konular"),
+    ("/sinavlar/", "SinavSimilasyonlari"),
+    ("/istatistikler/", "Istatistikler"),
+    ("/basarimlar/", "OdullerVeBasarimlar"),
+    ("/chatbot/", "ChatbotEtkilesim"),
+]
+
+
+def _deger(kolon, i: int):
+    # Kolon tipine göre örnek değer; yabancı anahtarlar boş bırakılır
+    if kolon.foreign_keys:
+        return None
+    tip = kolon.type.python_type
+    if tip is int:
+        return i % 100
+    if tip is Decimal:
+        return Decimal(i % 1000) / 10
+    if tip is datetime.datetime:
+        return datetime.datetime(2025, 1, 1) + datetime.timedelta(minutes=i)
+    if tip is datetime.date:
+        return datetime.date(2025, 1, 1) + datetime.timedelta(days=i % 365)
+    uzunluk = getattr(kolon.type, "length", None) or 200
+    return f"{kolon.name[:12]} {i} " + "x" * min(20, uzunluk - 20)
+
+
+def tohumla(engine, satir: int):
+    from sqlalchemy import insert
+    import models
+
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for _, ad in KAYNAKLAR:
+            tablo = getattr(models, ad).__table__
+            kolonlar = [k for k in tablo.columns if not k.primary_key]
+            conn.execute(insert(tablo), [{k.name: _deger(k, i) for k in kolonlar} for i in range(satir)])
+
+
+def olc(client, yol: str, sayfa: int, tekrar: int) -> tuple[float, bytes]:
+    # (satır başı µs medyanı, son yanıt gövdesi)
+    sureler = []
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        yanit = client.get(yol, params={"limit": sayfa})
+        sureler.append(time.perf_counter() - t0)
+        yanit.raise_for_status()
+    return statistics.median(sureler) / sayfa * 1e6, yanit.json()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sayfa", type=int, default=1000)
+    parser.add_argument("--tekrar", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(klasor, 'bench.db')}"
+        os.environ.setdefault("TOKEN_ANAHTARI", "benchmark-anahtari")
+        from fastapi.testclient import TestClient
+        import main as uygulama
+        import hizli, oturum
+
+        tohumla(uygulama.database.engine, args.sayfa)
+        client = TestClient(uygulama.app, headers={"Authorization": f"Bearer {oturum.token_olustur(1)}"})
+
+        print(f"{'kaynak':<16} {'ORM µs/satır':>13} {'hızlı µs/satır':>15} {'kazanç':>7}")
+        for yol, _ in KAYNAKLAR:
+            hizli.HIZLI_LISTE = False
+            once, beklenen = olc(client, yol, args.sayfa, args.tekrar)
+            hizli.HIZLI_LISTE = True
+            sonra, bulunan = olc(client, yol, args.sayfa, args.tekrar)
+            if bulunan != beklenen:
+                raise SystemExit(f"{yol}: hızlı yolun çıktısı response_model çıktısından farklı")
+            print(f"{yol:<16} {once:>13.1f} {sonra:>15.1f} {once / sonra:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
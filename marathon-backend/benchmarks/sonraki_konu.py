@@ -0,0 +1,73 @@
+# Uyarlanabilir konu seçiminin gecikmesi: --konu konu ve --ogrenci öğrenci tohumlanır, her
+# öğrenci bir kez ısıtıldıktan sonra motorun sonraki() çağrısının p50/p99 süresi ölçülür
+# (DB'ye gitmeden; eşitleme aralığı içinde). Sınır aşılırsa 1 ile çıkar.
+#   python -m benchmarks.sonraki_konu --konu 50000 --ogrenci 2000 --max-us 1000
+import argparse
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+import numpy as np
+
+
+def tohumla(engine, konu: int, ogrenci: int):
+    from sqlalchemy import insert
+    import models
+
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(models.Dersler), [{"ders_adi": f"ders {i}"} for i in range(20)])
+        conn.execute(insert(models.Konular), [
+            {"konu_adi": f"konu {i}", "konu_seviyesi": 1 + i % 10, "ders_id": 1 + i % 20} for i in range(konu)
+        ])
+        conn.execute(insert(models.Ogrenci), [
+            {"ogrenci_kullaniciAdi": f"o{i}", "ogrenci_email": f"o{i}@ornek.com", "ogrenci_sifreHashed": "x",
+             "ogrenci_ad": "Ad", "ogrenci_soyad": "Soyad", "ogrenci_dogumTarihi": datetime.date(2010, 1, 1),
+             "ogrenci_mevcutSeviye": 1 + i % 10, "ogrenci_basariOrani": i % 100, "ogrenci_dikkatSeviyesi": (i * 7) % 100,
+             "ogrenci_sonGuncellemeTarihi": datetime.datetime(2025, 1, 1)}
+            for i in range(ogrenci)
+        ])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--konu", type=int, default=50000)
+    parser.add_argument("--ogrenci", type=int, default=2000)
+    parser.add_argument("--istek", type=int, default=100000)
+    parser.add_argument("--max-us", type=float, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(klasor, 'bench.db')}"
+        os.environ.setdefault("TOKEN_ANAHTARI", "benchmark-anahtari")
+        import main as uygulama
+        import crud, uyarlama
+
+        tohumla(uygulama.database.engine, args.konu, args.ogrenci)
+        db = uygulama.database.SessionLocal()
+        ogrenciler = [crud.get_ogrenci(db, i) for i in range(1, args.ogrenci + 1)]
+        t0 = time.perf_counter()
+        for ogrenci in ogrenciler:
+            uyarlama.MOTOR.sonraki(db, ogrenci)
+        print(f"indeks + {args.ogrenci} öğrenci ısıtma: {time.perf_counter() - t0:.2f} sn")
+
+        rastgele = random.Random(7)
+        sureler = np.empty(args.istek)
+        for i in range(args.istek):
+            ogrenci, ders_id = rastgele.choice(ogrenciler), rastgele.choice([None, rastgele.randint(1, 20)])
+            t0 = time.perf_counter()
+            uyarlama.MOTOR.sonraki(db, ogrenci, ders_id=ders_id)
+            sureler[i] = time.perf_counter() - t0
+        db.close()
+
+    p50, p99 = np.percentile(sureler * 1e6, [50, 99])
+    print(f"sonraki(): p50 {p50:.1f} µs  p99 {p99:.1f} µs  ({args.istek} istek)")
+    if p99 > args.max_us:
+        print(f"p99 {args.max_us} µs sınırını aştı")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# İlişki endpointlerinde N+1 kontrolü: her endpoint az ilişkili ve çok ilişkili bir kayıt için
+# çağrılır, engine üzerinden çalışan SQL ifadeleri sayılır. Sayı ilişki adedine bağlıysa ya
+# da beklenen üst sınırı aşarsa 1 ile çıkar. Okuma önbelleği kapalı. CI kontrolü
+# tests/test_sorgu_sayisi.py'dedir; bu betik daha büyük ilişki sayılarını denemek içindir.
+#   python -m benchmarks.sorgu_sayisi --iliski 50
+import argparse
+import datetime
+import os
+import sys
+import tempfile
+
+# (yol şablonu, beklenen en fazla ifade sayısı); {az}/{cok} ilişki sayısı farklı iki kayıt
+ENDPOINTLER = [
+    ("/ogrenciler/{}/iliskiler", 4),
+    ("/ogrenciler/{}/dersler", 2),
+    ("/ogrenciler/{}/sinavlar", 2),
+    ("/ogrenciler/{}/basarimlar", 2),
+    ("/dersler/{}/ogrenciler", 2),
+    ("/sinavlar/{}/ogrenciler", 2),
+    ("/basarimlar/{}/ogrenciler", 2),
+]
+
+
+def tohumla(engine, iliski: int):
+    # Kayıt 1: tek ilişki, kayıt 2: --iliski ilişki (her iki yönde)
+    from sqlalchemy import insert
+    import models
+
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(models.Ogrenci), [
+            {"ogrenci_kullaniciAdi": f"o{i}", "ogrenci_email": f"o{i}@ornek.com", "ogrenci_sifreHashed": "x",
+             "ogrenci_ad": "Ad", "ogrenci_soyad": "Soyad", "ogrenci_dogumTarihi": datetime.date(2010, 1, 1),
+             "ogrenci_sonGuncellemeTarihi": datetime.datetime(2025, 1, 1)}
+            for i in range(iliski + 1)
+        ])
+        conn.execute(insert(models.Dersler), [{"ders_adi": f"ders {i}"} for i in range(iliski + 1)])
+        conn.execute(insert(models.SinavSimilasyonlari), [{"sinav_adi": f"sınav {i}"} for i in range(iliski + 1)])
+        conn.execute(insert(models.OdullerVeBasarimlar), [{"basarim_adi": f"başarım {i}"} for i in range(iliski + 1)])
+        ciftler = [(1, 1)] + [(2, k) for k in range(2, iliski + 2)] + [(k, 2) for k in range(3, iliski + 2)]
+        for bag, anahtar in ((models.Dersler_has_Ogrenci, "ders_id"),
+                             (models.SinavSimilasyonlari_has_Ogrenci, "sinav_id"),
+                             (models.OdullerVeBasarimlar_has_Ogrenci, "basarim_id")):
+            conn.execute(insert(bag), [{"ogrenci_id": o, anahtar: k} for o, k in ciftler])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iliski", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(klasor, 'bench.db')}"
+        os.environ.setdefault("TOKEN_ANAHTARI", "benchmark-anahtari")
+        from fastapi.testclient import TestClient
+        from sqlalchemy import event
+        import main as uygulama
+        import hizli, onbellek, oturum
+
+        tohumla(uygulama.database.engine, args.iliski)
+        onbellek.ayarla(None)
+        sayac = [0]
+        event.listen(uygulama.database.engine, "before_cursor_execute", lambda *a: sayac.__setitem__(0, sayac[0] + 1))
+        client = TestClient(uygulama.app)
+
+        hatali = False
+        for hizli_liste in (False, True):
+            hizli.HIZLI_LISTE = hizli_liste
+            for sablon, beklenen in ENDPOINTLER:
+                sayilar = []
+                for kimlik in (1, 2):
+                    sayac[0] = 0
+                    yanit = client.get(sablon.format(kimlik), params={"limit": args.iliski},
+                                       headers={"Authorization": f"Bearer {oturum.token_olustur(kimlik)}"})
+                    yanit.raise_for_status()
+                    sayilar.append(sayac[0])
+                durum = "ok" if sayilar[0] == sayilar[1] <= beklenen else "HATA"
+                hatali |= durum != "ok"
+                print(f"{'hızlı' if hizli_liste else 'orm':<6} {sablon:<28} 1 ilişki: {sayilar[0]} sorgu  "
+                      f"{args.iliski} ilişki: {sayilar[1]} sorgu  (en fazla {beklenen})  {durum}")
+
+    if hatali:
+        print("ilişki sayısına bağlı sorgu sayısı (N+1) ya da beklenenden fazla sorgu")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# Tek satırlık POST /istatistikler/ ile POST /istatistikler/batch yolunun satır/sn karşılaştırması.
+#   python -m benchmarks.toplu_ekleme --satir 2000
+import argparse
+import datetime
+import json
+import os
+import tempfile
+import time
+
+
+def kayit(i: int) -> dict:
+    return {
+        "istatistik_tarihi": (datetime.date(2025, 1, 1) + datetime.timedelta(days=i % 365)).isoformat(),
+        "istatistik_gunlukcalismaSuresi": (i % 300) / 10,
+        "istatistik_tamamlananModulSayisi": i % 10,
+        "istatistik_ortalamaodakPuani": i % 100,
+        "istatistik_cozulenSoruSayisi": i % 50,
+        "istatistik_dogruCevapOrani": (i % 100) / 100,
+        "istatistik_kazanilanHalkaSayisi": i % 5,
+        "istatistik_molaSayisi": i % 4,
+        "istatistik_toplamMolaSuresi": i % 30,
+        "istatistik_uykuKalitesi": i % 10,
+        "istatistik_notlar": None,
+        "ogrenci_id": None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--satir", type=int, default=2000)
+    parser.add_argument("--parti", type=int, default=1000, help="batch isteği başına kayıt")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(klasor, 'bench.db')}"
+        os.environ.setdefault("TOKEN_ANAHTARI", "benchmark-anahtari")
+        from fastapi.testclient import TestClient
+        import main as uygulama
+        import models, oturum
+
+        models.Base.metadata.create_all(bind=uygulama.database.engine)
+        client = TestClient(uygulama.app, headers={"Authorization": f"Bearer {oturum.token_olustur(1)}"})
+        kayitlar = [kayit(i) for i in range(args.satir)]
+
+        t0 = time.perf_counter()
+        for k in kayitlar:
+            client.post("/istatistikler/", json=k).raise_for_status()
+        tekli = args.satir / (time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        for bas in range(0, args.satir, args.parti):
+            client.post("/istatistikler/batch", json=kayitlar[bas:bas + args.parti]).raise_for_status()
+        toplu_json = args.satir / (time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        for bas in range(0, args.satir, args.parti):
+            govde = "\n".join(json.dumps(k) for k in kayitlar[bas:bas + args.parti])
+            client.post("/istatistikler/batch", content=govde,
+                        headers={"Content-Type": "application/x-ndjson"}).raise_for_status()
+        toplu_ndjson = args.satir / (time.perf_counter() - t0)
+
+    print(f"satir={args.satir} parti={args.parti}")
+    print(f"tekli POST      : {tekli:>10.0f} satır/sn")
+    print(f"batch (JSON)    : {toplu_json:>10.0f} satır/sn ({toplu_json / tekli:.1f}x)")
+    print(f"batch (NDJSON)  : {toplu_ndjson:>10.0f} satır/sn ({toplu_ndjson / tekli:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
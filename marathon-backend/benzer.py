@@ -0,0 +1,268 @@
+import json
+import math
+import os
+import re
+import threading
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional
+import numpy as np
+from sqlalchemy import select
+import models
+import db as database
+from arama import normalize
+
+try:
+    import fcntl
+except ImportError:  # Windows: dosya kilidi yok, tek worker varsayılır
+    fcntl = None
+
+# Chatbot için benzer soru önbelleği. chatbot_soruMetni soru kalıbı kelimeleri ("nedir",
+# "nasıl", "kaç"...) atılarak kelime kökü (ilk KOK_UZUNLUGU harf; Türkçe ekleri kırpar) ve
+# kelime içi karakter 3-gram özellikleriyle sabit boyutlu vektöre hash'lenir (signed feature
+# hashing, alt-doğrusal tf, L2 normu 1), vektörler diskteki memmap matriste tutulur. Yeni soru
+# geldiğinde kosinüs benzerliği eşik üstü adaylar bulunur; aday ancak iki soru arasında
+# yer değiştiren içerik kökü yoksa (ayni_soru_mu: "Dairenin alanı" / "Karenin alanı" elenir,
+# "Üçgenin iç açıları" / "Bir üçgenin iç açılarının ... derecedir" kalır) önceki
+# chatbot_cevapMetni ile yanıtlanabilir sayılır. Tek başına kosinüs bunu ayıramaz: 3-5 kelimelik
+# sorularda tek kelime değişimi de tek kelime eklemesi kadar yüksek skor alır.
+# Eşik ve boyut benchmarks/benzer_kalibrasyon.py'deki etiketli çiftlerle seçildi: bu eşikte
+# 1024 boyut 256'dan fazlasını yakalamıyor, matris 4 kat büyüyor.
+# Matris boyut x kapasite (sütun = kayıt) yerleşimindedir: sorgu vektörünün yalnızca sıfır
+# olmayan boyutlarının satırları okunur, 1M kayıtta bile taranan veri matrisin küçük bir kısmıdır.
+# Dosyalar worker'lar arasında paylaşılır; yazma (esitle) dosya kilidiyle tek seferde bir
+# süreçte yapılır, meta.json atomik değiştirilir.
+BENZER_DIZIN = os.getenv("BENZER_DIZIN", os.path.join(os.path.dirname(os.path.abspath(__file__)), "veri", "benzer"))
+BENZER_BOYUT = int(os.getenv("BENZER_BOYUT", "256"))
+BENZER_ESIK = float(os.getenv("BENZER_ESIK", "0.4"))
+BENZER_ILK_KAPASITE = 1024
+NGRAM = 3
+NGRAM_AGIRLIK = 0.15
+KOK_UZUNLUGU = 4
+# Özellik çıkarımı değişince artırılır; diskteki farklı sürüm vektörler yeniden hesaplanır
+OZELLIK_SURUMU = 2
+# Kök kontrolünde elenecek adaylar için sorgudan fazladan okunan aday oranı
+ADAY_CARPANI = 4
+SORGU_DILIMI = 4096
+# Soru kalıbı kelimeleri (normalize edilmiş): anlam taşımaz, farklı konulardaki soruları benzer gösterir
+DURAK_KELIMELER = frozenset(
+    "ne nedir nelerdir neresidir nerededir nasil kac kactir hangi hangisi kim kimdir zaman "
+    "bir mi mu misin musun midir mudur ile ve veya de da ki icin gibi kadar kadardir "
+    "demek demektir".split())
+_KELIME = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=200000)
+def _ozellik(parca: str, boyut: int) -> tuple[int, float]:
+    # Süreçler arası kararlı hash (PYTHONHASHSEED'den bağımsız): boyut indeksi ve işaret
+    h = zlib.crc32(parca.encode())
+    return h % boyut, (1.0 if h & 0x80000000 else -1.0)
+
+
+def icerik_kelimeleri(metin: Optional[str]) -> list[str]:
+    return [k for k in _KELIME.findall(normalize(metin or "")) if k not in DURAK_KELIMELER]
+
+
+def vektor(metin: Optional[str], boyut: int = BENZER_BOYUT) -> np.ndarray:
+    # Kök özellikleri "#" önekli; kelimeler arası 3-gram yok (kalıp ekleri "nin alanı" eşleşmesin)
+    parcalar = Counter()
+    for k in icerik_kelimeleri(metin):
+        parcalar["#" + k[:KOK_UZUNLUGU]] += 1
+        dizi = f" {k} "
+        parcalar.update(dizi[i:i + NGRAM] for i in range(len(dizi) - NGRAM + 1))
+    v = np.zeros(boyut, dtype=np.float32)
+    for parca, adet in parcalar.items():
+        indeks, isaret = _ozellik(parca, boyut)
+        agirlik = 1.0 if parca.startswith("#") else NGRAM_AGIRLIK
+        v[indeks] += isaret * agirlik * (1.0 + math.log(adet))
+    norm = np.linalg.norm(v)
+    return v / norm if norm else v
+
+
+def _kok_eslesir(a: str, b: str) -> bool:
+    # Ek farkı ("kare"/"karen") ya da kök sonu yumuşaması ("isik"/"isig", "cozu"/"coze")
+    return a.startswith(b) or b.startswith(a) or (min(len(a), len(b)) >= KOK_UZUNLUGU and a[:3] == b[:3])
+
+
+def ayni_soru_mu(a: Optional[str], b: Optional[str]) -> bool:
+    # Yalnızca bir tarafta fazladan içerik kökü olabilir; iki tarafta da karşılıksız kök varsa
+    # bir kelime yer değiştirmiştir (farklı soru)
+    ka = {k[:KOK_UZUNLUGU] for k in icerik_kelimeleri(a)}
+    kb = {k[:KOK_UZUNLUGU] for k in icerik_kelimeleri(b)}
+    fazla_a = any(not any(_kok_eslesir(x, y) for y in kb) for x in ka)
+    fazla_b = any(not any(_kok_eslesir(y, x) for x in ka) for y in kb)
+    return bool(ka and kb) and not (fazla_a and fazla_b)
+
+
+class BenzerIndeks:
+    def __init__(self, dizin: str = BENZER_DIZIN, boyut: int = BENZER_BOYUT):
+        self.dizin = dizin
+        self.boyut = boyut
+        self._kilit = threading.Lock()
+        self._meta = None
+        self._vektorler = None  # memmap (boyut, kapasite)
+        self._kimlikler = None  # memmap (kapasite,)
+
+    def _yol(self, ad: str) -> str:
+        return os.path.join(self.dizin, ad)
+
+    @contextmanager
+    def _dosya_kilidi(self):
+        os.makedirs(self.dizin, exist_ok=True)
+        with open(self._yol("kilit"), "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _meta_oku(self) -> Optional[dict]:
+        try:
+            with open(self._yol("meta.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _meta_yaz(self, meta: dict):
+        gecici = self._yol(f"meta.json.{os.getpid()}")
+        with open(gecici, "w") as f:
+            json.dump(meta, f)
+        os.replace(gecici, self._yol("meta.json"))
+        self._meta = meta
+
+    def _ac(self, meta: dict, mod: str = "r"):
+        kapasite = meta["kapasite"]
+        self._vektorler = np.memmap(self._yol("vektorler.f32"), dtype=np.float32, mode=mod, shape=(self.boyut, kapasite))
+        self._kimlikler = np.memmap(self._yol("kimlikler.i64"), dtype=np.int64, mode=mod, shape=(kapasite,))
+        self._meta = meta
+
+    def _guncel(self) -> Optional[dict]:
+        # Başka bir süreç kayıt eklediyse/büyüttüyse eşlemeyi yenile
+        meta = self._meta_oku()
+        if meta is None or meta.get("boyut") != self.boyut or meta.get("surum") != OZELLIK_SURUMU:
+            return None
+        if self._meta is None or self._vektorler is None or meta["kapasite"] != self._meta["kapasite"]:
+            self._ac(meta)
+        self._meta = meta
+        return meta
+
+    def _olustur(self, kaynak: str) -> dict:
+        meta = {"boyut": self.boyut, "surum": OZELLIK_SURUMU, "adet": 0, "kapasite": BENZER_ILK_KAPASITE,
+                "son_id": 0, "kaynak": kaynak}
+        for ad, boyut in (("vektorler.f32", self.boyut * 4), ("kimlikler.i64", 8)):
+            with open(self._yol(ad), "wb") as f:
+                f.truncate(meta["kapasite"] * boyut)
+        self._meta_yaz(meta)
+        return meta
+
+    def _buyut(self, meta: dict, gereken: int) -> dict:
+        # Sütun yerleşiminde kapasite artışı yeniden yazım gerektirir; ikiye katlanarak amortize edilir
+        kapasite = meta["kapasite"]
+        while kapasite < gereken:
+            kapasite *= 2
+        self._ac(meta)
+        adet = meta["adet"]
+        gecici = self._yol(f"vektorler.f32.{os.getpid()}")
+        yeni = np.memmap(gecici, dtype=np.float32, mode="w+", shape=(self.boyut, kapasite))
+        yeni[:, :adet] = self._vektorler[:, :adet]
+        yeni.flush()
+        del yeni
+        os.replace(gecici, self._yol("vektorler.f32"))
+        with open(self._yol("kimlikler.i64"), "r+b") as f:
+            f.truncate(kapasite * 8)
+        meta = dict(meta, kapasite=kapasite)
+        self._ac(meta, "r+")
+        return meta
+
+    def toplu_ekle(self, meta: dict, kimlikler, vektorler: np.ndarray) -> dict:
+        # vektorler: (adet, boyut); dosya kilidi altında çağrılır
+        m = len(kimlikler)
+        if not m:
+            return meta
+        adet = meta["adet"]
+        if adet + m > meta["kapasite"]:
+            meta = self._buyut(meta, adet + m)
+        elif self._vektorler is None or self._vektorler.mode != "r+" or self._meta["kapasite"] != meta["kapasite"]:
+            self._ac(meta, "r+")
+        self._vektorler[:, adet:adet + m] = vektorler.T
+        self._kimlikler[adet:adet + m] = kimlikler
+        meta = dict(meta, adet=adet + m, son_id=int(max(meta["son_id"], kimlikler[-1])))
+        self._meta_yaz(meta)
+        return meta
+
+    def esitle(self, db, parca: int = 10000):
+        # pk > son_id olan sorular eklenir: create_chatbot, toplu ekleme ve diğer worker'lar tek yoldan
+        # Sürücü adı atılır: async modda sync ve aiosqlite/aiomysql oturumları aynı kaynaktır
+        url = db.get_bind().url
+        kaynak = url.set(drivername=url.get_backend_name()).render_as_string(hide_password=True)
+        pk = models.ChatbotEtkilesim.chatbot_id
+        with self._kilit, self._dosya_kilidi():
+            meta = self._meta_oku()
+            if (meta is None or meta.get("boyut") != self.boyut or meta.get("surum") != OZELLIK_SURUMU
+                    or meta.get("kaynak") != kaynak):
+                # Farklı veritabanı, boyut veya özellik sürümü: eski vektörler geçersiz
+                self._vektorler = self._kimlikler = None
+                meta = self._olustur(kaynak)
+            sorgu = (select(pk, models.ChatbotEtkilesim.chatbot_soruMetni)
+                     .filter(pk > meta["son_id"]).order_by(pk).execution_options(yield_per=parca))
+            for satirlar in db.execute(sorgu).partitions():
+                kimlikler = np.fromiter((s[0] for s in satirlar), dtype=np.int64, count=len(satirlar))
+                vektorler = np.stack([vektor(s[1], self.boyut) for s in satirlar])
+                meta = self.toplu_ekle(meta, kimlikler, vektorler)
+
+    def kayit_ekle(self, db=None):
+        # create_chatbot sonrası; indeks henüz hiç kurulmadıysa ilk benzer soru sorgusunda kurulur.
+        # db verilmezse (async yol, threadpool'dan) ayrı bir sync oturum açılır
+        if not os.path.exists(self._yol("meta.json")):
+            return
+        if db is not None:
+            return self.esitle(db)
+        with database.SessionLocal() as db:
+            self.esitle(db)
+
+    def sorgula(self, metin: str, k: int = 5, esik: float = BENZER_ESIK) -> list[tuple[int, float]]:
+        # [(chatbot_id, kosinüs)] benzerlik azalan, yalnızca eşik üstü
+        q = vektor(metin, self.boyut)
+        boyutlar = np.flatnonzero(q)
+        with self._kilit:
+            meta = self._guncel()
+            if meta is None or not meta["adet"] or not len(boyutlar) or k <= 0:
+                return []
+            n = meta["adet"]
+            # Önbelleğe sığan sütun dilimleri: yalnızca sorgunun boyut satırları toplanıp gemv
+            qz = q[boyutlar]
+            skorlar = np.empty(n, dtype=np.float32)
+            for bas in range(0, n, SORGU_DILIMI):
+                son = min(bas + SORGU_DILIMI, n)
+                skorlar[bas:son] = qz @ self._vektorler[boyutlar, bas:son]
+            k = min(k, n)
+            adaylar = np.argpartition(skorlar, n - k)[n - k:]
+            adaylar = adaylar[skorlar[adaylar] >= esik]
+            adaylar = adaylar[np.argsort(-skorlar[adaylar], kind="stable")]
+            return [(int(self._kimlikler[i]), float(skorlar[i])) for i in adaylar]
+
+    def ozet(self) -> dict:
+        meta = self._meta_oku() or {}
+        return {"kayit": meta.get("adet", 0), "kapasite": meta.get("kapasite", 0),
+                "son_id": meta.get("son_id", 0), "boyut": self.boyut, "surum": meta.get("surum"),
+                "esik": BENZER_ESIK}
+
+
+CHATBOT = BenzerIndeks()
+
+
+def benzer_sorular(db, metin: str, k: int = 5, esik: Optional[float] = None):
+    # Sıralı (chatbot nesnesi, benzerlik); nesneler tek IN sorgusuyla yüklenir
+    CHATBOT.esitle(db)
+    # Kök kontrolünde elenenler yerine sonraki adaylar gelsin diye fazladan aday okunur
+    sonuclar = CHATBOT.sorgula(metin, k=k * ADAY_CARPANI, esik=BENZER_ESIK if esik is None else esik)
+    if not sonuclar:
+        return []
+    pk = models.ChatbotEtkilesim.chatbot_id
+    nesneler = {n.chatbot_id: n for n in db.query(models.ChatbotEtkilesim).filter(pk.in_([i for i, _ in sonuclar]))}
+    return [(nesneler[i], skor) for i, skor in sonuclar
+            if i in nesneler and ayni_soru_mu(metin, nesneler[i].chatbot_soruMetni)][:k]
@@ -1,61 +1,211 @@
-from sqlalchemy.orm import Session
-import models, schemas
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session, selectinload
+import models, schemas, arama, benzer, liderlik, onbellek, rollup, sifre, uyarlama
+from pagination import idlere_gore_sirala, sayfala
+from toplu import TOPLU_PARCA_BOYUTU
+
+# Tekil okumalar (ogrenci, ders, konu) önbellekten şema nesnesi olarak döner;
+# create_*/update_ogrenci ilgili anahtarı geçersiz kılar.
+def onbellekten_oku(anahtar: str, sema, yukle):
+    veri = onbellek.getir(anahtar)
+    if veri is not None:
+        return sema.model_validate(veri)
+    nesne = yukle()
+    if nesne is None:
+        return None
+    sonuc = sema.model_validate(nesne)
+    onbellek.koy(anahtar, sonuc.model_dump(mode="json"))
+    return sonuc
+
+# Liste fonksiyonlarına kolonlar verilirse (hizli.py) ORM nesnesi yerine yalnızca bu
+# kolonların satırları döner
+def _kaynak(db: Session, model, kolonlar=None):
+    return db.query(*kolonlar) if kolonlar else db.query(model)
+
+# ?ids= toplu okuma: kaynak başına tek IN sorgusu, sonuç istek sırasında
+def get_by_ids(db: Session, model, idler: list[int], kolonlar=None):
+    pk = model.__mapper__.primary_key[0]
+    return idlere_gore_sirala(_kaynak(db, model, kolonlar).filter(pk.in_(idler)).all(), pk.key, idler)
 
 # Ogrenci
 
 def get_ogrenci(db: Session, ogrenci_id: int):
-    return db.query(models.Ogrenci).filter(models.Ogrenci.ogrenci_id == ogrenci_id).first()
+    return onbellekten_oku(f"ogrenci:{ogrenci_id}", schemas.Ogrenci,
+                           lambda: db.query(models.Ogrenci).filter(models.Ogrenci.ogrenci_id == ogrenci_id).first())
 
 def get_ogrenci_by_email(db: Session, email: str):
     return db.query(models.Ogrenci).filter(models.Ogrenci.ogrenci_email == email).first()
 
-def get_ogrenciler(db: Session, skip: int = 0, limit: int = 10):
-    return db.query(models.Ogrenci).offset(skip).limit(limit).all()
+def get_ogrenciler(db: Session, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, kolonlar=None):
+    return sayfala(_kaynak(db, models.Ogrenci, kolonlar), models.Ogrenci.ogrenci_id,
+                   skip=skip, limit=limit, cursor=cursor)
 
 def create_ogrenci(db: Session, ogrenci: schemas.OgrenciCreate):
-    db_ogrenci = models.Ogrenci(**ogrenci.model_dump())
+    db_ogrenci = models.Ogrenci(**ogrenci.model_dump(exclude={"ogrenci_sifre"}),
+                                ogrenci_sifreHashed=sifre.hashle(ogrenci.ogrenci_sifre))
     db.add(db_ogrenci)
     db.commit()
     db.refresh(db_ogrenci)
+    onbellek.gecersiz_kil(f"ogrenci:{db_ogrenci.ogrenci_id}")
     return db_ogrenci
 
-def update_ogrenci(db: Session, ogrenci_id: int, ogrenci_update: schemas.OgrenciCreate):
+def update_ogrenci(db: Session, ogrenci_id: int, ogrenci_update: schemas.OgrenciUpdate):
     db_ogrenci = db.query(models.Ogrenci).filter(models.Ogrenci.ogrenci_id == ogrenci_id).first()
     if db_ogrenci:
-        for key, value in ogrenci_update.model_dump(exclude_unset=True).items():
+        for key, value in ogrenci_update.model_dump(exclude_unset=True, exclude={"ogrenci_sifre"}).items():
             setattr(db_ogrenci, key, value)
+        if ogrenci_update.ogrenci_sifre:
+            db_ogrenci.ogrenci_sifreHashed = sifre.hashle(ogrenci_update.ogrenci_sifre)
+        # Satır sürümü (ETag/Last-Modified): istemcinin gönderdiği değer değil sunucu zamanı
+        db_ogrenci.ogrenci_sonGuncellemeTarihi = datetime.now()
         db.commit()
         db.refresh(db_ogrenci)
+        onbellek.gecersiz_kil(f"ogrenci:{ogrenci_id}")
+        uyarlama.MOTOR.ogrenci_unut(ogrenci_id)
     return db_ogrenci
 
+# Girişte eski/eski parametreli şifre kaydını yeni hash ile değiştirir
+def update_ogrenci_sifre(db: Session, ogrenci_id: int, sifre_hash: str):
+    db.query(models.Ogrenci).filter(models.Ogrenci.ogrenci_id == ogrenci_id).update(
+        {models.Ogrenci.ogrenci_sifreHashed: sifre_hash}, synchronize_session=False)
+    db.commit()
+
+# Öğrenci ve tüm ilişkileri sabit sayıda sorguda: öğrenci + ilişki başına bir IN sorgusu
+def get_ogrenci_iliskileri(db: Session, ogrenci_id: int):
+    return (
+        db.query(models.Ogrenci)
+        .options(selectinload(models.Ogrenci.dersler), selectinload(models.Ogrenci.sinavlar),
+                 selectinload(models.Ogrenci.basarimlar))
+        .filter(models.Ogrenci.ogrenci_id == ogrenci_id)
+        .first()
+    )
+
+# Bağ tablosu üzerinden tek JOIN'li, sayfalı ilişki listeleri (her iki yön)
+def _bagli_kayitlar(db: Session, model, bag, filtre_kolonu: str, kimlik: int, skip: int, limit: int,
+                    cursor: Optional[str], kolonlar=None):
+    pk = model.__mapper__.primary_key[0]
+    query = (_kaynak(db, model, kolonlar).join(bag, getattr(bag, pk.key) == pk)
+             .filter(getattr(bag, filtre_kolonu) == kimlik))
+    return sayfala(query, pk, skip=skip, limit=limit, cursor=cursor)
+
+def get_ogrenci_dersleri(db: Session, ogrenci_id: int, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, kolonlar=None):
+    return _bagli_kayitlar(db, models.Dersler, models.Dersler_has_Ogrenci, "ogrenci_id", ogrenci_id, skip, limit, cursor, kolonlar)
+
+def get_ogrenci_sinavlari(db: Session, ogrenci_id: int, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, kolonlar=None):
+    return _bagli_kayitlar(db, models.SinavSimilasyonlari, models.SinavSimilasyonlari_has_Ogrenci, "ogrenci_id", ogrenci_id, skip, limit, cursor, kolonlar)
+
+def get_ogrenci_basarimlari(db: Session, ogrenci_id: int, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, kolonlar=None):
+    return _bagli_kayitlar(db, models.OdullerVeBasarimlar, models.OdullerVeBasarimlar_has_Ogrenci, "ogrenci_id", ogrenci_id, skip, limit, cursor, kolonlar)
+
+def get_ders_ogrencileri(db: Session, ders_id: int, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, kolonlar=None):
+    return _bagli_kayitlar(db, models.Ogrenci, models.Dersler_has_Ogrenci, "ders_id", ders_id, skip, limit, cursor, kolonlar)
+
+def get_sinav_ogrencileri(db: Session, sinav_id: int, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, kolonlar=None):
+    return _bagli_kayitlar(db, models.Ogrenci, models.SinavSimilasyonlari_has_Ogrenci, "sinav_id", sinav_id, skip, limit, cursor, kolonlar)
+
+def get_basarim_ogrencileri(db: Session, basarim_id: int, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, kolonlar=None):
+    return _bagli_kayitlar(db, models.Ogrenci, models.OdullerVeBasarimlar_has_Ogrenci, "basarim_id", basarim_id, skip, limit, cursor, kolonlar)
+
+# Toplu ekleme: kayıtlar (index, dict) çiftleri; her parça tek çok satırlı INSERT ve tek
+# transaction. Bir parça hata verirse hatalı kayıtları bulmak için tek tek denenir.
+# ayni_transaction verilirse eklenen kayıtlarla commit'ten önce çağrılır (ör. rollup).
+def toplu_ekle(db: Session, model, kayitlar, parca_boyutu: int = TOPLU_PARCA_BOYUTU, ayni_transaction=None):
+    eklenen, hatalar = 0, []
+    for bas in range(0, len(kayitlar), parca_boyutu):
+        parca = kayitlar[bas:bas + parca_boyutu]
+        try:
+            db.execute(insert(model), [kayit for _, kayit in parca])
+            if ayni_transaction is not None:
+                ayni_transaction(db, [kayit for _, kayit in parca])
+            db.commit()
+            eklenen += len(parca)
+            continue
+        except SQLAlchemyError:
+            db.rollback()
+        for index, kayit in parca:
+            try:
+                db.execute(insert(model), [kayit])
+                if ayni_transaction is not None:
+                    ayni_transaction(db, [kayit])
+                db.commit()
+                eklenen += 1
+            except SQLAlchemyError as e:
+                db.rollback()
+                hatalar.append({"index": index, "hata": str(getattr(e, "orig", None) or e)})
+    return eklenen, hatalar
+
 # Dersler
 
 def get_ders(db: Session, ders_id: int):
-    return db.query(models.Dersler).filter(models.Dersler.ders_id == ders_id).first()
+    return onbellekten_oku(f"ders:{ders_id}", schemas.Dersler,
+                           lambda: db.query(models.Dersler).filter(models.Dersler.ders_id == ders_id).first())
 
-def get_dersler(db: Session, skip: int = 0, limit: int = 10):
-    return db.query(models.Dersler).offset(skip).limit(limit).all()
+# Liste filtreleri hem Query hem select() üzerinde çalışır (crud_async de kullanır)
+def filtrele_dersler(query, baslangic: Optional[date] = None, bitis: Optional[date] = None):
+    if baslangic is not None:
+        query = query.filter(models.Dersler.ders_tarihi >= baslangic)
+    if bitis is not None:
+        query = query.filter(models.Dersler.ders_tarihi <= bitis)
+    return query
+
+def get_dersler(db: Session, skip: int = 0, limit: int = 10, cursor: Optional[str] = None,
+                baslangic: Optional[date] = None, bitis: Optional[date] = None, kolonlar=None):
+    query = filtrele_dersler(_kaynak(db, models.Dersler, kolonlar), baslangic, bitis)
+    return sayfala(query, models.Dersler.ders_id, skip=skip, limit=limit, cursor=cursor)
 
 def create_ders(db: Session, ders: schemas.DerslerCreate):
     db_ders = models.Dersler(**ders.model_dump())
     db.add(db_ders)
     db.commit()
     db.refresh(db_ders)
+    onbellek.gecersiz_kil(f"ders:{db_ders.ders_id}")
     return db_ders
 
+# Yazma kuyruğu partisi: birleştirilmiş ders odak/enerji güncellemeleri ({"ders_id", alanlar}).
+# Alan kümesi başına tek executemany UPDATE, tek transaction; silinmiş ders satırı eşleşmez
+# ve atlanır (ORM toplu UPDATE'in StaleDataError'ı partiyi sonsuz yeniden denemeye sokardı).
+def ders_odaklarini_yaz(db: Session, guncellemeler: list[dict]):
+    tablo = models.Dersler.__table__
+    gruplar = {}
+    for guncelleme in guncellemeler:
+        gruplar.setdefault(tuple(sorted(a for a in guncelleme if a != "ders_id")), []).append(guncelleme)
+    for alanlar, grup in gruplar.items():
+        sorgu = update(tablo).where(tablo.c.ders_id == bindparam("b_ders_id")).values({a: bindparam(a) for a in alanlar})
+        db.execute(sorgu, [{"b_ders_id": g["ders_id"], **{a: g[a] for a in alanlar}} for g in grup])
+    db.commit()
+    for guncelleme in guncellemeler:
+        onbellek.gecersiz_kil(f"ders:{guncelleme['ders_id']}")
+    return len(guncellemeler), []
+
 # Konular
 
 def get_konu(db: Session, konu_id: int):
-    return db.query(models.Konular).filter(models.Konular.konu_id == konu_id).first()
+    return onbellekten_oku(f"konu:{konu_id}", schemas.Konular,
+                           lambda: db.query(models.Konular).filter(models.Konular.konu_id == konu_id).first())
+
+def filtrele_konular(query, ders_id: Optional[int] = None, konu_seviyesi: Optional[int] = None):
+    if ders_id is not None:
+        query = query.filter(models.Konular.ders_id == ders_id)
+    if konu_seviyesi is not None:
+        query = query.filter(models.Konular.konu_seviyesi == konu_seviyesi)
+    return query
 
-def get_konular(db: Session, skip: int = 0, limit: int = 10):
-    return db.query(models.Konular).offset(skip).limit(limit).all()
+def get_konular(db: Session, skip: int = 0, limit: int = 10, cursor: Optional[str] = None,
+                ders_id: Optional[int] = None, konu_seviyesi: Optional[int] = None, kolonlar=None):
+    query = filtrele_konular(_kaynak(db, models.Konular, kolonlar), ders_id, konu_seviyesi)
+    return sayfala(query, models.Konular.konu_id, skip=skip, limit=limit, cursor=cursor)
 
 def create_konu(db: Session, konu: schemas.KonularCreate):
     db_konu = models.Konular(**konu.model_dump())
     db.add(db_konu)
     db.commit()
     db.refresh(db_konu)
+    onbellek.gecersiz_kil(f"konu:{db_konu.konu_id}")
+    arama.KONULAR.kayit_ekle(db_konu)
+    uyarlama.MOTOR.konu_ekle(db_konu)
     return db_konu
 
 # SinavSimilasyonlari
@@ -63,8 +213,26 @@ def create_konu(db: Session, konu: schemas.KonularCreate):
 def get_sinav(db: Session, sinav_id: int):
     return db.query(models.SinavSimilasyonlari).filter(models.SinavSimilasyonlari.sinav_id == sinav_id).first()
 
-def get_sinavlar(db: Session, skip: int = 0, limit: int = 10):
-    return db.query(models.SinavSimilasyonlari).offset(skip).limit(limit).all()
+def filtrele_sinavlar(query, baslangic: Optional[date] = None, bitis: Optional[date] = None):
+    if baslangic is not None:
+        query = query.filter(models.SinavSimilasyonlari.sinav_tarihi >= baslangic)
+    if bitis is not None:
+        query = query.filter(models.SinavSimilasyonlari.sinav_tarihi <= bitis)
+    return query
+
+def get_sinavlar(db: Session, skip: int = 0, limit: int = 10, cursor: Optional[str] = None,
+                 baslangic: Optional[date] = None, bitis: Optional[date] = None, kolonlar=None):
+    query = filtrele_sinavlar(_kaynak(db, models.SinavSimilasyonlari, kolonlar), baslangic, bitis)
+    return sayfala(query, models.SinavSimilasyonlari.sinav_id, skip=skip, limit=limit, cursor=cursor)
+
+# Dışa aktarma sorguları ORM nesnesi yerine tablo satırları döner (bkz. disa_aktar.py)
+def sinav_aktarim_sorgusu(ogrenci_id: Optional[int] = None, baslangic: Optional[date] = None,
+                          bitis: Optional[date] = None):
+    sinav, bag = models.SinavSimilasyonlari, models.SinavSimilasyonlari_has_Ogrenci
+    sorgu = filtrele_sinavlar(select(sinav.__table__), baslangic, bitis)
+    if ogrenci_id is not None:
+        sorgu = sorgu.filter(sinav.sinav_id.in_(select(bag.sinav_id).filter(bag.ogrenci_id == ogrenci_id)))
+    return sorgu.order_by(sinav.sinav_id)
 
 def create_sinav(db: Session, sinav: schemas.SinavSimilasyonlariCreate):
     db_sinav = models.SinavSimilasyonlari(**sinav.model_dump())
@@ -78,23 +246,96 @@ def create_sinav(db: Session, sinav: schemas.SinavSimilasyonlariCreate):
 def get_istatistik(db: Session, istatistik_id: int):
     return db.query(models.Istatistikler).filter(models.Istatistikler.istatistik_id == istatistik_id).first()
 
-def get_istatistikler(db: Session, skip: int = 0, limit: int = 10):
-    return db.query(models.Istatistikler).offset(skip).limit(limit).all()
+def filtrele_istatistikler(query, ogrenci_id: Optional[int] = None, baslangic: Optional[date] = None,
+                           bitis: Optional[date] = None):
+    if ogrenci_id is not None:
+        query = query.filter(models.Istatistikler.ogrenci_id == ogrenci_id)
+    if baslangic is not None:
+        query = query.filter(models.Istatistikler.istatistik_tarihi >= baslangic)
+    if bitis is not None:
+        query = query.filter(models.Istatistikler.istatistik_tarihi <= bitis)
+    return query
+
+def get_istatistikler(db: Session, skip: int = 0, limit: int = 10, cursor: Optional[str] = None,
+                      ogrenci_id: Optional[int] = None, baslangic: Optional[date] = None,
+                      bitis: Optional[date] = None, kolonlar=None):
+    query = filtrele_istatistikler(_kaynak(db, models.Istatistikler, kolonlar), ogrenci_id, baslangic, bitis)
+    return sayfala(query, models.Istatistikler.istatistik_id, skip=skip, limit=limit, cursor=cursor)
+
+def istatistik_aktarim_sorgusu(ogrenci_id: Optional[int] = None, baslangic: Optional[date] = None,
+                               bitis: Optional[date] = None):
+    sorgu = filtrele_istatistikler(select(models.Istatistikler.__table__), ogrenci_id, baslangic, bitis)
+    return sorgu.order_by(models.Istatistikler.istatistik_id)
 
 def create_istatistik(db: Session, istatistik: schemas.IstatistiklerCreate):
-    db_istatistik = models.Istatistikler(**istatistik.model_dump())
+    veri = istatistik.model_dump()
+    db_istatistik = models.Istatistikler(**veri)
     db.add(db_istatistik)
+    rollup.guncelle(db, [veri])
     db.commit()
     db.refresh(db_istatistik)
+    uyarlama.MOTOR.istatistik_ekle(db_istatistik)
+    liderlik.TABLO.istatistik_ekle(db_istatistik)
     return db_istatistik
 
+def create_istatistikler_toplu(db: Session, kayitlar):
+    return toplu_ekle(db, models.Istatistikler, kayitlar, ayni_transaction=rollup.guncelle)
+
+# Yazma kuyruğu (kuyruk.py) partisi: tek çok satırlı INSERT + rollup, tek transaction. Kayıt
+# kaynaklı hatada (FK, veri) toplu_ekle ile tek tek denenir; bağlantı hataları kuyruğun
+# yeniden denemesi için yükseltilir.
+def istatistikleri_yaz(db: Session, kayitlar: list[dict]):
+    try:
+        db.execute(insert(models.Istatistikler), kayitlar)
+        rollup.guncelle(db, kayitlar)
+        db.commit()
+        return len(kayitlar), []
+    except (IntegrityError, DataError):
+        db.rollback()
+    return create_istatistikler_toplu(db, list(enumerate(kayitlar)))
+
+# Öğrenci özeti için günlük toplamlar istatistikozetleri'nden (rollup.py) okunur.
+# Ortalamalar toplam/sayı olarak döner ki günler haftalara ağırlıklı toplanabilsin.
+def get_istatistik_gunluk(db: Session, ogrenci_id: int, baslangic: date, bitis: date):
+    ozet = models.IstatistikOzetleri
+    return (
+        db.query(
+            ozet.ozet_baslangic.label("tarih"),
+            ozet.ozet_kayitSayisi.label("kayit"),
+            ozet.ozet_calismaSuresi.label("calisma_suresi"),
+            ozet.ozet_odakToplam.label("odak_toplam"),
+            ozet.ozet_odakSayisi.label("odak_sayi"),
+            ozet.ozet_dogruToplam.label("dogru_toplam"),
+            ozet.ozet_dogruSayisi.label("dogru_sayi"),
+            ozet.ozet_cozulenSoru.label("cozulen_soru"),
+            ozet.ozet_halkaSayisi.label("halka"),
+        )
+        .filter(ozet.ogrenci_id == ogrenci_id, ozet.ozet_donem == "gun",
+                ozet.ozet_baslangic.between(baslangic, bitis))
+        .order_by(ozet.ozet_baslangic)
+        .all()
+    )
+
+def get_sinav_puanlari(db: Session, ogrenci_id: int, baslangic: date, bitis: date):
+    sinav, bag = models.SinavSimilasyonlari, models.SinavSimilasyonlari_has_Ogrenci
+    satirlar = (
+        db.query(sinav.sinav_puan)
+        .join(bag, bag.sinav_id == sinav.sinav_id)
+        .filter(bag.ogrenci_id == ogrenci_id, sinav.sinav_tarihi.between(baslangic, bitis),
+                sinav.sinav_puan.isnot(None))
+        .order_by(sinav.sinav_puan)
+        .all()
+    )
+    return [float(puan) for (puan,) in satirlar]
+
 # OdullerVeBasarimlar
 
 def get_basarim(db: Session, basarim_id: int):
     return db.query(models.OdullerVeBasarimlar).filter(models.OdullerVeBasarimlar.basarim_id == basarim_id).first()
 
-def get_basarimlar(db: Session, skip: int = 0, limit: int = 10):
-    return db.query(models.OdullerVeBasarimlar).offset(skip).limit(limit).all()
+def get_basarimlar(db: Session, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, kolonlar=None):
+    return sayfala(_kaynak(db, models.OdullerVeBasarimlar, kolonlar), models.OdullerVeBasarimlar.basarim_id,
+                   skip=skip, limit=limit, cursor=cursor)
 
 def create_basarim(db: Session, basarim: schemas.OdullerVeBasarimlarCreate):
     db_basarim = models.OdullerVeBasarimlar(**basarim.model_dump())
@@ -103,17 +344,49 @@ def create_basarim(db: Session, basarim: schemas.OdullerVeBasarimlarCreate):
     db.refresh(db_basarim)
     return db_basarim
 
+# Başarım verme: kayıtlar (index, {basarim_id, ogrenci_id}); zaten verilmiş olanlar
+# birincil anahtar hatasıyla index'iyle döner
+def basarim_ver_toplu(db: Session, kayitlar):
+    return toplu_ekle(db, models.OdullerVeBasarimlar_has_Ogrenci, kayitlar)
+
+def basarima_sahip_ogrenciler(db: Session, basarim_id: int, ogrenci_idler) -> set:
+    bag = models.OdullerVeBasarimlar_has_Ogrenci
+    return set(db.scalars(select(bag.ogrenci_id).filter(bag.basarim_id == basarim_id, bag.ogrenci_id.in_(ogrenci_idler))))
+
 # ChatbotEtkilesim
 
 def get_chatbot(db: Session, chatbot_id: int):
     return db.query(models.ChatbotEtkilesim).filter(models.ChatbotEtkilesim.chatbot_id == chatbot_id).first()
 
-def get_chatbotlar(db: Session, skip: int = 0, limit: int = 10):
-    return db.query(models.ChatbotEtkilesim).offset(skip).limit(limit).all()
+def filtrele_chatbotlar(query, ogrenci_id: Optional[int] = None, baslangic: Optional[datetime] = None,
+                        bitis: Optional[datetime] = None):
+    if ogrenci_id is not None:
+        query = query.filter(models.ChatbotEtkilesim.ogrenci_id == ogrenci_id)
+    if baslangic is not None:
+        query = query.filter(models.ChatbotEtkilesim.chatbot_zamanDamgasi >= baslangic)
+    if bitis is not None:
+        query = query.filter(models.ChatbotEtkilesim.chatbot_zamanDamgasi <= bitis)
+    return query
+
+def get_chatbotlar(db: Session, skip: int = 0, limit: int = 10, cursor: Optional[str] = None,
+                   ogrenci_id: Optional[int] = None, baslangic: Optional[datetime] = None,
+                   bitis: Optional[datetime] = None, kolonlar=None):
+    query = filtrele_chatbotlar(_kaynak(db, models.ChatbotEtkilesim, kolonlar), ogrenci_id, baslangic, bitis)
+    return sayfala(query, models.ChatbotEtkilesim.chatbot_id, skip=skip, limit=limit, cursor=cursor)
+
+def chatbot_aktarim_sorgusu(ogrenci_id: Optional[int] = None, baslangic: Optional[datetime] = None,
+                            bitis: Optional[datetime] = None):
+    sorgu = filtrele_chatbotlar(select(models.ChatbotEtkilesim.__table__), ogrenci_id, baslangic, bitis)
+    return sorgu.order_by(models.ChatbotEtkilesim.chatbot_id)
 
 def create_chatbot(db: Session, chatbot: schemas.ChatbotEtkilesimCreate):
     db_chatbot = models.ChatbotEtkilesim(**chatbot.model_dump())
     db.add(db_chatbot)
     db.commit()
     db.refresh(db_chatbot)
+    arama.CHATBOT.kayit_ekle(db_chatbot)
+    benzer.CHATBOT.kayit_ekle(db)
     return db_chatbot
+
+def create_chatbotlar_toplu(db: Session, kayitlar):
+    return toplu_ekle(db, models.ChatbotEtkilesim, kayitlar)
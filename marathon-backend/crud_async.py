@@ -0,0 +1,194 @@
+from datetime import date, datetime
+from typing import Optional
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import models, schemas, arama, benzer, liderlik, onbellek, rollup, sifre, uyarlama
+from crud import (
+    filtrele_chatbotlar,
+    filtrele_dersler,
+    filtrele_istatistikler,
+    filtrele_konular,
+    filtrele_sinavlar,
+)
+from pagination import idlere_gore_sirala, sayfa_sorgusu
+
+# crud.py'deki fonksiyonların AsyncSession ile çalışan karşılıkları
+
+# kolonlar verilirse (hizli.py) ORM nesnesi yerine satırlar döner
+def _secim(model, kolonlar=None):
+    return select(*kolonlar) if kolonlar else select(model)
+
+async def _listele(db: AsyncSession, stmt, pk, skip: int, limit: int, cursor: Optional[str], kolonlar=None):
+    stmt = sayfa_sorgusu(stmt, pk, skip=skip, limit=limit, cursor=cursor)
+    if kolonlar:
+        return (await db.execute(stmt)).all()
+    return (await db.scalars(stmt)).all()
+
+async def get_by_ids(db: AsyncSession, model, idler: list[int], kolonlar=None):
+    pk = model.__mapper__.primary_key[0]
+    stmt = _secim(model, kolonlar).filter(pk.in_(idler))
+    kayitlar = (await db.execute(stmt)).all() if kolonlar else (await db.scalars(stmt)).all()
+    return idlere_gore_sirala(kayitlar, pk.key, idler)
+
+async def _olustur(db: AsyncSession, model, veri, onbellek_onek: Optional[str] = None):
+    db_nesne = model(**veri.model_dump())
+    db.add(db_nesne)
+    await db.commit()
+    await db.refresh(db_nesne)
+    if onbellek_onek is not None:
+        pk = model.__mapper__.primary_key[0].name
+        onbellek.gecersiz_kil(f"{onbellek_onek}:{getattr(db_nesne, pk)}")
+    return db_nesne
+
+# Süreç içi yapılar (arama, uyarlama, liderlik) threading.Lock ile korunur; kilit beklemesi
+# event loop'u bloklamasın diye güncellemeler threadpool'da yapılır
+def _konu_isle(db_konu):
+    arama.KONULAR.kayit_ekle(db_konu)
+    uyarlama.MOTOR.konu_ekle(db_konu)
+
+def _istatistik_isle(db_istatistik):
+    uyarlama.MOTOR.istatistik_ekle(db_istatistik)
+    liderlik.TABLO.istatistik_ekle(db_istatistik)
+
+# crud.onbellekten_oku ile aynı anahtarlar ve şemalar
+async def _onbellekten_oku(db: AsyncSession, anahtar: str, sema, model, pk_deger):
+    veri = onbellek.getir(anahtar)
+    if veri is not None:
+        return sema.model_validate(veri)
+    nesne = await db.get(model, pk_deger)
+    if nesne is None:
+        return None
+    sonuc = sema.model_validate(nesne)
+    onbellek.koy(anahtar, sonuc.model_dump(mode="json"))
+    return sonuc
+
+# Ogrenci
+
+async def get_ogrenci(db: AsyncSession, ogrenci_id: int):
+    return await _onbellekten_oku(db, f"ogrenci:{ogrenci_id}", schemas.Ogrenci, models.Ogrenci, ogrenci_id)
+
+async def get_ogrenci_by_email(db: AsyncSession, email: str):
+    sonuc = await db.scalars(select(models.Ogrenci).filter(models.Ogrenci.ogrenci_email == email))
+    return sonuc.first()
+
+async def get_ogrenciler(db: AsyncSession, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, kolonlar=None):
+    return await _listele(db, _secim(models.Ogrenci, kolonlar), models.Ogrenci.ogrenci_id,
+                          skip, limit, cursor, kolonlar)
+
+# scrypt event loop dışında, sifre havuzunda hesaplanır
+async def create_ogrenci(db: AsyncSession, ogrenci: schemas.OgrenciCreate):
+    db_ogrenci = models.Ogrenci(**ogrenci.model_dump(exclude={"ogrenci_sifre"}),
+                                ogrenci_sifreHashed=await sifre.hashle_async(ogrenci.ogrenci_sifre))
+    db.add(db_ogrenci)
+    await db.commit()
+    await db.refresh(db_ogrenci)
+    onbellek.gecersiz_kil(f"ogrenci:{db_ogrenci.ogrenci_id}")
+    return db_ogrenci
+
+async def update_ogrenci(db: AsyncSession, ogrenci_id: int, ogrenci_update: schemas.OgrenciUpdate):
+    db_ogrenci = await db.get(models.Ogrenci, ogrenci_id)
+    if db_ogrenci:
+        for key, value in ogrenci_update.model_dump(exclude_unset=True, exclude={"ogrenci_sifre"}).items():
+            setattr(db_ogrenci, key, value)
+        if ogrenci_update.ogrenci_sifre:
+            db_ogrenci.ogrenci_sifreHashed = await sifre.hashle_async(ogrenci_update.ogrenci_sifre)
+        # Satır sürümü (ETag/Last-Modified): istemcinin gönderdiği değer değil sunucu zamanı
+        db_ogrenci.ogrenci_sonGuncellemeTarihi = datetime.now()
+        await db.commit()
+        await db.refresh(db_ogrenci)
+        onbellek.gecersiz_kil(f"ogrenci:{ogrenci_id}")
+        await run_in_threadpool(uyarlama.MOTOR.ogrenci_unut, ogrenci_id)
+    return db_ogrenci
+
+# Dersler
+
+async def get_ders(db: AsyncSession, ders_id: int):
+    return await _onbellekten_oku(db, f"ders:{ders_id}", schemas.Dersler, models.Dersler, ders_id)
+
+async def get_dersler(db: AsyncSession, skip: int = 0, limit: int = 10, cursor: Optional[str] = None,
+                      baslangic: Optional[date] = None, bitis: Optional[date] = None, kolonlar=None):
+    stmt = filtrele_dersler(_secim(models.Dersler, kolonlar), baslangic, bitis)
+    return await _listele(db, stmt, models.Dersler.ders_id, skip, limit, cursor, kolonlar)
+
+async def create_ders(db: AsyncSession, ders: schemas.DerslerCreate):
+    return await _olustur(db, models.Dersler, ders, onbellek_onek="ders")
+
+# Konular
+
+async def get_konu(db: AsyncSession, konu_id: int):
+    return await _onbellekten_oku(db, f"konu:{konu_id}", schemas.Konular, models.Konular, konu_id)
+
+async def get_konular(db: AsyncSession, skip: int = 0, limit: int = 10, cursor: Optional[str] = None,
+                      ders_id: Optional[int] = None, konu_seviyesi: Optional[int] = None, kolonlar=None):
+    stmt = filtrele_konular(_secim(models.Konular, kolonlar), ders_id, konu_seviyesi)
+    return await _listele(db, stmt, models.Konular.konu_id, skip, limit, cursor, kolonlar)
+
+async def create_konu(db: AsyncSession, konu: schemas.KonularCreate):
+    db_konu = await _olustur(db, models.Konular, konu, onbellek_onek="konu")
+    await run_in_threadpool(_konu_isle, db_konu)
+    return db_konu
+
+# SinavSimilasyonlari
+
+async def get_sinav(db: AsyncSession, sinav_id: int):
+    return await db.get(models.SinavSimilasyonlari, sinav_id)
+
+async def get_sinavlar(db: AsyncSession, skip: int = 0, limit: int = 10, cursor: Optional[str] = None,
+                       baslangic: Optional[date] = None, bitis: Optional[date] = None, kolonlar=None):
+    stmt = filtrele_sinavlar(_secim(models.SinavSimilasyonlari, kolonlar), baslangic, bitis)
+    return await _listele(db, stmt, models.SinavSimilasyonlari.sinav_id, skip, limit, cursor, kolonlar)
+
+async def create_sinav(db: AsyncSession, sinav: schemas.SinavSimilasyonlariCreate):
+    return await _olustur(db, models.SinavSimilasyonlari, sinav)
+
+# Istatistikler
+
+async def get_istatistik(db: AsyncSession, istatistik_id: int):
+    return await db.get(models.Istatistikler, istatistik_id)
+
+async def get_istatistikler(db: AsyncSession, skip: int = 0, limit: int = 10, cursor: Optional[str] = None,
+                            ogrenci_id: Optional[int] = None, baslangic: Optional[date] = None,
+                            bitis: Optional[date] = None, kolonlar=None):
+    stmt = filtrele_istatistikler(_secim(models.Istatistikler, kolonlar), ogrenci_id, baslangic, bitis)
+    return await _listele(db, stmt, models.Istatistikler.istatistik_id, skip, limit, cursor, kolonlar)
+
+async def create_istatistik(db: AsyncSession, istatistik: schemas.IstatistiklerCreate):
+    veri = istatistik.model_dump()
+    db_istatistik = models.Istatistikler(**veri)
+    db.add(db_istatistik)
+    await db.run_sync(rollup.guncelle, [veri])
+    await db.commit()
+    await db.refresh(db_istatistik)
+    await run_in_threadpool(_istatistik_isle, db_istatistik)
+    return db_istatistik
+
+# OdullerVeBasarimlar
+
+async def get_basarim(db: AsyncSession, basarim_id: int):
+    return await db.get(models.OdullerVeBasarimlar, basarim_id)
+
+async def get_basarimlar(db: AsyncSession, skip: int = 0, limit: int = 10, cursor: Optional[str] = None, kolonlar=None):
+    return await _listele(db, _secim(models.OdullerVeBasarimlar, kolonlar), models.OdullerVeBasarimlar.basarim_id,
+                          skip, limit, cursor, kolonlar)
+
+async def create_basarim(db: AsyncSession, basarim: schemas.OdullerVeBasarimlarCreate):
+    return await _olustur(db, models.OdullerVeBasarimlar, basarim)
+
+# ChatbotEtkilesim
+
+async def get_chatbot(db: AsyncSession, chatbot_id: int):
+    return await db.get(models.ChatbotEtkilesim, chatbot_id)
+
+async def get_chatbotlar(db: AsyncSession, skip: int = 0, limit: int = 10, cursor: Optional[str] = None,
+                         ogrenci_id: Optional[int] = None, baslangic: Optional[datetime] = None,
+                         bitis: Optional[datetime] = None, kolonlar=None):
+    stmt = filtrele_chatbotlar(_secim(models.ChatbotEtkilesim, kolonlar), ogrenci_id, baslangic, bitis)
+    return await _listele(db, stmt, models.ChatbotEtkilesim.chatbot_id, skip, limit, cursor, kolonlar)
+
+async def create_chatbot(db: AsyncSession, chatbot: schemas.ChatbotEtkilesimCreate):
+    db_chatbot = await _olustur(db, models.ChatbotEtkilesim, chatbot)
+    await run_in_threadpool(arama.CHATBOT.kayit_ekle, db_chatbot)
+    # Dosya kilidi ve memmap yazımı event loop'u bloklamasın: ayrı sync oturumla threadpool'da
+    await run_in_threadpool(benzer.CHATBOT.kayit_ekle)
+    return db_chatbot
@@ -1,8 +1,11 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
+import threading
 from dotenv import load_dotenv
+import metrikler
+from havuz import HavuzSayaclari, OlculenAsyncQueuePool, OlculenQueuePool, olcumle
 
 load_dotenv()
 
@@ -12,8 +15,98 @@ MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
 MYSQL_PORT = os.getenv("MYSQL_PORT", "3306")
 MYSQL_DB = os.getenv("MYSQL_DB", "railway")
 
-DATABASE_URL = f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
+def _env_bool(ad: str, varsayilan: str) -> bool:
+    return os.getenv(ad, varsayilan).lower() in ("1", "true", "yes")
 
-engine = create_engine(DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base() 
\ No newline at end of file
+DATABASE_URL = os.getenv(
+    "DATABASE_URL",
+    f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}",
+)
+
+# Async mod: endpointler AsyncSession ile çalışır (ör. ASYNC_DATABASE_URL=sqlite+aiosqlite:///test.db)
+ASYNC_DB = _env_bool("ASYNC_DB", "0")
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    f"mysql+aiomysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}",
+)
+
+# Engine profili: havuz boyutu uvicorn worker/thread sayısına göre ayarlanmalı
+DB_ECHO = _env_bool("DB_ECHO", "0")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", "1")
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+
+havuz_sayaclari = HavuzSayaclari()
+async_havuz_sayaclari = HavuzSayaclari()
+havuz_sayaclari.dinleyici = async_havuz_sayaclari.dinleyici = metrikler.havuz_bekleme_ekle
+
+def engine_ayarlari(url: str, async_mod: bool = False) -> dict:
+    ayarlar = {"echo": DB_ECHO, "pool_pre_ping": DB_POOL_PRE_PING}
+    # SQLite (testler, benchmark) kendi havuz sınıfını kullanır
+    if not url.startswith("sqlite"):
+        ayarlar.update(
+            poolclass=OlculenAsyncQueuePool if async_mod else OlculenQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+    return ayarlar
+
+def _statement_timeout(engine):
+    # MySQL: SELECT sorguları max_execution_time (ms) aşınca iptal edilir
+    if DB_STATEMENT_TIMEOUT_MS <= 0 or engine.dialect.name != "mysql":
+        return
+
+    @event.listens_for(engine.pool, "connect")
+    def _ayarla(dbapi_conn, kayit):
+        cursor = dbapi_conn.cursor()
+        cursor.execute(f"SET SESSION max_execution_time = {DB_STATEMENT_TIMEOUT_MS}")
+        cursor.close()
+
+Base = declarative_base()
+
+# Engine'ler ilk erişimde kurulur (db.engine, db.SessionLocal, ...): import sırasında sürücü
+# yüklenmez, bağlantı açılmaz. Uygulama bunu yaşam döngüsü başlangıcında yapar (bkz. isinma.py).
+# Tüketiciler "from db import engine" yerine db.engine kullanmalı, yoksa import'ta kurulur.
+_kurulum_kilidi = threading.Lock()
+
+
+def _sync_kur():
+    global engine, SessionLocal
+    engine = create_engine(DATABASE_URL, **engine_ayarlari(DATABASE_URL))
+    olcumle(engine, havuz_sayaclari)
+    metrikler.dinle(engine)
+    _statement_timeout(engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _async_kur():
+    global async_engine, AsyncSessionLocal
+    if not ASYNC_DB:
+        async_engine = AsyncSessionLocal = None
+        return
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_ayarlari(ASYNC_DATABASE_URL, async_mod=True))
+    olcumle(async_engine.sync_engine, async_havuz_sayaclari)
+    metrikler.dinle(async_engine.sync_engine)
+    _statement_timeout(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+_TEMBEL = {"engine": _sync_kur, "SessionLocal": _sync_kur, "async_engine": _async_kur, "AsyncSessionLocal": _async_kur}
+
+
+def __getattr__(ad: str):
+    # Yalnızca henüz kurulmamış adlar için çağrılır; kurulumdan sonra modül global'i döner
+    kur = _TEMBEL.get(ad)
+    if kur is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {ad!r}")
+    with _kurulum_kilidi:
+        if ad not in globals():
+            kur()
+    return globals()[ad]
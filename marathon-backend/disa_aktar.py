@@ -0,0 +1,60 @@
+import csv
+import io
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from fastapi.responses import StreamingResponse
+import db as database
+
+# Gece analitik aktarımları için akış halinde NDJSON/CSV. Satırlar ORM nesnesi ve pydantic
+# modeli olmadan, sunucu tarafı cursor'dan (yield_per) parça parça okunup yazılır;
+# bellek tablo boyutundan bağımsız olarak bir parça kadar kalır.
+DISA_AKTAR_PARCA = int(os.getenv("DISA_AKTAR_PARCA", "1000"))
+ICERIK_TIPLERI = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+def _json_deger(deger):
+    if isinstance(deger, (date, datetime)):
+        return deger.isoformat()
+    if isinstance(deger, Decimal):
+        return float(deger)
+    raise TypeError(f"JSON'a çevrilemeyen değer: {type(deger).__name__}")
+
+
+def _csv_parca(satirlar) -> str:
+    tampon = io.StringIO()
+    csv.writer(tampon, lineterminator="\n").writerows(
+        ["" if d is None else d for d in satir] for satir in satirlar
+    )
+    return tampon.getvalue()
+
+
+def satirlari_akit(sorgu, bicim: str, parca: int = DISA_AKTAR_PARCA):
+    # Oturum generator'a ait: StreamingResponse gövdeyi endpoint döndükten sonra tüketir,
+    # get_db'nin oturumu o sırada kapanmış olabilir
+    db = database.SessionLocal()
+    try:
+        sonuc = db.execute(sorgu.execution_options(yield_per=parca))
+        kolonlar = list(sonuc.keys())
+        if bicim == "csv":
+            yield _csv_parca([kolonlar])
+        for satirlar in sonuc.partitions():
+            if bicim == "csv":
+                yield _csv_parca(satirlar)
+            else:
+                yield "".join(
+                    json.dumps(dict(zip(kolonlar, satir)), default=_json_deger, ensure_ascii=False) + "\n"
+                    for satir in satirlar
+                )
+    finally:
+        db.close()
+
+
+def akis_yaniti(sorgu, bicim: str, dosya_adi: str) -> StreamingResponse:
+    uzanti = "csv" if bicim == "csv" else "ndjson"
+    return StreamingResponse(
+        satirlari_akit(sorgu, bicim),
+        media_type=ICERIK_TIPLERI[bicim],
+        headers={"Content-Disposition": f'attachment; filename="{dosya_adi}.{uzanti}"'},
+    )
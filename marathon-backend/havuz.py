@@ -0,0 +1,103 @@
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as HavuzTimeout
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+# Bağlantı havuzu sayaçları: checkout/checkin, yeni bağlantı, bekleme süresi, timeout
+class HavuzSayaclari:
+    def __init__(self):
+        self._kilit = threading.Lock()
+        self.dinleyici = None  # bekleme süresini isteğe yazan geri çağrı (metrikler.havuz_bekleme_ekle)
+        self.sifirla()
+
+    def sifirla(self):
+        with self._kilit:
+            self.checkout = 0
+            self.checkin = 0
+            self.baglanti = 0
+            self.timeout = 0
+            self.bekleme_toplam = 0.0
+            self.bekleme_max = 0.0
+
+    def bekleme_ekle(self, sure: float, zaman_asimi: bool = False):
+        with self._kilit:
+            if zaman_asimi:
+                self.timeout += 1
+            self.bekleme_toplam += sure
+            self.bekleme_max = max(self.bekleme_max, sure)
+        if self.dinleyici is not None:
+            self.dinleyici(sure)
+
+    def artir(self, alan: str):
+        with self._kilit:
+            setattr(self, alan, getattr(self, alan) + 1)
+
+    def ozet(self, pool=None) -> dict:
+        with self._kilit:
+            veri = {
+                "checkout": self.checkout,
+                "checkin": self.checkin,
+                "baglanti": self.baglanti,
+                "timeout": self.timeout,
+                "bekleme_toplam_ms": round(self.bekleme_toplam * 1000, 3),
+                "bekleme_max_ms": round(self.bekleme_max * 1000, 3),
+                "bekleme_ort_ms": round(self.bekleme_toplam * 1000 / self.checkout, 3) if self.checkout else 0.0,
+            }
+        if isinstance(pool, QueuePool):
+            veri.update(
+                boyut=pool.size(),
+                kullanimda=pool.checkedout(),
+                bosta=pool.checkedin(),
+                overflow=pool.overflow(),
+            )
+        return veri
+
+
+# Havuzdan bağlantı alırken geçen süreyi ölçer (pool event'leri bekleme süresini vermiyor)
+class _BeklemeOlcen:
+    sayaclar = None
+
+    def _do_get(self):
+        t0 = time.perf_counter()
+        try:
+            baglanti = super()._do_get()
+        except HavuzTimeout:
+            if self.sayaclar is not None:
+                self.sayaclar.bekleme_ekle(time.perf_counter() - t0, zaman_asimi=True)
+            raise
+        if self.sayaclar is not None:
+            self.sayaclar.bekleme_ekle(time.perf_counter() - t0)
+        return baglanti
+
+    def recreate(self):
+        # engine.dispose() havuzu yeniden kurar; sayaçlar yeni havuza taşınır
+        yeni = super().recreate()
+        yeni.sayaclar = self.sayaclar
+        return yeni
+
+
+class OlculenQueuePool(_BeklemeOlcen, QueuePool):
+    pass
+
+
+class OlculenAsyncQueuePool(_BeklemeOlcen, AsyncAdaptedQueuePool):
+    pass
+
+
+def olcumle(engine, sayaclar: HavuzSayaclari):
+    pool = engine.pool
+    pool.sayaclar = sayaclar
+
+    @event.listens_for(pool, "connect")
+    def _connect(dbapi_conn, kayit):
+        sayaclar.artir("baglanti")
+
+    @event.listens_for(pool, "checkout")
+    def _checkout(dbapi_conn, kayit, proxy):
+        sayaclar.artir("checkout")
+
+    @event.listens_for(pool, "checkin")
+    def _checkin(dbapi_conn, kayit):
+        sayaclar.artir("checkin")
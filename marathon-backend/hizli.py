@@ -0,0 +1,75 @@
+import os
+import typing
+from decimal import Decimal
+from fastapi import Response
+from pydantic_core import to_json
+import models, schemas
+from pagination import cursor_basligi_ekle, eksik_basligi_ekle
+
+# Liste endpointleri için opt-in hızlı yol (HIZLI_LISTE=1). Sorgu yalnızca şemadaki kolonları
+# seçer ve satır tuple'ları döner; ORM nesnesi ve pydantic modeli oluşturulmaz. Kolon
+# listesi ve tip dönüştürücüleri şema başına bir kez hesaplanır, JSON pydantic-core ile
+# yazılır. Çıktı response_model ile aynı biçimdedir (DECIMAL -> float, tarih ISO 8601).
+HIZLI_LISTE = os.getenv("HIZLI_LISTE", "0").lower() in ("1", "true", "yes")
+
+
+def _hedef_tip(annotation):
+    # Optional[X] -> X
+    argumanlar = [a for a in typing.get_args(annotation) if a is not type(None)]
+    return argumanlar[0] if argumanlar else annotation
+
+
+class HizliListe:
+    def __init__(self, model, sema):
+        self.kolonlar = []
+        self.anahtarlar = []
+        self._donusturuculer = []
+        for ad, alan in sema.model_fields.items():
+            kolon = getattr(model, ad)
+            self.kolonlar.append(kolon)
+            self.anahtarlar.append(ad)
+            if kolon.type.python_type is Decimal and _hedef_tip(alan.annotation) is float:
+                self._donusturuculer.append((len(self.anahtarlar) - 1, float))
+        self.anahtarlar = tuple(self.anahtarlar)
+
+    def sozlukler(self, satirlar) -> list[dict]:
+        anahtarlar = self.anahtarlar
+        if not self._donusturuculer:
+            return [dict(zip(anahtarlar, satir)) for satir in satirlar]
+        donusturuculer = self._donusturuculer
+        sonuc = []
+        for satir in satirlar:
+            degerler = list(satir)
+            for i, donustur in donusturuculer:
+                if degerler[i] is not None:
+                    degerler[i] = donustur(degerler[i])
+            sonuc.append(dict(zip(anahtarlar, degerler)))
+        return sonuc
+
+    def kodla(self, satirlar) -> bytes:
+        return to_json(self.sozlukler(satirlar))
+
+    def secim(self):
+        # crud liste fonksiyonlarının kolonlar argümanı
+        return self.kolonlar if HIZLI_LISTE else None
+
+    def liste_yaniti(self, response: Response, kayitlar, pk_adi: str, limit: int):
+        cursor_basligi_ekle(response, kayitlar, pk_adi, limit)
+        return self.yanit(kayitlar, response) if HIZLI_LISTE else kayitlar
+
+    def idler_yaniti(self, response: Response, kayitlar, eksikler: list[int]):
+        eksik_basligi_ekle(response, eksikler)
+        return self.yanit(kayitlar, response) if HIZLI_LISTE else kayitlar
+
+    def yanit(self, satirlar, response: Response) -> Response:
+        # Doğrudan dönen Response'a endpointte eklenen başlıklar (X-Next-Cursor) taşınır
+        return Response(self.kodla(satirlar), media_type="application/json", headers=dict(response.headers))
+
+
+OGRENCILER = HizliListe(models.Ogrenci, schemas.Ogrenci)
+DERSLER = HizliListe(models.Dersler, schemas.Dersler)
+KONULAR = HizliListe(models.Konular, schemas.Konular)
+SINAVLAR = HizliListe(models.SinavSimilasyonlari, schemas.SinavSimilasyonlari)
+ISTATISTIKLER = HizliListe(models.Istatistikler, schemas.Istatistikler)
+BASARIMLAR = HizliListe(models.OdullerVeBasarimlar, schemas.OdullerVeBasarimlar)
+CHATBOTLAR = HizliListe(models.ChatbotEtkilesim, schemas.ChatbotEtkilesim)
@@ -0,0 +1,120 @@
+import logging
+import os
+import threading
+import time
+from typing import Optional
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import configure_mappers
+import arama, crud, hizli, models, rollup, sifre
+import db as database
+
+# Başlangıç: import'ta DB'ye dokunulmaz (bkz. db.py). Yaşam döngüsü başında engine'ler kurulur ve
+# mapper'lar yapılandırılır; DB_ISINMA=1 ise ayrıca havuz önceden doldurulur, sık okuma sorguları
+# boş sonuçla bir kez çalıştırılıp engine'in derlenmiş SQL önbelleğine alınır ve login'deki sahte
+# hash hesaplanır. Böylece ilk istekler bağlantı açma/derleme maliyetini ödemez. Arama indeksleri
+# (arama.py) ARAMA_BASLANGICTA açıkken arka plan thread'inde kurulur, başlangıç beklemez. Isınma
+# ve indeks hataları başlangıcı durdurmaz (DB henüz hazır değilse ilk istekler her şeyi tembel
+# olarak kurar).
+DB_ISINMA = os.getenv("DB_ISINMA", "0").lower() in ("1", "true", "yes")
+DB_ISINMA_BAGLANTI = int(os.getenv("DB_ISINMA_BAGLANTI", str(min(4, database.DB_POOL_SIZE))))
+
+log = logging.getLogger("marathon.isinma")
+
+# (liste fonksiyonu, tekil fonksiyon, hızlı liste, model); crud ve crud_async'te aynı adlar
+KAYNAKLAR = (
+    ("get_ogrenciler", "get_ogrenci", hizli.OGRENCILER, models.Ogrenci),
+    ("get_dersler", "get_ders", hizli.DERSLER, models.Dersler),
+    ("get_konular", "get_konu", hizli.KONULAR, models.Konular),
+    ("get_sinavlar", "get_sinav", hizli.SINAVLAR, models.SinavSimilasyonlari),
+    ("get_istatistikler", "get_istatistik", hizli.ISTATISTIKLER, models.Istatistikler),
+    ("get_basarimlar", "get_basarim", hizli.BASARIMLAR, models.OdullerVeBasarimlar),
+    ("get_chatbotlar", "get_chatbot", hizli.CHATBOTLAR, models.ChatbotEtkilesim),
+)
+
+_ozet: dict = {}
+_arama_thread: Optional[threading.Thread] = None
+
+
+def _sure(t0: float) -> float:
+    return round((time.perf_counter() - t0) * 1000, 1)
+
+
+def _sync_isit():
+    baglantilar = [database.engine.connect() for _ in range(DB_ISINMA_BAGLANTI)]
+    for baglanti in baglantilar:
+        baglanti.close()
+    db = database.SessionLocal()
+    try:
+        # Var olmayan id'ler: sorgu derlenir, önbelleğe satır yazılmaz
+        for liste, tekil, hizli_liste, model in KAYNAKLAR:
+            getattr(crud, liste)(db, limit=1, kolonlar=hizli_liste.secim())
+            crud.get_by_ids(db, model, [0], kolonlar=hizli_liste.secim())
+            getattr(crud, tekil)(db, 0)
+        crud.get_ogrenci_by_email(db, "")
+    finally:
+        db.close()
+
+
+async def _async_isit():
+    import crud_async
+
+    baglantilar = [await database.async_engine.connect() for _ in range(DB_ISINMA_BAGLANTI)]
+    for baglanti in baglantilar:
+        await baglanti.close()
+    async with database.AsyncSessionLocal() as db:
+        for liste, tekil, hizli_liste, model in KAYNAKLAR:
+            await getattr(crud_async, liste)(db, limit=1, kolonlar=hizli_liste.secim())
+            await crud_async.get_by_ids(db, model, [0], kolonlar=hizli_liste.secim())
+            await getattr(crud_async, tekil)(db, 0)
+        await crud_async.get_ogrenci_by_email(db, "")
+
+
+def _arama_kur():
+    t0 = time.perf_counter()
+    try:
+        arama.kur()
+    except Exception as e:
+        _ozet["hata"] = str(e)
+        log.warning("Arama indeksleri kurulamadı, ilk aramada kurulacak: %s", e)
+    _ozet["arama_ms"] = _sure(t0)
+
+
+async def baslat():
+    global _arama_thread
+    t0 = time.perf_counter()
+    # Tembel kurulumu tetikler (bağlantı açılmaz); async engine yalnızca ASYNC_DB'de
+    database.engine
+    database.async_engine
+    # Desteklenmeyen veritabanı ilk istatistik yazımında değil başlangıçta reddedilir
+    rollup.dialect_kontrol(database.engine)
+    if database.async_engine is not None:
+        rollup.dialect_kontrol(database.async_engine.sync_engine)
+    configure_mappers()
+    _ozet.update(isinma=DB_ISINMA, kurulum_ms=_sure(t0), isinma_ms=None, arama_ms=None, hata=None)
+    if arama.ARAMA_BASLANGICTA and (_arama_thread is None or not _arama_thread.is_alive()):
+        _arama_thread = threading.Thread(target=_arama_kur, name="arama-indeksi", daemon=True)
+        _arama_thread.start()
+    if not DB_ISINMA:
+        return
+    t1 = time.perf_counter()
+    try:
+        await run_in_threadpool(_sync_isit)
+        if database.async_engine is not None:
+            await _async_isit()
+        await run_in_threadpool(sifre.sahte_hash)
+    except Exception as e:
+        _ozet["hata"] = str(e)
+        log.warning("DB ısınması başarısız, bağlantılar ilk isteklerde açılacak: %s", e)
+    _ozet["isinma_ms"] = _sure(t1)
+
+
+async def kapat():
+    # Kurulmamış engine kapanışta kurulmasın diye modül global'lerine bakılır
+    if vars(database).get("async_engine") is not None:
+        await database.async_engine.dispose()
+    if "engine" in vars(database):
+        await run_in_threadpool(database.engine.dispose)
+
+
+def ozet() -> dict:
+    return dict(_ozet, baglanti=DB_ISINMA_BAGLANTI)
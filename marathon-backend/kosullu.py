@@ -0,0 +1,105 @@
+import hashlib
+import os
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+from fastapi import Request, Response
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+
+# Koşullu GET: 200 dönen GET yanıtlarına doğrulayıcı eklenir. Endpoint ETag koymadıysa gövdenin
+# blake2b özeti zayıf ETag olur (W/: gzip'li ve gzip'siz gösterim aynı doğrulayıcıyı paylaşır).
+# If-None-Match eşleşirse, o yoksa Last-Modified <= If-Modified-Since ise gövde gönderilmeden 304
+# döner. Cache-Control: private, no-cache ile tarayıcı yanıtı saklar ama her kullanımda doğrular.
+# Akış yanıtları (export) tamponlanmaz. Satır sürümü olan kaynaklarda endpoint surum_kosulu() ile
+# kararı serileştirmeden önce verir; diğerlerinde 304 bant genişliğini kurtarır, serileştirmeyi değil.
+# Son güncelleme zamanı MySQL'de saniye çözünürlüklüdür: aynı saniyedeki iki güncelleme aynı
+# zamanı taşıyabilir, bu yüzden ETag yanıt alanlarının değerlerini de içerir.
+ONBELLEK_KONTROLU = "private, no-cache"
+# Büyük liste yanıtları gzip ile sıkıştırılır (Accept-Encoding: gzip); küçük yanıtlarda CPU'ya değmez
+GZIP_MIN_BAYT = int(os.getenv("GZIP_MIN_BAYT", "1024"))
+GZIP_SEVIYE = int(os.getenv("GZIP_SEVIYE", "5"))
+
+
+def zayif_etag(veri: bytes) -> str:
+    return f'W/"{hashlib.blake2b(veri, digest_size=16).hexdigest()}"'
+
+
+def http_tarihi(zaman: datetime) -> str:
+    # Naive DB zamanları yerel saat kabul edilir
+    return format_datetime(zaman.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def _etiket(etag: str) -> str:
+    return etag.strip().removeprefix("W/")
+
+
+def degismedi(istek_basliklari: Headers, etag: Optional[str], son_degisiklik: Optional[str]) -> bool:
+    # RFC 9110 13.2.2: If-None-Match varsa If-Modified-Since yok sayılır; zayıf karşılaştırma
+    eslesme = istek_basliklari.get("if-none-match")
+    if eslesme is not None:
+        return etag is not None and any(e.strip() == "*" or _etiket(e) == _etiket(etag) for e in eslesme.split(","))
+    tarih = istek_basliklari.get("if-modified-since")
+    if tarih is None or son_degisiklik is None:
+        return False
+    try:
+        return parsedate_to_datetime(son_degisiklik) <= parsedate_to_datetime(tarih)
+    except (TypeError, ValueError):
+        return False
+
+
+def alan_degerleri(satir, model: type[BaseModel]) -> tuple:
+    # Yanıt modelinin alanlarının satırdaki değerleri (serileştirmeden, yalnızca okunur)
+    return tuple(getattr(satir, alan, None) for alan in model.model_fields)
+
+
+def surum_kosulu(request: Request, response: Response, anahtar: str, surum: Optional[datetime],
+                 icerik: tuple = ()) -> Optional[Response]:
+    # Satır sürümünden (son güncelleme zamanı) ve içerikten doğrulayıcı: başlıklar yanıta konur,
+    # istek eşleşirse gövdesiz 304 döner. Sürüm yoksa middleware gövde özetini kullanır.
+    if surum is None:
+        return None
+    response.headers["ETag"] = zayif_etag(f"{anahtar}:{surum.isoformat()}:{icerik!r}".encode())
+    response.headers["Last-Modified"] = http_tarihi(surum)
+    response.headers["Cache-Control"] = ONBELLEK_KONTROLU
+    if degismedi(request.headers, response.headers["etag"], response.headers["last-modified"]):
+        return Response(status_code=304, headers=dict(response.headers))
+    return None
+
+
+class KosulluGetMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return await self.app(scope, receive, send)
+        istek_basliklari = Headers(scope=scope)
+        bekleyen = None  # tamponlanan http.response.start
+
+        async def gonder(mesaj):
+            nonlocal bekleyen
+            if mesaj["type"] == "http.response.start" and mesaj["status"] == 200:
+                bekleyen = mesaj
+                return
+            if mesaj["type"] != "http.response.body" or bekleyen is None:
+                return await send(mesaj)
+            baslangic, bekleyen = bekleyen, None
+            if mesaj.get("more_body", False):
+                await send(baslangic)
+                return await send(mesaj)
+            basliklar = MutableHeaders(scope=baslangic)
+            etag = basliklar.get("etag")
+            if etag is None:
+                etag = basliklar["ETag"] = zayif_etag(mesaj.get("body", b""))
+            if "cache-control" not in basliklar:
+                basliklar["Cache-Control"] = ONBELLEK_KONTROLU
+            if degismedi(istek_basliklari, etag, basliklar.get("last-modified")):
+                del basliklar["content-length"]
+                del basliklar["content-type"]
+                baslangic["status"] = 304
+                mesaj = {"type": "http.response.body", "body": b"", "more_body": False}
+            await send(baslangic)
+            await send(mesaj)
+
+        await self.app(scope, receive, gonder)
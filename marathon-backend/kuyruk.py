@@ -0,0 +1,326 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+import crud, schemas
+import db as database
+
+try:
+    import fcntl
+except ImportError:  # Windows: dosya kilidi yok, tek worker varsayılır
+    fcntl = None
+
+# Sık gelen telemetri (ders odak/enerji, istatistik) için write-behind yazma kuyruğu. Endpoint
+# kaydı doğrulayıp kuyruğa koyar ve 202 döner; arka plan thread'i kayıtları KUYRUK_PARTI
+# kayda ulaşınca ya da ilk kayıttan KUYRUK_ARALIGI saniye sonra partiler halinde, parti başına
+# tek transaction'da yazar. Anahtarlı türlerde (ders_id) aynı anahtarın bekleyen güncellemeleri
+# birleştirilir, son değer kazanır. Kuyruk (yazılmakta olanlar dahil) KUYRUK_MAX kayda
+# ulaşınca yeni kayıt reddedilir (endpoint 503 + Retry-After). Bağlantı hatasında parti kuyruğa
+# geri konur ve artan aralıkla yeniden denenir; bir tür KUYRUK_MAX_DENEME kez üst üste
+# yazılamazsa partisi KUYRUK_SPOOL dosyasına (NDJSON, yalnızca ekleme) alınır. Kapanışta kalanlar
+# yazılır, yazılamayanlar aynı dosyaya eklenir; dosya sonraki başlangıçta kuyruğa alınır.
+# Kayıtlar yazılana kadar yalnızca bu süreçte tutulur: süreç çökerse bekleyenler kaybolur.
+KUYRUK_MAX = int(os.getenv("KUYRUK_MAX", "10000"))
+KUYRUK_PARTI = int(os.getenv("KUYRUK_PARTI", "500"))
+KUYRUK_ARALIGI = float(os.getenv("KUYRUK_ARALIGI", "0.5"))
+KUYRUK_MAX_BEKLEME = float(os.getenv("KUYRUK_MAX_BEKLEME", "30"))
+KUYRUK_MAX_DENEME = int(os.getenv("KUYRUK_MAX_DENEME", "5"))
+KUYRUK_KAPANIS_SURESI = float(os.getenv("KUYRUK_KAPANIS_SURESI", "10"))
+KUYRUK_SPOOL = os.getenv("KUYRUK_SPOOL", os.path.join(os.path.dirname(os.path.abspath(__file__)), "veri", "kuyruk.ndjson"))
+
+log = logging.getLogger("marathon.kuyruk")
+
+
+class KayitTuru:
+    # yaz(db, kayitlar) -> (yazilan, hatalar); coz: spool'dan okunan JSON'u kayda çevirir
+    def __init__(self, ad: str, yaz: Callable, coz: Callable = dict, anahtar: Optional[str] = None):
+        self.ad = ad
+        self.yaz = yaz
+        self.coz = coz
+        self.anahtar = anahtar
+
+
+class YazmaKuyrugu:
+    def __init__(self, oturum_ac: Callable, turler: list, spool: str = KUYRUK_SPOOL):
+        self.oturum_ac = oturum_ac
+        self.turler = {t.ad: t for t in turler}
+        self.spool = spool
+        self._kosul = threading.Condition()
+        # Anahtarsız türler liste, anahtarlı türler anahtar -> kayıt (ekleme sırası korunur)
+        self._bekleyen = {t.ad: {} if t.anahtar else [] for t in turler}
+        self._ilk = None  # en eski bekleyen kaydın zamanı
+        self._yaziliyor = 0
+        self._thread = None
+        self._durduruluyor = False
+        self._kapandi = False
+        self._atexit = False
+        self._deneme = {t.ad: 0 for t in turler}  # tür başına üst üste başarısız yazma
+        self.sifirla()
+
+    def sifirla(self):
+        with self._kosul:
+            self.kabul = 0
+            self.birlestirilen = 0
+            self.reddedilen = 0
+            self.yazilan = 0
+            self.hatali = 0
+            self.flush = 0
+            self.flush_hata = 0
+            self.flush_toplam = 0.0
+            self.flush_max = 0.0
+            self.flush_son = 0.0
+            self.spool_yazilan = 0
+            self.spool_okunan = 0
+
+    def _derinlik(self) -> int:
+        return sum(len(b) for b in self._bekleyen.values())
+
+    def derinlik(self) -> int:
+        with self._kosul:
+            return self._derinlik() + self._yaziliyor
+
+    def _koy(self, tur: KayitTuru, kayit: dict) -> bool:
+        bekleyen = self._bekleyen[tur.ad]
+        if tur.anahtar is None:
+            bekleyen.append(kayit)
+            return False
+        anahtar = kayit[tur.anahtar]
+        birlesti = anahtar in bekleyen
+        bekleyen[anahtar] = {**bekleyen[anahtar], **kayit} if birlesti else kayit
+        return birlesti
+
+    def ekle(self, tur_adi: str, kayit: dict) -> bool:
+        tur = self.turler[tur_adi]
+        with self._kosul:
+            if self._kapandi:
+                return False
+            birlesecek = tur.anahtar is not None and kayit[tur.anahtar] in self._bekleyen[tur.ad]
+            if not birlesecek and self._derinlik() + self._yaziliyor >= KUYRUK_MAX:
+                self.reddedilen += 1
+                return False
+            ilk = self._ilk is None
+            if ilk:
+                self._ilk = time.monotonic()
+            self.birlestirilen += self._koy(tur, kayit)
+            self.kabul += 1
+            # Boş kuyrukta thread süresiz bekler; ilk kayıtta süre sayımı başlar
+            if ilk or self._derinlik() >= KUYRUK_PARTI:
+                self._kosul.notify()
+        self._calistir()
+        return True
+
+    def _calistir(self):
+        if self._thread is None:
+            with self._kosul:
+                if self._thread is None and not self._kapandi:
+                    self._thread = threading.Thread(target=self._dongu, name="yazma-kuyrugu", daemon=True)
+                    self._thread.start()
+
+    def _parti_al(self) -> dict:
+        # Tür başına en fazla KUYRUK_PARTI kayıt; kalanlar bir sonraki turda
+        parti = {}
+        for ad, bekleyen in self._bekleyen.items():
+            if not bekleyen:
+                continue
+            if isinstance(bekleyen, list):
+                parti[ad], self._bekleyen[ad] = bekleyen[:KUYRUK_PARTI], bekleyen[KUYRUK_PARTI:]
+            else:
+                anahtarlar = list(bekleyen)[:KUYRUK_PARTI]
+                parti[ad] = [bekleyen.pop(a) for a in anahtarlar]
+        self._yaziliyor = sum(len(k) for k in parti.values())
+        self._ilk = time.monotonic() if self._derinlik() else None
+        return parti
+
+    def _geri_koy(self, ad: str, kayitlar: list):
+        # Yazılamayan parti bekleyenlerin önüne; anahtarlı türde sonradan gelen değerler kazanır
+        tur, bekleyen = self.turler[ad], self._bekleyen[ad]
+        if tur.anahtar is None:
+            self._bekleyen[ad] = kayitlar + bekleyen
+        else:
+            yeni = {k[tur.anahtar]: k for k in kayitlar}
+            for anahtar, kayit in bekleyen.items():
+                yeni[anahtar] = {**yeni[anahtar], **kayit} if anahtar in yeni else kayit
+            self._bekleyen[ad] = yeni
+        if self._ilk is None:
+            self._ilk = time.monotonic()
+
+    def _yaz(self, parti: dict) -> dict:
+        # Yazılamayan türler döner (bağlantı/DB hatası); kayıt kaynaklı hatalar sayılıp atlanır.
+        # Deneme hakkı biten türün partisi yeniden denenmez, spool'a alınır.
+        kalan = {}
+        for ad, kayitlar in parti.items():
+            t0 = time.perf_counter()
+            db = self.oturum_ac()
+            try:
+                yazilan, hatalar = self.turler[ad].yaz(db, kayitlar)
+            except Exception:
+                with self._kosul:
+                    self.flush_hata += 1
+                    self._deneme[ad] += 1
+                    tukendi = self._deneme[ad] >= KUYRUK_MAX_DENEME
+                    if tukendi:
+                        self._deneme[ad] = 0
+                if not tukendi:
+                    log.exception("kuyruk: %d %s kaydı yazılamadı, yeniden denenecek", len(kayitlar), ad)
+                    kalan[ad] = kayitlar
+                    continue
+                log.exception("kuyruk: %d %s kaydı %d denemede yazılamadı, spool'a alınıyor",
+                              len(kayitlar), ad, KUYRUK_MAX_DENEME)
+                self._spool_ekle([(ad, k) for k in kayitlar])
+                continue
+            finally:
+                db.close()
+            sure = time.perf_counter() - t0
+            for hata in hatalar:
+                log.warning("kuyruk: %s kaydı atlandı: %s", ad, hata["hata"])
+            with self._kosul:
+                self._deneme[ad] = 0
+                self.flush += 1
+                self.flush_son = sure
+                self.flush_toplam += sure
+                self.flush_max = max(self.flush_max, sure)
+                self.yazilan += yazilan
+                self.hatali += len(hatalar)
+        return kalan
+
+    def _bekle(self, bekleme: float):
+        # Hata sonrası: yeni kayıt bildirimleri beklemeyi kısaltmaz, yalnızca kapanış keser
+        son = time.monotonic() + bekleme
+        while not self._durduruluyor and time.monotonic() < son:
+            self._kosul.wait(son - time.monotonic())
+
+    def _dongu(self):
+        bekleme = 0.0  # hata sonrası yeniden deneme aralığı
+        while True:
+            with self._kosul:
+                if bekleme:
+                    self._bekle(bekleme)
+                while not self._durduruluyor:
+                    derinlik = self._derinlik()
+                    if derinlik and (bekleme or derinlik >= KUYRUK_PARTI
+                                     or time.monotonic() - self._ilk >= KUYRUK_ARALIGI):
+                        break
+                    self._kosul.wait(KUYRUK_ARALIGI - (time.monotonic() - self._ilk) if derinlik else None)
+                if self._durduruluyor and not self._derinlik():
+                    return
+                parti = self._parti_al()
+            kalan = self._yaz(parti)
+            with self._kosul:
+                self._yaziliyor = 0
+                for ad, kayitlar in kalan.items():
+                    self._geri_koy(ad, kayitlar)
+                if kalan and self._durduruluyor:
+                    return  # kapanışta DB yoksa kalanlar spool'a (durdur)
+            bekleme = min(max(bekleme * 2, KUYRUK_ARALIGI), KUYRUK_MAX_BEKLEME) if kalan else 0.0
+
+    @contextmanager
+    def _spool_kilidi(self):
+        os.makedirs(os.path.dirname(self.spool) or ".", exist_ok=True)
+        with open(self.spool + ".kilit", "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _spool_ekle(self, kayitlar: list):
+        # kayitlar: (tür adı, kayıt) çiftleri
+        if not kayitlar:
+            return
+        satirlar = [json.dumps({"tur": ad, "kayit": kayit}, default=str, ensure_ascii=False) for ad, kayit in kayitlar]
+        with self._spool_kilidi(), open(self.spool, "a", encoding="utf-8") as f:
+            f.write("\n".join(satirlar) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        with self._kosul:
+            self.spool_yazilan += len(satirlar)
+        log.warning("kuyruk: %d kayıt %s dosyasına yazıldı", len(satirlar), self.spool)
+
+    def _spoola(self):
+        self._spool_ekle([(ad, kayit) for ad, bekleyen in self._bekleyen.items()
+                          for kayit in (bekleyen if isinstance(bekleyen, list) else bekleyen.values())])
+        for bekleyen in self._bekleyen.values():
+            bekleyen.clear()
+
+    def baslat(self):
+        # Önceki durdur'dan sonra yeniden başlatılabilir (ör. aynı süreçte ikinci lifespan); süre
+        # içinde bitmemiş eski thread varsa o devam eder
+        with self._kosul:
+            self._kapandi = False
+            self._durduruluyor = False
+            if self._thread is not None and not self._thread.is_alive():
+                self._thread = None
+            self._deneme = dict.fromkeys(self._deneme, 0)
+        # Önceki kapanıştan kalan spool kuyruğa alınır (birden çok worker'da yalnızca biri okur)
+        if os.path.exists(self.spool):
+            with self._spool_kilidi():
+                try:
+                    with open(self.spool, encoding="utf-8") as f:
+                        satirlar = [json.loads(s) for s in f if s.strip()]
+                except FileNotFoundError:
+                    satirlar = []
+                with self._kosul:
+                    for satir in satirlar:
+                        tur = self.turler.get(satir["tur"])
+                        if tur is not None:
+                            self._koy(tur, tur.coz(satir["kayit"]))
+                    if satirlar and self._ilk is None:
+                        self._ilk = time.monotonic()
+                    self.spool_okunan += len(satirlar)
+                if satirlar:
+                    os.remove(self.spool)
+                    log.info("kuyruk: spool'dan %d kayıt alındı", len(satirlar))
+        self._calistir()
+        if not self._atexit:
+            self._atexit = True
+            atexit.register(self.durdur)
+
+    def durdur(self, zaman_asimi: float = KUYRUK_KAPANIS_SURESI):
+        with self._kosul:
+            if self._kapandi:
+                return
+            self._durduruluyor = True
+            self._kosul.notify()
+        if self._thread is not None:
+            self._thread.join(zaman_asimi)
+        with self._kosul:
+            self._kapandi = True
+            # Thread süre içinde bitmediyse yazmakta olduğu parti yazılır ya da kaybolur
+            self._spoola()
+
+    def ozet(self) -> dict:
+        with self._kosul:
+            return {
+                "derinlik": self._derinlik(),
+                "yaziliyor": self._yaziliyor,
+                "max": KUYRUK_MAX,
+                "kabul": self.kabul,
+                "birlestirilen": self.birlestirilen,
+                "reddedilen": self.reddedilen,
+                "yazilan": self.yazilan,
+                "hatali": self.hatali,
+                "flush": self.flush,
+                "flush_hata": self.flush_hata,
+                "flush_toplam_ms": round(self.flush_toplam * 1000, 3),
+                "flush_son_ms": round(self.flush_son * 1000, 3),
+                "flush_max_ms": round(self.flush_max * 1000, 3),
+                "flush_ort_ms": round(self.flush_toplam * 1000 / self.flush, 3) if self.flush else 0.0,
+                "spool_yazilan": self.spool_yazilan,
+                "spool_okunan": self.spool_okunan,
+            }
+
+
+def _istatistik_coz(kayit: dict) -> dict:
+    return schemas.IstatistiklerCreate.model_validate(kayit).model_dump()
+
+
+KUYRUK = YazmaKuyrugu(lambda: database.SessionLocal(), [
+    KayitTuru("istatistik", crud.istatistikleri_yaz, _istatistik_coz),
+    KayitTuru("ders_odak", crud.ders_odaklarini_yaz, anahtar="ders_id"),
+])
@@ -0,0 +1,192 @@
+import bisect
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Optional
+from sqlalchemy import func, select
+import models
+from rollup import donem_baslangici
+
+# Kazanılan halka sayısına göre liderlik tabloları: (dönem, dönem başlangıcı, ders_id) başına
+# süreç içi sıralı dizi. Sıra/komşu/ilk N sorguları bisect ile O(log n) (+ dönen satır sayısı).
+# Kalıcı durum istatistikozetleri'dir: rollup her istatistik kaydıyla aynı transaction'da
+# öğrenci/dönem halka toplamını yazar; tablo ilk istendiğinde bu özetten tek indeksli sorguyla
+# kurulur, istatistikler taranmaz. ders_id verilirse yalnızca derse kayıtlı öğrenciler
+# (dersler_has_ogrenci) sıralanır. create_istatistik kaydı hemen işler; toplu ekleme ve diğer
+# worker'ların kayıtları en fazla LIDERLIK_ESITLE_ARALIGI saniyede bir pk > son_id sorgusuyla
+# eklenir. Tablolar LIDERLIK_YENILEME saniyede bir özetten yeniden kurulur (ders kayıtları,
+# rollup --yeniden-olustur gibi dış değişiklikler için).
+LIDERLIK_ESITLE_ARALIGI = float(os.getenv("LIDERLIK_ESITLE_ARALIGI", "1.0"))
+LIDERLIK_YENILEME = float(os.getenv("LIDERLIK_YENILEME", "300"))
+LIDERLIK_MAX_TABLO = int(os.getenv("LIDERLIK_MAX_TABLO", "64"))
+
+
+class SiraliTablo:
+    # Anahtar (-puan, ogrenci_id): puan azalan, eşitlikte id artan
+    def __init__(self, puanlar: dict[int, int], uyeler: Optional[set] = None, son_id: int = 0):
+        self._puanlar = dict(puanlar)
+        self._anahtarlar = sorted((-p, o) for o, p in self._puanlar.items())
+        self.uyeler = uyeler  # None: tüm öğrenciler
+        self.son_id = son_id
+        self.kurulma = time.monotonic()
+
+    def __len__(self):
+        return len(self._anahtarlar)
+
+    def ekle(self, ogrenci_id: int, artis: int):
+        eski = self._puanlar.get(ogrenci_id)
+        yeni = (eski or 0) + artis
+        self._puanlar[ogrenci_id] = yeni
+        anahtarlar, anahtar = self._anahtarlar, (-yeni, ogrenci_id)
+        if eski is None:
+            bisect.insort(anahtarlar, anahtar)
+            return
+        # Yalnızca geçilen öğrenciler kaydırılır: O(log n + geçilen), tüm dizi değil
+        i = bisect.bisect_left(anahtarlar, (-eski, ogrenci_id))
+        if anahtar < anahtarlar[i]:
+            j = bisect.bisect_left(anahtarlar, anahtar, 0, i)
+            anahtarlar[j + 1:i + 1] = anahtarlar[j:i]
+        else:
+            j = bisect.bisect_left(anahtarlar, anahtar, i + 1) - 1
+            anahtarlar[i:j] = anahtarlar[i + 1:j + 1]
+        anahtarlar[j] = anahtar
+
+    def sira(self, ogrenci_id: int) -> Optional[int]:
+        # Yarışma sırası: eşit puanlılar aynı sırayı paylaşır (1, 2, 2, 4)
+        puan = self._puanlar.get(ogrenci_id)
+        if puan is None:
+            return None
+        return bisect.bisect_left(self._anahtarlar, (-puan,)) + 1
+
+    def _satirlar(self, bas: int, son: int) -> list[dict]:
+        return [{"sira": self.sira(o), "ogrenci_id": o, "halka": -p} for p, o in self._anahtarlar[bas:son]]
+
+    def ilk(self, n: int) -> list[dict]:
+        return self._satirlar(0, n)
+
+    def konum(self, ogrenci_id: int, komsu: int) -> Optional[dict]:
+        puan = self._puanlar.get(ogrenci_id)
+        if puan is None:
+            return None
+        i = bisect.bisect_left(self._anahtarlar, (-puan, ogrenci_id))
+        return {"ogrenci_id": ogrenci_id, "sira": self.sira(ogrenci_id), "halka": puan, "toplam": len(self),
+                "komsular": self._satirlar(max(0, i - komsu), i + komsu + 1)}
+
+
+class Liderlik:
+    # Veritabanı okumaları (tablo kurma, eşitleme) kilit dışında yapılır; kilit yalnızca bellekteki
+    # tabloları korur. Kurulan tablo kilit altında yerine konur.
+    def __init__(self):
+        self._kilit = threading.Lock()
+        # Aynı anda tek eşitleme (DB okuması _kilit dışında)
+        self._esitle_kilit = threading.Lock()
+        self._tablolar = OrderedDict()  # (donem, baslangic, ders_id) -> SiraliTablo, LRU
+        # Doğrudan işlenmiş, henüz esitle'nin geçmediği istatistikler: id -> (ogrenci_id, tarih, halka).
+        # Kilit dışında kurulan tablo, anlık görüntüsünden sonra gelenleri yerine konarken buradan alır
+        self._uygulanan = {}
+        self._son_esitleme = 0.0
+
+    def _kur(self, db, donem: str, baslangic: date, ders_id: Optional[int]) -> SiraliTablo:
+        ist, ozet, bag = models.Istatistikler, models.IstatistikOzetleri, models.Dersler_has_Ogrenci
+        # Aynı transaction'daki iki okuma aynı anlık görüntüyü görür: son_id'ye kadarki
+        # kayıtlar özette, sonrakiler esitle'de
+        son_id = db.scalar(select(func.max(ist.istatistik_id))) or 0
+        sorgu = select(ozet.ogrenci_id, ozet.ozet_halkaSayisi).filter(
+            ozet.ozet_donem == donem, ozet.ozet_baslangic == baslangic)
+        uyeler = None
+        if ders_id is not None:
+            uyeler = set(db.scalars(select(bag.ogrenci_id).filter(bag.ders_id == ders_id)))
+            sorgu = sorgu.join(bag, bag.ogrenci_id == ozet.ogrenci_id).filter(bag.ders_id == ders_id)
+        return SiraliTablo({o: h for o, h in db.execute(sorgu)}, uyeler, son_id)
+
+    def _tablo(self, db, donem: str, tarih: date, ders_id: Optional[int]) -> SiraliTablo:
+        anahtar = (donem, donem_baslangici(donem, tarih), ders_id)
+        with self._kilit:
+            tablo = self._tablolar.get(anahtar)
+            if tablo is not None and time.monotonic() - tablo.kurulma <= LIDERLIK_YENILEME:
+                self._tablolar.move_to_end(anahtar)
+                return tablo
+        yeni = self._kur(db, *anahtar)
+        with self._kilit:
+            # Kurulurken doğrudan işlenenler; esitle'nin budadıkları bir sonraki eşitlemede gelir
+            for istatistik_id, (ogrenci_id, tarih_, halka) in sorted(self._uygulanan.items()):
+                self._isle(istatistik_id, ogrenci_id, tarih_, halka, [(anahtar, yeni)])
+            self._tablolar[anahtar] = yeni
+            self._tablolar.move_to_end(anahtar)
+            while len(self._tablolar) > LIDERLIK_MAX_TABLO:
+                self._tablolar.popitem(last=False)
+            self._son_esitleme = 0.0
+        return yeni
+
+    def _isle(self, istatistik_id: int, ogrenci_id, tarih, halka, tablolar=None):
+        if ogrenci_id is None or tarih is None or not halka:
+            return
+        for (donem, baslangic, _), tablo in (self._tablolar.items() if tablolar is None else tablolar):
+            if (istatistik_id > tablo.son_id and baslangic == donem_baslangici(donem, tarih)
+                    and (tablo.uyeler is None or ogrenci_id in tablo.uyeler)):
+                tablo.ekle(ogrenci_id, halka)
+
+    def istatistik_ekle(self, istatistik):
+        # create_istatistik commit'inden sonra
+        veri = (istatistik.ogrenci_id, istatistik.istatistik_tarihi, istatistik.istatistik_kazanilanHalkaSayisi)
+        with self._kilit:
+            self._isle(istatistik.istatistik_id, *veri)
+            if self._tablolar:
+                self._uygulanan[istatistik.istatistik_id] = veri
+
+    def _oku(self, db, son_id: int) -> list:
+        ist = models.Istatistikler
+        return db.execute(
+            select(ist.istatistik_id, ist.ogrenci_id, ist.istatistik_tarihi, ist.istatistik_kazanilanHalkaSayisi)
+            .filter(ist.istatistik_id > son_id).order_by(ist.istatistik_id)).all()
+
+    def _uygula(self, satirlar: list):
+        # Okuma sırasında kurulan tabloya da uygulanır (_isle her tablonun son_id'sine bakar)
+        son_id = 0
+        for istatistik_id, ogrenci_id, tarih, halka in satirlar:
+            if istatistik_id not in self._uygulanan:
+                self._isle(istatistik_id, ogrenci_id, tarih, halka)
+            son_id = istatistik_id
+        for tablo in self._tablolar.values():
+            tablo.son_id = max(tablo.son_id, son_id)
+        son_id = min((t.son_id for t in self._tablolar.values()), default=son_id)
+        self._uygulanan = {i: v for i, v in self._uygulanan.items() if i > son_id}
+
+    def esitle(self, db, zorla: bool = False):
+        # Başka bir istek zaten eşitliyorsa beklenmez (en fazla LIDERLIK_ESITLE_ARALIGI eski)
+        if not self._esitle_kilit.acquire(blocking=zorla):
+            return
+        try:
+            with self._kilit:
+                if not self._tablolar or not (zorla or time.monotonic() - self._son_esitleme >= LIDERLIK_ESITLE_ARALIGI):
+                    return
+                son_id = min(t.son_id for t in self._tablolar.values())
+            satirlar = self._oku(db, son_id)
+            with self._kilit:
+                self._uygula(satirlar)
+                self._son_esitleme = time.monotonic()
+        finally:
+            self._esitle_kilit.release()
+
+    def ilk(self, db, donem: str, tarih: date, ders_id: Optional[int] = None, n: int = 10) -> list[dict]:
+        self.esitle(db)
+        tablo = self._tablo(db, donem, tarih, ders_id)
+        with self._kilit:
+            return tablo.ilk(n)
+
+    def konum(self, db, ogrenci_id: int, donem: str, tarih: date, ders_id: Optional[int] = None,
+              komsu: int = 2) -> Optional[dict]:
+        self.esitle(db)
+        tablo = self._tablo(db, donem, tarih, ders_id)
+        with self._kilit:
+            return tablo.konum(ogrenci_id, komsu)
+
+    def ozet(self) -> dict:
+        with self._kilit:
+            return {"tablo": len(self._tablolar), "satir": sum(len(t) for t in self._tablolar.values()),
+                    "tablolar": [f"{d}:{b.isoformat()}:{'*' if ders is None else ders}" for d, b, ders in self._tablolar]}
+
+
+TABLO = Liderlik()
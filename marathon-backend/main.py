@@ -1,13 +1,33 @@
-from fastapi import FastAPI, Depends, HTTPException, Form
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from typing import Literal, Optional
+from fastapi import FastAPI, Depends, HTTPException, Form, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from db import SessionLocal, engine
-import models, schemas, crud
+import db as database
+from db import ASYNC_DB
+from oturum import oturum_gerekli, sahip_kontrolu
+from pagination import GecersizCursor, GecersizIdListesi, ID_LISTESI_MAX, SAYFA_MAX, id_listesi
+import models, schemas, arama, benzer, crud, disa_aktar, hizli, isinma, kosullu, kuyruk, liderlik, metrikler, onbellek, oturum, ozet, sifre, toplu, uyarlama
 
-# Ensure tables are created and metadata is up to date
-models.Base.metadata.create_all(bind=engine)
+# Şema Alembic ile kurulur/güncellenir: alembic upgrade head (bkz. migrations/env.py)
 
-app = FastAPI(title="Marathon Backend API", description="Eğitim platformu için backend API", version="1.0.0")
+# Başlangıçta engine'ler kurulur ve isteğe bağlı DB ısınması yapılır (bkz. isinma.py), önceki
+# kapanıştan kalan yazma kuyruğu spool'u alınır; kapanışta bekleyen kayıtlar yazılır (bkz.
+# kuyruk.py) ve havuzlar kapatılır
+@asynccontextmanager
+async def yasam_dongusu(app: FastAPI):
+    await isinma.baslat()
+    await run_in_threadpool(kuyruk.KUYRUK.baslat)
+    yield
+    await run_in_threadpool(kuyruk.KUYRUK.durdur)
+    await isinma.kapat()
+
+app = FastAPI(title="Marathon Backend API", description="Eğitim platformu için backend API", version="1.0.0", lifespan=yasam_dongusu)
 
 # CORS middleware ekle
 app.add_middleware(
@@ -29,10 +49,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Toplam-Sonuc", "X-Onek-Kesildi", "X-Eksik-Idler", "Server-Timing", "ETag", "Last-Modified"],
 )
 
+# Koşullu GET (ETag/Last-Modified, 304) sıkıştırmanın içinde: özet sıkıştırılmamış gövdeden alınır
+app.add_middleware(kosullu.KosulluGetMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=kosullu.GZIP_MIN_BAYT, compresslevel=kosullu.GZIP_SEVIYE)
+
+# İstek süresi, DB sorgu sayısı/süresi, havuz bekleme ve yanıt boyutu ölçümü (en dış katman)
+app.add_middleware(metrikler.MetrikMiddleware)
+
+@app.exception_handler(GecersizCursor)
+def gecersiz_cursor_handler(request: Request, exc: GecersizCursor):
+    return JSONResponse(status_code=400, content={"detail": "Geçersiz cursor"})
+
+@app.exception_handler(GecersizIdListesi)
+def gecersiz_id_listesi_handler(request: Request, exc: GecersizIdListesi):
+    return JSONResponse(status_code=400, content={"detail": f"ids virgülle ayrılmış 1-{ID_LISTESI_MAX} tam sayı olmalı"})
+
 def get_db():
-    db = SessionLocal()
+    db = database.SessionLocal()
     try:
         yield db
     finally:
@@ -42,34 +78,95 @@ def get_db():
 def read_root():
     return {"message": "Marathon Backend API'ye hoş geldiniz!"}
 
-# Login endpoint
+# Bağlantı havuzu sayaçları (checkout, bekleme, overflow)
+@app.get("/sistem/havuz")
+def havuz_durumu():
+    durum = {"sync": database.havuz_sayaclari.ozet(database.engine.pool)}
+    if database.async_engine is not None:
+        durum["async"] = database.async_havuz_sayaclari.ozet(database.async_engine.pool)
+    return durum
+
+# Prometheus metin formatında istek/DB/havuz metrikleri
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrikleri_getir():
+    return PlainTextResponse(metrikler.KAYIT.prometheus(havuz_durumu(), kuyruk.KUYRUK.ozet()), media_type="text/plain; version=0.0.4")
+
+# Okuma önbelleği sayaçları
+@app.get("/sistem/onbellek")
+def onbellek_durumu():
+    return onbellek.ozet()
+
+# Başlangıç süreleri (engine kurulumu, DB ısınması)
+@app.get("/sistem/baslangic")
+def baslangic_durumu():
+    return isinma.ozet()
+
+# Token doğrulama önbelleği ve iptal listesi
+@app.get("/sistem/oturum")
+def oturum_durumu():
+    return oturum.dogrulayici.ozet()
+
+# Arama indeksi boyutları
+@app.get("/sistem/arama")
+def arama_durumu():
+    return {"konular": arama.KONULAR.ozet(), "chatbot": arama.CHATBOT.ozet(), "benzer_soru": benzer.CHATBOT.ozet()}
+
+# Uyarlanabilir konu seçicinin indeks ve öğrenci durumu boyutları
+@app.get("/sistem/uyarlama")
+def uyarlama_durumu():
+    return uyarlama.MOTOR.ozet()
+
+# Bellekteki liderlik tabloları
+@app.get("/sistem/liderlik")
+def liderlik_durumu():
+    return liderlik.TABLO.ozet()
+
+# Yazma kuyruğu derinliği, birleştirme/red ve flush süreleri
+@app.get("/sistem/kuyruk")
+def kuyruk_durumu():
+    return kuyruk.KUYRUK.ozet()
+
+# Telemetri kaydı yazma kuyruğuna alınır; kuyruk doluysa 503 + Retry-After (backpressure)
+def kuyruga_al(tur: str, kayit: dict):
+    if not kuyruk.KUYRUK.ekle(tur, kayit):
+        raise HTTPException(status_code=503, detail="Yazma kuyruğu dolu, daha sonra tekrar deneyin", headers={"Retry-After": "1"})
+    return {"derinlik": kuyruk.KUYRUK.derinlik()}
+
+# Login endpoint: şifre doğrulaması sınırlı sifre havuzunda, DB işleri threadpool'da çalışır
 @app.post("/login")
-def login(email: str = Form(...), password: str = Form(...), db: Session = Depends(get_db)):
+async def login(email: str = Form(...), password: str = Form(...), db: Session = Depends(get_db)):
     try:
         # Kullanıcıyı email ile bul
-        ogrenci = crud.get_ogrenci_by_email(db, email=email)
-        if not ogrenci:
-            raise HTTPException(status_code=401, detail="E-posta veya şifre hatalı")
-        
-        # Şifre kontrolü (basit kodlama ile)
-        expected_hash = email + 'password'
-        import base64
-        expected_encoded = base64.b64encode(expected_hash.encode()).decode()
-        
-        if ogrenci.ogrenci_sifreHashed != expected_encoded:
+        ogrenci = await run_in_threadpool(crud.get_ogrenci_by_email, db, email=email)
+        kayitli = ogrenci.ogrenci_sifreHashed if ogrenci else ""
+        dogru, yeniden_hashle = await sifre.dogrula_async(password, kayitli, email)
+        if not ogrenci or not dogru:
             raise HTTPException(status_code=401, detail="E-posta veya şifre hatalı")
-        
+        # Commit sonrası nesne expire olur; yanıt önceden hazırlanır
+        kullanici = schemas.Ogrenci.model_validate(ogrenci)
+
+        # Eski base64 ya da eski parametreli kayıt: girilen şifre güncel maliyetle hashlenir
+        if yeniden_hashle:
+            yeni_hash = await sifre.hashle_async(password)
+            await run_in_threadpool(crud.update_ogrenci_sifre, db, kullanici.ogrenci_id, yeni_hash)
+
         # Başarılı login
         return {
             "message": "Giriş başarılı",
-            "user": ogrenci,
-            "token": base64.b64encode(f"{ogrenci.ogrenci_id}:{email}".encode()).decode()
+            "user": kullanici,
+            "token": oturum.token_olustur(kullanici.ogrenci_id)
         }
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Giriş sırasında hata: {str(e)}")
 
+# Logout: token süresi dolana kadar bu süreçte iptal listesinde tutulur (yalnızca bu worker, bkz. oturum.py)
+@app.post("/logout")
+async def logout(kimlik: Optional[HTTPAuthorizationCredentials] = Depends(oturum.bearer), ogrenci_id: int = Depends(oturum_gerekli)):
+    oturum.dogrulayici.iptal_et(kimlik.credentials)
+    return {"message": "Çıkış yapıldı"}
+
 # Ogrenci Endpoints
 @app.post("/ogrenciler/", response_model=schemas.Ogrenci)
 def ogrenci_olustur(ogrenci: schemas.OgrenciCreate, db: Session = Depends(get_db)):
@@ -78,19 +175,28 @@ def ogrenci_olustur(ogrenci: schemas.OgrenciCreate, db: Session = Depends(get_db
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Öğrenci oluşturulurken hata: {str(e)}")
 
-@app.get("/ogrenciler/", response_model=list[schemas.Ogrenci])
-def ogrencileri_listele(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    return crud.get_ogrenciler(db, skip=skip, limit=limit)
+@app.get("/ogrenciler/", response_model=list[schemas.Ogrenci], dependencies=[Depends(oturum_gerekli)])
+def ogrencileri_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, idler: Optional[list[int]] = Depends(id_listesi), db: Session = Depends(get_db)):
+    if idler is not None:
+        kayitlar, eksikler = crud.get_by_ids(db, models.Ogrenci, idler, kolonlar=hizli.OGRENCILER.secim())
+        return hizli.OGRENCILER.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = crud.get_ogrenciler(db, skip=skip, limit=limit, cursor=cursor, kolonlar=hizli.OGRENCILER.secim())
+    return hizli.OGRENCILER.liste_yaniti(response, kayitlar, "ogrenci_id", limit)
 
 @app.get("/ogrenciler/{ogrenci_id}", response_model=schemas.Ogrenci)
-def ogrenci_getir(ogrenci_id: int, db: Session = Depends(get_db)):
+def ogrenci_getir(ogrenci_id: int, request: Request, response: Response, db: Session = Depends(get_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
     db_ogrenci = crud.get_ogrenci(db, ogrenci_id=ogrenci_id)
     if db_ogrenci is None:
         raise HTTPException(status_code=404, detail="Öğrenci bulunamadı")
-    return db_ogrenci
+    # Değişmemişse 304: yanıt modeli doğrulanmaz, serileştirilmez
+    kosul = kosullu.surum_kosulu(request, response, f"ogrenci:{ogrenci_id}", db_ogrenci.ogrenci_sonGuncellemeTarihi,
+                                 kosullu.alan_degerleri(db_ogrenci, schemas.Ogrenci))
+    return kosul or db_ogrenci
 
 @app.put("/ogrenciler/{ogrenci_id}", response_model=schemas.Ogrenci)
-def ogrenci_guncelle(ogrenci_id: int, ogrenci: schemas.OgrenciCreate, db: Session = Depends(get_db)):
+def ogrenci_guncelle(ogrenci_id: int, ogrenci: schemas.OgrenciUpdate, db: Session = Depends(get_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
     try:
         db_ogrenci = crud.update_ogrenci(db=db, ogrenci_id=ogrenci_id, ogrenci_update=ogrenci)
         if db_ogrenci is None:
@@ -99,6 +205,66 @@ def ogrenci_guncelle(ogrenci_id: int, ogrenci: schemas.OgrenciCreate, db: Sessio
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Öğrenci güncellenirken hata: {str(e)}")
 
+@app.get("/ogrenciler/{ogrenci_id}/ozet", response_model=schemas.OgrenciOzet)
+def ogrenci_ozeti(ogrenci_id: int, baslangic: Optional[date] = None, bitis: Optional[date] = None, db: Session = Depends(get_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    # Varsayılan aralık: son 30 gün
+    bitis = bitis or date.today()
+    baslangic = baslangic or bitis - timedelta(days=29)
+    if baslangic > bitis:
+        raise HTTPException(status_code=400, detail="Başlangıç tarihi bitişten sonra olamaz")
+    if crud.get_ogrenci(db, ogrenci_id=ogrenci_id) is None:
+        raise HTTPException(status_code=404, detail="Öğrenci bulunamadı")
+    gunluk = crud.get_istatistik_gunluk(db, ogrenci_id, baslangic, bitis)
+    puanlar = crud.get_sinav_puanlari(db, ogrenci_id, baslangic, bitis)
+    return ozet.ozet_olustur(ogrenci_id, baslangic, bitis, gunluk, puanlar)
+
+# Öğrencinin seviyesine ve son sonuçlarına göre sıradaki konu (bkz. uyarlama.py)
+@app.get("/ogrenciler/{ogrenci_id}/sonraki-konu", response_model=schemas.SonrakiKonu)
+def sonraki_konu(ogrenci_id: int, ders_id: Optional[int] = None, db: Session = Depends(get_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    db_ogrenci = crud.get_ogrenci(db, ogrenci_id=ogrenci_id)
+    if db_ogrenci is None:
+        raise HTTPException(status_code=404, detail="Öğrenci bulunamadı")
+    secim = uyarlama.MOTOR.sonraki(db, db_ogrenci, ders_id=ders_id)
+    db_konu = crud.get_konu(db, konu_id=secim[0]) if secim else None
+    if db_konu is None:
+        raise HTTPException(status_code=404, detail="Uygun konu bulunamadı")
+    return schemas.SonrakiKonu(**schemas.Konular.model_validate(db_konu).model_dump(), secilen_seviye=secim[1], ustalik=secim[2])
+
+# Öğrenci ilişkileri: tümü birlikte (selectinload, 4 sorgu) ya da ilişki başına sayfalı (tek JOIN)
+@app.get("/ogrenciler/{ogrenci_id}/iliskiler", response_model=schemas.OgrenciIliskileri)
+def ogrenci_iliskileri(ogrenci_id: int, db: Session = Depends(get_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    db_ogrenci = crud.get_ogrenci_iliskileri(db, ogrenci_id=ogrenci_id)
+    if db_ogrenci is None:
+        raise HTTPException(status_code=404, detail="Öğrenci bulunamadı")
+    return db_ogrenci
+
+@app.get("/ogrenciler/{ogrenci_id}/dersler", response_model=list[schemas.Dersler])
+def ogrenci_dersleri(ogrenci_id: int, response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, db: Session = Depends(get_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    if crud.get_ogrenci(db, ogrenci_id=ogrenci_id) is None:
+        raise HTTPException(status_code=404, detail="Öğrenci bulunamadı")
+    kayitlar = crud.get_ogrenci_dersleri(db, ogrenci_id, skip=skip, limit=limit, cursor=cursor, kolonlar=hizli.DERSLER.secim())
+    return hizli.DERSLER.liste_yaniti(response, kayitlar, "ders_id", limit)
+
+@app.get("/ogrenciler/{ogrenci_id}/sinavlar", response_model=list[schemas.SinavSimilasyonlari])
+def ogrenci_sinavlari(ogrenci_id: int, response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, db: Session = Depends(get_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    if crud.get_ogrenci(db, ogrenci_id=ogrenci_id) is None:
+        raise HTTPException(status_code=404, detail="Öğrenci bulunamadı")
+    kayitlar = crud.get_ogrenci_sinavlari(db, ogrenci_id, skip=skip, limit=limit, cursor=cursor, kolonlar=hizli.SINAVLAR.secim())
+    return hizli.SINAVLAR.liste_yaniti(response, kayitlar, "sinav_id", limit)
+
+@app.get("/ogrenciler/{ogrenci_id}/basarimlar", response_model=list[schemas.OdullerVeBasarimlar])
+def ogrenci_basarimlari(ogrenci_id: int, response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, db: Session = Depends(get_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    if crud.get_ogrenci(db, ogrenci_id=ogrenci_id) is None:
+        raise HTTPException(status_code=404, detail="Öğrenci bulunamadı")
+    kayitlar = crud.get_ogrenci_basarimlari(db, ogrenci_id, skip=skip, limit=limit, cursor=cursor, kolonlar=hizli.BASARIMLAR.secim())
+    return hizli.BASARIMLAR.liste_yaniti(response, kayitlar, "basarim_id", limit)
+
 # Dersler Endpoints
 @app.post("/dersler/", response_model=schemas.Dersler)
 def ders_olustur(ders: schemas.DerslerCreate, db: Session = Depends(get_db)):
@@ -108,8 +274,12 @@ def ders_olustur(ders: schemas.DerslerCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Ders oluşturulurken hata: {str(e)}")
 
 @app.get("/dersler/", response_model=list[schemas.Dersler])
-def dersleri_listele(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    return crud.get_dersler(db, skip=skip, limit=limit)
+def dersleri_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, baslangic: Optional[date] = None, bitis: Optional[date] = None, idler: Optional[list[int]] = Depends(id_listesi), db: Session = Depends(get_db)):
+    if idler is not None:
+        kayitlar, eksikler = crud.get_by_ids(db, models.Dersler, idler, kolonlar=hizli.DERSLER.secim())
+        return hizli.DERSLER.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = crud.get_dersler(db, skip=skip, limit=limit, cursor=cursor, baslangic=baslangic, bitis=bitis, kolonlar=hizli.DERSLER.secim())
+    return hizli.DERSLER.liste_yaniti(response, kayitlar, "ders_id", limit)
 
 @app.get("/dersler/{ders_id}", response_model=schemas.Dersler)
 def ders_getir(ders_id: int, db: Session = Depends(get_db)):
@@ -118,14 +288,49 @@ def ders_getir(ders_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Ders bulunamadı")
     return db_ders
 
+# Canlı ders odak/enerji güncellemesi: doğrulanır, kuyruğa alınır (202); aynı dersin bekleyen
+# güncellemeleri birleştirilip toplu UPDATE ile yazılır
+@app.post("/dersler/{ders_id}/odak", status_code=202, response_model=schemas.KuyrukKabul, dependencies=[Depends(oturum_gerekli)])
+def ders_odak_guncelle(ders_id: int, odak: schemas.DersOdak, db: Session = Depends(get_db)):
+    alanlar = odak.model_dump(exclude_none=True)
+    if not alanlar:
+        raise HTTPException(status_code=400, detail="En az bir alan gönderilmeli")
+    if crud.get_ders(db, ders_id=ders_id) is None:
+        raise HTTPException(status_code=404, detail="Ders bulunamadı")
+    return kuyruga_al("ders_odak", {"ders_id": ders_id, **alanlar})
+
+@app.get("/dersler/{ders_id}/ogrenciler", response_model=list[schemas.Ogrenci], dependencies=[Depends(oturum_gerekli)])
+def ders_ogrencileri(ders_id: int, response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    if crud.get_ders(db, ders_id=ders_id) is None:
+        raise HTTPException(status_code=404, detail="Ders bulunamadı")
+    kayitlar = crud.get_ders_ogrencileri(db, ders_id, skip=skip, limit=limit, cursor=cursor, kolonlar=hizli.OGRENCILER.secim())
+    return hizli.OGRENCILER.liste_yaniti(response, kayitlar, "ogrenci_id", limit)
+
 # Konular Endpoints
 @app.post("/konular/", response_model=schemas.Konular)
 def konu_olustur(konu: schemas.KonularCreate, db: Session = Depends(get_db)):
     return crud.create_konu(db=db, konu=konu)
 
 @app.get("/konular/", response_model=list[schemas.Konular])
-def konulari_listele(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    return crud.get_konular(db, skip=skip, limit=limit)
+def konulari_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, ders_id: Optional[int] = None, konu_seviyesi: Optional[int] = None, idler: Optional[list[int]] = Depends(id_listesi), db: Session = Depends(get_db)):
+    if idler is not None:
+        kayitlar, eksikler = crud.get_by_ids(db, models.Konular, idler, kolonlar=hizli.KONULAR.secim())
+        return hizli.KONULAR.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = crud.get_konular(db, skip=skip, limit=limit, cursor=cursor, ders_id=ders_id, konu_seviyesi=konu_seviyesi, kolonlar=hizli.KONULAR.secim())
+    return hizli.KONULAR.liste_yaniti(response, kayitlar, "konu_id", limit)
+
+# Arama: BM25 sıralı sonuçlar skip/limit ile sayfalanır, toplam eşleşme X-Toplam-Sonuc başlığında;
+# ön ek genişlemesi sınıra takıldıysa X-Onek-Kesildi: 1 (bkz. arama.py). {id} route'larından önce tanımlı olmalı.
+def arama_basliklari(response: Response, toplam: int, kesildi: bool):
+    response.headers["X-Toplam-Sonuc"] = str(toplam)
+    if kesildi:
+        response.headers["X-Onek-Kesildi"] = "1"
+
+@app.get("/konular/ara", response_model=list[schemas.KonuAramaSonucu])
+def konularda_ara(response: Response, q: str, skip: int = Query(0, ge=0), limit: int = Query(10, ge=0, le=SAYFA_MAX), ders_id: Optional[int] = None, db: Session = Depends(get_db)):
+    toplam, sonuclar, kesildi = arama.ara(arama.KONULAR, db, q, skip=skip, limit=limit, filtre_degeri=ders_id)
+    arama_basliklari(response, toplam, kesildi)
+    return [schemas.KonuAramaSonucu(**schemas.Konular.model_validate(n).model_dump(), skor=skor) for n, skor in sonuclar]
 
 @app.get("/konular/{konu_id}", response_model=schemas.Konular)
 def konu_getir(konu_id: int, db: Session = Depends(get_db)):
@@ -140,8 +345,18 @@ def sinav_olustur(sinav: schemas.SinavSimilasyonlariCreate, db: Session = Depend
     return crud.create_sinav(db=db, sinav=sinav)
 
 @app.get("/sinavlar/", response_model=list[schemas.SinavSimilasyonlari])
-def sinavlari_listele(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    return crud.get_sinavlar(db, skip=skip, limit=limit)
+def sinavlari_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, baslangic: Optional[date] = None, bitis: Optional[date] = None, idler: Optional[list[int]] = Depends(id_listesi), db: Session = Depends(get_db)):
+    if idler is not None:
+        kayitlar, eksikler = crud.get_by_ids(db, models.SinavSimilasyonlari, idler, kolonlar=hizli.SINAVLAR.secim())
+        return hizli.SINAVLAR.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = crud.get_sinavlar(db, skip=skip, limit=limit, cursor=cursor, baslangic=baslangic, bitis=bitis, kolonlar=hizli.SINAVLAR.secim())
+    return hizli.SINAVLAR.liste_yaniti(response, kayitlar, "sinav_id", limit)
+
+# Dışa aktarma: ?bicim=ndjson|csv, akış halinde (bkz. disa_aktar.py). {id} route'larından önce tanımlı olmalı.
+@app.get("/sinavlar/export")
+def sinavlari_disa_aktar(bicim: Literal["ndjson", "csv"] = "ndjson", ogrenci_id: Optional[int] = None, baslangic: Optional[date] = None, bitis: Optional[date] = None, oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    return disa_aktar.akis_yaniti(crud.sinav_aktarim_sorgusu(ogrenci_id, baslangic, bitis), bicim, "sinavlar")
 
 @app.get("/sinavlar/{sinav_id}", response_model=schemas.SinavSimilasyonlari)
 def sinav_getir(sinav_id: int, db: Session = Depends(get_db)):
@@ -150,16 +365,54 @@ def sinav_getir(sinav_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Sınav bulunamadı")
     return db_sinav
 
+@app.get("/sinavlar/{sinav_id}/ogrenciler", response_model=list[schemas.Ogrenci], dependencies=[Depends(oturum_gerekli)])
+def sinav_ogrencileri(sinav_id: int, response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    if crud.get_sinav(db, sinav_id=sinav_id) is None:
+        raise HTTPException(status_code=404, detail="Sınav bulunamadı")
+    kayitlar = crud.get_sinav_ogrencileri(db, sinav_id, skip=skip, limit=limit, cursor=cursor, kolonlar=hizli.OGRENCILER.secim())
+    return hizli.OGRENCILER.liste_yaniti(response, kayitlar, "ogrenci_id", limit)
+
 # Istatistikler Endpoints
-@app.post("/istatistikler/", response_model=schemas.Istatistikler)
+@app.post("/istatistikler/", response_model=schemas.Istatistikler, dependencies=[Depends(oturum_gerekli)])
 def istatistik_olustur(istatistik: schemas.IstatistiklerCreate, db: Session = Depends(get_db)):
     return crud.create_istatistik(db=db, istatistik=istatistik)
 
+# Yüksek frekanslı istatistik kaydı: doğrulanır, kuyruğa alınır (202), partiler halinde yazılır
+@app.post("/istatistikler/kuyruk", status_code=202, response_model=schemas.KuyrukKabul, dependencies=[Depends(oturum_gerekli)])
+def istatistik_kuyruga_al(istatistik: schemas.IstatistiklerCreate):
+    return kuyruga_al("istatistik", istatistik.model_dump())
+
+# Toplu ekleme: JSON dizisi veya NDJSON (Content-Type: application/x-ndjson)
+def toplu_ekle_istegi(request_govde: bytes, content_type: str, sema, ekle, db: Session):
+    try:
+        gecerli, hatalar = toplu.kayitlari_ayristir(request_govde, content_type, sema)
+    except toplu.TopluIstekHatasi as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    eklenen, db_hatalari = ekle(db, gecerli)
+    hatalar = sorted(hatalar + db_hatalari, key=lambda h: h["index"])
+    return {"eklenen": eklenen, "hatali": len(hatalar), "hatalar": hatalar}
+
+@app.post("/istatistikler/batch", response_model=schemas.TopluSonuc, dependencies=[Depends(oturum_gerekli)])
+async def istatistik_toplu_olustur(request: Request, db: Session = Depends(get_db)):
+    govde = await request.body()
+    return await run_in_threadpool(toplu_ekle_istegi, govde, request.headers.get("content-type", ""),
+                                   schemas.IstatistiklerCreate, crud.create_istatistikler_toplu, db)
+
 @app.get("/istatistikler/", response_model=list[schemas.Istatistikler])
-def istatistikleri_listele(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    return crud.get_istatistikler(db, skip=skip, limit=limit)
+def istatistikleri_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, ogrenci_id: Optional[int] = None, baslangic: Optional[date] = None, bitis: Optional[date] = None, idler: Optional[list[int]] = Depends(id_listesi), db: Session = Depends(get_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    if idler is not None:
+        kayitlar, eksikler = crud.get_by_ids(db, models.Istatistikler, idler, kolonlar=hizli.ISTATISTIKLER.secim())
+        return hizli.ISTATISTIKLER.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = crud.get_istatistikler(db, skip=skip, limit=limit, cursor=cursor, ogrenci_id=ogrenci_id, baslangic=baslangic, bitis=bitis, kolonlar=hizli.ISTATISTIKLER.secim())
+    return hizli.ISTATISTIKLER.liste_yaniti(response, kayitlar, "istatistik_id", limit)
 
-@app.get("/istatistikler/{istatistik_id}", response_model=schemas.Istatistikler)
+@app.get("/istatistikler/export")
+def istatistikleri_disa_aktar(bicim: Literal["ndjson", "csv"] = "ndjson", ogrenci_id: Optional[int] = None, baslangic: Optional[date] = None, bitis: Optional[date] = None, oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    return disa_aktar.akis_yaniti(crud.istatistik_aktarim_sorgusu(ogrenci_id, baslangic, bitis), bicim, "istatistikler")
+
+@app.get("/istatistikler/{istatistik_id}", response_model=schemas.Istatistikler, dependencies=[Depends(oturum_gerekli)])
 def istatistik_getir(istatistik_id: int, db: Session = Depends(get_db)):
     db_istatistik = crud.get_istatistik(db, istatistik_id=istatistik_id)
     if db_istatistik is None:
@@ -172,8 +425,12 @@ def basarim_olustur(basarim: schemas.OdullerVeBasarimlarCreate, db: Session = De
     return crud.create_basarim(db=db, basarim=basarim)
 
 @app.get("/basarimlar/", response_model=list[schemas.OdullerVeBasarimlar])
-def basarimlari_listele(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    return crud.get_basarimlar(db, skip=skip, limit=limit)
+def basarimlari_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, idler: Optional[list[int]] = Depends(id_listesi), db: Session = Depends(get_db)):
+    if idler is not None:
+        kayitlar, eksikler = crud.get_by_ids(db, models.OdullerVeBasarimlar, idler, kolonlar=hizli.BASARIMLAR.secim())
+        return hizli.BASARIMLAR.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = crud.get_basarimlar(db, skip=skip, limit=limit, cursor=cursor, kolonlar=hizli.BASARIMLAR.secim())
+    return hizli.BASARIMLAR.liste_yaniti(response, kayitlar, "basarim_id", limit)
 
 @app.get("/basarimlar/{basarim_id}", response_model=schemas.OdullerVeBasarimlar)
 def basarim_getir(basarim_id: int, db: Session = Depends(get_db)):
@@ -182,18 +439,89 @@ def basarim_getir(basarim_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Başarım bulunamadı")
     return db_basarim
 
+@app.get("/basarimlar/{basarim_id}/ogrenciler", response_model=list[schemas.Ogrenci], dependencies=[Depends(oturum_gerekli)])
+def basarim_ogrencileri(basarim_id: int, response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    if crud.get_basarim(db, basarim_id=basarim_id) is None:
+        raise HTTPException(status_code=404, detail="Başarım bulunamadı")
+    kayitlar = crud.get_basarim_ogrencileri(db, basarim_id, skip=skip, limit=limit, cursor=cursor, kolonlar=hizli.OGRENCILER.secim())
+    return hizli.OGRENCILER.liste_yaniti(response, kayitlar, "ogrenci_id", limit)
+
+# Toplu başarım verme: JSON dizisi ya da NDJSON, kayıt başına {basarim_id, ogrenci_id}
+@app.post("/basarimlar/ver/batch", response_model=schemas.TopluSonuc, dependencies=[Depends(oturum_gerekli)])
+async def basarim_toplu_ver(request: Request, db: Session = Depends(get_db)):
+    govde = await request.body()
+    return await run_in_threadpool(toplu_ekle_istegi, govde, request.headers.get("content-type", ""),
+                                   schemas.BasarimVerme, crud.basarim_ver_toplu, db)
+
+# Başarımı liderlik tablosunun ilk n öğrencisine verir; zaten sahip olanlar atlanır
+@app.post("/basarimlar/{basarim_id}/liderlere", response_model=schemas.TopluSonuc, dependencies=[Depends(oturum_gerekli)])
+def basarim_liderlere_ver(basarim_id: int, donem: Literal["gun", "hafta", "ay"] = "hafta", tarih: Optional[date] = None, ders_id: Optional[int] = None, n: int = Query(10, ge=1, le=100), db: Session = Depends(get_db)):
+    if crud.get_basarim(db, basarim_id=basarim_id) is None:
+        raise HTTPException(status_code=404, detail="Başarım bulunamadı")
+    liderler = [s["ogrenci_id"] for s in liderlik.TABLO.ilk(db, donem, tarih or date.today(), ders_id, n=n)]
+    sahipler = crud.basarima_sahip_ogrenciler(db, basarim_id, liderler) if liderler else set()
+    kayitlar = [(i, {"basarim_id": basarim_id, "ogrenci_id": o}) for i, o in enumerate(liderler) if o not in sahipler]
+    eklenen, hatalar = crud.basarim_ver_toplu(db, kayitlar)
+    return {"eklenen": eklenen, "hatali": len(hatalar), "hatalar": hatalar}
+
+# Liderlik Endpoints: dönem başına halka sıralaması (bkz. liderlik.py)
+@app.get("/liderlik/", response_model=list[schemas.LiderlikSatiri], dependencies=[Depends(oturum_gerekli)])
+def liderlik_tablosu(donem: Literal["gun", "hafta", "ay"] = "hafta", tarih: Optional[date] = None, ders_id: Optional[int] = None, n: int = Query(10, ge=1, le=100), db: Session = Depends(get_db)):
+    return liderlik.TABLO.ilk(db, donem, tarih or date.today(), ders_id, n=n)
+
+@app.get("/liderlik/ogrenciler/{ogrenci_id}", response_model=schemas.LiderlikKonumu, dependencies=[Depends(oturum_gerekli)])
+def liderlik_konumu(ogrenci_id: int, donem: Literal["gun", "hafta", "ay"] = "hafta", tarih: Optional[date] = None, ders_id: Optional[int] = None, komsu: int = Query(2, ge=0, le=50), db: Session = Depends(get_db)):
+    konum = liderlik.TABLO.konum(db, ogrenci_id, donem, tarih or date.today(), ders_id, komsu=komsu)
+    if konum is None:
+        raise HTTPException(status_code=404, detail="Öğrenci bu dönemin liderlik tablosunda yok")
+    return konum
+
 # ChatbotEtkilesim Endpoints
-@app.post("/chatbot/", response_model=schemas.ChatbotEtkilesim)
+@app.post("/chatbot/", response_model=schemas.ChatbotEtkilesim, dependencies=[Depends(oturum_gerekli)])
 def chatbot_olustur(chatbot: schemas.ChatbotEtkilesimCreate, db: Session = Depends(get_db)):
     return crud.create_chatbot(db=db, chatbot=chatbot)
 
+@app.post("/chatbot/batch", response_model=schemas.TopluSonuc, dependencies=[Depends(oturum_gerekli)])
+async def chatbot_toplu_olustur(request: Request, db: Session = Depends(get_db)):
+    govde = await request.body()
+    return await run_in_threadpool(toplu_ekle_istegi, govde, request.headers.get("content-type", ""),
+                                   schemas.ChatbotEtkilesimCreate, crud.create_chatbotlar_toplu, db)
+
 @app.get("/chatbot/", response_model=list[schemas.ChatbotEtkilesim])
-def chatbotlari_listele(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    return crud.get_chatbotlar(db, skip=skip, limit=limit)
+def chatbotlari_listele(response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=SAYFA_MAX), cursor: Optional[str] = None, ogrenci_id: Optional[int] = None, baslangic: Optional[datetime] = None, bitis: Optional[datetime] = None, idler: Optional[list[int]] = Depends(id_listesi), db: Session = Depends(get_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    if idler is not None:
+        kayitlar, eksikler = crud.get_by_ids(db, models.ChatbotEtkilesim, idler, kolonlar=hizli.CHATBOTLAR.secim())
+        return hizli.CHATBOTLAR.idler_yaniti(response, kayitlar, eksikler)
+    kayitlar = crud.get_chatbotlar(db, skip=skip, limit=limit, cursor=cursor, ogrenci_id=ogrenci_id, baslangic=baslangic, bitis=bitis, kolonlar=hizli.CHATBOTLAR.secim())
+    return hizli.CHATBOTLAR.liste_yaniti(response, kayitlar, "chatbot_id", limit)
+
+@app.get("/chatbot/export")
+def chatbotlari_disa_aktar(bicim: Literal["ndjson", "csv"] = "ndjson", ogrenci_id: Optional[int] = None, baslangic: Optional[datetime] = None, bitis: Optional[datetime] = None, oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    return disa_aktar.akis_yaniti(crud.chatbot_aktarim_sorgusu(ogrenci_id, baslangic, bitis), bicim, "chatbot")
 
-@app.get("/chatbot/{chatbot_id}", response_model=schemas.ChatbotEtkilesim)
+@app.get("/chatbot/ara", response_model=list[schemas.ChatbotAramaSonucu])
+def chatbotta_ara(response: Response, q: str, skip: int = Query(0, ge=0), limit: int = Query(10, ge=0, le=SAYFA_MAX), ogrenci_id: Optional[int] = None, db: Session = Depends(get_db), oturum_id: int = Depends(oturum_gerekli)):
+    sahip_kontrolu(oturum_id, ogrenci_id)
+    toplam, sonuclar, kesildi = arama.ara(arama.CHATBOT, db, q, skip=skip, limit=limit, filtre_degeri=ogrenci_id)
+    arama_basliklari(response, toplam, kesildi)
+    return [schemas.ChatbotAramaSonucu(**schemas.ChatbotEtkilesim.model_validate(n).model_dump(), skor=skor) for n, skor in sonuclar]
+
+# Benzer soru: eşik üstü önceki etkileşimler (skor = kosinüs benzerliği), bkz. benzer.py
+@app.get("/chatbot/benzer", response_model=list[schemas.ChatbotAramaSonucu], dependencies=[Depends(oturum_gerekli)])
+def benzer_sorular(q: str, k: int = Query(5, ge=1, le=50), esik: Optional[float] = Query(None, ge=0.0, le=1.0), db: Session = Depends(get_db)):
+    sonuclar = benzer.benzer_sorular(db, q, k=k, esik=esik)
+    return [schemas.ChatbotAramaSonucu(**schemas.ChatbotEtkilesim.model_validate(n).model_dump(), skor=skor) for n, skor in sonuclar]
+
+@app.get("/chatbot/{chatbot_id}", response_model=schemas.ChatbotEtkilesim, dependencies=[Depends(oturum_gerekli)])
 def chatbot_getir(chatbot_id: int, db: Session = Depends(get_db)):
     db_chatbot = crud.get_chatbot(db, chatbot_id=chatbot_id)
     if db_chatbot is None:
         raise HTTPException(status_code=404, detail="Chatbot etkileşimi bulunamadı")
-    return db_chatbot 
\ No newline at end of file
+    return db_chatbot 
+
+# ASYNC_DB=1 ise CRUD endpointleri async_api'deki async karşılıklarıyla değiştirilir
+if ASYNC_DB:
+    import async_api
+    async_api.bagla(app)
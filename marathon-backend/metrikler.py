@@ -0,0 +1,260 @@
+import bisect
+import contextvars
+import logging
+import os
+import random
+import threading
+import time
+from typing import Optional
+from sqlalchemy import event
+
+# İstek düzeyinde ölçüm: route şablonu başına gecikme, DB sorgu sayısı/süresi, havuz bekleme ve
+# yanıt boyutu histogramları. ASGI middleware isteği sarar; SQLAlchemy cursor event'leri sorguları
+# contextvar'daki istek kaydına yazar (threadpool ve async greenlet'lere context kopyalanır).
+# Prometheus metin formatında /metrics'ten, istek başına Server-Timing başlığında döner.
+# YAVAS_SORGU_MS > 0 ise bu süreyi aşan sorgular YAVAS_SORGU_ORNEKLEME oranında loglanır
+# (parametreler loglanmaz).
+METRIKLER = os.getenv("METRIKLER", "1").lower() in ("1", "true", "yes")
+YAVAS_SORGU_MS = float(os.getenv("YAVAS_SORGU_MS", "0"))
+YAVAS_SORGU_ORNEKLEME = float(os.getenv("YAVAS_SORGU_ORNEKLEME", "1.0"))
+YAVAS_SORGU_MAX_UZUNLUK = 2000
+
+SURE_KOVALARI = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BOYUT_KOVALARI = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+SORGU_KOVALARI = (0, 1, 2, 4, 8, 16, 32, 64, 128)
+ESLESMEYEN = "<eslesmeyen>"
+
+yavas_log = logging.getLogger("marathon.yavas_sorgu")
+
+
+class Histogram:
+    def __init__(self, sinirlar: tuple):
+        self.sinirlar = sinirlar
+        self.kovalar = [0] * (len(sinirlar) + 1)  # son kova +Inf
+        self.toplam = 0.0
+        self.adet = 0
+
+    def gozle(self, deger: float):
+        self.kovalar[bisect.bisect_left(self.sinirlar, deger)] += 1
+        self.toplam += deger
+        self.adet += 1
+
+
+class IstekKaydi:
+    __slots__ = ("scope", "sorgu", "db_sure", "havuz_bekleme")
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.sorgu = 0
+        self.db_sure = 0.0
+        self.havuz_bekleme = 0.0
+
+    @property
+    def route(self) -> str:
+        # Router eşleşen route'u scope'a yazar; path şablonu (/ogrenciler/{ogrenci_id}) etiket olur
+        return getattr(self.scope.get("route"), "path", ESLESMEYEN)
+
+
+_istek: contextvars.ContextVar[Optional[IstekKaydi]] = contextvars.ContextVar("metrik_istek", default=None)
+
+
+class Metrikler:
+    def __init__(self):
+        self._kilit = threading.Lock()
+        self.sifirla()
+
+    def sifirla(self):
+        with self._kilit:
+            # (method, route) -> histogramlar; (method, route, durum) -> istek sayısı
+            self._rotalar = {}
+            self._durumlar = {}
+            self.sorgu = 0  # istek dışı (arka plan, başlangıç) sorgular dahil
+            self.db_sure = 0.0
+            self.yavas_sorgu = 0
+
+    def _rota(self, anahtar: tuple) -> dict:
+        rota = self._rotalar.get(anahtar)
+        if rota is None:
+            rota = self._rotalar[anahtar] = {
+                "sure": Histogram(SURE_KOVALARI),
+                "db_sure": Histogram(SURE_KOVALARI),
+                "sorgu": Histogram(SORGU_KOVALARI),
+                "boyut": Histogram(BOYUT_KOVALARI),
+                "havuz_bekleme": 0.0,
+            }
+        return rota
+
+    def istek_ekle(self, method: str, kayit: IstekKaydi, durum: int, sure: float, boyut: int):
+        anahtar = (method, kayit.route)
+        with self._kilit:
+            rota = self._rota(anahtar)
+            rota["sure"].gozle(sure)
+            rota["db_sure"].gozle(kayit.db_sure)
+            rota["sorgu"].gozle(kayit.sorgu)
+            rota["boyut"].gozle(boyut)
+            rota["havuz_bekleme"] += kayit.havuz_bekleme
+            durum_anahtari = anahtar + (durum,)
+            self._durumlar[durum_anahtari] = self._durumlar.get(durum_anahtari, 0) + 1
+
+    def sorgu_ekle(self, sure: float, yavas: bool):
+        with self._kilit:
+            self.sorgu += 1
+            self.db_sure += sure
+            self.yavas_sorgu += yavas
+
+    def prometheus(self, havuzlar: Optional[dict] = None, kuyruk: Optional[dict] = None) -> str:
+        satirlar = []
+
+        def baslik(ad: str, tur: str, aciklama: str):
+            satirlar.append(f"# HELP {ad} {aciklama}")
+            satirlar.append(f"# TYPE {ad} {tur}")
+
+        def histogram(ad: str, aciklama: str, alan: str):
+            baslik(ad, "histogram", aciklama)
+            for (method, route), rota in rotalar:
+                h, etiket = rota[alan], _etiketler(method=method, route=route)
+                kumulatif = 0
+                for sinir, adet in zip(h.sinirlar + ("+Inf",), h.kovalar):
+                    kumulatif += adet
+                    satirlar.append(f"{ad}_bucket{{{etiket},le=\"{sinir}\"}} {kumulatif}")
+                satirlar.append(f"{ad}_sum{{{etiket}}} {h.toplam:.6f}")
+                satirlar.append(f"{ad}_count{{{etiket}}} {h.adet}")
+
+        with self._kilit:
+            rotalar = sorted((k, {a: _kopya(v) for a, v in r.items()}) for k, r in self._rotalar.items())
+            durumlar = sorted(self._durumlar.items())
+            sorgu, db_sure, yavas = self.sorgu, self.db_sure, self.yavas_sorgu
+
+        baslik("http_istek_toplam", "counter", "Route ve durum koduna göre istek sayısı")
+        for (method, route, durum), adet in durumlar:
+            satirlar.append(f"http_istek_toplam{{{_etiketler(method=method, route=route, durum=durum)}}} {adet}")
+        histogram("http_istek_sure_saniye", "İstek süresi (saniye)", "sure")
+        histogram("http_istek_db_sure_saniye", "İstek başına DB sorgu süresi (saniye)", "db_sure")
+        histogram("http_istek_db_sorgu", "İstek başına DB sorgu sayısı", "sorgu")
+        histogram("http_yanit_boyut_bayt", "Yanıt gövdesi boyutu (bayt)", "boyut")
+        baslik("http_istek_havuz_bekleme_saniye_toplam", "counter", "Havuzdan bağlantı beklerken geçen toplam süre")
+        for (method, route), rota in rotalar:
+            satirlar.append(f"http_istek_havuz_bekleme_saniye_toplam{{{_etiketler(method=method, route=route)}}} "
+                            f"{rota['havuz_bekleme']:.6f}")
+
+        baslik("db_sorgu_toplam", "counter", "Çalışan SQL ifadesi sayısı (istek dışı dahil)")
+        satirlar.append(f"db_sorgu_toplam {sorgu}")
+        baslik("db_sorgu_sure_saniye_toplam", "counter", "SQL ifadelerinde geçen toplam süre")
+        satirlar.append(f"db_sorgu_sure_saniye_toplam {db_sure:.6f}")
+        baslik("db_yavas_sorgu_toplam", "counter", "YAVAS_SORGU_MS eşiğini aşan sorgu sayısı")
+        satirlar.append(f"db_yavas_sorgu_toplam {yavas}")
+
+        # Havuz sayaçları (havuz.HavuzSayaclari.ozet); SQLite'ta yalnızca checkout/checkin
+        for ad, tur, alan, carpan in (
+                ("db_havuz_checkout_toplam", "counter", "checkout", 1),
+                ("db_havuz_baglanti_toplam", "counter", "baglanti", 1),
+                ("db_havuz_timeout_toplam", "counter", "timeout", 1),
+                ("db_havuz_bekleme_saniye_toplam", "counter", "bekleme_toplam_ms", 0.001),
+                ("db_havuz_kullanimda", "gauge", "kullanimda", 1),
+                ("db_havuz_bosta", "gauge", "bosta", 1),
+                ("db_havuz_overflow", "gauge", "overflow", 1)):
+            degerler = [(motor, ozet[alan]) for motor, ozet in (havuzlar or {}).items() if alan in ozet]
+            if degerler:
+                baslik(ad, tur, f"Bağlantı havuzu: {alan}")
+                for motor, deger in degerler:
+                    satirlar.append(f"{ad}{{{_etiketler(motor=motor)}}} {deger * carpan:g}")
+
+        # Yazma kuyruğu (kuyruk.YazmaKuyrugu.ozet)
+        if kuyruk is not None:
+            for ad, tur, deger, aciklama in (
+                    ("kuyruk_derinlik", "gauge", kuyruk["derinlik"] + kuyruk["yaziliyor"], "Bekleyen ve yazılmakta olan kayıt"),
+                    ("kuyruk_kabul_toplam", "counter", kuyruk["kabul"], "Kuyruğa alınan kayıt"),
+                    ("kuyruk_birlestirilen_toplam", "counter", kuyruk["birlestirilen"], "Bekleyen kayıtla birleştirilen güncelleme"),
+                    ("kuyruk_reddedilen_toplam", "counter", kuyruk["reddedilen"], "Kuyruk dolu olduğu için reddedilen kayıt"),
+                    ("kuyruk_yazilan_toplam", "counter", kuyruk["yazilan"], "Veritabanına yazılan kayıt"),
+                    ("kuyruk_hatali_toplam", "counter", kuyruk["hatali"], "Hatalı olduğu için atlanan kayıt"),
+                    ("kuyruk_flush_toplam", "counter", kuyruk["flush"], "Başarılı parti yazımı"),
+                    ("kuyruk_flush_hata_toplam", "counter", kuyruk["flush_hata"], "Yeniden denenecek başarısız parti yazımı"),
+                    ("kuyruk_flush_saniye_toplam", "counter", kuyruk["flush_toplam_ms"] / 1000, "Parti yazımlarında geçen toplam süre"),
+                    ("kuyruk_flush_max_saniye", "gauge", kuyruk["flush_max_ms"] / 1000, "En uzun parti yazımı")):
+                baslik(ad, tur, aciklama)
+                satirlar.append(f"{ad} {deger:g}")
+        return "\n".join(satirlar) + "\n"
+
+
+def _kopya(deger):
+    if isinstance(deger, Histogram):
+        kopya = Histogram(deger.sinirlar)
+        kopya.kovalar, kopya.toplam, kopya.adet = list(deger.kovalar), deger.toplam, deger.adet
+        return kopya
+    return deger
+
+
+def _kacis(deger) -> str:
+    return str(deger).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _etiketler(**etiketler) -> str:
+    return ",".join(f'{ad}="{_kacis(deger)}"' for ad, deger in etiketler.items())
+
+
+KAYIT = Metrikler()
+
+
+def havuz_bekleme_ekle(sure: float):
+    # havuz.HavuzSayaclari dinleyicisi: bekleme süresi o anki isteğe yazılır
+    kayit = _istek.get()
+    if kayit is not None:
+        kayit.havuz_bekleme += sure
+
+
+def dinle(engine):
+    # Sync engine ya da async_engine.sync_engine
+    @event.listens_for(engine, "before_cursor_execute")
+    def _once(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrik_baslangic = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _sonra(conn, cursor, statement, parameters, context, executemany):
+        baslangic = getattr(context, "_metrik_baslangic", None)
+        if baslangic is None:
+            return
+        sure = time.perf_counter() - baslangic
+        kayit = _istek.get()
+        if kayit is not None:
+            kayit.sorgu += 1
+            kayit.db_sure += sure
+        yavas = 0 < YAVAS_SORGU_MS <= sure * 1000
+        KAYIT.sorgu_ekle(sure, yavas)
+        if yavas and random.random() < YAVAS_SORGU_ORNEKLEME:
+            yavas_log.warning("yavaş sorgu %.1f ms route=%s: %s", sure * 1000,
+                              kayit.route if kayit else None, " ".join(statement.split())[:YAVAS_SORGU_MAX_UZUNLUK])
+
+
+class MetrikMiddleware:
+    # Saf ASGI: BaseHTTPMiddleware'in gövde kopyalama ve ayrı task maliyeti yok
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRIKLER:
+            return await self.app(scope, receive, send)
+        kayit = IstekKaydi(scope)
+        belirtec = _istek.set(kayit)
+        baslangic = time.perf_counter()
+        durum, boyut = 500, 0
+
+        async def gonder(mesaj):
+            nonlocal durum, boyut
+            if mesaj["type"] == "http.response.start":
+                durum = mesaj["status"]
+                # Başlık gönderilirken endpoint bitmiştir (StreamingResponse'ta ilk parçaya kadar)
+                toplam = (time.perf_counter() - baslangic) * 1000
+                zamanlama = (f'db;dur={kayit.db_sure * 1000:.2f};desc="{kayit.sorgu} sorgu", '
+                             f"havuz;dur={kayit.havuz_bekleme * 1000:.2f}, app;dur={toplam:.2f}")
+                mesaj["headers"] = list(mesaj.get("headers", [])) + [(b"server-timing", zamanlama.encode())]
+            elif mesaj["type"] == "http.response.body":
+                boyut += len(mesaj.get("body", b""))
+            await send(mesaj)
+
+        try:
+            await self.app(scope, receive, gonder)
+        finally:
+            KAYIT.istek_ekle(scope["method"], kayit, durum, time.perf_counter() - baslangic, boyut)
+            _istek.reset(belirtec)
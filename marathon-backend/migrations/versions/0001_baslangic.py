@@ -0,0 +1,165 @@
+"""Başlangıç şeması
+
+Revision ID: 0001_baslangic
+Revises:
+Create Date: 2026-10-17 00:00:00
+
+Uygulamanın ilk tabloları. Elle kurulmuş mevcut bir veritabanı bu revizyona
+`alembic stamp 0001_baslangic` ile işaretlenip sonraki revizyonlarla güncellenir.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_baslangic'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('dersler',
+    sa.Column('ders_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('ders_adi', sa.String(length=45), nullable=False),
+    sa.Column('ders_baslangicSaati', sa.DateTime(), nullable=True),
+    sa.Column('ders_bitisSaati', sa.DateTime(), nullable=True),
+    sa.Column('ders_tamamlandiMi', sa.SmallInteger().with_variant(mysql.TINYINT(), 'mysql'), nullable=True),
+    sa.Column('ders_kazanilanHalkaSayisi', sa.SmallInteger().with_variant(mysql.TINYINT(), 'mysql'), nullable=True),
+    sa.Column('ders_odakPuani', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('ders_enerjiSeviyesi', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('ders_tarihi', sa.Date(), nullable=True),
+    sa.PrimaryKeyConstraint('ders_id')
+    )
+    op.create_index('ix_dersler_ders_id', 'dersler', ['ders_id'])
+
+    op.create_table('odullervebasarimlar',
+    sa.Column('basarim_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('basarim_adi', sa.String(length=45), nullable=True),
+    sa.Column('basarim_kazanmaTarihi', sa.Date(), nullable=True),
+    sa.PrimaryKeyConstraint('basarim_id')
+    )
+    op.create_index('ix_odullervebasarimlar_basarim_id', 'odullervebasarimlar', ['basarim_id'])
+
+    op.create_table('ogrenci',
+    sa.Column('ogrenci_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('ogrenci_kullaniciAdi', sa.String(length=45), nullable=False),
+    sa.Column('ogrenci_email', sa.String(length=45), nullable=False),
+    sa.Column('ogrenci_sifreHashed', sa.String(length=255), nullable=False),
+    sa.Column('ogrenci_ad', sa.String(length=45), nullable=False),
+    sa.Column('ogrenci_soyad', sa.String(length=45), nullable=False),
+    sa.Column('ogrenci_dogumTarihi', sa.Date(), nullable=False),
+    sa.Column('ogrenci_okulSeviyesi', sa.String(length=45), nullable=True),
+    sa.Column('ogrenci_adhdSeviyesi', sa.String(length=45), nullable=True),
+    sa.Column('ogrenci_kayitTarihi', sa.String(length=45), nullable=True),
+    sa.Column('ogrenci_odakSuresi', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('ogrenci_soruCozmeHizi', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('ogrenci_basariOrani', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('ogrenci_dikkatSeviyesi', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('ogrenci_mevcutSeviye', sa.SmallInteger(), nullable=True),
+    sa.Column('ogrenci_ogrenmeStili', sa.String(length=45), nullable=True),
+    sa.Column('ogrenci_sonGuncellemeTarihi', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('ogrenci_id'),
+    sa.UniqueConstraint('ogrenci_email'),
+    sa.UniqueConstraint('ogrenci_kullaniciAdi')
+    )
+    op.create_index('ix_ogrenci_ogrenci_id', 'ogrenci', ['ogrenci_id'])
+
+    op.create_table('sinavsimilasyonlari',
+    sa.Column('sinav_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('sinav_adi', sa.String(length=45), nullable=True),
+    sa.Column('sinav_baslangicSaati', sa.DateTime(), nullable=True),
+    sa.Column('sinav_bitisSaati', sa.DateTime(), nullable=True),
+    sa.Column('sinav_puan', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('sinav_dogruCevapSayisi', sa.SmallInteger().with_variant(mysql.TINYINT(), 'mysql'), nullable=True),
+    sa.Column('sinav_yanlisCevapSayisi', sa.SmallInteger().with_variant(mysql.TINYINT(), 'mysql'), nullable=True),
+    sa.Column('sinav_tarihi', sa.Date(), nullable=True),
+    sa.Column('sinav_kullanilanSenaryo', sa.Text(), nullable=True),
+    sa.Column('sinav_detayliAnalizMetni', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('sinav_id')
+    )
+    op.create_index('ix_sinavsimilasyonlari_sinav_id', 'sinavsimilasyonlari', ['sinav_id'])
+
+    op.create_table('chatbotetkilesim',
+    sa.Column('chatbot_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('chatbot_soruMetni', sa.Text(), nullable=True),
+    sa.Column('chatbot_cevapMetni', sa.Text(), nullable=True),
+    sa.Column('chatbot_zamanDamgasi', sa.DateTime(), nullable=True),
+    sa.Column('chatbot_duyguCikarimi', sa.String(length=45), nullable=True),
+    sa.Column('ogrenci_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['ogrenci_id'], ['ogrenci.ogrenci_id'], name='fk_chatbotetkilesim_ogrenci_id'),
+    sa.PrimaryKeyConstraint('chatbot_id')
+    )
+    op.create_index('ix_chatbotetkilesim_chatbot_id', 'chatbotetkilesim', ['chatbot_id'])
+
+    op.create_table('dersler_has_ogrenci',
+    sa.Column('ders_id', sa.Integer(), nullable=False),
+    sa.Column('ogrenci_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['ders_id'], ['dersler.ders_id'], name='fk_dersler_has_ogrenci_ders_id'),
+    sa.ForeignKeyConstraint(['ogrenci_id'], ['ogrenci.ogrenci_id'], name='fk_dersler_has_ogrenci_ogrenci_id'),
+    sa.PrimaryKeyConstraint('ders_id', 'ogrenci_id')
+    )
+    op.create_table('istatistikler',
+    sa.Column('istatistik_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('istatistik_tarihi', sa.Date(), nullable=True),
+    sa.Column('istatistik_gunlukcalismaSuresi', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('istatistik_tamamlananModulSayisi', sa.SmallInteger().with_variant(mysql.TINYINT(), 'mysql'), nullable=True),
+    sa.Column('istatistik_ortalamaodakPuani', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('istatistik_cozulenSoruSayisi', sa.SmallInteger().with_variant(mysql.TINYINT(), 'mysql'), nullable=True),
+    sa.Column('istatistik_dogruCevapOrani', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('istatistik_kazanilanHalkaSayisi', sa.SmallInteger().with_variant(mysql.TINYINT(), 'mysql'), nullable=True),
+    sa.Column('istatistik_molaSayisi', sa.SmallInteger().with_variant(mysql.TINYINT(), 'mysql'), nullable=True),
+    sa.Column('istatistik_toplamMolaSuresi', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('istatistik_uykuKalitesi', sa.DECIMAL(precision=5, scale=2), nullable=True),
+    sa.Column('istatistik_notlar', sa.Text(), nullable=True),
+    sa.Column('ogrenci_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['ogrenci_id'], ['ogrenci.ogrenci_id'], name='fk_istatistikler_ogrenci_id'),
+    sa.PrimaryKeyConstraint('istatistik_id')
+    )
+    op.create_index('ix_istatistikler_istatistik_id', 'istatistikler', ['istatistik_id'])
+
+    op.create_table('konular',
+    sa.Column('konu_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('konu_adi', sa.String(length=45), nullable=False),
+    sa.Column('konu_seviyesi', sa.SmallInteger().with_variant(mysql.TINYINT(), 'mysql'), nullable=True),
+    sa.Column('konu_tipi', sa.String(length=45), nullable=True),
+    sa.Column('konu_metni', sa.Text(), nullable=True),
+    sa.Column('konu_dogruCevap', sa.String(length=45), nullable=True),
+    sa.Column('konu_ipucu', sa.String(length=45), nullable=True),
+    sa.Column('konu_cozumMetni', sa.Text(), nullable=True),
+    sa.Column('konu_cozumVideoUrl', sa.String(length=45), nullable=True),
+    sa.Column('ders_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['ders_id'], ['dersler.ders_id'], name='fk_konular_ders_id'),
+    sa.PrimaryKeyConstraint('konu_id')
+    )
+    op.create_index('ix_konular_konu_id', 'konular', ['konu_id'])
+
+    op.create_table('odullervebasarimlar_has_ogrenci',
+    sa.Column('basarim_id', sa.Integer(), nullable=False),
+    sa.Column('ogrenci_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['basarim_id'], ['odullervebasarimlar.basarim_id'], name='fk_odullervebasarimlar_has_ogrenci_basarim_id'),
+    sa.ForeignKeyConstraint(['ogrenci_id'], ['ogrenci.ogrenci_id'], name='fk_odullervebasarimlar_has_ogrenci_ogrenci_id'),
+    sa.PrimaryKeyConstraint('basarim_id', 'ogrenci_id')
+    )
+    op.create_table('sinavsimilasyonlari_has_ogrenci',
+    sa.Column('sinav_id', sa.Integer(), nullable=False),
+    sa.Column('ogrenci_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['ogrenci_id'], ['ogrenci.ogrenci_id'], name='fk_sinavsimilasyonlari_has_ogrenci_ogrenci_id'),
+    sa.ForeignKeyConstraint(['sinav_id'], ['sinavsimilasyonlari.sinav_id'], name='fk_sinavsimilasyonlari_has_ogrenci_sinav_id'),
+    sa.PrimaryKeyConstraint('sinav_id', 'ogrenci_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sinavsimilasyonlari_has_ogrenci')
+    op.drop_table('odullervebasarimlar_has_ogrenci')
+    op.drop_table('konular')
+    op.drop_table('istatistikler')
+    op.drop_table('dersler_has_ogrenci')
+    op.drop_table('chatbotetkilesim')
+    op.drop_table('sinavsimilasyonlari')
+    op.drop_table('ogrenci')
+    op.drop_table('odullervebasarimlar')
+    op.drop_table('dersler')
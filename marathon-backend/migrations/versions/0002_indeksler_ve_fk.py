@@ -0,0 +1,89 @@
+"""Sorgu desenlerine uygun indeksler ve düzeltilmiş yabancı anahtarlar
+
+Revision ID: 0002_indeksler_ve_fk
+Revises: 0001_baslangic
+Create Date: 2026-10-17 00:00:01
+
+Öğrenci başına tarih aralığı sorguları (istatistikler, chatbotetkilesim), ders_id ile
+konu listesi ve ara tabloların ogrenci_id tarafı için indeksler. Eski modeller
+'Dersler', 'Ogrenci', 'sinav_similasyonlari', 'oduller_ve_basarimlar' gibi var olmayan
+tablolara işaret ediyordu; yanlış hedefli FK'ler kaldırılıp doğruları eklenir.
+Yetim satırlar (karşılığı olmayan ogrenci_id/ders_id) FK eklenmeden önce temizlenmelidir.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_indeksler_ve_fk'
+down_revision: Union[str, Sequence[str], None] = '0001_baslangic'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEKSLER = [
+    ('ix_istatistikler_ogrenci_tarih', 'istatistikler', ['ogrenci_id', 'istatistik_tarihi']),
+    ('ix_chatbotetkilesim_ogrenci_zaman', 'chatbotetkilesim', ['ogrenci_id', 'chatbot_zamanDamgasi']),
+    ('ix_konular_ders_seviye', 'konular', ['ders_id', 'konu_seviyesi']),
+    ('ix_sinavsimilasyonlari_sinav_tarihi', 'sinavsimilasyonlari', ['sinav_tarihi']),
+    ('ix_dersler_ders_tarihi', 'dersler', ['ders_tarihi']),
+    ('ix_dersler_has_ogrenci_ogrenci', 'dersler_has_ogrenci', ['ogrenci_id']),
+    ('ix_sinavsimilasyonlari_has_ogrenci_ogrenci', 'sinavsimilasyonlari_has_ogrenci', ['ogrenci_id']),
+    ('ix_odullervebasarimlar_has_ogrenci_ogrenci', 'odullervebasarimlar_has_ogrenci', ['ogrenci_id']),
+]
+
+# (tablo, kolon, hedef tablo, hedef kolon)
+YABANCI_ANAHTARLAR = [
+    ('konular', 'ders_id', 'dersler', 'ders_id'),
+    ('istatistikler', 'ogrenci_id', 'ogrenci', 'ogrenci_id'),
+    ('chatbotetkilesim', 'ogrenci_id', 'ogrenci', 'ogrenci_id'),
+    ('dersler_has_ogrenci', 'ders_id', 'dersler', 'ders_id'),
+    ('dersler_has_ogrenci', 'ogrenci_id', 'ogrenci', 'ogrenci_id'),
+    ('sinavsimilasyonlari_has_ogrenci', 'sinav_id', 'sinavsimilasyonlari', 'sinav_id'),
+    ('sinavsimilasyonlari_has_ogrenci', 'ogrenci_id', 'ogrenci', 'ogrenci_id'),
+    ('odullervebasarimlar_has_ogrenci', 'basarim_id', 'odullervebasarimlar', 'basarim_id'),
+    ('odullervebasarimlar_has_ogrenci', 'ogrenci_id', 'ogrenci', 'ogrenci_id'),
+]
+
+
+def _fk_duzelt(bind):
+    # SQLite ALTER ile FK değiştiremez; SQLite veritabanları 0001 ile doğru FK'lerle kurulur
+    if bind.dialect.name == 'sqlite':
+        return
+    inspector = sa.inspect(bind)
+    for tablo, kolon, hedef, hedef_kolon in YABANCI_ANAHTARLAR:
+        dogru_var = False
+        for fk in inspector.get_foreign_keys(tablo):
+            if fk['constrained_columns'] != [kolon]:
+                continue
+            if fk['referred_table'].lower() == hedef and fk['referred_columns'] == [hedef_kolon]:
+                dogru_var = True
+            else:
+                op.drop_constraint(fk['name'], tablo, type_='foreignkey')
+        if not dogru_var:
+            op.create_foreign_key(f'fk_{tablo}_{kolon}', tablo, hedef, [kolon], [hedef_kolon])
+
+
+def upgrade() -> None:
+    # İndeksler önce: MySQL FK için ayrı bir indeks oluşturmasın
+    for ad, tablo, kolonlar in INDEKSLER:
+        op.create_index(ad, tablo, kolonlar)
+    _fk_duzelt(op.get_bind())
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        for ad, tablo, _ in reversed(INDEKSLER):
+            op.drop_index(ad, table_name=tablo)
+        return
+    # MySQL FK'nin kullandığı indeksin silinmesine izin vermez; FK indeks olmadan yeniden
+    # eklenince MySQL kendi indeksini oluşturur
+    fk_kolonlari = {(t, k): (h, hk) for t, k, h, hk in YABANCI_ANAHTARLAR}
+    for ad, tablo, kolonlar in reversed(INDEKSLER):
+        hedef = fk_kolonlari.get((tablo, kolonlar[0]))
+        if hedef is not None:
+            op.drop_constraint(f'fk_{tablo}_{kolonlar[0]}', tablo, type_='foreignkey')
+        op.drop_index(ad, table_name=tablo)
+        if hedef is not None:
+            op.create_foreign_key(f'fk_{tablo}_{kolonlar[0]}', tablo, hedef[0], [kolonlar[0]], [hedef[1]])
@@ -0,0 +1,40 @@
+"""istatistikozetleri rollup tablosu
+
+Revision ID: 0003_istatistik_ozetleri
+Revises: 0002_indeksler_ve_fk
+Create Date: 2026-10-17 00:00:02
+
+Tablo oluşturulduktan sonra mevcut veriler için: python -m rollup --yeniden-olustur
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_istatistik_ozetleri'
+down_revision: Union[str, Sequence[str], None] = '0002_indeksler_ve_fk'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('istatistikozetleri',
+    sa.Column('ogrenci_id', sa.Integer(), nullable=False),
+    sa.Column('ozet_donem', sa.String(length=5), nullable=False),
+    sa.Column('ozet_baslangic', sa.Date(), nullable=False),
+    sa.Column('ozet_kayitSayisi', sa.Integer(), nullable=False),
+    sa.Column('ozet_calismaSuresi', sa.DECIMAL(precision=14, scale=2), nullable=False),
+    sa.Column('ozet_odakToplam', sa.DECIMAL(precision=14, scale=2), nullable=False),
+    sa.Column('ozet_odakSayisi', sa.Integer(), nullable=False),
+    sa.Column('ozet_dogruToplam', sa.DECIMAL(precision=14, scale=2), nullable=False),
+    sa.Column('ozet_dogruSayisi', sa.Integer(), nullable=False),
+    sa.Column('ozet_cozulenSoru', sa.Integer(), nullable=False),
+    sa.Column('ozet_halkaSayisi', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['ogrenci_id'], ['ogrenci.ogrenci_id'], name='fk_istatistikozetleri_ogrenci_id'),
+    sa.PrimaryKeyConstraint('ogrenci_id', 'ozet_donem', 'ozet_baslangic')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('istatistikozetleri')
@@ -0,0 +1,25 @@
+"""liderlik tabloları için istatistikozetleri dönem indeksi
+
+Revision ID: 0004_liderlik_indeksi
+Revises: 0003_istatistik_ozetleri
+Create Date: 2026-10-17 00:00:03
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_liderlik_indeksi'
+down_revision: Union[str, Sequence[str], None] = '0003_istatistik_ozetleri'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_istatistikozetleri_donem_halka', 'istatistikozetleri',
+                    ['ozet_donem', 'ozet_baslangic', 'ozet_halkaSayisi'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_istatistikozetleri_donem_halka', table_name='istatistikozetleri')
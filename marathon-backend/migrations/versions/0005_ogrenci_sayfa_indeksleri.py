@@ -0,0 +1,31 @@
+"""öğrenci başına sayfalı listeler için ogrenci_id + pk indeksleri
+
+Revision ID: 0005_ogrenci_sayfa_indeksleri
+Revises: 0004_liderlik_indeksi
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_ogrenci_sayfa_indeksleri'
+down_revision: Union[str, Sequence[str], None] = '0004_liderlik_indeksi'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEKSLER = [
+    ('ix_istatistikler_ogrenci_id', 'istatistikler', ['ogrenci_id', 'istatistik_id']),
+    ('ix_chatbotetkilesim_ogrenci_id', 'chatbotetkilesim', ['ogrenci_id', 'chatbot_id']),
+]
+
+
+def upgrade() -> None:
+    for ad, tablo, kolonlar in INDEKSLER:
+        op.create_index(ad, tablo, kolonlar)
+
+
+def downgrade() -> None:
+    for ad, tablo, _ in reversed(INDEKSLER):
+        op.drop_index(ad, table_name=tablo)
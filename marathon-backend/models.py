@@ -1,8 +1,16 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, DECIMAL, SmallInteger, Text, ForeignKey, Table
-from sqlalchemy.dialects.mysql import TINYINT
+from sqlalchemy import Column, Integer, String, Date, DateTime, DECIMAL, SmallInteger, Text, ForeignKey, Table, Index
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
 from db import Base
 
+# MySQL'de TINYINT, diğer dialect'lerde (ör. testlerdeki SQLite) SMALLINT
+TinyInt = SmallInteger().with_variant(mysql.TINYINT(), "mysql")
+
+# Çoktan-çoğa ilişkiler lazy="raise": fark edilmeden N+1 sorgu üretilmesin diye yalnızca
+# selectinload/joinedload ile (ör. crud.get_ogrenci_iliskileri) yüklenebilir
+def _iliski(hedef: str, bag: str, karsi: str, sira: str):
+    return relationship(hedef, secondary=bag, back_populates=karsi, order_by=sira, lazy="raise")
+
 class Ogrenci(Base):
     __tablename__ = "ogrenci"
     
@@ -24,59 +32,90 @@ class Ogrenci(Base):
     ogrenci_ogrenmeStili = Column(String(45))
     ogrenci_sonGuncellemeTarihi = Column(DateTime, nullable=False)
 
+    dersler = _iliski("Dersler", "dersler_has_ogrenci", "ogrenciler", "Dersler.ders_id")
+    sinavlar = _iliski("SinavSimilasyonlari", "sinavsimilasyonlari_has_ogrenci", "ogrenciler", "SinavSimilasyonlari.sinav_id")
+    basarimlar = _iliski("OdullerVeBasarimlar", "odullervebasarimlar_has_ogrenci", "ogrenciler", "OdullerVeBasarimlar.basarim_id")
+
 class Dersler(Base):
     __tablename__ = "dersler"
+    __table_args__ = (Index("ix_dersler_ders_tarihi", "ders_tarihi"),)
     ders_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     ders_adi = Column(String(45), nullable=False)
     ders_baslangicSaati = Column(DateTime)
     ders_bitisSaati = Column(DateTime)
-    ders_tamamlandiMi = Column(TINYINT)
-    ders_kazanilanHalkaSayisi = Column(TINYINT)
+    ders_tamamlandiMi = Column(TinyInt)
+    ders_kazanilanHalkaSayisi = Column(TinyInt)
     ders_odakPuani = Column(DECIMAL(5,2))
     ders_enerjiSeviyesi = Column(DECIMAL(5,2))
     ders_tarihi = Column(Date)
 
+    ogrenciler = _iliski("Ogrenci", "dersler_has_ogrenci", "dersler", "Ogrenci.ogrenci_id")
+
 class Konular(Base):
     __tablename__ = "konular"
+    __table_args__ = (Index("ix_konular_ders_seviye", "ders_id", "konu_seviyesi"),)
     konu_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     konu_adi = Column(String(45), nullable=False)
-    konu_seviyesi = Column(TINYINT)
+    konu_seviyesi = Column(TinyInt)
     konu_tipi = Column(String(45))
     konu_metni = Column(Text)
     konu_dogruCevap = Column(String(45))
     konu_ipucu = Column(String(45))
     konu_cozumMetni = Column(Text)
     konu_cozumVideoUrl = Column(String(45))
-    ders_id = Column(Integer, ForeignKey('Dersler.ders_id'))
+    ders_id = Column(Integer, ForeignKey('dersler.ders_id'))
 
 class SinavSimilasyonlari(Base):
     __tablename__ = "sinavsimilasyonlari"
+    __table_args__ = (Index("ix_sinavsimilasyonlari_sinav_tarihi", "sinav_tarihi"),)
     sinav_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     sinav_adi = Column(String(45))
     sinav_baslangicSaati = Column(DateTime)
     sinav_bitisSaati = Column(DateTime)
     sinav_puan = Column(DECIMAL(5,2))
-    sinav_dogruCevapSayisi = Column(TINYINT)
-    sinav_yanlisCevapSayisi = Column(TINYINT)
+    sinav_dogruCevapSayisi = Column(TinyInt)
+    sinav_yanlisCevapSayisi = Column(TinyInt)
     sinav_tarihi = Column(Date)
     sinav_kullanilanSenaryo = Column(Text)
     sinav_detayliAnalizMetni = Column(Text)
 
+    ogrenciler = _iliski("Ogrenci", "sinavsimilasyonlari_has_ogrenci", "sinavlar", "Ogrenci.ogrenci_id")
+
 class Istatistikler(Base):
     __tablename__ = "istatistikler"
+    # ogrenci_id + pk: öğrencinin sayfalı listesi (ORDER BY istatistik_id LIMIT) sıralamasız okunur
+    __table_args__ = (Index("ix_istatistikler_ogrenci_tarih", "ogrenci_id", "istatistik_tarihi"),
+                      Index("ix_istatistikler_ogrenci_id", "ogrenci_id", "istatistik_id"))
     istatistik_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     istatistik_tarihi = Column(Date)
     istatistik_gunlukcalismaSuresi = Column(DECIMAL(5,2))
-    istatistik_tamamlananModulSayisi = Column(TINYINT)
+    istatistik_tamamlananModulSayisi = Column(TinyInt)
     istatistik_ortalamaodakPuani = Column(DECIMAL(5,2))
-    istatistik_cozulenSoruSayisi = Column(TINYINT)
+    istatistik_cozulenSoruSayisi = Column(TinyInt)
     istatistik_dogruCevapOrani = Column(DECIMAL(5,2))
-    istatistik_kazanilanHalkaSayisi = Column(TINYINT)
-    istatistik_molaSayisi = Column(TINYINT)
+    istatistik_kazanilanHalkaSayisi = Column(TinyInt)
+    istatistik_molaSayisi = Column(TinyInt)
     istatistik_toplamMolaSuresi = Column(DECIMAL(5,2))
     istatistik_uykuKalitesi = Column(DECIMAL(5,2))
     istatistik_notlar = Column(Text)
-    ogrenci_id = Column(Integer, ForeignKey('Ogrenci.ogrenci_id'))
+    ogrenci_id = Column(Integer, ForeignKey('ogrenci.ogrenci_id'))
+
+# Istatistikler için öğrenci başına gün/hafta/ay toplamları (rollup.py günceller)
+class IstatistikOzetleri(Base):
+    __tablename__ = "istatistikozetleri"
+    # Liderlik tabloları dönem başına bu indeksten kurulur (liderlik.py)
+    __table_args__ = (Index("ix_istatistikozetleri_donem_halka", "ozet_donem", "ozet_baslangic", "ozet_halkaSayisi"),)
+    ogrenci_id = Column(Integer, ForeignKey('ogrenci.ogrenci_id'), primary_key=True)
+    ozet_donem = Column(String(5), primary_key=True)  # 'gun', 'hafta', 'ay'
+    ozet_baslangic = Column(Date, primary_key=True)
+    ozet_kayitSayisi = Column(Integer, nullable=False, default=0)
+    ozet_calismaSuresi = Column(DECIMAL(14,2), nullable=False, default=0)
+    ozet_odakToplam = Column(DECIMAL(14,2), nullable=False, default=0)
+    ozet_odakSayisi = Column(Integer, nullable=False, default=0)
+    ozet_dogruToplam = Column(DECIMAL(14,2), nullable=False, default=0)
+    ozet_dogruSayisi = Column(Integer, nullable=False, default=0)
+    ozet_cozulenSoru = Column(Integer, nullable=False, default=0)
+    ozet_halkaSayisi = Column(Integer, nullable=False, default=0)
 
 class OdullerVeBasarimlar(Base):
     __tablename__ = "odullervebasarimlar"
@@ -84,27 +123,34 @@ class OdullerVeBasarimlar(Base):
     basarim_adi = Column(String(45))
     basarim_kazanmaTarihi = Column(Date)
 
+    ogrenciler = _iliski("Ogrenci", "odullervebasarimlar_has_ogrenci", "basarimlar", "Ogrenci.ogrenci_id")
+
 class ChatbotEtkilesim(Base):
     __tablename__ = "chatbotetkilesim"
+    __table_args__ = (Index("ix_chatbotetkilesim_ogrenci_zaman", "ogrenci_id", "chatbot_zamanDamgasi"),
+                      Index("ix_chatbotetkilesim_ogrenci_id", "ogrenci_id", "chatbot_id"))
     chatbot_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     chatbot_soruMetni = Column(Text)
     chatbot_cevapMetni = Column(Text)
     chatbot_zamanDamgasi = Column(DateTime)
     chatbot_duyguCikarimi = Column(String(45))
-    ogrenci_id = Column(Integer, ForeignKey('Ogrenci.ogrenci_id'))
+    ogrenci_id = Column(Integer, ForeignKey('ogrenci.ogrenci_id'))
 
 # Çoktan-çoğa ilişki tabloları
 class Dersler_has_Ogrenci(Base):
     __tablename__ = "dersler_has_ogrenci"
+    __table_args__ = (Index("ix_dersler_has_ogrenci_ogrenci", "ogrenci_id"),)
     ders_id = Column(Integer, ForeignKey('dersler.ders_id'), primary_key=True)
     ogrenci_id = Column(Integer, ForeignKey('ogrenci.ogrenci_id'), primary_key=True)
 
 class SinavSimilasyonlari_has_Ogrenci(Base):
     __tablename__ = "sinavsimilasyonlari_has_ogrenci"
-    sinav_id = Column(Integer, ForeignKey('sinav_similasyonlari.sinav_id'), primary_key=True)
+    __table_args__ = (Index("ix_sinavsimilasyonlari_has_ogrenci_ogrenci", "ogrenci_id"),)
+    sinav_id = Column(Integer, ForeignKey('sinavsimilasyonlari.sinav_id'), primary_key=True)
     ogrenci_id = Column(Integer, ForeignKey('ogrenci.ogrenci_id'), primary_key=True)
 
 class OdullerVeBasarimlar_has_Ogrenci(Base):
     __tablename__ = "odullervebasarimlar_has_ogrenci"
-    basarim_id = Column(Integer, ForeignKey('oduller_ve_basarimlar.basarim_id'), primary_key=True)
+    __table_args__ = (Index("ix_odullervebasarimlar_has_ogrenci_ogrenci", "ogrenci_id"),)
+    basarim_id = Column(Integer, ForeignKey('odullervebasarimlar.basarim_id'), primary_key=True)
     ogrenci_id = Column(Integer, ForeignKey('ogrenci.ogrenci_id'), primary_key=True) 
\ No newline at end of file
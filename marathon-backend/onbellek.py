@@ -0,0 +1,172 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+# Okuma önbelleği sayaçları
+class OnbellekSayaclari:
+    def __init__(self):
+        self._kilit = threading.Lock()
+        self.sifirla()
+
+    def sifirla(self):
+        with self._kilit:
+            self.hit = 0
+            self.miss = 0
+            self.tahliye = 0
+            self.gecersiz = 0
+
+    def artir(self, alan: str, adet: int = 1):
+        with self._kilit:
+            setattr(self, alan, getattr(self, alan) + adet)
+
+    def ozet(self) -> dict:
+        with self._kilit:
+            toplam = self.hit + self.miss
+            return {
+                "hit": self.hit,
+                "miss": self.miss,
+                "hit_orani": round(self.hit / toplam, 4) if toplam else 0.0,
+                "tahliye": self.tahliye,
+                "gecersiz": self.gecersiz,
+            }
+
+
+# Süreç içi TTL + LRU önbellek; hem kayıt sayısı hem yaklaşık bayt sınırı var
+class BellekOnbellek:
+    def __init__(self, ttl: float = 300, max_kayit: int = 10000, max_bayt: int = 64 * 1024 * 1024,
+                 sayaclar: Optional[OnbellekSayaclari] = None):
+        self.ttl = ttl
+        self.max_kayit = max_kayit
+        self.max_bayt = max_bayt
+        self.sayaclar = sayaclar or OnbellekSayaclari()
+        self._kayitlar = OrderedDict()
+        self._bayt = 0
+        self._kilit = threading.Lock()
+
+    def getir(self, anahtar: str):
+        with self._kilit:
+            kayit = self._kayitlar.get(anahtar)
+            if kayit is not None and kayit[0] < time.monotonic():
+                self._cikar(anahtar)
+                kayit = None
+            if kayit is None:
+                return None
+            self._kayitlar.move_to_end(anahtar)
+            return kayit[1]
+
+    def koy(self, anahtar: str, deger):
+        # Boyut, değerin JSON karşılığından tahmin edilir; değer kendisi saklanır
+        bayt = len(json.dumps(deger, separators=(",", ":")))
+        if bayt > self.max_bayt:
+            return
+        with self._kilit:
+            if anahtar in self._kayitlar:
+                self._cikar(anahtar)
+            self._kayitlar[anahtar] = (time.monotonic() + self.ttl, deger, bayt)
+            self._bayt += bayt
+            while len(self._kayitlar) > self.max_kayit or self._bayt > self.max_bayt:
+                self._cikar(next(iter(self._kayitlar)))
+                self.sayaclar.artir("tahliye")
+
+    def sil(self, anahtar: str):
+        with self._kilit:
+            if anahtar in self._kayitlar:
+                self._cikar(anahtar)
+
+    def temizle(self):
+        with self._kilit:
+            self._kayitlar.clear()
+            self._bayt = 0
+
+    def boyut(self) -> dict:
+        with self._kilit:
+            return {"kayit": len(self._kayitlar), "bayt": self._bayt}
+
+    def _cikar(self, anahtar: str):
+        self._bayt -= self._kayitlar.pop(anahtar)[2]
+
+
+# Worker'lar arası paylaşılan önbellek. istemci get/set(ex=)/delete sunan herhangi bir
+# nesne olabilir; verilmezse REDIS_URL ile redis istemcisi kurulur.
+class RedisOnbellek:
+    def __init__(self, ttl: float = 300, istemci=None, url: Optional[str] = None,
+                 onek: str = "marathon:", sayaclar: Optional[OnbellekSayaclari] = None):
+        if istemci is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise RuntimeError("CACHE_BACKEND=redis için 'redis' paketi kurulu olmalı") from e
+            istemci = redis.Redis.from_url(url or "redis://localhost:6379/0")
+        self.ttl = ttl
+        self.istemci = istemci
+        self.onek = onek
+        self.sayaclar = sayaclar or OnbellekSayaclari()
+
+    def getir(self, anahtar: str):
+        veri = self.istemci.get(self.onek + anahtar)
+        return json.loads(veri) if veri is not None else None
+
+    def koy(self, anahtar: str, deger):
+        self.istemci.set(self.onek + anahtar, json.dumps(deger, separators=(",", ":")), ex=int(self.ttl))
+
+    def sil(self, anahtar: str):
+        self.istemci.delete(self.onek + anahtar)
+
+    def temizle(self):
+        for anahtar in self.istemci.scan_iter(self.onek + "*"):
+            self.istemci.delete(anahtar)
+
+    def boyut(self) -> dict:
+        return {}
+
+
+def onbellek_olustur():
+    ttl = float(os.getenv("CACHE_TTL", "300"))
+    backend = os.getenv("CACHE_BACKEND", "memory")
+    if backend == "redis":
+        return RedisOnbellek(ttl=ttl, url=os.getenv("REDIS_URL"))
+    if backend == "none":
+        return None
+    return BellekOnbellek(
+        ttl=ttl,
+        max_kayit=int(os.getenv("CACHE_MAX_ITEMS", "10000")),
+        max_bayt=int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    )
+
+
+onbellek = onbellek_olustur()
+
+
+def ayarla(yeni):
+    # Testlerde / benchmarklarda backend'i değiştirmek için
+    global onbellek
+    onbellek = yeni
+
+
+def getir(anahtar: str):
+    if onbellek is None:
+        return None
+    deger = onbellek.getir(anahtar)
+    onbellek.sayaclar.artir("hit" if deger is not None else "miss")
+    return deger
+
+
+def koy(anahtar: str, deger):
+    if onbellek is not None and deger is not None:
+        onbellek.koy(anahtar, deger)
+
+
+def gecersiz_kil(anahtar: str):
+    if onbellek is not None:
+        onbellek.sil(anahtar)
+        onbellek.sayaclar.artir("gecersiz")
+
+
+def ozet() -> dict:
+    if onbellek is None:
+        return {"backend": "none"}
+    return {"backend": type(onbellek).__name__, **onbellek.sayaclar.ozet(), **onbellek.boyut()}
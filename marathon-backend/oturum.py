@@ -0,0 +1,135 @@
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# İmzalı, süreli oturum token'ı: base64url(payload).base64url(HMAC-SHA256)
+# payload: {"sub": ogrenci_id, "exp": bitiş (epoch sn), "jti": token kimliği}
+# Tüm worker/sunucular aynı TOKEN_ANAHTARI ile çalışmalı; verilmezse uygulama başlamaz.
+# Yalnızca geliştirmede TOKEN_GELISTIRME=1 ile süreç başına rastgele anahtar kullanılabilir
+# (bu durumda worker'lar birbirinin token'ını reddeder, yeniden başlatma herkesi çıkarır).
+TOKEN_ANAHTARI = os.getenv("TOKEN_ANAHTARI", "").encode()
+TOKEN_GELISTIRME = os.getenv("TOKEN_GELISTIRME", "0").lower() in ("1", "true", "yes")
+TOKEN_SURESI = int(os.getenv("TOKEN_SURESI", str(8 * 3600)))
+TOKEN_ONBELLEK_BOYUTU = int(os.getenv("TOKEN_ONBELLEK_BOYUTU", "10000"))
+
+if not TOKEN_ANAHTARI:
+    if not TOKEN_GELISTIRME:
+        raise RuntimeError("TOKEN_ANAHTARI tanımlı değil (geliştirme için TOKEN_GELISTIRME=1)")
+    TOKEN_ANAHTARI = secrets.token_bytes(32)
+    logging.getLogger("marathon.oturum").warning("TOKEN_ANAHTARI yok, süreç başına rastgele anahtar kullanılıyor")
+
+
+class GecersizToken(ValueError):
+    pass
+
+
+def _b64(veri: bytes) -> str:
+    return base64.urlsafe_b64encode(veri).rstrip(b"=").decode()
+
+
+def _b64_coz(metin: str) -> bytes:
+    return base64.urlsafe_b64decode(metin + "=" * (-len(metin) % 4))
+
+
+def _imza(govde: str) -> str:
+    return _b64(hmac.new(TOKEN_ANAHTARI, govde.encode(), hashlib.sha256).digest())
+
+
+def token_olustur(ogrenci_id: int, sure: Optional[int] = None) -> str:
+    payload = {"sub": ogrenci_id, "exp": int(time.time()) + (sure or TOKEN_SURESI), "jti": secrets.token_hex(8)}
+    govde = _b64(json.dumps(payload, separators=(",", ":")).encode())
+    return f"{govde}.{_imza(govde)}"
+
+
+def _coz(token: str) -> dict:
+    govde, ayirac, imza = token.partition(".")
+    if not ayirac or not hmac.compare_digest(imza.encode(), _imza(govde).encode()):
+        raise GecersizToken("imza geçersiz")
+    try:
+        payload = json.loads(_b64_coz(govde))
+        int(payload["sub"]), int(payload["exp"]), str(payload["jti"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise GecersizToken("payload geçersiz") from e
+    return payload
+
+
+# Doğrulanmış token'ların LRU'su ve iptal listesi. Önbellek yalnızca HMAC + JSON maliyetini
+# atlar; süre ve iptal kontrolü her istekte yapılır. İkisi de süreç içidir (worker başına):
+# logout yalnızca isteği alan worker'da geçerlidir, diğer worker'lar ve yeniden başlatılan
+# süreç token'ı süresi dolana kadar (TOKEN_SURESI) kabul eder. Kesin iptal gerekiyorsa
+# TOKEN_SURESI kısa tutulmalı ya da liste paylaşılan bir depoya taşınmalıdır.
+class TokenDogrulayici:
+    def __init__(self, max_kayit: int = TOKEN_ONBELLEK_BOYUTU):
+        self.max_kayit = max_kayit
+        self._dogrulanan = OrderedDict()
+        self._iptal = {}
+        self._kilit = threading.Lock()
+        self.hit = 0
+        self.miss = 0
+
+    def dogrula(self, token: str) -> dict:
+        with self._kilit:
+            payload = self._dogrulanan.get(token)
+            if payload is not None:
+                self._dogrulanan.move_to_end(token)
+                self.hit += 1
+        if payload is None:
+            payload = _coz(token)
+            with self._kilit:
+                self.miss += 1
+                self._dogrulanan[token] = payload
+                while len(self._dogrulanan) > self.max_kayit:
+                    self._dogrulanan.popitem(last=False)
+        if payload["exp"] < time.time():
+            raise GecersizToken("token süresi dolmuş")
+        if payload["jti"] in self._iptal:
+            raise GecersizToken("token iptal edilmiş")
+        return payload
+
+    def iptal_et(self, token: str):
+        payload = _coz(token)
+        simdi = time.time()
+        with self._kilit:
+            # Liste yalnızca süresi dolmamış token'ları tutar; bu yüzden küçük kalır
+            for jti in [j for j, exp in self._iptal.items() if exp < simdi]:
+                del self._iptal[jti]
+            self._iptal[payload["jti"]] = payload["exp"]
+            self._dogrulanan.pop(token, None)
+
+    def ozet(self) -> dict:
+        with self._kilit:
+            return {"onbellek": len(self._dogrulanan), "iptal": len(self._iptal), "iptal_kapsami": "surec",
+                    "hit": self.hit, "miss": self.miss}
+
+
+dogrulayici = TokenDogrulayici()
+bearer = HTTPBearer(auto_error=False)
+
+
+# Korunan endpointlerin dependency'si; MySQL'e gitmez, ogrenci_id döner
+async def oturum_gerekli(kimlik: Optional[HTTPAuthorizationCredentials] = Depends(bearer)) -> int:
+    if kimlik is None:
+        raise HTTPException(status_code=401, detail="Oturum gerekli", headers={"WWW-Authenticate": "Bearer"})
+    try:
+        return int(dogrulayici.dogrula(kimlik.credentials)["sub"])
+    except GecersizToken as e:
+        raise HTTPException(status_code=401, detail=f"Geçersiz oturum: {e}", headers={"WWW-Authenticate": "Bearer"})
+
+
+# Öğrenciye ait veriye yalnızca o öğrencinin oturumu erişir (path ya da sorgu ogrenci_id'si)
+def sahip_kontrolu(oturum_id: int, ogrenci_id: Optional[int]):
+    if ogrenci_id is not None and ogrenci_id != oturum_id:
+        raise HTTPException(status_code=403, detail="Bu öğrencinin verilerine erişim yetkiniz yok")
@@ -0,0 +1,93 @@
+from datetime import date, timedelta
+from typing import Optional
+
+
+def _oran(toplam, sayi) -> Optional[float]:
+    return round(float(toplam) / sayi, 4) if sayi else None
+
+
+def _yuzdelik(sirali: list[float], p: float) -> Optional[float]:
+    # Doğrusal interpolasyon (numpy/percentile_cont "linear" yöntemi)
+    if not sirali:
+        return None
+    konum = (len(sirali) - 1) * p
+    alt = int(konum)
+    ust = min(alt + 1, len(sirali) - 1)
+    return round(sirali[alt] + (sirali[ust] - sirali[alt]) * (konum - alt), 4)
+
+
+def _egilim(noktalar: list[tuple[date, float]]) -> Optional[float]:
+    # Günlük doğru oranının en küçük kareler eğimi (gün başına değişim)
+    if len(noktalar) < 2:
+        return None
+    xs = [(t - noktalar[0][0]).days for t, _ in noktalar]
+    ys = [y for _, y in noktalar]
+    ort_x, ort_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    payda = sum((x - ort_x) ** 2 for x in xs)
+    if payda == 0:
+        return None
+    return round(sum((x - ort_x) * (y - ort_y) for x, y in zip(xs, ys)) / payda, 6)
+
+
+def _bos_toplam() -> dict:
+    return {"calisma": 0.0, "odak_t": 0.0, "odak_n": 0, "dogru_t": 0.0, "dogru_n": 0, "halka": 0}
+
+
+def _ekle(toplam: dict, satir):
+    toplam["calisma"] += float(satir.calisma_suresi or 0)
+    toplam["odak_t"] += float(satir.odak_toplam or 0)
+    toplam["odak_n"] += satir.odak_sayi or 0
+    toplam["dogru_t"] += float(satir.dogru_toplam or 0)
+    toplam["dogru_n"] += satir.dogru_sayi or 0
+    toplam["halka"] += int(satir.halka or 0)
+
+
+# Günlük satırlar (crud.get_istatistik_gunluk) ve sıralı sınav puanlarından özet
+def ozet_olustur(ogrenci_id: int, baslangic: date, bitis: date, gunluk_satirlar, sinav_puanlari: list[float]) -> dict:
+    genel = _bos_toplam()
+    haftalar: dict[date, dict] = {}
+    gunluk = []
+    for satir in gunluk_satirlar:
+        _ekle(genel, satir)
+        hafta = satir.tarih - timedelta(days=satir.tarih.weekday())
+        _ekle(haftalar.setdefault(hafta, _bos_toplam()), satir)
+        gunluk.append({
+            "tarih": satir.tarih,
+            "calisma_suresi": round(float(satir.calisma_suresi or 0), 2),
+            "odak_puani": _oran(satir.odak_toplam, satir.odak_sayi),
+            "dogru_orani": _oran(satir.dogru_toplam, satir.dogru_sayi),
+            "cozulen_soru": int(satir.cozulen_soru or 0),
+            "halka": int(satir.halka or 0),
+        })
+
+    haftalik = [
+        {
+            "hafta_baslangici": hafta,
+            "calisma_suresi": round(t["calisma"], 2),
+            "odak_puani": _oran(t["odak_t"], t["odak_n"]),
+            "dogru_orani": _oran(t["dogru_t"], t["dogru_n"]),
+            "halka": t["halka"],
+        }
+        for hafta, t in sorted(haftalar.items())
+    ]
+
+    return {
+        "ogrenci_id": ogrenci_id,
+        "baslangic": baslangic,
+        "bitis": bitis,
+        "toplam_calisma_suresi": round(genel["calisma"], 2),
+        "ortalama_odak_puani": _oran(genel["odak_t"], genel["odak_n"]),
+        "ortalama_dogru_orani": _oran(genel["dogru_t"], genel["dogru_n"]),
+        "dogru_orani_egilimi": _egilim([(g["tarih"], g["dogru_orani"]) for g in gunluk if g["dogru_orani"] is not None]),
+        "toplam_halka": genel["halka"],
+        "gunluk": gunluk,
+        "haftalik": haftalik,
+        "sinavlar": {
+            "sinav_sayisi": len(sinav_puanlari),
+            "ortalama": round(sum(sinav_puanlari) / len(sinav_puanlari), 4) if sinav_puanlari else None,
+            "p25": _yuzdelik(sinav_puanlari, 0.25),
+            "p50": _yuzdelik(sinav_puanlari, 0.50),
+            "p75": _yuzdelik(sinav_puanlari, 0.75),
+            "p90": _yuzdelik(sinav_puanlari, 0.90),
+        },
+    }
@@ -0,0 +1,88 @@
+import base64
+import json
+import os
+from typing import Optional
+
+# ?ids=1,2,3 ile tek istekte en fazla kaç kayıt istenebilir
+ID_LISTESI_MAX = int(os.getenv("ID_LISTESI_MAX", "500"))
+# Liste endpointlerinde limit üst sınırı (skip/limit ve cursor modlarında)
+SAYFA_MAX = int(os.getenv("SAYFA_MAX", "1000"))
+
+
+class GecersizCursor(ValueError):
+    pass
+
+
+class GecersizIdListesi(ValueError):
+    pass
+
+
+# Cursor, sayfadaki son kaydın birincil anahtarını taşıyan opak bir token
+def encode_cursor(son_id: int) -> str:
+    ham = json.dumps({"id": son_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(ham).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        dolgu = "=" * (-len(cursor) % 4)
+        veri = json.loads(base64.urlsafe_b64decode(cursor + dolgu))
+        son_id = veri["id"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise GecersizCursor(cursor) from e
+    if not isinstance(son_id, int) or isinstance(son_id, bool):
+        raise GecersizCursor(cursor)
+    return son_id
+
+
+# Query (sync) ve select() (async) nesnelerinin ikisinde de çalışır
+def sayfa_sorgusu(query, pk, skip: int = 0, limit: int = 10, cursor: Optional[str] = None):
+    # Sıralama her iki modda da birincil anahtara göre sabit
+    query = query.order_by(pk)
+    if cursor is not None:
+        return query.filter(pk > decode_cursor(cursor)).limit(limit)
+    return query.offset(skip).limit(limit)
+
+
+def sayfala(query, pk, skip: int = 0, limit: int = 10, cursor: Optional[str] = None):
+    return sayfa_sorgusu(query, pk, skip=skip, limit=limit, cursor=cursor).all()
+
+
+def sonraki_cursor(kayitlar, pk_adi: str, limit: int) -> Optional[str]:
+    if not kayitlar or len(kayitlar) < limit:
+        return None
+    return encode_cursor(getattr(kayitlar[-1], pk_adi))
+
+
+# Liste endpointleri: skip/limit (eski mod) veya cursor ile keyset sayfalama.
+# Sayfa doluysa bir sonraki sayfanın cursor'ı X-Next-Cursor başlığında döner.
+def cursor_basligi_ekle(response, kayitlar, pk_adi: str, limit: int):
+    cursor = sonraki_cursor(kayitlar, pk_adi, limit)
+    if cursor is not None:
+        response.headers["X-Next-Cursor"] = cursor
+    return kayitlar
+
+
+# Liste endpointlerinin ids parametresi (FastAPI dependency): "3,1,3" -> [3, 1]; sıra korunur,
+# tekrarlar atılır. ids verilirse endpointin diğer filtreleri ve sayfalama uygulanmaz.
+def id_listesi(ids: Optional[str] = None) -> Optional[list[int]]:
+    if ids is None:
+        return None
+    try:
+        idler = list(dict.fromkeys(int(p) for p in ids.split(",") if p.strip()))
+    except ValueError as e:
+        raise GecersizIdListesi(ids) from e
+    if not idler or len(idler) > ID_LISTESI_MAX:
+        raise GecersizIdListesi(ids)
+    return idler
+
+
+def idlere_gore_sirala(kayitlar, pk_adi: str, idler: list[int]):
+    # (istek sırasındaki kayıtlar, bulunamayan id'ler)
+    bulunan = {getattr(k, pk_adi): k for k in kayitlar}
+    return [bulunan[i] for i in idler if i in bulunan], [i for i in idler if i not in bulunan]
+
+
+def eksik_basligi_ekle(response, eksikler: list[int]):
+    if eksikler:
+        response.headers["X-Eksik-Idler"] = ",".join(map(str, eksikler))
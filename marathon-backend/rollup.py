@@ -0,0 +1,212 @@
+# Istatistikler için artımlı gün/hafta/ay toplamları (istatistikozetleri tablosu).
+# create_istatistik ve toplu ekleme aynı transaction içinde guncelle() çağırır.
+#   python -m rollup --yeniden-olustur [--ogrenci 42]
+#   python -m rollup --dogrula
+import argparse
+from datetime import date, timedelta
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+import models
+
+DONEMLER = ("gun", "hafta", "ay")
+OLCULER = (
+    "ozet_kayitSayisi", "ozet_calismaSuresi", "ozet_odakToplam", "ozet_odakSayisi",
+    "ozet_dogruToplam", "ozet_dogruSayisi", "ozet_cozulenSoru", "ozet_halkaSayisi",
+)
+ONDALIK = {"ozet_calismaSuresi", "ozet_odakToplam", "ozet_dogruToplam"}
+# Artımlı upsert yalnızca bu dialect'ler için yazılı; uygulama başlangıçta kontrol eder
+DESTEKLENEN_DIALECTLER = ("mysql", "sqlite")
+
+
+class DesteklenmeyenVeritabani(RuntimeError):
+    pass
+
+
+def dialect_kontrol(engine):
+    if engine.dialect.name not in DESTEKLENEN_DIALECTLER:
+        raise DesteklenmeyenVeritabani(
+            f"istatistik özetleri {engine.dialect.name} veritabanında çalışmaz "
+            f"(desteklenen: {', '.join(DESTEKLENEN_DIALECTLER)})")
+
+
+def donem_baslangici(donem: str, tarih: date) -> date:
+    if donem == "hafta":
+        return tarih - timedelta(days=tarih.weekday())
+    if donem == "ay":
+        return tarih.replace(day=1)
+    return tarih
+
+
+def _bos() -> dict:
+    return dict.fromkeys(OLCULER, 0)
+
+
+def _topla(hedef: dict, kaynak: dict):
+    for olcu in OLCULER:
+        hedef[olcu] += kaynak[olcu]
+
+
+def _kayit_katkisi(kayit: dict) -> dict:
+    odak = kayit.get("istatistik_ortalamaodakPuani")
+    dogru = kayit.get("istatistik_dogruCevapOrani")
+    return {
+        "ozet_kayitSayisi": 1,
+        "ozet_calismaSuresi": float(kayit.get("istatistik_gunlukcalismaSuresi") or 0),
+        "ozet_odakToplam": float(odak or 0),
+        "ozet_odakSayisi": int(odak is not None),
+        "ozet_dogruToplam": float(dogru or 0),
+        "ozet_dogruSayisi": int(dogru is not None),
+        "ozet_cozulenSoru": int(kayit.get("istatistik_cozulenSoruSayisi") or 0),
+        "ozet_halkaSayisi": int(kayit.get("istatistik_kazanilanHalkaSayisi") or 0),
+    }
+
+
+def katkilar(kayitlar) -> dict:
+    # (ogrenci_id, donem, baslangic) -> ölçü toplamları; öğrencisiz/tarihsiz kayıtlar atlanır
+    sonuc = {}
+    for kayit in kayitlar:
+        ogrenci_id, tarih = kayit.get("ogrenci_id"), kayit.get("istatistik_tarihi")
+        if ogrenci_id is None or tarih is None:
+            continue
+        katki = _kayit_katkisi(kayit)
+        for donem in DONEMLER:
+            _topla(sonuc.setdefault((ogrenci_id, donem, donem_baslangici(donem, tarih)), _bos()), katki)
+    return sonuc
+
+
+def _upsert(db: Session, satirlar: list[dict]):
+    tablo = models.IstatistikOzetleri.__table__
+    bind = db.get_bind()
+    dialect_kontrol(bind)
+    if bind.dialect.name == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(tablo)
+        stmt = stmt.on_duplicate_key_update({o: tablo.c[o] + stmt.inserted[o] for o in OLCULER})
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(tablo)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[tablo.c.ogrenci_id, tablo.c.ozet_donem, tablo.c.ozet_baslangic],
+            set_={o: tablo.c[o] + stmt.excluded[o] for o in OLCULER},
+        )
+    db.execute(stmt, satirlar)
+
+
+def guncelle(db: Session, kayitlar):
+    # Commit çağıranın işi; böylece ham kayıt ve toplamlar birlikte yazılır
+    toplamlar = katkilar(kayitlar)
+    if toplamlar:
+        _upsert(db, [
+            {"ogrenci_id": o, "ozet_donem": d, "ozet_baslangic": b, **olculer}
+            for (o, d, b), olculer in sorted(toplamlar.items())
+        ])
+
+
+def _gunluk_toplamlar(db: Session, ogrenci_id: int):
+    ist = models.Istatistikler
+    query = db.query(
+        ist.ogrenci_id,
+        ist.istatistik_tarihi,
+        func.count().label("ozet_kayitSayisi"),
+        func.coalesce(func.sum(ist.istatistik_gunlukcalismaSuresi), 0).label("ozet_calismaSuresi"),
+        func.coalesce(func.sum(ist.istatistik_ortalamaodakPuani), 0).label("ozet_odakToplam"),
+        func.count(ist.istatistik_ortalamaodakPuani).label("ozet_odakSayisi"),
+        func.coalesce(func.sum(ist.istatistik_dogruCevapOrani), 0).label("ozet_dogruToplam"),
+        func.count(ist.istatistik_dogruCevapOrani).label("ozet_dogruSayisi"),
+        func.coalesce(func.sum(ist.istatistik_cozulenSoruSayisi), 0).label("ozet_cozulenSoru"),
+        func.coalesce(func.sum(ist.istatistik_kazanilanHalkaSayisi), 0).label("ozet_halkaSayisi"),
+    ).filter(ist.ogrenci_id == ogrenci_id, ist.istatistik_tarihi.isnot(None))
+    return query.group_by(ist.ogrenci_id, ist.istatistik_tarihi).all()
+
+
+def _ogrenciler(db: Session, ogrenci_id=None) -> list[int]:
+    # Ham kaydı olan ve artık ham kaydı kalmamış (yalnızca özeti olan) öğrenciler
+    if ogrenci_id is not None:
+        return [ogrenci_id]
+    ist, ozet = models.Istatistikler, models.IstatistikOzetleri
+    ham = select(ist.ogrenci_id).where(ist.ogrenci_id.isnot(None))
+    return sorted(o for (o,) in db.execute(ham.union(select(ozet.ogrenci_id))))
+
+
+def _ogrenci_toplamlari(db: Session, ogrenci_id: int) -> dict:
+    toplamlar = {}
+    for satir in _gunluk_toplamlar(db, ogrenci_id):
+        gun = {o: float(getattr(satir, o)) if o in ONDALIK else int(getattr(satir, o)) for o in OLCULER}
+        for donem in DONEMLER:
+            _topla(toplamlar.setdefault((donem, donem_baslangici(donem, satir.istatistik_tarihi)), _bos()), gun)
+    return toplamlar
+
+
+def hesapla(db: Session, ogrenci_id=None):
+    # Ham tablodan tam yeniden hesap; bellek sınırlı kalsın diye öğrenci öğrenci üretilir
+    for ogr in _ogrenciler(db, ogrenci_id):
+        toplamlar = _ogrenci_toplamlari(db, ogr)
+        if toplamlar:
+            yield ogr, toplamlar
+
+
+def yeniden_olustur(db: Session, ogrenci_id=None) -> int:
+    # Tablo hiçbir anda boşaltılmaz: her öğrencinin satırları kendi transaction'ında kilitlenir,
+    # ham tablodan yeniden hesaplanır, silinip yazılır. Okuyucular öğrencinin ya eski ya yeni
+    # toplamlarını görür; kilit, aynı anda gelen artımlı güncellemenin kaybolmasını önler.
+    ozet = models.IstatistikOzetleri
+    yazilan = 0
+    for ogr in _ogrenciler(db, ogrenci_id):
+        db.execute(select(ozet.ogrenci_id).where(ozet.ogrenci_id == ogr).with_for_update())
+        toplamlar = _ogrenci_toplamlari(db, ogr)
+        db.execute(delete(ozet).where(ozet.ogrenci_id == ogr))
+        if toplamlar:
+            db.execute(insert(ozet), [
+                {"ogrenci_id": ogr, "ozet_donem": d, "ozet_baslangic": b, **o}
+                for (d, b), o in toplamlar.items()
+            ])
+        db.commit()
+        yazilan += len(toplamlar)
+    return yazilan
+
+
+def dogrula(db: Session, ogrenci_id=None, tolerans: float = 0.01) -> list[dict]:
+    # Saklanan toplamlar ile tam yeniden hesap arasındaki farklar
+    ozet = models.IstatistikOzetleri
+    query = db.query(ozet)
+    if ogrenci_id is not None:
+        query = query.filter(ozet.ogrenci_id == ogrenci_id)
+    saklanan = {(s.ogrenci_id, s.ozet_donem, s.ozet_baslangic): {o: float(getattr(s, o)) for o in OLCULER}
+                for s in query}
+    farklar = []
+    for ogr, toplamlar in hesapla(db, ogrenci_id):
+        for (donem, baslangic), beklenen in toplamlar.items():
+            anahtar = (ogr, donem, baslangic)
+            bulunan = saklanan.pop(anahtar, None)
+            if bulunan is None or any(abs(bulunan[o] - beklenen[o]) > tolerans for o in OLCULER):
+                farklar.append({"anahtar": anahtar, "beklenen": beklenen, "bulunan": bulunan})
+    farklar.extend({"anahtar": k, "beklenen": None, "bulunan": v} for k, v in saklanan.items())
+    return farklar
+
+
+def main():
+    from db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="istatistikozetleri bakım komutu")
+    parser.add_argument("--yeniden-olustur", action="store_true")
+    parser.add_argument("--dogrula", action="store_true")
+    parser.add_argument("--ogrenci", type=int)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        dialect_kontrol(db.get_bind())
+        if args.yeniden_olustur:
+            print(f"{yeniden_olustur(db, args.ogrenci)} özet satırı yazıldı")
+        if args.dogrula:
+            farklar = dogrula(db, args.ogrenci)
+            for fark in farklar[:20]:
+                print(fark)
+            print(f"{len(farklar)} fark")
+            raise SystemExit(1 if farklar else 0)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
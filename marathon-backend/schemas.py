@@ -20,8 +20,13 @@ class OgrenciBase(BaseModel):
     ogrenci_ogrenmeStili: Optional[str]
     ogrenci_sonGuncellemeTarihi: Optional[datetime]
 
+# Şifre düz metin gelir, sunucuda hashlenir (sifre.hashle); istemcinin hash'i kabul edilmez
 class OgrenciCreate(OgrenciBase):
-    ogrenci_sifreHashed: str
+    ogrenci_sifre: str
+
+# Güncellemede şifre yalnızca verilirse değişir
+class OgrenciUpdate(OgrenciBase):
+    ogrenci_sifre: Optional[str] = None
 
 class Ogrenci(OgrenciBase):
     ogrenci_id: int
@@ -42,6 +47,11 @@ class DerslerBase(BaseModel):
 class DerslerCreate(DerslerBase):
     pass
 
+# Canlı ders telemetrisi (yazma kuyruğu); gönderilmeyen alan değişmez
+class DersOdak(BaseModel):
+    ders_odakPuani: Optional[float] = None
+    ders_enerjiSeviyesi: Optional[float] = None
+
 class Dersler(DerslerBase):
     ders_id: int
     class Config:
@@ -67,6 +77,14 @@ class Konular(KonularBase):
     class Config:
         from_attributes = True
 
+class KonuAramaSonucu(Konular):
+    skor: float
+
+# Uyarlanabilir seçim: seçilen konu, seçildiği seviye ve öğrencinin güncel ustalığı (0-1)
+class SonrakiKonu(Konular):
+    secilen_seviye: int
+    ustalik: float
+
 # SinavSimilasyonlari
 class SinavSimilasyonlariBase(BaseModel):
     sinav_adi: Optional[str]
@@ -138,3 +156,78 @@ class ChatbotEtkilesim(ChatbotEtkilesimBase):
     chatbot_id: int
     class Config:
         from_attributes = True
+
+class ChatbotAramaSonucu(ChatbotEtkilesim):
+    skor: float
+
+# Öğrenci ve çoktan-çoğa ilişkileri tek yanıtta
+class OgrenciIliskileri(Ogrenci):
+    dersler: list[Dersler]
+    sinavlar: list[SinavSimilasyonlari]
+    basarimlar: list[OdullerVeBasarimlar]
+
+# Başarım verme (odullervebasarimlar_has_ogrenci)
+class BasarimVerme(BaseModel):
+    basarim_id: int
+    ogrenci_id: int
+
+# Liderlik tablosu
+class LiderlikSatiri(BaseModel):
+    sira: int
+    ogrenci_id: int
+    halka: int
+
+class LiderlikKonumu(LiderlikSatiri):
+    toplam: int
+    komsular: list[LiderlikSatiri]
+
+# Toplu ekleme
+class TopluHata(BaseModel):
+    index: int
+    hata: str
+
+class TopluSonuc(BaseModel):
+    eklenen: int
+    hatali: int
+    hatalar: list[TopluHata]
+
+# Yazma kuyruğuna alınan kayıt (202)
+class KuyrukKabul(BaseModel):
+    derinlik: int
+
+# Öğrenci özeti
+class OzetGun(BaseModel):
+    tarih: date
+    calisma_suresi: float
+    odak_puani: Optional[float]
+    dogru_orani: Optional[float]
+    cozulen_soru: int
+    halka: int
+
+class OzetHafta(BaseModel):
+    hafta_baslangici: date
+    calisma_suresi: float
+    odak_puani: Optional[float]
+    dogru_orani: Optional[float]
+    halka: int
+
+class SinavPuanDagilimi(BaseModel):
+    sinav_sayisi: int
+    ortalama: Optional[float]
+    p25: Optional[float]
+    p50: Optional[float]
+    p75: Optional[float]
+    p90: Optional[float]
+
+class OgrenciOzet(BaseModel):
+    ogrenci_id: int
+    baslangic: date
+    bitis: date
+    toplam_calisma_suresi: float
+    ortalama_odak_puani: Optional[float]
+    ortalama_dogru_orani: Optional[float]
+    dogru_orani_egilimi: Optional[float]
+    toplam_halka: int
+    gunluk: list[OzetGun]
+    haftalik: list[OzetHafta]
+    sinavlar: SinavPuanDagilimi
@@ -0,0 +1,81 @@
+import asyncio
+import base64
+import functools
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# scrypt maliyeti; N büyüdükçe hem süre hem bellek (128 * N * r bayt) artar
+SIFRE_SCRYPT_N = int(os.getenv("SIFRE_SCRYPT_N", str(2 ** 14)))
+SIFRE_SCRYPT_R = int(os.getenv("SIFRE_SCRYPT_R", "8"))
+SIFRE_SCRYPT_P = int(os.getenv("SIFRE_SCRYPT_P", "1"))
+# Aynı anda çalışan hash işlemi sınırı; hashlib.scrypt GIL'i bırakır, çekirdek sayısı kadarı yeterli
+SIFRE_HAVUZ_BOYUTU = int(os.getenv("SIFRE_HAVUZ_BOYUTU", str(min(4, os.cpu_count() or 1))))
+
+ONEK = "scrypt"
+_TUZ_BAYT = 16
+_HASH_BAYT = 32
+
+_havuz = ThreadPoolExecutor(max_workers=SIFRE_HAVUZ_BOYUTU, thread_name_prefix="sifre")
+
+
+def _b64(veri: bytes) -> str:
+    return base64.b64encode(veri).decode()
+
+
+def _scrypt(sifre: str, tuz: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(sifre.encode(), salt=tuz, n=n, r=r, p=p, maxmem=256 * n * r, dklen=_HASH_BAYT)
+
+
+def hashle(sifre: str) -> str:
+    # Biçim: scrypt$N$r$p$tuz$hash (base64); parametreler kayıtla saklanır, maliyet sonradan değişebilir
+    tuz = os.urandom(_TUZ_BAYT)
+    ozet = _scrypt(sifre, tuz, SIFRE_SCRYPT_N, SIFRE_SCRYPT_R, SIFRE_SCRYPT_P)
+    return f"{ONEK}${SIFRE_SCRYPT_N}${SIFRE_SCRYPT_R}${SIFRE_SCRYPT_P}${_b64(tuz)}${_b64(ozet)}"
+
+
+def hashli_mi(kayitli: str) -> bool:
+    return kayitli.startswith(ONEK + "$")
+
+
+def eski_kodlama(email: str, sifre: str) -> str:
+    # Eski frontend kaydı btoa(email + şifre) idi (pratikte sabit 'password' gönderiyordu)
+    return _b64((email + sifre).encode())
+
+
+# Kullanıcı bulunamadığında da aynı maliyette doğrulama yapılır (e-posta var/yok zamanlamadan anlaşılmasın).
+# İlk ihtiyaçta üretilir: her worker import'ta bir scrypt maliyeti ödemesin (ısınmada önceden hesaplanabilir)
+@functools.cache
+def sahte_hash() -> str:
+    return hashle(os.urandom(8).hex())
+
+
+def dogrula(sifre: str, kayitli: str, email: str) -> tuple[bool, bool]:
+    # (doğru mu, yeniden hashlenmeli mi)
+    if not kayitli:
+        kayitli = sahte_hash()
+    if not hashli_mi(kayitli):
+        # Eski base64 kaydı: yalnızca girilen şifre aynı kodlamayı üretiyorsa kabul edilir ve
+        # güncel parametrelerle hashlenip değiştirilir. Şifresi hiç saklanmamış eski hesaplar
+        # (sabit 'password') gerçek şifreleriyle giremez, şifre sıfırlamaları gerekir.
+        _scrypt(sifre, b"\0" * _TUZ_BAYT, SIFRE_SCRYPT_N, SIFRE_SCRYPT_R, SIFRE_SCRYPT_P)
+        dogru = hmac.compare_digest(kayitli.encode(), eski_kodlama(email, sifre).encode())
+        return dogru, dogru
+    try:
+        _, n, r, p, tuz, beklenen = kayitli.split("$")
+        n, r, p = int(n), int(r), int(p)
+        ozet = _scrypt(sifre, base64.b64decode(tuz), n, r, p)
+    except ValueError:
+        return False, False
+    dogru = hmac.compare_digest(ozet, base64.b64decode(beklenen))
+    guncel = (n, r, p) == (SIFRE_SCRYPT_N, SIFRE_SCRYPT_R, SIFRE_SCRYPT_P)
+    return dogru, dogru and not guncel
+
+
+async def hashle_async(sifre: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(_havuz, hashle, sifre)
+
+
+async def dogrula_async(sifre: str, kayitli: str, email: str) -> tuple[bool, bool]:
+    return await asyncio.get_running_loop().run_in_executor(_havuz, dogrula, sifre, kayitli, email)
@@ -0,0 +1,40 @@
+import os
+import tempfile
+
+import pytest
+
+# Uygulama modülleri ortamı import sırasında okur: geçici SQLite, sabit token anahtarı,
+# geçici spool/indeks dizinleri ve kapalı okuma önbelleği (testler birbirini etkilemesin)
+_KLASOR = tempfile.mkdtemp(prefix="marathon-test-")
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{os.path.join(_KLASOR, 'test.db')}",
+    TOKEN_ANAHTARI="test-anahtari",
+    KUYRUK_SPOOL=os.path.join(_KLASOR, "kuyruk.ndjson"),
+    BENZER_DIZIN=os.path.join(_KLASOR, "benzer"),
+    CACHE_BACKEND="none",
+)
+
+
+@pytest.fixture
+def engine():
+    # Her test boş şemayla başlar
+    import db, models
+
+    models.Base.metadata.create_all(bind=db.engine)
+    yield db.engine
+    models.Base.metadata.drop_all(bind=db.engine)
+
+
+@pytest.fixture
+def token():
+    import oturum
+
+    return oturum.token_olustur(1)
+
+
+@pytest.fixture
+def client(engine, token):
+    from fastapi.testclient import TestClient
+    import main
+
+    return TestClient(main.app, headers={"Authorization": f"Bearer {token}"})
@@ -0,0 +1,40 @@
+import asyncio
+import os
+
+import httpx
+import pytest
+from benchmarks.api_yuk import VARSAYILAN_SENARYOLAR, karsilastir, kos, senaryolar, tohumla
+
+import main
+
+HACIM = {"ogrenci": 50, "istatistik": 2000, "chatbot": 500, "konu": 30, "ders": 20, "tohum": 7}
+
+
+@pytest.fixture
+def tohumlanmis(engine):
+    tohumla(os.environ["DATABASE_URL"], HACIM)
+
+
+@pytest.mark.parametrize("senaryo", VARSAYILAN_SENARYOLAR)
+def test_yuk_senaryosu_hatasiz(tohumlanmis, token, senaryo):
+    async def calistir():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test",
+                                     headers={"Authorization": f"Bearer {token}"}) as client:
+            return await kos(client, senaryolar(HACIM)[senaryo], 20, 4, HACIM["tohum"])
+
+    assert asyncio.run(calistir())["hata"] == 0
+
+
+def _sonuc(p95: float, istek_sn: float) -> dict:
+    return {"meta": {}, "sonuclar": {"ogrenci_getir": {"8": {"p95_ms": p95, "istek_sn": istek_sn}}}}
+
+
+@pytest.mark.parametrize("p95,istek_sn,gerileme", [
+    (10.0, 100.0, False),
+    (10.9, 91.0, False),   # tolerans içinde
+    (12.0, 100.0, True),   # p95 %20 kötü
+    (10.0, 80.0, True),    # throughput %20 düşük
+])
+def test_karsilastir_toleransi(p95, istek_sn, gerileme):
+    assert karsilastir(_sonuc(p95, istek_sn), _sonuc(10.0, 100.0), 0.10) is gerileme
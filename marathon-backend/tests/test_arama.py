@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+import arama, isinma, models
+from pagination import SAYFA_MAX
+
+KONU = 80
+
+
+@pytest.fixture
+def indeksler(engine, monkeypatch):
+    # Modül düzeyindeki indeksler testler arasında taşınmasın; her test boş indeksle başlar
+    monkeypatch.setattr(arama, "KONULAR", arama.TersIndeks(
+        models.Konular, "konu_id", {"konu_adi": 3.0, "konu_metni": 1.0}, filtre="ders_id"))
+    monkeypatch.setattr(arama, "CHATBOT", arama.TersIndeks(
+        models.ChatbotEtkilesim, "chatbot_id", {"chatbot_soruMetni": 1.0}, filtre="ogrenci_id"))
+    with Session(engine) as db:
+        # "ucgen" ön ekiyle genişleme sınırından fazla farklı terim
+        db.execute(insert(models.Konular), [
+            {"konu_adi": f"ucgen{i:03d}", "konu_metni": "iç açılar toplamı"} for i in range(KONU)])
+        db.commit()
+    return arama.KONULAR
+
+
+def test_indeks_varsayilan_olarak_ilk_aramada_kurulur(indeksler, client):
+    asyncio.run(isinma.baslat())
+    assert not indeksler.kuruldu
+    assert client.get("/konular/ara", params={"q": "ucgen001"}).headers["X-Toplam-Sonuc"] == "1"
+    assert indeksler.kuruldu and not arama.CHATBOT.kuruldu
+
+
+def test_indeks_baslangicta_arka_planda_kurulur(indeksler, monkeypatch):
+    monkeypatch.setattr(arama, "ARAMA_BASLANGICTA", True)
+    asyncio.run(isinma.baslat())
+    isinma._arama_thread.join(10)
+    assert indeksler.kuruldu and indeksler.ozet()["kayit"] == KONU
+    assert arama.CHATBOT.kuruldu
+
+
+def test_veritabani_okumasi_arama_kilidi_disinda(indeksler, engine):
+    kilitli_sorgular = []
+
+    def kontrol(conn, cursor, ifade, parametreler, context, executemany):
+        kilitli_sorgular.append(indeksler._kilit.locked())
+
+    event.listen(engine, "before_cursor_execute", kontrol)
+    try:
+        with Session(engine) as db:
+            indeksler.esitle(db, parca=16)
+    finally:
+        event.remove(engine, "before_cursor_execute", kontrol)
+    assert kilitli_sorgular and not any(kilitli_sorgular)
+    assert indeksler.ozet()["kayit"] == KONU
+
+
+def test_onek_siniri_basliga_yansir(indeksler, client):
+    yanit = client.get("/konular/ara", params={"q": "ucgen", "limit": 5})
+    assert yanit.status_code == 200
+    assert yanit.headers["X-Onek-Kesildi"] == "1"
+    assert int(yanit.headers["X-Toplam-Sonuc"]) == arama.ONEK_MAX_GENISLEME
+    yanit = client.get("/konular/ara", params={"q": "ucgen001"})
+    assert "X-Onek-Kesildi" not in yanit.headers
+    assert yanit.headers["X-Toplam-Sonuc"] == "1"
+
+
+@pytest.mark.parametrize("yol", ["/konular/ara", "/chatbot/ara"])
+@pytest.mark.parametrize("parametre", ["skip", "limit"])
+def test_negatif_sayfalama_reddedilir(indeksler, client, yol, parametre):
+    assert client.get(yol, params={"q": "ucgen", parametre: -1}).status_code == 422
+
+
+@pytest.mark.parametrize("yol", ["/konular/ara", "/chatbot/ara"])
+def test_limit_ust_siniri(indeksler, client, yol):
+    assert client.get(yol, params={"q": "ucgen", "limit": SAYFA_MAX + 1}).status_code == 422
+    assert client.get(yol, params={"q": "ucgen", "limit": SAYFA_MAX}).status_code == 200
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+# ASYNC_DB import sırasında okunur (db.py, main.py): senaryo ASYNC_DB=1 ortamlı alt süreçte,
+# yaşam döngüsüyle başlatılan uygulamaya karşı çalışır
+KLASOR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def ogrenci(i: int, **ek) -> dict:
+    veri = dict.fromkeys(["ogrenci_okulSeviyesi", "ogrenci_adhdSeviyesi", "ogrenci_kayitTarihi",
+                          "ogrenci_odakSuresi", "ogrenci_soruCozmeHizi", "ogrenci_basariOrani",
+                          "ogrenci_dikkatSeviyesi", "ogrenci_mevcutSeviye", "ogrenci_ogrenmeStili"])
+    veri.update(ogrenci_kullaniciAdi=f"o{i}", ogrenci_email=f"o{i}@ornek.com", ogrenci_ad="Ad",
+                ogrenci_soyad="Soyad", ogrenci_dogumTarihi="2010-01-01",
+                ogrenci_sonGuncellemeTarihi="2025-01-01T00:00:00")
+    return dict(veri, **ek)
+
+
+def loop_disinda(fn):
+    # Süreç içi yapıların kilitli güncellemeleri event loop thread'inde yapılmamalı
+    cagrilar = []
+
+    def izle(*args):
+        try:
+            asyncio.get_running_loop()
+            cagrilar.append(False)
+        except RuntimeError:
+            cagrilar.append(True)
+        return fn(*args)
+
+    return izle, cagrilar
+
+
+def senaryo():
+    from fastapi.testclient import TestClient
+    import crud_async, db, liderlik, main, models, oturum, uyarlama
+
+    assert db.ASYNC_DB
+    models.Base.metadata.create_all(bind=db.engine)
+    get_ogrenci, async_okumalar = crud_async.get_ogrenci, []
+
+    async def izlenen_get_ogrenci(*args, **kwargs):
+        async_okumalar.append(kwargs.get("ogrenci_id"))
+        return await get_ogrenci(*args, **kwargs)
+
+    crud_async.get_ogrenci = izlenen_get_ogrenci
+    liderlik.TABLO.istatistik_ekle, liderlik_cagrilari = loop_disinda(liderlik.TABLO.istatistik_ekle)
+    uyarlama.MOTOR.istatistik_ekle, uyarlama_cagrilari = loop_disinda(uyarlama.MOTOR.istatistik_ekle)
+    with TestClient(main.app) as client:
+        # Oluşturma ve okuma (async router üzerinden)
+        for i in range(1, 4):
+            yanit = client.post("/ogrenciler/", json=ogrenci(i, ogrenci_sifre="sifre-123"))
+            assert yanit.status_code == 200 and yanit.json()["ogrenci_id"] == i
+        client.headers["Authorization"] = f"Bearer {oturum.token_olustur(1)}"
+        yanit = client.get("/ogrenciler/1")
+        assert yanit.status_code == 200 and yanit.json()["ogrenci_email"] == "o1@ornek.com"
+        assert async_okumalar == [1]
+
+        # ETag: değişmemişse 304, güncellemeden sonra yeni gövde
+        etag = yanit.headers["ETag"]
+        assert client.get("/ogrenciler/1", headers={"If-None-Match": etag}).status_code == 304
+        yanit = client.put("/ogrenciler/1", json=ogrenci(1, ogrenci_ad="Yeni"))
+        assert yanit.status_code == 200 and yanit.json()["ogrenci_ad"] == "Yeni"
+        yanit = client.get("/ogrenciler/1", headers={"If-None-Match": etag})
+        assert yanit.status_code == 200 and yanit.json()["ogrenci_ad"] == "Yeni"
+        assert client.get("/ogrenciler/2").status_code == 403
+
+        # Cursor ile sayfalama: son sayfada X-Next-Cursor yok
+        yanit = client.get("/ogrenciler/", params={"limit": 2})
+        assert [o["ogrenci_id"] for o in yanit.json()] == [1, 2]
+        yanit = client.get("/ogrenciler/", params={"limit": 2, "cursor": yanit.headers["X-Next-Cursor"]})
+        assert [o["ogrenci_id"] for o in yanit.json()] == [3]
+        assert "X-Next-Cursor" not in yanit.headers
+
+        # İstatistik: liderlik ve uyarlama güncellemeleri threadpool'da
+        yanit = client.post("/istatistikler/", json={
+            "istatistik_tarihi": "2025-03-05", "istatistik_gunlukcalismaSuresi": 10,
+            "istatistik_tamamlananModulSayisi": 1, "istatistik_ortalamaodakPuani": None,
+            "istatistik_cozulenSoruSayisi": 5, "istatistik_dogruCevapOrani": 80,
+            "istatistik_kazanilanHalkaSayisi": 3, "istatistik_molaSayisi": 0, "istatistik_toplamMolaSuresi": 0,
+            "istatistik_uykuKalitesi": None, "istatistik_notlar": None, "ogrenci_id": 1})
+        assert yanit.status_code == 200
+        assert liderlik_cagrilari == [True] and uyarlama_cagrilari == [True]
+        yanit = client.get("/istatistikler/", params={"ogrenci_id": 1})
+        assert [s["istatistik_kazanilanHalkaSayisi"] for s in yanit.json()] == [3]
+
+
+def test_async_mod_uctan_uca(tmp_path):
+    veritabani = tmp_path / "async.db"
+    env = dict(os.environ, ASYNC_DB="1", DATABASE_URL=f"sqlite:///{veritabani}",
+               ASYNC_DATABASE_URL=f"sqlite+aiosqlite:///{veritabani}", KUYRUK_SPOOL=str(tmp_path / "kuyruk.ndjson"),
+               BENZER_DIZIN=str(tmp_path / "benzer"), PYTHONPATH=KLASOR)
+    sonuc = subprocess.run([sys.executable, "-c", "import test_async_api; test_async_api.senaryo()"],
+                           cwd=os.path.dirname(os.path.abspath(__file__)), env=env, capture_output=True, text=True)
+    assert sonuc.returncode == 0, sonuc.stderr
@@ -0,0 +1,83 @@
+import asyncio
+import os
+import threading
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+import benzer, crud_async, models, schemas
+from benchmarks.benzer_kalibrasyon import AYNI, FARKLI, kabul_edilen
+
+SORULAR = ["Karenin alanı nasıl hesaplanır?", "Bir üçgenin iç açılarının toplamı kaç derecedir?",
+           "Fotosentez nedir?"]
+
+
+@pytest.fixture
+def indeks(engine, monkeypatch, tmp_path):
+    # Her test kendi dizininde boş indeksle başlar (id'ler testler arasında yeniden kullanılır)
+    yeni = benzer.BenzerIndeks(str(tmp_path / "benzer"))
+    monkeypatch.setattr(benzer, "CHATBOT", yeni)
+    with Session(engine) as db:
+        db.execute(insert(models.ChatbotEtkilesim), [
+            {"chatbot_soruMetni": s, "chatbot_cevapMetni": f"cevap {i}"} for i, s in enumerate(SORULAR)])
+        db.commit()
+    return yeni
+
+
+def test_kalip_ayni_konu_farkli_soru_eslesmez(indeks, engine):
+    with Session(engine) as db:
+        assert benzer.benzer_sorular(db, "Dairenin alanı nasıl hesaplanır?") == []
+
+
+def test_ayni_sorunun_farkli_ifadesi_eslesir(indeks, engine):
+    with Session(engine) as db:
+        sonuclar = benzer.benzer_sorular(db, "Üçgenin iç açıları toplamı kaçtır?")
+    assert [n.chatbot_soruMetni for n, _ in sonuclar] == [SORULAR[1]]
+    assert sonuclar[0][1] >= benzer.BENZER_ESIK
+
+
+@pytest.mark.parametrize("params", [{"k": 0}, {"k": 51}, {"esik": -0.1}, {"esik": 1.5}])
+def test_benzer_parametre_sinirlari(indeks, client, params):
+    assert client.get("/chatbot/benzer", params=dict(params, q="Fotosentez nedir?")).status_code == 422
+
+
+def test_benzer_sinir_degerleri_kabul_edilir(indeks, client):
+    yanit = client.get("/chatbot/benzer", params={"q": "Fotosentez nedir?", "k": 50, "esik": 1.0})
+    assert yanit.status_code == 200
+    yanit = client.get("/chatbot/benzer", params={"q": "Fotosentez nedir?", "k": 1, "esik": 0.0})
+    assert [s["chatbot_soruMetni"] for s in yanit.json()] == [SORULAR[2]]
+
+
+def test_kalibrasyon_ciftleri():
+    # Yanlış kabul yok; yalnızca ortak kökü olmayan iki eş anlamlı ifade kaçırılabilir
+    assert kabul_edilen(FARKLI, benzer.BENZER_ESIK, benzer.BENZER_BOYUT) == 0
+    assert kabul_edilen(AYNI, benzer.BENZER_ESIK, benzer.BENZER_BOYUT) >= len(AYNI) - 2
+
+
+def test_async_kayit_ekle_event_loop_disinda(indeks, engine, monkeypatch):
+    with Session(engine) as db:
+        indeks.esitle(db)
+    threadler = []
+    kayit_ekle = indeks.kayit_ekle
+
+    def izle(*args):
+        threadler.append(threading.current_thread())
+        return kayit_ekle(*args)
+
+    monkeypatch.setattr(indeks, "kayit_ekle", izle)
+
+    async def olustur():
+        async_engine = create_async_engine(os.environ["DATABASE_URL"].replace("sqlite://", "sqlite+aiosqlite://"))
+        try:
+            async with AsyncSession(async_engine, expire_on_commit=False) as db:
+                return await crud_async.create_chatbot(db, schemas.ChatbotEtkilesimCreate(
+                    chatbot_soruMetni="Asal sayı nedir?", chatbot_cevapMetni="cevap", chatbot_zamanDamgasi=None,
+                    chatbot_duyguCikarimi=None, ogrenci_id=None))
+        finally:
+            await async_engine.dispose()
+
+    yeni = asyncio.run(olustur())
+    assert threadler and threadler[0] is not threading.main_thread()
+    assert indeks.sorgula("Asal sayılar ne demek?", k=1)[0][0] == yeni.chatbot_id
@@ -0,0 +1,20 @@
+import pytest
+from benchmarks.disa_aktar_bellek import olc, tohumla
+
+import main
+
+MAX_MB = 8
+
+
+@pytest.mark.parametrize("bicim", ["ndjson", "csv"])
+def test_export_bellegi_tablo_boyutundan_bagimsiz(engine, token, bicim):
+    # Akış satır satır yazılmalı: tablo 4 katına çıkınca tepe bellek büyümemeli
+    baslik = int(bicim == "csv")
+    tohumla(engine, 4000)
+    satir, _, kucuk_mb = olc(main.app, token, bicim)
+    assert satir == 4000 + baslik
+    tohumla(engine, 12000)
+    satir, _, buyuk_mb = olc(main.app, token, bicim)
+    assert satir == 16000 + baslik
+    assert buyuk_mb < kucuk_mb * 1.5 + 0.5
+    assert buyuk_mb < MAX_MB
@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as HavuzTimeout
+
+import db
+from havuz import HavuzSayaclari, OlculenQueuePool, olcumle
+
+
+@pytest.fixture
+def motor(tmp_path):
+    # Tek bağlantılı havuz: ikinci checkout bekler
+    engine = create_engine(f"sqlite:///{tmp_path / 'havuz.db'}", poolclass=OlculenQueuePool,
+                           pool_size=1, max_overflow=0, pool_timeout=0.2)
+    sayaclar = HavuzSayaclari()
+    olcumle(engine, sayaclar)
+    yield engine, sayaclar
+    engine.dispose()
+
+
+def test_bekleme_ve_zaman_asimi_sayilir(motor):
+    engine, sayaclar = motor
+    birinci = engine.connect()
+    with pytest.raises(HavuzTimeout):
+        engine.connect()
+    ozet = sayaclar.ozet(engine.pool)
+    assert ozet["timeout"] == 1 and ozet["bekleme_max_ms"] >= 200
+    assert ozet["kullanimda"] == 1 and ozet["boyut"] == 1
+
+    # Bağlantı başka thread'de bırakılınca bekleyen checkout alır; süre bekleme olarak yazılır
+    zamanlayici = threading.Timer(0.05, birinci.close)
+    zamanlayici.start()
+    with engine.connect():
+        pass
+    zamanlayici.join()
+    ozet = sayaclar.ozet(engine.pool)
+    assert ozet["checkout"] == 2 and ozet["checkin"] == 2 and ozet["baglanti"] == 1
+    assert ozet["bekleme_toplam_ms"] >= 200 + 40
+
+
+def test_dispose_sonrasi_sayaclar_korunur(motor):
+    engine, sayaclar = motor
+    engine.dispose()
+    assert engine.pool.sayaclar is sayaclar
+    with engine.connect():
+        pass
+    assert sayaclar.ozet()["checkout"] == 1
+
+
+def test_uretim_profili_havuz_ayarlari():
+    ayarlar = db.engine_ayarlari("mysql+pymysql://k:s@h/d")
+    assert ayarlar["poolclass"] is OlculenQueuePool
+    assert ayarlar["pool_size"] == db.DB_POOL_SIZE and ayarlar["pool_recycle"] == db.DB_POOL_RECYCLE
+    assert ayarlar["echo"] is False and ayarlar["pool_pre_ping"] is True
+    assert "poolclass" not in db.engine_ayarlari("sqlite:///x.db")
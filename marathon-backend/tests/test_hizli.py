@@ -0,0 +1,63 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+import hizli, models
+
+
+@pytest.fixture
+def veri(engine):
+    with Session(engine) as db:
+        db.execute(insert(models.Ogrenci), [
+            {"ogrenci_kullaniciAdi": f"o{i}", "ogrenci_email": f"o{i}@ornek.com", "ogrenci_sifreHashed": "x",
+             "ogrenci_ad": "Ad", "ogrenci_soyad": "Soyad", "ogrenci_dogumTarihi": date(2010, 1, i),
+             "ogrenci_odakSuresi": 12.5 * i, "ogrenci_basariOrani": None, "ogrenci_mevcutSeviye": i,
+             "ogrenci_sonGuncellemeTarihi": datetime(2025, 1, 1, 8, 30, i)}
+            for i in range(1, 6)])
+        db.execute(insert(models.SinavSimilasyonlari), [
+            {"sinav_adi": f"s{i}", "sinav_puan": 33.33 * i, "sinav_tarihi": date(2025, 3, i),
+             "sinav_baslangicSaati": datetime(2025, 3, i, 10), "sinav_dogruCevapSayisi": i}
+            for i in range(1, 4)] + [{"sinav_adi": "bos"}])
+        db.execute(insert(models.SinavSimilasyonlari_has_Ogrenci), [{"sinav_id": i, "ogrenci_id": 1} for i in (1, 3)])
+        db.execute(insert(models.Istatistikler), [
+            {"istatistik_tarihi": date(2025, 3, i), "istatistik_gunlukcalismaSuresi": 10.25 * i,
+             "istatistik_ortalamaodakPuani": None if i % 2 else 75.5, "istatistik_dogruCevapOrani": 0.8,
+             "istatistik_kazanilanHalkaSayisi": i, "ogrenci_id": 1}
+            for i in range(1, 5)])
+        db.execute(insert(models.ChatbotEtkilesim), [
+            {"chatbot_soruMetni": f"soru {i}", "chatbot_cevapMetni": "cevap",
+             "chatbot_zamanDamgasi": datetime(2025, 3, 1, 12, i), "ogrenci_id": 1}
+            for i in range(1, 4)])
+        db.commit()
+
+
+@pytest.mark.parametrize("yol, params", [
+    ("/ogrenciler/", {"limit": 3}),
+    ("/ogrenciler/", {"ids": "4,2,99,2"}),
+    ("/ogrenciler/1/sinavlar", {}),
+    ("/sinavlar/", {"limit": 10}),
+    ("/istatistikler/", {"ogrenci_id": 1, "limit": 2}),
+    ("/chatbot/", {"ogrenci_id": 1}),
+])
+def test_hizli_yol_orm_ciktisiyla_ayni(client, veri, monkeypatch, yol, params):
+    yanitlar = []
+    for acik in (False, True):
+        monkeypatch.setattr(hizli, "HIZLI_LISTE", acik)
+        yanit = client.get(yol, params=params)
+        assert yanit.status_code == 200
+        yanitlar.append(yanit)
+    orm, hizli_yanit = yanitlar
+    assert orm.json() and hizli_yanit.json() == orm.json()
+    for baslik in ("X-Next-Cursor", "X-Eksik-Idler", "Content-Type"):
+        assert hizli_yanit.headers.get(baslik) == orm.headers.get(baslik)
+
+
+def test_decimal_kolonlar_float_olarak_yazilir():
+    satir = dict.fromkeys(hizli.SINAVLAR.anahtarlar)
+    satir["sinav_puan"] = Decimal("66.66")
+    sonuc = hizli.SINAVLAR.sozlukler([tuple(satir.values())])
+    assert sonuc == [dict(satir, sinav_puan=66.66)]
+    assert type(sonuc[0]["sinav_puan"]) is float
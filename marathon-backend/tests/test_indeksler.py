@@ -0,0 +1,27 @@
+import os
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from benchmarks.indeks_kontrol import sorgu_kontrol, sorgular
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory):
+    # Şema modellerden değil migration'lardan kurulur: üretimdeki indeksler kontrol edilir
+    url = f"sqlite:///{tmp_path_factory.mktemp('indeks') / 'indeks.db'}"
+    config = Config(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", url)
+    command.upgrade(config, "head")
+    engine = create_engine(url)
+    with Session(engine) as oturum:
+        yield oturum
+    engine.dispose()
+
+
+@pytest.mark.parametrize("ad,cagri,beklenen,siralama_serbest", sorgular(), ids=[s[0] for s in sorgular()])
+def test_sorgu_plani_beklenen_indeksi_kullanir(db, ad, cagri, beklenen, siralama_serbest):
+    tamam, ozet = sorgu_kontrol(db, cagri, beklenen, siralama_serbest)
+    assert tamam, ozet
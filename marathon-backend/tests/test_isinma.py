@@ -0,0 +1,71 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import event
+
+import isinma, sifre
+
+KLASOR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def cagrilar(monkeypatch):
+    sayac = {"sahte_hash": 0}
+
+    def sahte_hash():
+        sayac["sahte_hash"] += 1
+
+    monkeypatch.setattr(sifre, "sahte_hash", sahte_hash)
+    return sayac
+
+
+def test_isinma_kapaliyken_sorgu_calismaz(engine, monkeypatch, cagrilar):
+    monkeypatch.setattr(isinma, "DB_ISINMA", False)
+    monkeypatch.setattr(isinma, "_sync_isit", lambda: pytest.fail("ısınma çalışmamalı"))
+    asyncio.run(isinma.baslat())
+    ozet = isinma.ozet()
+    assert ozet["isinma"] is False and ozet["isinma_ms"] is None and ozet["hata"] is None
+    assert cagrilar["sahte_hash"] == 0
+
+
+def test_isinma_acikken_sorgular_onceden_calisir(engine, monkeypatch, cagrilar):
+    monkeypatch.setattr(isinma, "DB_ISINMA", True)
+    sorgular = []
+
+    def say(conn, cursor, ifade, *args):
+        sorgular.append(ifade)
+
+    event.listen(engine, "before_cursor_execute", say)
+    try:
+        asyncio.run(isinma.baslat())
+    finally:
+        event.remove(engine, "before_cursor_execute", say)
+    ozet = isinma.ozet()
+    assert ozet["isinma_ms"] is not None and ozet["hata"] is None
+    # Kaynak başına liste, id listesi ve tekil okuma + e-posta ile öğrenci
+    assert len(sorgular) >= 3 * len(isinma.KAYNAKLAR) + 1
+    assert cagrilar["sahte_hash"] == 1
+
+
+def test_isinma_hatasi_baslangici_durdurmaz(engine, monkeypatch, cagrilar):
+    def hata():
+        raise RuntimeError("veritabanı hazır değil")
+
+    monkeypatch.setattr(isinma, "DB_ISINMA", True)
+    monkeypatch.setattr(isinma, "_sync_isit", hata)
+    asyncio.run(isinma.baslat())
+    assert isinma.ozet()["hata"] == "veritabanı hazır değil"
+
+
+def test_import_veritabanina_baglanmaz(tmp_path):
+    # SQLite dosyası ilk bağlantıda oluşur; main import'u dosyayı oluşturmamalı
+    veritabani = tmp_path / "import.db"
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{veritabani}", KUYRUK_SPOOL=str(tmp_path / "kuyruk.ndjson"),
+               BENZER_DIZIN=str(tmp_path / "benzer"), TOKEN_ANAHTARI="test-anahtari", CACHE_BACKEND="none")
+    sonuc = subprocess.run([sys.executable, "-c", "import main, db; assert 'engine' not in vars(db)"],
+                           cwd=KLASOR, env=env, capture_output=True, text=True)
+    assert sonuc.returncode == 0, sonuc.stderr
+    assert not veritabani.exists()
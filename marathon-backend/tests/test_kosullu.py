@@ -0,0 +1,28 @@
+from datetime import date, datetime
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+import models
+
+
+def test_ayni_saniyedeki_guncelleme_etagi_degistirir(client, engine):
+    with Session(engine) as db:
+        db.execute(insert(models.Ogrenci).values(
+            ogrenci_kullaniciAdi="o", ogrenci_email="o@ornek.com", ogrenci_sifreHashed="x", ogrenci_ad="Ad",
+            ogrenci_soyad="Soyad", ogrenci_dogumTarihi=date(2010, 1, 1),
+            ogrenci_sonGuncellemeTarihi=datetime(2025, 1, 1, 12, 0, 0)))
+        db.commit()
+    ilk = client.get("/ogrenciler/1")
+    assert ilk.status_code == 200
+    etag = ilk.headers["ETag"]
+    assert client.get("/ogrenciler/1", headers={"If-None-Match": etag}).status_code == 304
+
+    # Saniye çözünürlüklü sütunda aynı zamanı taşıyan ikinci güncelleme
+    with Session(engine) as db:
+        db.execute(update(models.Ogrenci).values(ogrenci_ad="Yeni"))
+        db.commit()
+    yanit = client.get("/ogrenciler/1", headers={"If-None-Match": etag})
+    assert yanit.status_code == 200 and yanit.json()["ogrenci_ad"] == "Yeni"
+    assert yanit.headers["ETag"] != etag
+    assert client.get("/ogrenciler/1", headers={"If-None-Match": yanit.headers["ETag"]}).status_code == 304
@@ -0,0 +1,62 @@
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import kuyruk
+
+
+@pytest.fixture
+def hizli(monkeypatch):
+    monkeypatch.setattr(kuyruk, "KUYRUK_ARALIGI", 0.01)
+    monkeypatch.setattr(kuyruk, "KUYRUK_MAX_BEKLEME", 0.02)
+    monkeypatch.setattr(kuyruk, "KUYRUK_MAX_DENEME", 3)
+    kayitlar = []
+    monkeypatch.setattr(kuyruk.atexit, "register", kayitlar.append)
+    return kayitlar
+
+
+def bekle(kosul, sure: float = 5.0):
+    son = time.monotonic() + sure
+    while not kosul() and time.monotonic() < son:
+        time.sleep(0.01)
+    assert kosul()
+
+
+def test_durdurulan_kuyruk_yeniden_baslatilir(hizli, tmp_path):
+    yazilan = []
+
+    def yaz(db, kayitlar):
+        yazilan.extend(kayitlar)
+        return len(kayitlar), []
+
+    k = kuyruk.YazmaKuyrugu(lambda: SimpleNamespace(close=lambda: None), [kuyruk.KayitTuru("t", yaz)],
+                            spool=str(tmp_path / "spool.ndjson"))
+    k.baslat()
+    k.durdur()
+    assert not k.ekle("t", {"n": 1})
+    # İkinci lifespan: kuyruk yeniden kayıt kabul eder ve yazar
+    k.baslat()
+    assert k.ekle("t", {"n": 2})
+    bekle(lambda: yazilan == [{"n": 2}])
+    k.durdur()
+    assert hizli == [k.durdur]
+
+
+def test_deneme_hakki_biten_parti_spoola_alinir(hizli, tmp_path):
+    denemeler = []
+
+    def yaz(db, kayitlar):
+        denemeler.append(len(kayitlar))
+        raise RuntimeError("bağlantı yok")
+
+    spool = tmp_path / "spool.ndjson"
+    k = kuyruk.YazmaKuyrugu(lambda: SimpleNamespace(close=lambda: None), [kuyruk.KayitTuru("t", yaz)],
+                            spool=str(spool))
+    k.baslat()
+    assert k.ekle("t", {"n": 1})
+    bekle(lambda: k.ozet()["spool_yazilan"] == 1)
+    assert len(denemeler) == kuyruk.KUYRUK_MAX_DENEME and k.derinlik() == 0
+    assert [json.loads(s) for s in spool.read_text(encoding="utf-8").splitlines()] == [{"tur": "t", "kayit": {"n": 1}}]
+    k.durdur()
@@ -0,0 +1,95 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+import crud, liderlik, models, schemas
+
+GUN = date(2025, 3, 5)
+
+
+def istatistik(ogrenci_id: int, halka: int) -> schemas.IstatistiklerCreate:
+    return schemas.IstatistiklerCreate(
+        istatistik_tarihi=GUN, istatistik_gunlukcalismaSuresi=10, istatistik_tamamlananModulSayisi=1,
+        istatistik_ortalamaodakPuani=None, istatistik_cozulenSoruSayisi=1, istatistik_dogruCevapOrani=None,
+        istatistik_kazanilanHalkaSayisi=halka, istatistik_molaSayisi=0, istatistik_toplamMolaSuresi=0,
+        istatistik_uykuKalitesi=None, istatistik_notlar=None, ogrenci_id=ogrenci_id)
+
+
+@pytest.fixture
+def db(engine, monkeypatch):
+    monkeypatch.setattr(liderlik, "TABLO", liderlik.Liderlik())
+    with Session(engine) as oturum:
+        oturum.execute(insert(models.Ogrenci), [
+            {"ogrenci_kullaniciAdi": f"o{i}", "ogrenci_email": f"o{i}@ornek.com", "ogrenci_sifreHashed": "x",
+             "ogrenci_ad": "Ad", "ogrenci_soyad": "Soyad", "ogrenci_dogumTarihi": date(2010, 1, 1),
+             "ogrenci_sonGuncellemeTarihi": datetime(2025, 1, 1)} for i in range(3)])
+        oturum.commit()
+        for ogrenci_id, halka in ((1, 5), (2, 3), (3, 4)):
+            crud.create_istatistik(oturum, istatistik(ogrenci_id, halka))
+        yield oturum
+
+
+def halkalar(satirlar: list[dict]) -> dict:
+    return {s["ogrenci_id"]: s["halka"] for s in satirlar}
+
+
+def test_veritabani_okumalari_liderlik_kilidi_disinda(db, engine):
+    tablo = liderlik.TABLO
+    kilitli = []
+
+    def kontrol(conn, cursor, ifade, parametreler, context, executemany):
+        kilitli.append(tablo._kilit.locked())
+
+    event.listen(engine, "before_cursor_execute", kontrol)
+    try:
+        tablo.ilk(db, "gun", GUN)
+        tablo.esitle(db, zorla=True)
+        tablo.konum(db, 1, "hafta", GUN)
+    finally:
+        event.remove(engine, "before_cursor_execute", kontrol)
+    assert kilitli and not any(kilitli)
+
+
+def test_kurulurken_gelen_kayit_bir_kez_sayilir(db, monkeypatch):
+    tablo = liderlik.TABLO
+    tablo.ilk(db, "ay", GUN)  # doğrudan işlenenler yalnızca tablo varken kaydedilir
+    kur = tablo._kur
+
+    def araya_giren(oturum, *anahtar):
+        # Anlık görüntü alındıktan sonra, tablo yerine konmadan önce yeni kayıt
+        sonuc = kur(oturum, *anahtar)
+        crud.create_istatistik(db, istatistik(2, 7))
+        return sonuc
+
+    monkeypatch.setattr(tablo, "_kur", araya_giren)
+    beklenen = {1: 5, 2: 10, 3: 4}
+    assert halkalar(tablo.ilk(db, "gun", GUN)) == beklenen
+    monkeypatch.setattr(tablo, "_kur", kur)
+    tablo.esitle(db, zorla=True)
+    assert halkalar(tablo.ilk(db, "gun", GUN)) == beklenen
+    assert halkalar(tablo.ilk(db, "ay", GUN)) == beklenen
+
+
+@pytest.mark.parametrize("yol, params", [
+    ("/liderlik/", {"n": 0}),
+    ("/liderlik/", {"n": -1}),
+    ("/liderlik/", {"n": 101}),
+    ("/liderlik/ogrenciler/1", {"komsu": -1}),
+    ("/liderlik/ogrenciler/1", {"komsu": 51}),
+])
+def test_liderlik_parametre_sinirlari(client, db, yol, params):
+    assert client.get(yol, params=params).status_code == 422
+
+
+def test_liderlere_basarim_n_siniri(client, db):
+    assert client.post("/basarimlar/1/liderlere", params={"n": -1}).status_code == 422
+    assert client.post("/basarimlar/1/liderlere", params={"n": 101}).status_code == 422
+
+
+def test_liderlik_sinir_degerleri_kabul_edilir(client, db):
+    yanit = client.get("/liderlik/", params={"n": 100, "tarih": GUN.isoformat()})
+    assert yanit.status_code == 200 and len(yanit.json()) == 3
+    yanit = client.get("/liderlik/ogrenciler/1", params={"komsu": 0, "tarih": GUN.isoformat()})
+    assert yanit.status_code == 200
@@ -0,0 +1,83 @@
+import re
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+import metrikler, models
+
+
+@pytest.fixture
+def kayit():
+    metrikler.KAYIT.sifirla()
+    yield metrikler.KAYIT
+    metrikler.KAYIT.sifirla()
+
+
+def ogrenci_ekle(engine):
+    with Session(engine) as db:
+        db.execute(insert(models.Ogrenci).values(
+            ogrenci_kullaniciAdi="o1", ogrenci_email="o1@ornek.com", ogrenci_sifreHashed="x", ogrenci_ad="Ad",
+            ogrenci_soyad="Soyad", ogrenci_dogumTarihi=date(2010, 1, 1),
+            ogrenci_sonGuncellemeTarihi=datetime(2025, 1, 1)))
+        db.commit()
+
+
+def metrik_satirlari(client) -> dict:
+    yanit = client.get("/metrics")
+    assert yanit.status_code == 200 and yanit.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    degerler = {}
+    for satir in yanit.text.splitlines():
+        if not satir.startswith("#"):
+            ad, deger = satir.rsplit(" ", 1)
+            degerler[ad] = float(deger)
+    return degerler
+
+
+def test_server_timing_db_suresini_ve_sorgu_sayisini_verir(client, engine, kayit):
+    ogrenci_ekle(engine)
+    yanit = client.get("/ogrenciler/")
+    eslesme = re.fullmatch(r'db;dur=([\d.]+);desc="(\d+) sorgu", havuz;dur=([\d.]+), app;dur=([\d.]+)',
+                           yanit.headers["Server-Timing"])
+    assert eslesme is not None
+    db_ms, sorgu, _, app_ms = eslesme.groups()
+    assert int(sorgu) >= 1 and float(db_ms) <= float(app_ms)
+
+
+def test_prometheus_route_sablonu_ve_histogramlar(client, engine, kayit):
+    ogrenci_ekle(engine)
+    client.get("/ogrenciler/")
+    client.get("/ogrenciler/")
+    client.get("/ogrenciler/1")
+    client.get("/ogrenciler/2")  # başka öğrenci: 403
+    client.get("/yok/boyle-bir-yol")
+    m = metrik_satirlari(client)
+
+    assert m['http_istek_toplam{method="GET",route="/ogrenciler/",durum="200"}'] == 2
+    # Etiket path şablonudur, id başına ayrı seri açılmaz
+    assert m['http_istek_toplam{method="GET",route="/ogrenciler/{ogrenci_id}",durum="200"}'] == 1
+    assert m['http_istek_toplam{method="GET",route="/ogrenciler/{ogrenci_id}",durum="403"}'] == 1
+    assert m['http_istek_toplam{method="GET",route="<eslesmeyen>",durum="404"}'] == 1
+
+    etiket = 'method="GET",route="/ogrenciler/"'
+    kovalar = [m[f'http_istek_sure_saniye_bucket{{{etiket},le="{s}"}}'] for s in metrikler.SURE_KOVALARI + ("+Inf",)]
+    assert kovalar == sorted(kovalar) and kovalar[-1] == m[f"http_istek_sure_saniye_count{{{etiket}}}"] == 2
+    assert m[f"http_istek_db_sorgu_count{{{etiket}}}"] == 2
+    assert m[f"http_istek_db_sorgu_sum{{{etiket}}}"] >= 2
+    assert m[f'http_istek_db_sorgu_bucket{{{etiket},le="0"}}'] == 0
+    assert m[f"http_yanit_boyut_bayt_sum{{{etiket}}}"] > 0
+    assert m["db_sorgu_toplam"] >= m[f"http_istek_db_sorgu_sum{{{etiket}}}"]
+    assert 'db_havuz_checkout_toplam{motor="sync"}' in m
+    assert "kuyruk_derinlik" in m
+
+
+def test_histogram_kova_siniri_dahil():
+    h = metrikler.Histogram((1, 2))
+    for deger in (0.5, 1, 1.5, 3):
+        h.gozle(deger)
+    assert h.kovalar == [2, 1, 1] and h.adet == 4 and h.toplam == 6
+
+
+def test_etiket_degerleri_kacislanir():
+    assert metrikler._etiketler(route='/a"b\\c\n') == 'route="/a\\"b\\\\c\\n"'
@@ -0,0 +1,83 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+import models, onbellek
+
+
+class Saat:
+    def __init__(self):
+        self.simdi = 1000.0
+
+    def __call__(self) -> float:
+        return self.simdi
+
+
+@pytest.fixture
+def saat(monkeypatch):
+    sahte = Saat()
+    monkeypatch.setattr(onbellek.time, "monotonic", sahte)
+    return sahte
+
+
+def test_ttl_dolunca_kayit_dusar(saat):
+    bellek = onbellek.BellekOnbellek(ttl=10)
+    bellek.koy("a", {"x": 1})
+    saat.simdi += 9.9
+    assert bellek.getir("a") == {"x": 1}
+    saat.simdi += 0.2
+    assert bellek.getir("a") is None
+    assert bellek.boyut() == {"kayit": 0, "bayt": 0}
+
+
+def test_lru_en_az_kullanilani_cikarir(saat):
+    bellek = onbellek.BellekOnbellek(ttl=60, max_kayit=2)
+    bellek.koy("a", 1)
+    bellek.koy("b", 2)
+    assert bellek.getir("a") == 1  # a en son kullanılan olur
+    bellek.koy("c", 3)
+    assert bellek.getir("b") is None
+    assert (bellek.getir("a"), bellek.getir("c")) == (1, 3)
+    assert bellek.sayaclar.ozet()["tahliye"] == 1
+
+
+def test_bayt_siniri_asilinca_cikarir(saat):
+    bellek = onbellek.BellekOnbellek(ttl=60, max_bayt=15)  # JSON karşılığı kayıt başına 10 bayt
+    bellek.koy("a", "x" * 8)
+    bellek.koy("b", "y" * 8)
+    assert bellek.getir("a") is None and bellek.getir("b") == "y" * 8
+    bellek.koy("buyuk", "z" * 30)  # sınırdan büyük değer hiç saklanmaz
+    assert bellek.getir("buyuk") is None and bellek.getir("b") == "y" * 8
+
+
+@pytest.fixture
+def acik_onbellek(monkeypatch):
+    # conftest önbelleği kapatır (CACHE_BACKEND=none); bu testler bellek önbelleğiyle çalışır
+    bellek = onbellek.BellekOnbellek(ttl=60)
+    monkeypatch.setattr(onbellek, "onbellek", bellek)
+    return bellek
+
+
+def test_yazma_sonrasi_okuma_taze_veri_doner(acik_onbellek, client, engine):
+    with Session(engine) as db:
+        db.execute(insert(models.Ogrenci).values(
+            ogrenci_kullaniciAdi="o1", ogrenci_email="o1@ornek.com", ogrenci_sifreHashed="x", ogrenci_ad="Ad",
+            ogrenci_soyad="Soyad", ogrenci_dogumTarihi=date(2010, 1, 1),
+            ogrenci_sonGuncellemeTarihi=datetime(2025, 1, 1)))
+        db.commit()
+    assert client.get("/ogrenciler/1").json()["ogrenci_ad"] == "Ad"
+    # API dışı değişiklik önbellekten okunan yanıta yansımaz: ikinci okuma önbellekten
+    with Session(engine) as db:
+        db.execute(update(models.Ogrenci).values(ogrenci_soyad="Dogrudan"))
+        db.commit()
+    assert client.get("/ogrenciler/1").json()["ogrenci_soyad"] == "Soyad"
+    assert acik_onbellek.sayaclar.ozet()["hit"] == 1
+
+    govde = client.get("/ogrenciler/1").json()
+    del govde["ogrenci_id"]
+    assert client.put("/ogrenciler/1", json=dict(govde, ogrenci_ad="Yeni")).status_code == 200
+    yanit = client.get("/ogrenciler/1").json()
+    assert yanit["ogrenci_ad"] == "Yeni"
+    assert acik_onbellek.sayaclar.ozet()["gecersiz"] >= 1
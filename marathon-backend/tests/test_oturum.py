@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+import models, oturum
+
+
+def oturum_import(**ortam) -> subprocess.CompletedProcess:
+    # Modül düzeyindeki anahtar kontrolü için temiz ortamda yeni süreç
+    env = {k: v for k, v in os.environ.items() if not k.startswith("TOKEN_")}
+    env.update(ortam)
+    return subprocess.run([sys.executable, "-c", "import oturum; print(len(oturum.TOKEN_ANAHTARI))"],
+                          env=env, capture_output=True, text=True)
+
+
+def test_anahtar_yoksa_baslamaz():
+    sonuc = oturum_import()
+    assert sonuc.returncode != 0
+    assert "TOKEN_ANAHTARI" in sonuc.stderr
+
+
+def test_gelistirme_bayragiyla_rastgele_anahtar():
+    sonuc = oturum_import(TOKEN_GELISTIRME="1")
+    assert sonuc.returncode == 0
+    assert sonuc.stdout.strip() == "32"
+
+
+def test_iptal_edilen_token_reddedilir():
+    token = oturum.token_olustur(7)
+    dogrulayici = oturum.TokenDogrulayici()
+    assert dogrulayici.dogrula(token)["sub"] == 7
+    dogrulayici.iptal_et(token)
+    with pytest.raises(oturum.GecersizToken):
+        dogrulayici.dogrula(token)
+
+
+@pytest.mark.parametrize("yol", ["/ogrenciler/2", "/ogrenciler/2/ozet", "/istatistikler/?ogrenci_id=2",
+                                 "/chatbot/?ogrenci_id=2"])
+def test_baska_ogrencinin_verisi_okunamaz(client, engine, yol):
+    assert client.get(yol).status_code == 403
+
+
+def test_baska_ogrenci_guncellenemez(client, engine):
+    # client fixture'ı 1 numaralı öğrencinin token'ını taşır
+    with Session(engine) as db:
+        db.execute(insert(models.Ogrenci), [
+            {"ogrenci_kullaniciAdi": f"o{i}", "ogrenci_email": f"o{i}@ornek.com", "ogrenci_sifreHashed": "x",
+             "ogrenci_ad": "Ad", "ogrenci_soyad": "Soyad", "ogrenci_dogumTarihi": date(2010, 1, 1),
+             "ogrenci_sonGuncellemeTarihi": datetime(2025, 1, 1)} for i in (1, 2)])
+        db.commit()
+    govde = {"ogrenci_kullaniciAdi": "o2", "ogrenci_email": "saldirgan@ornek.com", "ogrenci_ad": "Ad",
+             "ogrenci_soyad": "Soyad", "ogrenci_dogumTarihi": "2010-01-01", "ogrenci_okulSeviyesi": None,
+             "ogrenci_adhdSeviyesi": None, "ogrenci_kayitTarihi": None, "ogrenci_odakSuresi": None,
+             "ogrenci_soruCozmeHizi": None, "ogrenci_basariOrani": None, "ogrenci_dikkatSeviyesi": None,
+             "ogrenci_mevcutSeviye": None, "ogrenci_ogrenmeStili": None,
+             "ogrenci_sonGuncellemeTarihi": "2025-01-02T00:00:00", "ogrenci_sifre": "yeni-sifre"}
+    assert client.put("/ogrenciler/2", json=govde).status_code == 403
+    with Session(engine) as db:
+        assert db.scalar(select(models.Ogrenci.ogrenci_email).where(models.Ogrenci.ogrenci_id == 2)) == "o2@ornek.com"
+    assert client.put("/ogrenciler/1", json=dict(govde, ogrenci_kullaniciAdi="o1")).status_code == 200
@@ -0,0 +1,72 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+import models, ozet
+
+
+def istatistik(tarih: str, calisma: float, odak, dogru, halka: int) -> dict:
+    return {"istatistik_tarihi": tarih, "istatistik_gunlukcalismaSuresi": calisma,
+            "istatistik_tamamlananModulSayisi": 1, "istatistik_ortalamaodakPuani": odak,
+            "istatistik_cozulenSoruSayisi": 10, "istatistik_dogruCevapOrani": dogru,
+            "istatistik_kazanilanHalkaSayisi": halka, "istatistik_molaSayisi": 0, "istatistik_toplamMolaSuresi": 0,
+            "istatistik_uykuKalitesi": None, "istatistik_notlar": None, "ogrenci_id": 1}
+
+
+@pytest.fixture
+def veri(client, engine):
+    with Session(engine) as db:
+        db.execute(insert(models.Ogrenci), [
+            {"ogrenci_kullaniciAdi": f"o{i}", "ogrenci_email": f"o{i}@ornek.com", "ogrenci_sifreHashed": "x",
+             "ogrenci_ad": "Ad", "ogrenci_soyad": "Soyad", "ogrenci_dogumTarihi": date(2010, 1, 1),
+             "ogrenci_sonGuncellemeTarihi": datetime(2025, 1, 1)}
+            for i in (1, 2)])
+        # 7. sınav aralık dışında, 8. sınav başka öğrencinin
+        db.execute(insert(models.SinavSimilasyonlari), [
+            {"sinav_id": i, "sinav_adi": f"s{i}", "sinav_puan": puan, "sinav_tarihi": tarih}
+            for i, (puan, tarih) in enumerate([(85, date(2025, 3, 2)), (40, date(2025, 3, 5)), (100, date(2025, 3, 9)),
+                                               (55, date(2025, 3, 11)), (70, date(2025, 3, 12)),
+                                               (None, date(2025, 3, 12)), (10, date(2025, 2, 1)),
+                                               (0, date(2025, 3, 5))], start=1)])
+        db.execute(insert(models.SinavSimilasyonlari_has_Ogrenci),
+                   [{"sinav_id": i, "ogrenci_id": 1} for i in range(1, 8)] + [{"sinav_id": 8, "ogrenci_id": 2}])
+        db.commit()
+    # Rollup tablosu istatistik yazılırken güncellenir
+    for satir in [istatistik("2025-03-03", 10, 80, 0.5, 1), istatistik("2025-03-03", 20, None, 0.7, 2),
+                  istatistik("2025-03-04", 5, 60, None, 0), istatistik("2025-03-10", 15, 70, 0.9, 3),
+                  istatistik("2025-02-20", 100, 10, 0.1, 9)]:
+        assert client.post("/istatistikler/", json=satir).status_code == 200
+
+
+def test_ozet_gunluk_haftalik_ve_sinav_dagilimi(client, veri):
+    yanit = client.get("/ogrenciler/1/ozet", params={"baslangic": "2025-03-01", "bitis": "2025-03-31"})
+    assert yanit.status_code == 200
+    sonuc = yanit.json()
+    assert sonuc["toplam_calisma_suresi"] == 50
+    assert sonuc["ortalama_odak_puani"] == 70
+    assert sonuc["ortalama_dogru_orani"] == pytest.approx(0.7)
+    assert sonuc["toplam_halka"] == 6
+    assert [(g["tarih"], g["calisma_suresi"], g["dogru_orani"], g["halka"]) for g in sonuc["gunluk"]] == [
+        ("2025-03-03", 30, pytest.approx(0.6), 3), ("2025-03-04", 5, None, 0), ("2025-03-10", 15, 0.9, 3)]
+    # Haftalar pazartesiden başlar
+    assert [(h["hafta_baslangici"], h["calisma_suresi"], h["odak_puani"], h["halka"]) for h in sonuc["haftalik"]] == [
+        ("2025-03-03", 35, 70, 3), ("2025-03-10", 15, 70, 3)]
+    # Günlük doğru oranı 7 günde 0.6'dan 0.9'a
+    assert sonuc["dogru_orani_egilimi"] == pytest.approx(0.3 / 7, abs=1e-6)
+    assert sonuc["sinavlar"] == {"sinav_sayisi": 5, "ortalama": 70, "p25": 55, "p50": 70, "p75": 85, "p90": 94}
+
+
+def test_bos_aralik_ve_gecersiz_aralik(client, veri):
+    sonuc = client.get("/ogrenciler/1/ozet", params={"baslangic": "2024-01-01", "bitis": "2024-01-31"}).json()
+    assert sonuc["toplam_calisma_suresi"] == 0 and sonuc["gunluk"] == [] and sonuc["dogru_orani_egilimi"] is None
+    assert sonuc["sinavlar"]["sinav_sayisi"] == 0 and sonuc["sinavlar"]["p50"] is None
+    yanit = client.get("/ogrenciler/1/ozet", params={"baslangic": "2025-03-31", "bitis": "2025-03-01"})
+    assert yanit.status_code == 400
+
+
+def test_yuzdelik_dogrusal_interpolasyon():
+    assert ozet._yuzdelik([10.0], 0.9) == 10
+    assert ozet._yuzdelik([1.0, 2.0], 0.5) == 1.5
+    assert ozet._yuzdelik([1.0, 2.0, 3.0, 4.0], 0.9) == pytest.approx(3.7)
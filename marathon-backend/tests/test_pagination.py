@@ -0,0 +1,102 @@
+import base64
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+import models
+from pagination import ID_LISTESI_MAX, SAYFA_MAX, encode_cursor
+
+
+def ogrenci_ekle(engine, idler):
+    with Session(engine) as db:
+        db.execute(insert(models.Ogrenci), [
+            {"ogrenci_id": i, "ogrenci_kullaniciAdi": f"o{i}", "ogrenci_email": f"o{i}@ornek.com",
+             "ogrenci_sifreHashed": "x", "ogrenci_ad": "Ad", "ogrenci_soyad": "Soyad",
+             "ogrenci_dogumTarihi": date(2010, 1, 1), "ogrenci_sonGuncellemeTarihi": datetime(2025, 1, 1)}
+            for i in idler])
+        db.commit()
+
+
+def sayfa(client, **params) -> tuple[list[int], str]:
+    yanit = client.get("/ogrenciler/", params=params)
+    assert yanit.status_code == 200
+    return [o["ogrenci_id"] for o in yanit.json()], yanit.headers.get("X-Next-Cursor")
+
+
+def test_son_sayfada_cursor_yok(client, engine):
+    ogrenci_ekle(engine, range(1, 6))
+    idler, cursor = sayfa(client, limit=2)
+    gorulen = list(idler)
+    while cursor is not None:
+        idler, cursor = sayfa(client, limit=2, cursor=cursor)
+        gorulen += idler
+    assert gorulen == [1, 2, 3, 4, 5]
+    assert idler == [5]
+
+
+def test_sayfalar_arasinda_eklenen_kayit_tekrarlanmaz_atlanmaz(client, engine):
+    ogrenci_ekle(engine, [2, 4, 6, 8])
+    idler, cursor = sayfa(client, limit=2)
+    assert idler == [2, 4]
+    # Cursor'dan önceki kayıt (offset'i kaydırırdı) ve sonraki kayıt
+    ogrenci_ekle(engine, [1, 5])
+    idler, cursor = sayfa(client, limit=2, cursor=cursor)
+    assert idler == [5, 6]
+    idler, cursor = sayfa(client, limit=2, cursor=cursor)
+    assert idler == [8] and cursor is None
+
+
+@pytest.mark.parametrize("cursor", [
+    "bozuk!",
+    base64.urlsafe_b64encode(b"json degil").decode(),
+    base64.urlsafe_b64encode(b'{"id": "3"}').decode(),
+    base64.urlsafe_b64encode(b'{"kimlik": 3}').decode(),
+    encode_cursor(3)[:-2],
+])
+def test_gecersiz_cursor_400(client, engine, cursor):
+    yanit = client.get("/ogrenciler/", params={"cursor": cursor})
+    assert yanit.status_code == 400
+    assert yanit.json()["detail"] == "Geçersiz cursor"
+
+
+@pytest.mark.parametrize("params", [{"limit": 0}, {"limit": -1}, {"limit": SAYFA_MAX + 1}, {"skip": -1}])
+def test_limit_sinirlari(client, engine, params):
+    assert client.get("/ogrenciler/", params=params).status_code == 422
+
+
+def test_limit_en_fazla_sayfa_max(client, engine):
+    assert client.get("/ogrenciler/", params={"limit": SAYFA_MAX}).status_code == 200
+
+
+def test_id_listesi_istek_sirasinda_tek_sorguda(client, engine):
+    ogrenci_ekle(engine, range(1, 6))
+    sorgular = []
+
+    def say(conn, cursor, statement, *args):
+        sorgular.append(statement)
+
+    event.listen(engine, "before_cursor_execute", say)
+    try:
+        yanit = client.get("/ogrenciler/", params={"ids": "4,99,2,4, 1"})
+    finally:
+        event.remove(engine, "before_cursor_execute", say)
+    assert yanit.status_code == 200
+    assert [o["ogrenci_id"] for o in yanit.json()] == [4, 2, 1]
+    assert yanit.headers["X-Eksik-Idler"] == "99"
+    assert len([s for s in sorgular if "FROM ogrenci" in s]) == 1
+
+
+def test_tum_idler_bulununca_eksik_basligi_yok(client, engine):
+    ogrenci_ekle(engine, [1, 2])
+    yanit = client.get("/ogrenciler/", params={"ids": "2,1"})
+    assert [o["ogrenci_id"] for o in yanit.json()] == [2, 1]
+    assert "X-Eksik-Idler" not in yanit.headers
+
+
+@pytest.mark.parametrize("ids", ["", ",", "1,a", "1.5", ",".join(map(str, range(1, ID_LISTESI_MAX + 2)))])
+def test_gecersiz_id_listesi_400(client, engine, ids):
+    yanit = client.get("/ogrenciler/", params={"ids": ids})
+    assert yanit.status_code == 400
+    assert yanit.json()["detail"].startswith("ids")
@@ -0,0 +1,116 @@
+import asyncio
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session
+
+import crud, isinma, models, rollup, schemas
+
+OGRENCI = 4
+
+
+def _istatistik(rastgele: random.Random) -> dict:
+    return {
+        "istatistik_tarihi": date(2025, 1, 1) + timedelta(days=rastgele.randrange(90)),
+        "istatistik_gunlukcalismaSuresi": rastgele.randint(0, 600) / 10,
+        "istatistik_tamamlananModulSayisi": 1,
+        "istatistik_ortalamaodakPuani": rastgele.choice([None, rastgele.randint(0, 100)]),
+        "istatistik_cozulenSoruSayisi": rastgele.randint(0, 60),
+        "istatistik_dogruCevapOrani": rastgele.choice([None, rastgele.randint(0, 100) / 100]),
+        "istatistik_kazanilanHalkaSayisi": rastgele.randint(0, 5),
+        "istatistik_molaSayisi": 0,
+        "istatistik_toplamMolaSuresi": 0,
+        "istatistik_uykuKalitesi": None,
+        "istatistik_notlar": None,
+        "ogrenci_id": 1 + rastgele.randrange(OGRENCI),
+    }
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as oturum:
+        oturum.execute(insert(models.Ogrenci), [
+            {"ogrenci_kullaniciAdi": f"o{i}", "ogrenci_email": f"o{i}@ornek.com", "ogrenci_sifreHashed": "x",
+             "ogrenci_ad": "Ad", "ogrenci_soyad": "Soyad", "ogrenci_dogumTarihi": date(2010, 1, 1),
+             "ogrenci_sonGuncellemeTarihi": datetime(2025, 1, 1)}
+            for i in range(OGRENCI + 1)
+        ])
+        oturum.commit()
+        # Artımlı yollar: tekil ekleme ve toplu ekleme
+        rastgele = random.Random(3)
+        for _ in range(40):
+            crud.create_istatistik(oturum, schemas.IstatistiklerCreate(**_istatistik(rastgele)))
+        crud.create_istatistikler_toplu(oturum, list(enumerate(_istatistik(rastgele) for _ in range(200))))
+        yield oturum
+
+
+def ham_toplamlar(db: Session) -> dict:
+    # Ham tablodan, rollup kodundan bağımsız beklenen toplamlar
+    beklenen = {}
+    for k in db.scalars(select(models.Istatistikler)):
+        baslangiclar = {"gun": k.istatistik_tarihi,
+                        "hafta": k.istatistik_tarihi - timedelta(days=k.istatistik_tarihi.weekday()),
+                        "ay": k.istatistik_tarihi.replace(day=1)}
+        for donem, baslangic in baslangiclar.items():
+            t = beklenen.setdefault((k.ogrenci_id, donem, baslangic), dict.fromkeys(rollup.OLCULER, 0.0))
+            t["ozet_kayitSayisi"] += 1
+            t["ozet_calismaSuresi"] += float(k.istatistik_gunlukcalismaSuresi or 0)
+            t["ozet_odakToplam"] += float(k.istatistik_ortalamaodakPuani or 0)
+            t["ozet_odakSayisi"] += k.istatistik_ortalamaodakPuani is not None
+            t["ozet_dogruToplam"] += float(k.istatistik_dogruCevapOrani or 0)
+            t["ozet_dogruSayisi"] += k.istatistik_dogruCevapOrani is not None
+            t["ozet_cozulenSoru"] += k.istatistik_cozulenSoruSayisi or 0
+            t["ozet_halkaSayisi"] += k.istatistik_kazanilanHalkaSayisi or 0
+    return beklenen
+
+
+def saklanan_toplamlar(db: Session) -> dict:
+    return {(s.ogrenci_id, s.ozet_donem, s.ozet_baslangic): {o: float(getattr(s, o)) for o in rollup.OLCULER}
+            for s in db.scalars(select(models.IstatistikOzetleri))}
+
+
+def esit_mi(saklanan: dict, beklenen: dict) -> bool:
+    return saklanan.keys() == beklenen.keys() and all(
+        abs(saklanan[k][o] - beklenen[k][o]) < 0.01 for k in beklenen for o in rollup.OLCULER)
+
+
+def test_artimli_toplamlar_ham_veriyle_esit(db):
+    assert esit_mi(saklanan_toplamlar(db), ham_toplamlar(db))
+    assert rollup.dogrula(db) == []
+
+
+def test_yeniden_olustur_bozulan_ve_artik_satirlari_duzeltir(db):
+    ozet = models.IstatistikOzetleri
+    db.execute(update(ozet).where(ozet.ogrenci_id == 1).values(ozet_halkaSayisi=999))
+    # Ham kaydı olmayan öğrencinin artık özet satırı
+    db.execute(insert(ozet).values(ogrenci_id=OGRENCI + 1, ozet_donem="gun", ozet_baslangic=date(2025, 1, 1),
+                                   ozet_kayitSayisi=1))
+    db.commit()
+    assert not esit_mi(saklanan_toplamlar(db), ham_toplamlar(db))
+    rollup.yeniden_olustur(db)
+    assert esit_mi(saklanan_toplamlar(db), ham_toplamlar(db))
+
+
+def test_yeniden_olustur_tabloyu_bosaltmaz(db, engine, monkeypatch):
+    # Yeniden hesap sırasında başka bir bağlantıdan okuyan her an satır görmeli
+    sayimlar = []
+    hesapla = rollup._ogrenci_toplamlari
+
+    def izle(oturum, ogrenci_id):
+        with engine.connect() as baglanti:
+            sayimlar.append(baglanti.scalar(select(func.count()).select_from(models.IstatistikOzetleri)))
+        return hesapla(oturum, ogrenci_id)
+
+    monkeypatch.setattr(rollup, "_ogrenci_toplamlari", izle)
+    once = len(saklanan_toplamlar(db))
+    rollup.yeniden_olustur(db)
+    assert len(sayimlar) == OGRENCI
+    assert min(sayimlar) == once
+
+
+def test_desteklenmeyen_dialect_baslangicta_reddedilir(monkeypatch, engine):
+    monkeypatch.setattr(rollup, "DESTEKLENEN_DIALECTLER", ("mysql",))
+    with pytest.raises(rollup.DesteklenmeyenVeritabani):
+        asyncio.run(isinma.baslat())
@@ -0,0 +1,63 @@
+from datetime import date, datetime
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+import models, sifre
+
+EPOSTA = "ogr@ornek.com"
+SIFRE = "dogru-sifre-1"
+
+
+def ogrenci(**ek) -> dict:
+    veri = dict.fromkeys(["ogrenci_dogumTarihi", "ogrenci_okulSeviyesi", "ogrenci_adhdSeviyesi",
+                          "ogrenci_kayitTarihi", "ogrenci_odakSuresi", "ogrenci_soruCozmeHizi",
+                          "ogrenci_basariOrani", "ogrenci_dikkatSeviyesi", "ogrenci_mevcutSeviye",
+                          "ogrenci_ogrenmeStili"])
+    veri.update(ogrenci_kullaniciAdi="ogr", ogrenci_email=EPOSTA, ogrenci_ad="Ad", ogrenci_soyad="Soyad",
+                ogrenci_dogumTarihi="2010-01-01", ogrenci_sonGuncellemeTarihi="2025-01-01T00:00:00")
+    return dict(veri, **ek)
+
+
+def kayitli_hash(engine) -> str:
+    with Session(engine) as db:
+        return db.scalar(select(models.Ogrenci.ogrenci_sifreHashed).where(models.Ogrenci.ogrenci_email == EPOSTA))
+
+
+def giris(client, parola: str) -> int:
+    return client.post("/login", data={"email": EPOSTA, "password": parola}).status_code
+
+
+def test_kayitta_sifre_sunucuda_hashlenir(client, engine):
+    assert client.post("/ogrenciler/", json=ogrenci(ogrenci_sifre=SIFRE)).status_code == 200
+    assert sifre.hashli_mi(kayitli_hash(engine))
+    assert giris(client, SIFRE) == 200
+    assert giris(client, "baska-sifre") == 401
+
+
+def test_guncelleme_istemci_hashini_yazmaz(client, engine):
+    ogrenci_id = client.post("/ogrenciler/", json=ogrenci(ogrenci_sifre=SIFRE)).json()["ogrenci_id"]
+    # Eski istemci: btoa(email + 'password') gönderir; yok sayılır, şifre değişmez
+    eski = ogrenci(ogrenci_sifreHashed=sifre.eski_kodlama(EPOSTA, "password"))
+    assert client.put(f"/ogrenciler/{ogrenci_id}", json=eski).status_code == 200
+    assert giris(client, "password") == 401
+    assert giris(client, SIFRE) == 200
+    assert client.put(f"/ogrenciler/{ogrenci_id}", json=ogrenci(ogrenci_sifre="yeni-sifre")).status_code == 200
+    assert sifre.hashli_mi(kayitli_hash(engine))
+    assert giris(client, SIFRE) == 401
+    assert giris(client, "yeni-sifre") == 200
+
+
+def test_eski_kayit_yalnizca_ayni_kodlamayi_ureten_sifreyi_kabul_eder(client, engine):
+    with Session(engine) as db:
+        db.execute(insert(models.Ogrenci).values(
+            ogrenci_kullaniciAdi="ogr", ogrenci_email=EPOSTA, ogrenci_ad="Ad", ogrenci_soyad="Soyad",
+            ogrenci_dogumTarihi=date(2010, 1, 1), ogrenci_sonGuncellemeTarihi=datetime(2025, 1, 1),
+            ogrenci_sifreHashed=sifre.eski_kodlama(EPOSTA, "password")))
+        db.commit()
+    assert giris(client, "herhangi-bir-sifre") == 401
+    assert not sifre.hashli_mi(kayitli_hash(engine))
+    assert giris(client, "password") == 200
+    # Kabul edilen eski kayıt yeni hash'e çevrilir
+    assert sifre.hashli_mi(kayitli_hash(engine))
+    assert giris(client, "password") == 200
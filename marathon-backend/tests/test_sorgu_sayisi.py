@@ -0,0 +1,35 @@
+import pytest
+from sqlalchemy import event
+from benchmarks.sorgu_sayisi import ENDPOINTLER, tohumla
+
+import hizli, oturum
+
+ILISKI = 20
+
+
+@pytest.fixture
+def sayac(engine):
+    sayi = [0]
+
+    def say(*_):
+        sayi[0] += 1
+
+    event.listen(engine, "before_cursor_execute", say)
+    yield sayi
+    event.remove(engine, "before_cursor_execute", say)
+
+
+@pytest.mark.parametrize("hizli_liste", [False, True], ids=["orm", "hizli"])
+@pytest.mark.parametrize("sablon,beklenen", ENDPOINTLER)
+def test_iliski_endpointlerinde_n_arti_1_yok(client, engine, sayac, monkeypatch, hizli_liste, sablon, beklenen):
+    # Kayıt 1 tek, kayıt 2 ILISKI ilişkiye sahip: sorgu sayısı ilişki adedine bağlı olmamalı
+    monkeypatch.setattr(hizli, "HIZLI_LISTE", hizli_liste)
+    tohumla(engine, ILISKI)
+    sayilar = []
+    for kimlik in (1, 2):
+        sayac[0] = 0
+        yanit = client.get(sablon.format(kimlik), params={"limit": ILISKI},
+                           headers={"Authorization": f"Bearer {oturum.token_olustur(kimlik)}"})
+        assert yanit.status_code == 200
+        sayilar.append(sayac[0])
+    assert 0 < sayilar[0] == sayilar[1] <= beklenen
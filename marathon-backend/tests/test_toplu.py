@@ -0,0 +1,43 @@
+import json
+from datetime import date, datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+import crud, models
+
+
+def chatbot(i: int, **ek) -> dict:
+    return dict({"chatbot_soruMetni": f"soru {i}", "chatbot_cevapMetni": "cevap", "chatbot_zamanDamgasi": None,
+                 "chatbot_duyguCikarimi": None, "ogrenci_id": None}, **ek)
+
+
+def test_ndjson_kayit_basina_hata_raporu(client, engine):
+    satirlar = [json.dumps(chatbot(0)), "{bozuk", json.dumps(chatbot(2, chatbot_zamanDamgasi="dün")),
+                json.dumps(chatbot(3))]
+    yanit = client.post("/chatbot/batch", content="\n".join(satirlar).encode(),
+                        headers={"Content-Type": "application/x-ndjson"})
+    assert yanit.status_code == 200
+    sonuc = yanit.json()
+    assert sonuc["eklenen"] == 2 and sonuc["hatali"] == 2
+    assert [h["index"] for h in sonuc["hatalar"]] == [1, 2]
+    with Session(engine) as db:
+        assert db.scalars(select(models.ChatbotEtkilesim.chatbot_soruMetni)).all() == ["soru 0", "soru 3"]
+
+
+def test_json_dizisi_degilse_400(client, engine):
+    assert client.post("/chatbot/batch", json={"chatbot_soruMetni": "tek"}).status_code == 400
+
+
+def test_parca_hatasinda_kayitlar_tek_tek_denenir(engine):
+    def ogrenci(i: int, **ek) -> dict:
+        return dict({"ogrenci_kullaniciAdi": f"o{i}", "ogrenci_email": f"o{i}@ornek.com", "ogrenci_sifreHashed": "x",
+                     "ogrenci_ad": "Ad", "ogrenci_soyad": "Soyad", "ogrenci_dogumTarihi": date(2010, 1, 1),
+                     "ogrenci_sonGuncellemeTarihi": datetime(2025, 1, 1)}, **ek)
+
+    # Parça 2: ikinci kayıt NOT NULL ihlali; parçanın geri kalanı yine yazılır
+    kayitlar = list(enumerate([ogrenci(0), ogrenci(1), ogrenci(2), ogrenci(3, ogrenci_ad=None), ogrenci(4)]))
+    with Session(engine) as db:
+        eklenen, hatalar = crud.toplu_ekle(db, models.Ogrenci, kayitlar, parca_boyutu=2)
+        assert eklenen == 4 and [h["index"] for h in hatalar] == [3]
+        assert db.scalar(select(func.count()).select_from(models.Ogrenci)) == 4
@@ -0,0 +1,72 @@
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+
+import models, uyarlama
+
+
+@pytest.mark.parametrize("seviye, hedef", [(0.5, 1), (1.5, 2), (2.5, 3), (3.5, 4), (2.49, 2)])
+def test_hedef_seviye_yarimi_yukari_yuvarlar(seviye, hedef):
+    assert uyarlama.OgrenciDurumu(seviye, 0.5, 0.5).hedef_seviye() == hedef
+
+
+def test_seviye_indeksli_aralikla_sinirli():
+    durum = uyarlama.OgrenciDurumu(2.0, 0.5, 0.5)
+    for _ in range(20):
+        durum.sonuc_isle(1.0, aralik=(1, 3))
+    assert durum.seviye == 3
+    # Üst sınırda biriken başarı düşüşü geciktirmez: tek zorlanma bir adım indirir
+    durum.sonuc_isle(0.0, aralik=(1, 3))
+    assert durum.seviye == 3 - uyarlama.SEVIYE_ADIMI
+    for _ in range(20):
+        durum.sonuc_isle(0.0, aralik=(1, 3))
+    assert durum.seviye == 1
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as oturum:
+        oturum.execute(insert(models.Konular), [{"konu_adi": f"k{i}", "konu_seviyesi": 1 + i % 3} for i in range(6)])
+        oturum.execute(insert(models.Ogrenci).values(
+            ogrenci_kullaniciAdi="o", ogrenci_email="o@ornek.com", ogrenci_sifreHashed="x", ogrenci_ad="Ad",
+            ogrenci_soyad="Soyad", ogrenci_dogumTarihi=date(2010, 1, 1), ogrenci_mevcutSeviye=9,
+            ogrenci_sonGuncellemeTarihi=datetime(2025, 1, 1)))
+        oturum.execute(insert(models.Istatistikler), [
+            {"istatistik_tarihi": date(2025, 1, 1 + i), "istatistik_dogruCevapOrani": 95, "ogrenci_id": 1}
+            for i in range(5)])
+        oturum.commit()
+        yield oturum
+
+
+def test_veritabani_okumalari_motor_kilidi_disinda(db, engine):
+    motor = uyarlama.KonuSecici()
+    kilitli = []
+
+    def kontrol(conn, cursor, ifade, parametreler, context, executemany):
+        kilitli.append(motor._kilit.locked())
+
+    ogrenci = db.get(models.Ogrenci, 1)
+    event.listen(engine, "before_cursor_execute", kontrol)
+    try:
+        konu_id, seviye, _ = motor.sonraki(db, ogrenci)
+    finally:
+        event.remove(engine, "before_cursor_execute", kontrol)
+    assert kilitli and not any(kilitli)
+    # Kayıtlı seviye (9) ve başarılar indeksteki en yüksek seviyeyle (3) sınırlanır
+    assert seviye == 3 and motor._ogrenciler[1].seviye == 3
+
+
+def test_dogrudan_eklenen_konu_araya_gireni_atlatmaz(db):
+    motor = uyarlama.KonuSecici()
+    motor.esitle(db)
+    # Diğer worker'ın eklediği konu (7) ve bu worker'da oluşturulan konu (8)
+    db.execute(insert(models.Konular), [{"konu_adi": "diger", "konu_seviyesi": 1}, {"konu_adi": "bu", "konu_seviyesi": 1}])
+    db.commit()
+    motor.konu_ekle(SimpleNamespace(konu_id=8, ders_id=None, konu_seviyesi=1))
+    motor.esitle(db, zorla=True)
+    assert sorted(motor._konular[(None, 1)]) == sorted(db.scalars(
+        select(models.Konular.konu_id).where(models.Konular.konu_seviyesi == 1)))
+    assert motor.ozet()["son_konu_id"] == 8
@@ -0,0 +1,48 @@
+import json
+import os
+from pydantic import ValidationError
+
+TOPLU_MAX_KAYIT = int(os.getenv("TOPLU_MAX_KAYIT", "10000"))
+TOPLU_PARCA_BOYUTU = int(os.getenv("TOPLU_PARCA_BOYUTU", "500"))
+
+
+class TopluIstekHatasi(ValueError):
+    pass
+
+
+def _hata_metni(e: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, h['loc']))}: {h['msg']}" for h in e.errors())
+
+
+# Gövde JSON dizisi ya da NDJSON (satır başına bir kayıt) olabilir.
+# Geçerli kayıtlar (index, dict) olarak, geçersizler index'leriyle birlikte döner.
+def kayitlari_ayristir(govde: bytes, content_type: str, sema):
+    if "ndjson" in content_type or "jsonl" in content_type:
+        satirlar = [s for s in govde.splitlines() if s.strip()]
+        ham = []
+        for satir in satirlar:
+            try:
+                ham.append(json.loads(satir))
+            except ValueError as e:
+                ham.append(e)
+    else:
+        try:
+            ham = json.loads(govde)
+        except ValueError as e:
+            raise TopluIstekHatasi("Gövde geçerli bir JSON dizisi değil") from e
+        if not isinstance(ham, list):
+            raise TopluIstekHatasi("Gövde bir JSON dizisi olmalı")
+
+    if len(ham) > TOPLU_MAX_KAYIT:
+        raise TopluIstekHatasi(f"En fazla {TOPLU_MAX_KAYIT} kayıt gönderilebilir")
+
+    gecerli, hatalar = [], []
+    for i, kayit in enumerate(ham):
+        if isinstance(kayit, ValueError):
+            hatalar.append({"index": i, "hata": f"Geçersiz JSON: {kayit}"})
+            continue
+        try:
+            gecerli.append((i, sema.model_validate(kayit).model_dump()))
+        except ValidationError as e:
+            hatalar.append({"index": i, "hata": _hata_metni(e)})
+    return gecerli, hatalar
@@ -0,0 +1,269 @@
+import bisect
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import date
+from typing import Optional
+from sqlalchemy import select
+import models
+
+# Öğrenciye sıradaki konuyu seçen uyarlanabilir motor. Konular (ders_id, seviye) anahtarıyla
+# süreç içinde indekslenir; her öğrenci için ustalık durumu (başarı, dikkat, hedef seviye)
+# tutulur. Seçim tablo taramadan yapılır: hedef seviyeye en yakın dolu seviye bisect ile
+# bulunur, o seviyedeki konular öğrenci başına imleçle sırayla dolaşılır.
+# Ustalık yeni Istatistikler (istatistik_dogruCevapOrani, ortalama odak) ve sınav sonuçlarıyla
+# (doğru/yanlış sayısı) üstel ortalama olarak güncellenir. create_konu/create_istatistik kaydı
+# hemen işler; toplu ekleme ve diğer worker'ların kayıtları en fazla ESITLE_ARALIGI saniyede
+# bir pk > son_id sorgusuyla tamamlanır. Veritabanı okumaları (eşitleme, öğrencinin ilk
+# ısıtılması) motor kilidi dışında yapılır; kilit yalnızca bellekteki durumu korur.
+# Seviye indekste bulunan en düşük/en yüksek konu seviyesiyle sınırlıdır: en üst seviyede
+# art arda başarılar seviyeyi sınırsız büyütüp düşüşü geciktirmez.
+USTALIK_ALFA = float(os.getenv("USTALIK_ALFA", "0.3"))
+ESITLE_ARALIGI = float(os.getenv("USTALIK_ESITLE_ARALIGI", "1.0"))
+# Öğrenci ilk istendiğinde son kaç sonuçla ısıtılır
+ILK_SONUC_SAYISI = 20
+SEVIYE_ADIMI = 0.5
+USTA_ESIGI = 0.8  # bu başarının üstünde seviye artar
+ZORLANMA_ESIGI = 0.5  # altında azalır
+DUSUK_DIKKAT = 0.4  # dikkat bunun altındaysa bir seviye kolay konu verilir
+
+
+def _oran(deger) -> Optional[float]:
+    # DECIMAL(5,2) alanlar yüzde (0-100) ya da oran (0-1) olarak girilebiliyor
+    if deger is None:
+        return None
+    deger = float(deger)
+    return min(max(deger / 100 if deger > 1 else deger, 0.0), 1.0)
+
+
+class OgrenciDurumu:
+    __slots__ = ("seviye", "basari", "dikkat", "imlecler")
+
+    def __init__(self, seviye: float, basari: float, dikkat: float):
+        self.seviye = seviye
+        self.basari = basari
+        self.dikkat = dikkat
+        self.imlecler = {}  # (ders_id, seviye) -> sıradaki konu sırası
+
+    def sinirla(self, aralik: Optional[tuple[int, int]]):
+        if aralik is not None:
+            self.seviye = min(max(self.seviye, aralik[0]), aralik[1])
+
+    def sonuc_isle(self, basari: Optional[float], dikkat: Optional[float] = None,
+                   aralik: Optional[tuple[int, int]] = None):
+        if basari is not None:
+            self.basari += USTALIK_ALFA * (basari - self.basari)
+            if basari >= USTA_ESIGI:
+                self.seviye += SEVIYE_ADIMI
+            elif basari < ZORLANMA_ESIGI:
+                self.seviye -= SEVIYE_ADIMI
+            self.sinirla(aralik)
+        if dikkat is not None:
+            self.dikkat += USTALIK_ALFA * (dikkat - self.dikkat)
+
+    def hedef_seviye(self) -> int:
+        # round() yarımları çifte yuvarlar (2.5 -> 2, 3.5 -> 4); yarım her zaman yukarı
+        return math.floor(self.seviye + 0.5) - (1 if self.dikkat < DUSUK_DIKKAT else 0)
+
+
+class KonuSecici:
+    def __init__(self):
+        self._kilit = threading.Lock()
+        # Aynı anda tek eşitleme (DB okuması _kilit dışında)
+        self._esitle_kilit = threading.Lock()
+        self._konular = defaultdict(list)  # (ders_id, seviye) -> [konu_id], ders_id=None tüm dersler
+        self._seviyeler = defaultdict(list)  # ders_id -> sıralı seviyeler
+        self._ogrenciler = {}
+        self._uygulanan = set()  # son_id üstünde doğrudan işlenmiş istatistik id'leri
+        self._eklenen_konular = set()  # son_konu_id üstünde doğrudan eklenmiş konu id'leri
+        self.son_konu_id = 0
+        self.son_istatistik_id = 0
+        self.son_sinav_id = 0
+        self._son_esitleme = 0.0
+        self.kuruldu = False
+
+    # Konu indeksi
+
+    def _konu_ekle(self, konu_id: int, ders_id: Optional[int], seviye: Optional[int]):
+        seviye = seviye or 0
+        for anahtar in {ders_id, None}:
+            liste = self._konular[(anahtar, seviye)]
+            if not liste:
+                bisect.insort(self._seviyeler[anahtar], seviye)
+            liste.append(konu_id)
+
+    def konu_ekle(self, konu):
+        # create_konu sonrası; indeks kurulmadıysa ilk seçimde zaten yüklenecek. son_konu_id
+        # ilerletilmez: araya giren diğer worker kayıtları eşitlemede atlanmasın
+        with self._kilit:
+            if self.kuruldu and konu.konu_id > self.son_konu_id and konu.konu_id not in self._eklenen_konular:
+                self._konu_ekle(konu.konu_id, konu.ders_id, konu.konu_seviyesi)
+                self._eklenen_konular.add(konu.konu_id)
+
+    def _seviye_araligi(self) -> Optional[tuple[int, int]]:
+        seviyeler = self._seviyeler.get(None)
+        return (seviyeler[0], seviyeler[-1]) if seviyeler else None
+
+    # Sonuçlar
+
+    def _istatistik_isle(self, ogrenci_id, basari, odak) -> bool:
+        durum = self._ogrenciler.get(ogrenci_id)
+        if durum is None:
+            return False  # öğrenci ilk istendiğinde geçmişinden ısıtılır
+        durum.sonuc_isle(_oran(basari), _oran(odak), self._seviye_araligi())
+        return True
+
+    def istatistik_ekle(self, istatistik):
+        with self._kilit:
+            if istatistik.istatistik_id > self.son_istatistik_id and self._istatistik_isle(
+                    istatistik.ogrenci_id, istatistik.istatistik_dogruCevapOrani, istatistik.istatistik_ortalamaodakPuani):
+                self._uygulanan.add(istatistik.istatistik_id)
+
+    def ogrenci_unut(self, ogrenci_id: int):
+        # Öğrenci kaydı güncellendi: bir sonraki istekte yeniden ısıtılır
+        with self._kilit:
+            self._ogrenciler.pop(ogrenci_id, None)
+
+    @staticmethod
+    def _sinav_orani(dogru, yanlis) -> Optional[float]:
+        toplam = (dogru or 0) + (yanlis or 0)
+        return (dogru or 0) / toplam if toplam else None
+
+    def _oku(self, db, kuruldu: bool, son_konu_id: int, son_istatistik_id: int, son_sinav_id: int) -> dict:
+        # Kilit dışında: son_id'lerden sonraki kayıtlar
+        konu, ist, sinav, bag = models.Konular, models.Istatistikler, models.SinavSimilasyonlari, models.SinavSimilasyonlari_has_Ogrenci
+        okunan = {"konular": db.execute(
+            select(konu.konu_id, konu.ders_id, konu.konu_seviyesi)
+            .filter(konu.konu_id > son_konu_id).order_by(konu.konu_id)).all()}
+        if not kuruldu:
+            # Geçmiş sonuçlar öğrenci ilk istendiğinde okunur; burada yalnızca başlangıç noktası alınır
+            okunan["son_istatistik_id"] = db.scalar(select(ist.istatistik_id).order_by(ist.istatistik_id.desc()).limit(1)) or 0
+            okunan["son_sinav_id"] = db.scalar(select(sinav.sinav_id).order_by(sinav.sinav_id.desc()).limit(1)) or 0
+            return okunan
+        okunan["istatistikler"] = db.execute(
+            select(ist.istatistik_id, ist.ogrenci_id, ist.istatistik_dogruCevapOrani, ist.istatistik_ortalamaodakPuani)
+            .filter(ist.istatistik_id > son_istatistik_id).order_by(ist.istatistik_id)).all()
+        # Sınav-öğrenci bağı sınavdan sonra eklenirse ve sınav bu noktayı geçmişse sayılmaz
+        okunan["sinavlar"] = db.execute(
+            select(sinav.sinav_id, bag.ogrenci_id, sinav.sinav_dogruCevapSayisi, sinav.sinav_yanlisCevapSayisi)
+            .join(bag, bag.sinav_id == sinav.sinav_id)
+            .filter(sinav.sinav_id > son_sinav_id).order_by(sinav.sinav_id)).all()
+        return okunan
+
+    def _uygula(self, okunan: dict):
+        # Kilit altında; eşitleme tek olduğundan son_id'leri yalnızca bu yol ilerletir
+        for konu_id, ders_id, seviye in okunan["konular"]:
+            if konu_id not in self._eklenen_konular:
+                self._konu_ekle(konu_id, ders_id, seviye)
+            self.son_konu_id = konu_id
+        self._eklenen_konular = {i for i in self._eklenen_konular if i > self.son_konu_id}
+        if not self.kuruldu:
+            self.son_istatistik_id = okunan["son_istatistik_id"]
+            self.son_sinav_id = okunan["son_sinav_id"]
+            self.kuruldu = True
+            return
+        for istatistik_id, ogrenci_id, basari, odak in okunan["istatistikler"]:
+            if istatistik_id not in self._uygulanan:
+                self._istatistik_isle(ogrenci_id, basari, odak)
+            self.son_istatistik_id = istatistik_id
+        self._uygulanan = {i for i in self._uygulanan if i > self.son_istatistik_id}
+        aralik = self._seviye_araligi()
+        for sinav_id, ogrenci_id, dogru, yanlis in okunan["sinavlar"]:
+            durum = self._ogrenciler.get(ogrenci_id)
+            if durum is not None:
+                durum.sonuc_isle(self._sinav_orani(dogru, yanlis), aralik=aralik)
+            self.son_sinav_id = sinav_id
+
+    def esitle(self, db, zorla: bool = False):
+        # Kurulmuşsa ve başka bir istek zaten eşitliyorsa beklenmez (en fazla ESITLE_ARALIGI eski)
+        if not self._esitle_kilit.acquire(blocking=zorla or not self.kuruldu):
+            return
+        try:
+            with self._kilit:
+                if not (zorla or not self.kuruldu or time.monotonic() - self._son_esitleme >= ESITLE_ARALIGI):
+                    return
+                son_idler = (self.kuruldu, self.son_konu_id, self.son_istatistik_id, self.son_sinav_id)
+            okunan = self._oku(db, *son_idler)
+            with self._kilit:
+                self._uygula(okunan)
+                self._son_esitleme = time.monotonic()
+        finally:
+            self._esitle_kilit.release()
+
+    def _gecmis(self, db, ogrenci_id: int, son_istatistik_id: int, son_sinav_id: int) -> list:
+        # Kilit dışında: son sonuçlar (istatistik + sınav) tarih sırasıyla; son_id sonrası esitle'ye kalır
+        ist, sinav, bag = models.Istatistikler, models.SinavSimilasyonlari, models.SinavSimilasyonlari_has_Ogrenci
+        olaylar = [(t, _oran(b), _oran(o)) for t, b, o in db.execute(
+            select(ist.istatistik_tarihi, ist.istatistik_dogruCevapOrani, ist.istatistik_ortalamaodakPuani)
+            .filter(ist.ogrenci_id == ogrenci_id, ist.istatistik_id <= son_istatistik_id)
+            .order_by(ist.istatistik_tarihi.desc()).limit(ILK_SONUC_SAYISI))]
+        olaylar += [(t, self._sinav_orani(d, y), None) for t, d, y in db.execute(
+            select(sinav.sinav_tarihi, sinav.sinav_dogruCevapSayisi, sinav.sinav_yanlisCevapSayisi)
+            .join(bag, bag.sinav_id == sinav.sinav_id)
+            .filter(bag.ogrenci_id == ogrenci_id, sinav.sinav_id <= son_sinav_id)
+            .order_by(sinav.sinav_tarihi.desc()).limit(ILK_SONUC_SAYISI))]
+        return sorted(olaylar, key=lambda o: o[0] or date.min)
+
+    def _durum(self, db, ogrenci) -> OgrenciDurumu:
+        # Kilit dışında çağrılır; geçmiş okunurken eşitleme son_id'leri ilerletirse aradaki sonuçlar
+        # ne ısıtmaya ne eşitlemeye girer, bu yüzden ısıtma yeni son_id'lerle tekrarlanır
+        for _ in range(3):
+            with self._kilit:
+                durum = self._ogrenciler.get(ogrenci.ogrenci_id)
+                if durum is not None:
+                    return durum
+                son_idler = (self.son_istatistik_id, self.son_sinav_id)
+                aralik = self._seviye_araligi()
+            varsayilan = aralik[0] if aralik else 0
+            # Kolon varsayılanı 0.0 "henüz ölçülmedi" demek; nötr 0.5 ile başlanır
+            durum = OgrenciDurumu(
+                seviye=float(ogrenci.ogrenci_mevcutSeviye if ogrenci.ogrenci_mevcutSeviye is not None else varsayilan),
+                basari=_oran(ogrenci.ogrenci_basariOrani) or 0.5,
+                dikkat=_oran(ogrenci.ogrenci_dikkatSeviyesi) or 0.5,
+            )
+            durum.sinirla(aralik)
+            for _, basari, dikkat in self._gecmis(db, ogrenci.ogrenci_id, *son_idler):
+                durum.sonuc_isle(basari, dikkat, aralik)
+            with self._kilit:
+                if (self.son_istatistik_id, self.son_sinav_id) == son_idler:
+                    return self._ogrenciler.setdefault(ogrenci.ogrenci_id, durum)
+        with self._kilit:
+            return self._ogrenciler.setdefault(ogrenci.ogrenci_id, durum)
+
+    def _en_yakin_seviye(self, ders_id: Optional[int], hedef: int) -> Optional[int]:
+        # Eşit uzaklıkta kolay olan tercih edilir
+        seviyeler = self._seviyeler.get(ders_id)
+        if not seviyeler:
+            return None
+        i = bisect.bisect_left(seviyeler, hedef)
+        if i == len(seviyeler):
+            return seviyeler[-1]
+        if seviyeler[i] == hedef or i == 0:
+            return seviyeler[i]
+        return seviyeler[i - 1] if hedef - seviyeler[i - 1] <= seviyeler[i] - hedef else seviyeler[i]
+
+    def sonraki(self, db, ogrenci, ders_id: Optional[int] = None) -> Optional[tuple[int, int, float]]:
+        # (konu_id, seçilen seviye, ustalık) ya da uygun konu yoksa None
+        self.esitle(db)
+        durum = self._durum(db, ogrenci)
+        with self._kilit:
+            durum.sinirla(self._seviye_araligi())
+            seviye = self._en_yakin_seviye(ders_id, durum.hedef_seviye())
+            if seviye is None:
+                return None
+            anahtar = (ders_id, seviye)
+            liste = self._konular[anahtar]
+            sira = durum.imlecler.get(anahtar, 0)
+            durum.imlecler[anahtar] = sira + 1
+            return liste[sira % len(liste)], seviye, durum.basari
+
+    def ozet(self) -> dict:
+        with self._kilit:
+            return {"konu": sum(len(l) for (d, _), l in self._konular.items() if d is None),
+                    "ogrenci": len(self._ogrenciler), "son_konu_id": self.son_konu_id,
+                    "son_istatistik_id": self.son_istatistik_id, "son_sinav_id": self.son_sinav_id}
+
+
+MOTOR = KonuSecici()
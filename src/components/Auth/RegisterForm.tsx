@@ -58,7 +58,7 @@ export const RegisterForm: React.FC<RegisterFormProps> = ({ onRegister, onSwitch
         grade: formData.grade,
         adhdType: formData.adhdType,
         learningStyle: formData.learningStyle,
-      });
+      }, formData.password);
 
       onRegister(user);
     } catch (err) {
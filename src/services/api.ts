@@ -4,6 +4,10 @@ import { Ogrenci, OgrenciCreate, Dersler, DerslerCreate, Konular, KonularCreate,
 // API Base URL - backend FastAPI server
 const API_BASE_URL = 'http://localhost:8000';
 
+// localStorage keys shared with AuthService
+export const TOKEN_KEY = 'marathon_token';
+export const CURRENT_USER_KEY = 'marathon_current_user';
+
 // Login response interface
 interface LoginResponse {
   message: string;
@@ -24,7 +28,7 @@ const apiClient = axios.create({
 apiClient.interceptors.request.use(
   (config) => {
     // Add auth token to requests if available
-    const token = localStorage.getItem('token');
+    const token = localStorage.getItem(TOKEN_KEY);
     if (token) {
       config.headers.Authorization = `Bearer ${token}`;
     }
@@ -41,8 +45,8 @@ apiClient.interceptors.response.use(
   (error) => {
     if (error.response?.status === 401) {
       // Token expired or invalid, clear localStorage
-      localStorage.removeItem('token');
-      localStorage.removeItem('user');
+      localStorage.removeItem(TOKEN_KEY);
+      localStorage.removeItem(CURRENT_USER_KEY);
       window.location.href = '/login';
     }
     return Promise.reject(error);
@@ -81,6 +85,12 @@ export class ApiService {
     return response.data;
   }
 
+  // Birden çok id tek istekte; sonuç istek sırasında, bulunamayanlar X-Eksik-Idler başlığında
+  static async getOgrencilerByIds(ogrenciIds: number[]): Promise<Ogrenci[]> {
+    const response = await apiClient.get<Ogrenci[]>(`/ogrenciler/?ids=${ogrenciIds.join(',')}`);
+    return response.data;
+  }
+
   static async updateOgrenci(ogrenciId: number, ogrenciData: OgrenciCreate): Promise<Ogrenci> {
     const response = await apiClient.put<Ogrenci>(`/ogrenciler/${ogrenciId}`, ogrenciData);
     return response.data;
@@ -102,6 +112,17 @@ export class ApiService {
     return response.data;
   }
 
+  static async getDerslerByIds(dersIds: number[]): Promise<Dersler[]> {
+    const response = await apiClient.get<Dersler[]>(`/dersler/?ids=${dersIds.join(',')}`);
+    return response.data;
+  }
+
+  // Canlı ders odak/enerji güncellemesi: sunucu kuyruğa alır (202), yazım arka planda
+  static async updateDersOdak(dersId: number, odak: { ders_odakPuani?: number; ders_enerjiSeviyesi?: number }): Promise<{ derinlik: number }> {
+    const response = await apiClient.post<{ derinlik: number }>(`/dersler/${dersId}/odak`, odak);
+    return response.data;
+  }
+
   // Konular (Topics) endpoints
   static async createKonu(konuData: KonularCreate): Promise<Konular> {
     const response = await apiClient.post<Konular>('/konular/', konuData);
@@ -118,6 +139,11 @@ export class ApiService {
     return response.data;
   }
 
+  static async getKonularByIds(konuIds: number[]): Promise<Konular[]> {
+    const response = await apiClient.get<Konular[]>(`/konular/?ids=${konuIds.join(',')}`);
+    return response.data;
+  }
+
   // SinavSimilasyonlari (Exam Simulations) endpoints
   static async createSinav(sinavData: SinavSimilasyonlariCreate): Promise<SinavSimilasyonlari> {
     const response = await apiClient.post<SinavSimilasyonlari>('/sinavlar/', sinavData);
@@ -140,6 +166,12 @@ export class ApiService {
     return response.data;
   }
 
+  // Yüksek frekanslı istatistik: kuyruğa alınır (202), kayıt id'si dönmez
+  static async queueIstatistik(istatistikData: IstatistiklerCreate): Promise<{ derinlik: number }> {
+    const response = await apiClient.post<{ derinlik: number }>('/istatistikler/kuyruk', istatistikData);
+    return response.data;
+  }
+
   static async getIstatistikler(skip = 0, limit = 10): Promise<Istatistikler[]> {
     const response = await apiClient.get<Istatistikler[]>(`/istatistikler/?skip=${skip}&limit=${limit}`);
     return response.data;
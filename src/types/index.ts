@@ -23,7 +23,7 @@ export interface Ogrenci {
 export interface OgrenciCreate {
   ogrenci_kullaniciAdi: string;
   ogrenci_email: string;
-  ogrenci_sifreHashed: string;
+  ogrenci_sifre?: string; // plain text, hashed by the backend; omit on update to keep the password
   ogrenci_ad: string;
   ogrenci_soyad: string;
   ogrenci_dogumTarihi?: string;
@@ -279,14 +279,14 @@ export function ogrenciToUser(ogrenci: Ogrenci): User {
 }
 
 // Helper function to convert User to Ogrenci format
-export function userToOgrenci(user: User, hashedPassword: string): OgrenciCreate {
+export function userToOgrenci(user: User, password?: string): OgrenciCreate {
   const currentDateTime = new Date().toISOString(); // ISO datetime format
   const defaultBirthDate = user.birthDate || '2000-01-01'; // Use user's birth date or default
   
   return {
     ogrenci_kullaniciAdi: user.username || user.email.split('@')[0], // Use username or email prefix
     ogrenci_email: user.email,
-    ogrenci_sifreHashed: hashedPassword,
+    ...(password ? { ogrenci_sifre: password } : {}),
     ogrenci_ad: user.firstName,
     ogrenci_soyad: user.lastName,
     ogrenci_dogumTarihi: defaultBirthDate,
@@ -1,15 +1,12 @@
-import { User, Ogrenci, OgrenciCreate, ogrenciToUser, userToOgrenci } from '../types';
-import { ApiService } from '../services/api';
+import { User, OgrenciCreate, ogrenciToUser, userToOgrenci } from '../types';
+import { ApiService, CURRENT_USER_KEY, TOKEN_KEY } from '../services/api';
 
 export class AuthService {
-  private static readonly CURRENT_USER_KEY = 'marathon_current_user';
-  private static readonly TOKEN_KEY = 'marathon_token';
+  private static readonly CURRENT_USER_KEY = CURRENT_USER_KEY;
+  private static readonly TOKEN_KEY = TOKEN_KEY;
 
-  static async register(userData: Omit<User, 'id' | 'joinDate'>): Promise<User> {
+  static async register(userData: Omit<User, 'id' | 'joinDate'>, password: string): Promise<User> {
     try {
-      // Hash password (in a real app, you'd use proper hashing)
-      const hashedPassword = btoa(userData.email + 'password'); // Simple encoding for demo
-      
       // Convert User to OgrenciCreate format
       const userWithDefaults: User = {
         ...userData,
@@ -17,21 +14,18 @@ export class AuthService {
         joinDate: new Date().toISOString(),
       };
       
-      const ogrenciData: OgrenciCreate = userToOgrenci(userWithDefaults, hashedPassword);
-      
-      // Debug: Log the data being sent
-      console.log('Sending ogrenci data to backend:', ogrenciData);
+      const ogrenciData: OgrenciCreate = userToOgrenci(userWithDefaults, password); // password is hashed by the backend
       
-      // Create user in backend
-      const createdOgrenci: Ogrenci = await ApiService.createOgrenci(ogrenciData);
+      // Create user in backend, then log in to get a signed token
+      await ApiService.createOgrenci(ogrenciData);
+      const loginResponse = await ApiService.login(ogrenciData.ogrenci_email, password);
       
       // Convert back to User format
-      const user = ogrenciToUser(createdOgrenci);
+      const user = ogrenciToUser(loginResponse.user);
       
       // Store user and token locally
       localStorage.setItem(this.CURRENT_USER_KEY, JSON.stringify(user));
-      // In a real app, you'd get an actual JWT token from backend
-      localStorage.setItem(this.TOKEN_KEY, btoa(user.id + ':' + user.email));
+      localStorage.setItem(this.TOKEN_KEY, loginResponse.token);
       
       return user;
     } catch (error: any) {
@@ -166,11 +160,8 @@ export class AuthService {
         throw new Error('Kullanıcı oturumu bulunamadı');
       }
 
-      // Hash password (using the same simple method for consistency)
-      const hashedPassword = btoa(updatedUser.email + 'password');
-      
-      // Convert User to OgrenciCreate format for update
-      const ogrenciData: OgrenciCreate = userToOgrenci(updatedUser, hashedPassword);
+      // Convert User to OgrenciCreate format for update (password is left unchanged)
+      const ogrenciData: OgrenciCreate = userToOgrenci(updatedUser);
       
       // Update user in backend
       const updatedOgrenci = await ApiService.updateOgrenci(parseInt(updatedUser.id), ogrenciData);